@@ -37,6 +37,10 @@ from .bdf_interface.utils import (
     fill_dmigs, _get_card_name, _parse_dynamic_syntax,
 )
 from pyNastran.bdf.bdf_interface.add_card import CARD_MAP
+from .bdf_interface.parallel_cards import (
+    parse_cards_parallel, create_card_objects, get_parallel_card_names)
+from .bdf_interface.include_cache import IncludeCache, CACHED_INCLUDE_CARD
+from .bdf_interface.fast_cards import parse_cards_fast
 from .bdf_interface.replication import (
     to_fields_replication, get_nrepeats, int_replication, float_replication,
     _field, repeat_cards)
@@ -584,6 +588,13 @@ class BDF_(BDFMethods, GetCard, AddCards, WriteMeshs, UnXrefMesh):
         self._remove_disabled_cards = False
         self.use_new_deck_parser = False
 
+        # the fixed field GRID, CTRIA3, CQUAD4, CTETRA, CPENTA, CHEXA cards
+        # are parsed in bulk (see bdf_interface/fast_cards.py)
+        self.use_fast_card_parser = True
+
+        # the cache for the mesh INCLUDE files (see read_bdf)
+        self._include_cache: Optional[IncludeCache] = None
+
         # file management parameters
         self.active_filenames: list[str] = []
         self.active_filename: Optional[str] = None
@@ -1338,7 +1349,9 @@ class BDF_(BDFMethods, GetCard, AddCards, WriteMeshs, UnXrefMesh):
                  punch: bool=False,
                  read_includes: bool=True,
                  save_file_structure: bool=False,
-                 encoding: Optional[str]=None) -> None:
+                 encoding: Optional[str]=None,
+                 n_workers: int=1,
+                 cache_dirname: Optional[PathLike]=None) -> None:
         """
         Read method for the bdf files
 
@@ -1358,6 +1371,14 @@ class BDF_(BDFMethods, GetCard, AddCards, WriteMeshs, UnXrefMesh):
             enables the ``write_bdfs`` method
         encoding : str; default=None -> system default
             the unicode encoding
+        n_workers : int; default=1
+            the number of processes used to create the high count cards
+            (e.g., GRID, CQUAD4, CHEXA); the model is the same as for
+            n_workers=1
+        cache_dirname : str; default=None -> no cache
+            the directory for the cache of the mesh INCLUDE files
+            (see bdf_interface/include_cache.py); only the INCLUDE files
+            that changed are parsed
 
         .. code-block:: python
 
@@ -1388,6 +1409,10 @@ class BDF_(BDFMethods, GetCard, AddCards, WriteMeshs, UnXrefMesh):
                          consider_superelements=self.is_superelements,
                          log=self.log, debug=self.debug)
         obj.use_new_parser = self.use_new_deck_parser
+        if cache_dirname is not None and read_includes and not save_file_structure and \
+           not self.is_superelements:
+            obj.include_cache = IncludeCache(str(cache_dirname), self._encoding, self.log)
+        self._include_cache = obj.include_cache
 
         out = obj.get_lines(bdf_filename, punch=self.punch, make_ilines=True)
         (system_lines,
@@ -1413,7 +1438,7 @@ class BDF_(BDFMethods, GetCard, AddCards, WriteMeshs, UnXrefMesh):
         self.case_control_deck.rsolmap_to_str = self.rsolmap_to_str
 
         try:
-            self._parse_all_cards(bulk_data_lines, bulk_data_ilines)
+            self._parse_all_cards(bulk_data_lines, bulk_data_ilines, n_workers=n_workers)
         except SuperelementFlagError:
             if self.is_superelements:
                 raise
@@ -1423,9 +1448,11 @@ class BDF_(BDFMethods, GetCard, AddCards, WriteMeshs, UnXrefMesh):
             self.is_superelements = True
             self.read_bdf(bdf_filename=bdf_filename, validate=validate, xref=xref, punch=punch,
                           read_includes=read_includes, save_file_structure=save_file_structure,
-                          encoding=encoding)
+                          encoding=encoding, n_workers=n_workers,
+                          cache_dirname=cache_dirname)
             return
 
+        self._include_cache = None
         if additional_deck_lines:
             add_superelements_from_deck_lines(self, BDF, additional_deck_lines)
 
@@ -1443,10 +1470,15 @@ class BDF_(BDFMethods, GetCard, AddCards, WriteMeshs, UnXrefMesh):
 
         self.cross_reference(xref=xref)
         self._xref = xref
+        if save_file_structure:
+            # after the cross-referencing, so the card hashes are the same
+            # when the model is written
+            self._set_unmodified_files()
 
         self.log.debug('---finished BDF.read_bdf of %s---' % self.bdf_filename)
 
-    def _parse_all_cards(self, bulk_data_lines: list[str], bulk_data_ilines: Any) -> None:
+    def _parse_all_cards(self, bulk_data_lines: list[str], bulk_data_ilines: Any,
+                         n_workers: int=1) -> None:
         """creates and loads all the cards the bulk data section"""
         strict = True
         cards_list = []
@@ -1470,7 +1502,8 @@ class BDF_(BDFMethods, GetCard, AddCards, WriteMeshs, UnXrefMesh):
                 #card_name = card[0]
                 #if card_name == 'CBAR':
                     #print(card)
-        self._parse_cards(cards_list, cards_dict, card_count, strict=strict)
+        self._parse_cards(cards_list, cards_dict, card_count, strict=strict,
+                          n_workers=n_workers)
 
         if self.values_to_skip:
             for key, values in self.values_to_skip.items():
@@ -1960,6 +1993,7 @@ class BDF_(BDFMethods, GetCard, AddCards, WriteMeshs, UnXrefMesh):
 
         # update the card
         obj.update_field(ifield, value)
+        self.mark_card_modified(obj)
         return obj
 
     def set_dynamic_syntax(self, dict_of_vars: dict[str, int | float | str]) -> None:
@@ -3013,7 +3047,6 @@ class BDF_(BDFMethods, GetCard, AddCards, WriteMeshs, UnXrefMesh):
                 dmig = -1
                 self._dmig_temp[name].append((card_obj, comment))
         else:
-            field2 = integer_or_string(card_obj, 2, 'flag')
             if field2 == 0:
                 dmig = DMIG.add_card(card_obj, comment=comment)
                 self._add_methods._add_dmig_object(dmig)
@@ -3558,7 +3591,7 @@ class BDF_(BDFMethods, GetCard, AddCards, WriteMeshs, UnXrefMesh):
                 self._iparse_errors += 1
                 #self.log.error(str(card_obj))
                 var = traceback.format_exception_only(type(exception), exception)
-                self._stored_parse_errors.append((card, var))
+                self._stored_parse_errors.append((_get_card_fields(card_obj), var))
                 if self._iparse_errors > self._nparse_errors:
                     self.pop_parse_errors()
                 #raise
@@ -3578,7 +3611,7 @@ class BDF_(BDFMethods, GetCard, AddCards, WriteMeshs, UnXrefMesh):
                 self._iparse_errors += 1
                 self.log.error(str(card_obj))
                 var = traceback.format_exception_only(type(exception), exception)
-                self._stored_parse_errors.append((card, var))
+                self._stored_parse_errors.append((_get_card_fields(card_obj), var))
                 if self._iparse_errors > self._nparse_errors:
                     self.pop_parse_errors()
             #except AssertionError as exception:
@@ -3588,6 +3621,53 @@ class BDF_(BDFMethods, GetCard, AddCards, WriteMeshs, UnXrefMesh):
             #raise RuntimeError(card_obj)
             self.reject_cards.append(card_obj)
 
+    def _add_parsed_card(self, card_name: str, card_lines: list[str],
+                         class_instance: Any, exception: Optional[Exception]) -> None:
+        """
+        Adds a card that was created by ``parse_cards_parallel``.
+        The card count and parsing errors match ``add_card``.
+
+        Parameters
+        ----------
+        card_name : str
+            the card_name -> 'GRID'
+        card_lines : list[str] / None
+            the unparsed card; used for the error message
+            None : the card was loaded from the cache
+        class_instance : BaseCard / None
+            the card object; None if there was an error
+        exception : Exception / None
+            the parsing error from the worker
+
+        """
+        self.increase_card_count(card_name)
+        is_prepare = card_name not in self._card_parser
+        if is_prepare:
+            add_card_function = self._add_methods._add_element_object
+        else:
+            add_card_function = self._card_parser[card_name][1]
+
+        try:
+            if exception is not None:
+                raise exception
+            add_card_function(class_instance)
+        except (SyntaxError, AssertionError, KeyError, ValueError) as error:
+            if card_lines is None:
+                card_obj = class_instance
+                card = class_instance.raw_fields()
+            else:
+                card = wipe_empty_fields(to_fields(card_lines, card_name))
+                card_obj = BDFCard(card, has_none=False)
+            if is_prepare:
+                self.log.error(str(card_obj))
+            else:
+                print('problem adding %s' % card_obj)
+            self._iparse_errors += 1
+            var = traceback.format_exception_only(type(error), error)
+            self._stored_parse_errors.append((card, var))
+            if self._iparse_errors > self._nparse_errors:
+                self.pop_parse_errors()
+
     def is_acoustic(self) -> bool:
         card_names = ['ACPLNW', 'AMLREG', 'CAABSF', 'PMIC', 'MATPOR', 'MICPNT']
         nacoustics = [self.card_count.get(card_name, 0) for card_name in card_names]
@@ -4290,7 +4370,7 @@ class BDF_(BDFMethods, GetCard, AddCards, WriteMeshs, UnXrefMesh):
     def _parse_cards(self, cards_list: list[list[str]],
                      cards_dict: dict[str, list[str]],
                      card_count: dict[str, int],
-                     strict: bool=True) -> None:
+                     strict: bool=True, n_workers: int=1) -> None:
         """creates card objects and adds the parsed cards to the deck"""
         # we don't want replication markers in the card_count
         card_names_to_remove = (card_name for card_name in list(card_count.keys())
@@ -4304,7 +4384,7 @@ class BDF_(BDFMethods, GetCard, AddCards, WriteMeshs, UnXrefMesh):
 
         if cards_list:
             # this is the block that actually runs
-            self._parse_cards_list(cards_list, strict=strict)
+            self._parse_cards_list(cards_list, strict=strict, n_workers=n_workers)
 
     def _parse_cards_dict(self, cards_dict: dict[str, list[str]]) -> None:
         """parses the cards that are in dictionary format"""
@@ -4330,9 +4410,25 @@ class BDF_(BDFMethods, GetCard, AddCards, WriteMeshs, UnXrefMesh):
                     self.add_card(card_lines, card_name, comment=comment, ifile=ifile,
                                   is_list=False, has_none=False)
 
-    def _parse_cards_list(self, cards_list: list[str], strict: bool=True):
+    def _parse_cards_list(self, cards_list: list[str], strict: bool=True,
+                          n_workers: int=1):
         """parses the cards that are in list format"""
         add_card = self.add_card if strict else self.add_card_lax
+
+        # the high count cards are created with the columnar parser and/or in
+        # a process pool and are then added in order
+        parsed_cards = {}
+        if strict and not self.save_file_structure:
+            if self.use_fast_card_parser:
+                parsed_cards = parse_cards_fast(self, cards_list)
+            if n_workers > 1:
+                parsed_cards = parse_cards_parallel(self, cards_list, n_workers,
+                                                    parsed_cards=parsed_cards)
+
+        include_cache = self._include_cache
+        cards_to_cache = {}
+        if include_cache is not None and strict and not self.save_file_structure:
+            cards_to_cache = self._get_cards_to_cache(cards_list, parsed_cards)
         del strict
 
         save_file_structure = self.save_file_structure
@@ -4374,6 +4470,15 @@ class BDF_(BDFMethods, GetCard, AddCards, WriteMeshs, UnXrefMesh):
             for icard, card in enumerate(cards_list):
                 card_name, comment, card_lines, (ifile, unused_iline) = card
                 #print(unused_iline, card_lines[0])
+                if icard in parsed_cards:
+                    class_instance, exception = parsed_cards.pop(icard)
+                    self._add_parsed_card(card_name, card_lines, class_instance, exception)
+                    continue
+                if card_name == CACHED_INCLUDE_CARD and include_cache is not None:
+                    for card_namei, class_instance in include_cache.pop_cards(ifile, comment):
+                        self._add_parsed_card(card_namei, None, class_instance, None)
+                    continue
+
                 if card_name is None:
                     msg = f'card_name = {card_name!r}\n'
                     msg += f'card_lines = {card_lines}'
@@ -4407,6 +4512,64 @@ class BDF_(BDFMethods, GetCard, AddCards, WriteMeshs, UnXrefMesh):
                     add_card(card_lines, card_name, comment=comment, ifile=ifile,
                              is_list=False, has_none=False)
 
+            for ifile, (cards, comment) in cards_to_cache.items():
+                include_cache.save(ifile, cards, comment)
+
+    def _get_cards_to_cache(self, cards_list: list[Any],
+                            parsed_cards: dict[int, tuple[Any, Optional[Exception]]],
+                            ) -> dict[int, tuple[list[tuple[str, Any]], str]]:
+        """
+        Creates the cards of the INCLUDE files that will be saved to the
+        cache.  An INCLUDE file is cached if all the cards are mesh cards
+        (see get_parallel_card_names) and are valid.
+
+        Parameters
+        ----------
+        cards_list : list[card]
+            card : [card_name, comment, card_lines, (ifile, iline)]
+        parsed_cards : dict[icard] = (class_instance, exception)
+            the cards that have already been created; updated in place
+
+        Returns
+        -------
+        cards_to_cache : dict[ifile] = (cards, comment)
+            cards : list[(card_name, class_instance)]
+                the cards in deck order
+            comment : str
+                the unprocessed comment of the first card
+
+        """
+        uncached_files = self._include_cache.uncached_files
+        if not uncached_files:
+            return {}
+        card_names = get_parallel_card_names(self)
+
+        icards_by_ifile = defaultdict(list)
+        invalid_ifiles = set()
+        for icard, card in enumerate(cards_list):
+            ifile = card[3][0]
+            if ifile not in uncached_files:
+                continue
+            if card[0] in card_names:
+                icards_by_ifile[ifile].append(icard)
+            else:
+                invalid_ifiles.add(ifile)
+
+        cards_to_cache = {}
+        for ifile, icards in icards_by_ifile.items():
+            if ifile in invalid_ifiles:
+                continue
+            for icard in icards:
+                if icard not in parsed_cards:
+                    card_name, comment, card_lines, unused_ifile_iline = cards_list[icard]
+                    parsed_cards[icard] = create_card_objects(
+                        card_name, [(comment, card_lines)])[0]
+            if any(parsed_cards[icard][1] is not None for icard in icards):
+                continue
+            cards = [(cards_list[icard][0], parsed_cards[icard][0]) for icard in icards]
+            cards_to_cache[ifile] = (cards, cards_list[icards[0]][1])
+        return cards_to_cache
+
     #def _is_case_control_deck(self, line):
         #line_upper = line.upper().strip()
         #if 'CEND' in line.upper():
@@ -4892,6 +5055,13 @@ class BDF(BDF_):
         self.cards_to_read.update(REMOVED_CARDS)  # add
 
 
+def _get_card_fields(card_obj: BDFCard | list[str]) -> list[Optional[str]]:
+    """gets the fields of the card for the parsing error message"""
+    if isinstance(card_obj, BDFCard):
+        return card_obj.card
+    # DEQATN, PBRSECT, ... store the card lines
+    return card_obj
+
 def _echo_card(card, card_obj):
     """echos a card"""
     try:
@@ -4909,7 +5079,9 @@ def read_bdf(bdf_filename: Optional[str]=None, validate: bool=True,
              read_cards: Optional[list[str]]=None,
              encoding: Optional[str]=None,
              log: Optional[SimpleLogger]=None,
-             debug: bool=True, mode: str='msc') -> BDF:
+             debug: bool=True, mode: str='msc',
+             n_workers: int=1,
+             cache_dirname: Optional[str]=None) -> BDF:
     """
     Creates the BDF object
 
@@ -4944,6 +5116,11 @@ def read_bdf(bdf_filename: Optional[str]=None, validate: bool=True,
     mode : str; default='msc'
         the type of Nastran
         valid_modes = {'msc', 'nx'}
+    n_workers : int; default=1
+        the number of processes used to create the high count cards
+        (e.g., GRID, CQUAD4, CHEXA)
+    cache_dirname : str; default=None -> no cache
+        the directory for the cache of the mesh INCLUDE files
 
     Returns
     -------
@@ -4985,7 +5162,8 @@ def read_bdf(bdf_filename: Optional[str]=None, validate: bool=True,
     model.read_bdf(bdf_filename=bdf_filename, validate=validate,
                    xref=xref, punch=punch, read_includes=True,
                    save_file_structure=save_file_structure,
-                   encoding=encoding)
+                   encoding=encoding, n_workers=n_workers,
+                   cache_dirname=cache_dirname)
 
     #if 0:
         ### TODO: remove all the extra methods
@@ -0,0 +1,227 @@
+"""
+Defines the bulk cross-referencing used by ``BDF.cross_reference`` for
+the GRIDs and the high count elements (e.g., CQUAD4, CTRIA3, CHEXA).
+
+Rather than calling ``card.cross_reference(model)`` for each card, the
+node/property/material ids of each card type are stacked into arrays
+and looked up against the sorted ids of the model in one pass.  Every
+card with a missing reference is found at once and is left for the
+standard ``cross_reference``, so the error messages are unchanged.
+
+"""
+from __future__ import annotations
+from collections import defaultdict
+from typing import Any, TYPE_CHECKING
+
+import numpy as np
+
+from pyNastran.bdf.cards.nodes import GRID
+from pyNastran.bdf.cards.elements.shell import (
+    CQUAD4, CQUAD8, CQUADR, CSHEAR, CTRIA3, CTRIA6, CTRIAR)
+from pyNastran.bdf.cards.elements.rods import CROD, CONROD, CTUBE
+from pyNastran.bdf.cards.elements.solid import (
+    CTETRA4, CTETRA10, CPENTA6, CPENTA15, CHEXA8, CHEXA20, CPYRAM5, CPYRAM13)
+if TYPE_CHECKING:  # pragma: no cover
+    from pyNastran.bdf.bdf import BDF
+
+#: card_class : (allow_empty_nodes, ref_name, has_theta_mcid)
+#: this mirrors the card_class.cross_reference methods
+#:   allow_empty_nodes : model.EmptyNodes is used instead of model.Nodes
+#:   ref_name : 'pid' -> model.Property; 'mid' -> model.Material
+#:   has_theta_mcid : an integer theta_mcid is a coordinate system
+BULK_XREF_ELEMENTS = {
+    CTRIA3: (False, 'pid', True),
+    CTRIA6: (True, 'pid', True),
+    CTRIAR: (False, 'pid', True),
+    CQUAD4: (False, 'pid', True),
+    CQUAD8: (True, 'pid', True),
+    CQUADR: (True, 'pid', True),
+    CSHEAR: (False, 'pid', False),
+    CROD: (False, 'pid', False),
+    CTUBE: (False, 'pid', False),
+    CONROD: (False, 'mid', False),
+    CTETRA4: (False, 'pid', False),
+    CTETRA10: (True, 'pid', False),
+    CPENTA6: (False, 'pid', False),
+    CPENTA15: (True, 'pid', False),
+    CHEXA8: (False, 'pid', False),
+    CHEXA20: (True, 'pid', False),
+    CPYRAM5: (True, 'pid', False),
+    CPYRAM13: (True, 'pid', False),
+}
+
+
+class IdLookup:
+    """maps an array of ids to the card objects using a sorted id array"""
+    def __init__(self, cards: dict[int, Any]):
+        """
+        Creates the IdLookup
+
+        Parameters
+        ----------
+        cards : dict[int, card]
+            the cards to look up (e.g., model.nodes)
+
+        """
+        ncards = len(cards)
+        ids = np.fromiter(cards.keys(), dtype='int64', count=ncards)
+        objs = np.empty(ncards, dtype=object)
+        for i, card in enumerate(cards.values()):
+            objs[i] = card
+        isort = np.argsort(ids, kind='stable')
+        self.ids = ids[isort]
+        self.objs = objs[isort]
+
+    def get(self, ids: np.ndarray,
+            allow_empty: bool=False) -> tuple[np.ndarray, np.ndarray]:
+        """
+        Gets the card objects
+
+        Parameters
+        ----------
+        ids : (n, ...) int ndarray
+            the ids to look up
+        allow_empty : bool; default=False
+            an id of 0 is a blank field (None)
+
+        Returns
+        -------
+        objs : (n, ...) object ndarray
+            the card objects; undefined if is_found=False
+        is_found : (n, ...) bool ndarray
+            does the card exist
+
+        """
+        if len(self.ids) == 0:
+            objs = np.full(ids.shape, None, dtype=object)
+            is_found = np.zeros(ids.shape, dtype='bool')
+        else:
+            index = np.searchsorted(self.ids, ids)
+            index[index == len(self.ids)] = 0
+            objs = self.objs[index]
+            is_found = (self.ids[index] == ids)
+        if allow_empty:
+            is_empty = (ids == 0)
+            objs[is_empty] = None
+            is_found |= is_empty
+        return objs, is_found
+
+
+def cross_reference_nodes_bulk(model: BDF) -> bool:
+    """
+    Links the GRIDs to the coordinate systems
+
+    Returns
+    -------
+    is_xref : bool
+        False if the nodes must be cross-referenced with GRID.cross_reference
+        (e.g., there is a GRDSET or a missing coordinate system)
+
+    """
+    nodes = list(model.nodes.values())
+    if model.grdset or not nodes or not all(type(node) is GRID for node in nodes):
+        return False
+
+    nnodes = len(nodes)
+    coords = IdLookup(model.coords)
+    try:
+        cp = np.fromiter((node.cp for node in nodes), dtype='int64', count=nnodes)
+        cd = np.fromiter((node.cd for node in nodes), dtype='int64', count=nnodes)
+    except TypeError:
+        # a blank field
+        return False
+    cp_ref, is_found_cp = coords.get(cp)
+    is_cd = (cd != -1)
+    cd_ref, is_found_cd = coords.get(np.where(is_cd, cd, 0))
+    if not (is_found_cp.all() and is_found_cd[is_cd].all()):
+        return False
+
+    for node, cp_refi, cd_refi, is_cdi in zip(nodes, cp_ref.tolist(), cd_ref.tolist(),
+                                              is_cd.tolist()):
+        node.cp_ref = cp_refi
+        if is_cdi:
+            node.cd_ref = cd_refi
+    return True
+
+
+def cross_reference_elements_bulk(model: BDF) -> set[int]:
+    """
+    Links the high count elements (see BULK_XREF_ELEMENTS) to the nodes,
+    properties/materials and coordinate systems
+
+    Returns
+    -------
+    eids : set[int]
+        the elements that were cross-referenced; the other elements
+        (e.g., CBAR, an element with a missing node) must be
+        cross-referenced with element.cross_reference
+
+    """
+    eids = set()
+    if model._is_axis_symmetric and model.axif is not None:
+        # Nodes uses the GRIDBs
+        return eids
+
+    elements_by_class = defaultdict(list)
+    for elem in model.elements.values():
+        if type(elem) in BULK_XREF_ELEMENTS:
+            elements_by_class[type(elem)].append(elem)
+    if not elements_by_class:
+        return eids
+
+    # the same priority as model.Node and model.Material
+    node_lookup = IdLookup({**model.epoints, **model.spoints, **model.nodes})
+    lookups = {
+        'pid': IdLookup(model.properties),
+        'mid': IdLookup({**model.thermal_materials, **model.materials}),
+    }
+    coords = model.coords
+    for card_class, elements in elements_by_class.items():
+        allow_empty_nodes, ref_name, has_theta_mcid = BULK_XREF_ELEMENTS[card_class]
+        try:
+            if allow_empty_nodes:
+                nids = np.array([[0 if nid is None else nid for nid in elem.nodes]
+                                 for elem in elements], dtype='int64')
+            else:
+                nids = np.array([elem.nodes for elem in elements], dtype='int64')
+            ref_ids = np.array([getattr(elem, ref_name) for elem in elements], dtype='int64')
+        except (TypeError, ValueError):
+            # ragged/blank ids
+            continue
+        if nids.ndim != 2:
+            continue
+
+        nodes_ref, is_found = node_lookup.get(nids, allow_empty=allow_empty_nodes)
+        refs, is_valid = lookups[ref_name].get(ref_ids)
+        is_valid &= is_found.all(axis=1)
+
+        ivalid = np.flatnonzero(is_valid)
+        if len(ivalid) < len(elements):
+            elements = [elements[i] for i in ivalid.tolist()]
+            nodes_ref = nodes_ref[ivalid]
+            refs = refs[ivalid]
+
+        if has_theta_mcid:
+            theta_mcids = [elem.theta_mcid for elem in elements]
+            if not all(theta_mcid in coords for theta_mcid in theta_mcids
+                       if isinstance(theta_mcid, int)):
+                # leave the elements with a missing coordinate system
+                is_valid = [not isinstance(theta_mcid, int) or theta_mcid in coords
+                            for theta_mcid in theta_mcids]
+                elements = [elem for elem, is_validi in zip(elements, is_valid) if is_validi]
+                nodes_ref = nodes_ref[is_valid]
+                refs = refs[is_valid]
+            for elem in elements:
+                if isinstance(elem.theta_mcid, int):
+                    elem.theta_mcid_ref = coords[elem.theta_mcid]
+
+        if ref_name == 'pid':
+            for elem, nodes_refi, refi in zip(elements, nodes_ref.tolist(), refs.tolist()):
+                elem.nodes_ref = nodes_refi
+                elem.pid_ref = refi
+        else:
+            for elem, nodes_refi, refi in zip(elements, nodes_ref.tolist(), refs.tolist()):
+                elem.nodes_ref = nodes_refi
+                elem.mid_ref = refi
+        eids.update(elem.eid for elem in elements)
+    return eids
@@ -74,6 +74,8 @@ from typing import Any
 
 from numpy import zeros, argsort, arange, array_equal, array
 from pyNastran.bdf.bdf_interface.attributes import BDFAttributes
+from pyNastran.bdf.bdf_interface.bulk_xref import (
+    cross_reference_nodes_bulk, cross_reference_elements_bulk)
 
 class XrefMesh(BDFAttributes):
     """Links up the various cards in the BDF."""
@@ -329,12 +331,13 @@ class XrefMesh(BDFAttributes):
     def _cross_reference_nodes(self) -> None:
         """Links the nodes to coordinate systems"""
         grdset = self.grdset
-        for node in self.nodes.values():
-            try:
-                node.cross_reference(self, grdset)
-            except Exception:
-                self.log.error("Couldn't cross reference GRID.\n%s" % (str(node)))
-                raise
+        if not cross_reference_nodes_bulk(self):
+            for node in self.nodes.values():
+                try:
+                    node.cross_reference(self, grdset)
+                except Exception:
+                    self.log.error("Couldn't cross reference GRID.\n%s" % (str(node)))
+                    raise
 
         for point in self.points.values():
             try:
@@ -360,7 +363,13 @@ class XrefMesh(BDFAttributes):
         Links the elements to nodes, properties (and materials depending on
         the card).
         """
+        # the high count elements are linked at once; the rest
+        # (and any element with a missing reference) are linked one by one
+        # so the errors are the same
+        eids_xref = cross_reference_elements_bulk(self)
         for elem in self.elements.values():
+            if elem.eid in eids_xref:
+                continue
             try:
                 elem.cross_reference(self)
             except (SyntaxError, RuntimeError, AssertionError, KeyError, ValueError) as error:
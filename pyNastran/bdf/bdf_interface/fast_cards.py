@@ -0,0 +1,305 @@
+"""
+Defines the columnar fast path for the high count mesh cards, which is
+used by ``BDF.read_bdf`` when ``model.use_fast_card_parser=True``.
+
+The fixed field (small field and GRID* large field) forms of:
+ - GRID
+ - CTRIA3, CQUAD4
+ - CTETRA (4 node), CPENTA (6 node), CHEXA (8 node)
+
+are sliced into (ncards, nfields) byte arrays, which are then converted
+into integer/float columns, so the BDFCard/assign_type step is skipped.
+Any card that doesn't have the standard form (e.g., csv, tabs,
+continuation fields, shorthand floats such as 1.-3, ps on a GRID) is
+left for the standard parser, so the error messages are unchanged.
+
+"""
+from __future__ import annotations
+from collections import defaultdict
+from typing import Any, Optional, TYPE_CHECKING
+
+import numpy as np
+
+from pyNastran.bdf.bdf_interface.parallel_cards import get_parallel_card_names
+from pyNastran.bdf.cards.nodes import GRID
+from pyNastran.bdf.cards.elements.shell import CQUAD4, CTRIA3
+from pyNastran.bdf.cards.elements.solid import CTETRA4, CPENTA6, CHEXA8
+if TYPE_CHECKING:  # pragma: no cover
+    from pyNastran.bdf.bdf import BDF
+
+FAST_CARDS = {'GRID', 'CTRIA3', 'CQUAD4', 'CTETRA', 'CPENTA', 'CHEXA'}
+
+
+def parse_cards_fast(model: BDF, cards_list: list[Any]) -> dict[int, tuple[Any, None]]:
+    """
+    Creates the GRID, CTRIA3, CQUAD4, CTETRA, CPENTA and CHEXA cards
+    with the columnar parser
+
+    Parameters
+    ----------
+    model : BDF
+        the model to add the cards to (used for the active cards)
+    cards_list : list[card]
+        card : [card_name, comment, card_lines, (ifile, iline)]
+
+    Returns
+    -------
+    parsed_cards : dict[icard] = (class_instance, None)
+        icard : the index into cards_list
+        the cards that weren't parsed must be parsed by the standard reader
+
+    """
+    if model._is_dynamic_syntax or model.echo:
+        return {}
+    card_names = get_parallel_card_names(model).intersection(FAST_CARDS)
+    if not card_names:
+        return {}
+
+    # (card_name, is_large_field) : icards
+    icards_by_form = defaultdict(list)
+    for icard, card in enumerate(cards_list):
+        card_name = card[0]
+        if card_name == 'ECHOON':
+            # the echo flag is stateful
+            return {}
+        if card_name not in card_names:
+            continue
+        card_lines = card[2]
+        nlines = len(card_lines)
+        line0 = card_lines[0]
+        if nlines == 1:
+            if card_name == 'CHEXA' or '*' in line0:
+                continue
+            is_large_field = False
+        elif nlines == 2:
+            line1 = card_lines[1]
+            if card_name == 'GRID':
+                if '*' not in line0 or '*' not in line1:
+                    continue
+                is_large_field = True
+            elif card_name == 'CHEXA':
+                if '*' in line0 or '*' in line1:
+                    continue
+                is_large_field = False
+            else:
+                continue
+        else:
+            continue
+
+        lines = line0 if nlines == 1 else line0 + line1
+        if ',' in lines or '\t' in lines or '=' in lines or not lines.isascii():
+            continue
+        icards_by_form[(card_name, is_large_field)].append(icard)
+
+    parsed_cards = {}
+    for (card_name, is_large_field), icards in icards_by_form.items():
+        card_lines_list = [cards_list[icard][2] for icard in icards]
+        fields = card_lines_to_field_array(card_lines_list, is_large_field)
+        if card_name == 'GRID':
+            ivalid, objs = _create_grids(fields)
+        elif card_name in ('CTRIA3', 'CQUAD4'):
+            ivalid, objs = _create_shells(card_name, fields)
+        else:
+            ivalid, objs = _create_solids(card_name, fields)
+
+        for i, obj in zip(ivalid, objs):
+            icard = icards[i]
+            comment = cards_list[icard][1]
+            if comment:
+                obj.comment = comment
+            parsed_cards[icard] = (obj, None)
+    return parsed_cards
+
+
+def card_lines_to_field_array(card_lines_list: list[list[str]],
+                              is_large_field: bool) -> np.ndarray:
+    """
+    Slices the fixed field cards into a (ncards, nfields) bytes array.
+    The card name and the continuation markers aren't included, so the
+    first column is field 1 (e.g., the GRID id).
+
+    Parameters
+    ----------
+    card_lines_list : list[card_lines]
+        card_lines : list[str]
+            the lines of a card; all cards must have the same number of lines
+    is_large_field : bool
+        16 character fields (GRID*) vs. 8 character fields
+
+    Returns
+    -------
+    fields : (ncards, nfields) bytes ndarray
+        the unstripped fields with the 'S8' or 'S16' dtype
+
+    """
+    width = 16 if is_large_field else 8
+    nlines = len(card_lines_list[0])
+    lines = ''.join([line[8:72].ljust(64)
+                     for card_lines in card_lines_list
+                     for line in card_lines])
+    nfields = nlines * 64 // width
+    fields = np.frombuffer(lines.encode('ascii'), dtype=f'S{width:d}').reshape(
+        len(card_lines_list), nfields)
+    return fields
+
+
+def _integer_column(column: np.ndarray,
+                    default: Optional[int | np.ndarray]=None) -> tuple[np.ndarray, np.ndarray]:
+    """
+    Casts a column of fields to integers
+
+    Parameters
+    ----------
+    column : (ncards, ) bytes ndarray
+        the fields
+    default : int / (ncards, ) int ndarray / None
+        None : the field is required
+        the value for a blank field
+
+    Returns
+    -------
+    values : (ncards, ) int64 ndarray
+        the values
+    is_valid : (ncards, ) bool ndarray
+        False if the field requires the standard parser
+
+    """
+    svalues = np.char.strip(column)
+    is_int = np.char.isdigit(svalues)
+    values = np.where(is_int, svalues, b'0').astype('int64')
+    if default is None:
+        return values, is_int
+
+    is_blank = (svalues == b'')
+    if isinstance(default, np.ndarray):
+        values[is_blank] = default[is_blank]
+    else:
+        values[is_blank] = default
+    return values, is_int | is_blank
+
+
+def _double_column(column: np.ndarray,
+                   default: Optional[float]=None) -> tuple[np.ndarray, np.ndarray]:
+    """
+    Casts a column of fields to floats.  Only fields with a decimal
+    point that Python can cast (e.g., 1.0, -.5, 1.2e+3) are supported.
+
+    Parameters
+    ----------
+    column : (ncards, ) bytes ndarray
+        the fields
+    default : float / None
+        None : the field is required
+        the value for a blank field
+
+    Returns
+    -------
+    values : (ncards, ) float64 ndarray
+        the values
+    is_valid : (ncards, ) bool ndarray
+        False if the field requires the standard parser
+
+    """
+    svalues = np.char.strip(column)
+    is_float = np.char.find(svalues, b'.') >= 0
+    try:
+        values = np.where(is_float, svalues, b'0.').astype('float64')
+    except ValueError:
+        # shorthand (e.g., 1.-3) or an invalid field
+        values = np.zeros(len(svalues), dtype='float64')
+        for i in np.where(is_float)[0]:
+            try:
+                values[i] = float(svalues[i])
+            except ValueError:
+                is_float[i] = False
+
+    if default is None:
+        return values, is_float
+    is_blank = (svalues == b'')
+    values[is_blank] = default
+    return values, is_float | is_blank
+
+
+def _blank_columns(fields: np.ndarray) -> np.ndarray:
+    """are all the fields blank"""
+    return (np.char.strip(fields) == b'').all(axis=1)
+
+
+def _create_grids(fields: np.ndarray) -> tuple[np.ndarray, list[GRID]]:
+    """creates the GRIDs from the (ncards, 8) field array"""
+    nid, is_valid = _integer_column(fields[:, 0])
+    cp, is_valid_cp = _integer_column(fields[:, 1], default=0)
+    x1, is_valid_x1 = _double_column(fields[:, 2], default=0.)
+    x2, is_valid_x2 = _double_column(fields[:, 3], default=0.)
+    x3, is_valid_x3 = _double_column(fields[:, 4], default=0.)
+    cd, is_valid_cd = _integer_column(fields[:, 5], default=0)
+    seid, is_valid_seid = _integer_column(fields[:, 7], default=0)
+    is_valid &= (is_valid_cp & is_valid_x1 & is_valid_x2 & is_valid_x3 &
+                 is_valid_cd & is_valid_seid & _blank_columns(fields[:, [6]]))
+
+    ivalid = np.where(is_valid)[0]
+    xyz = np.column_stack([x1, x2, x3])[ivalid].tolist()
+    objs = [GRID(nidi, xyzi, cpi, cdi, '', seidi)
+            for nidi, xyzi, cpi, cdi, seidi in zip(
+                nid[ivalid].tolist(), xyz, cp[ivalid].tolist(),
+                cd[ivalid].tolist(), seid[ivalid].tolist())]
+    return ivalid, objs
+
+
+def _create_shells(card_name: str, fields: np.ndarray) -> tuple[np.ndarray, list[Any]]:
+    """creates the CTRIA3/CQUAD4s from the (ncards, 8) field array"""
+    nnodes = 3 if card_name == 'CTRIA3' else 4
+    eid, is_valid = _integer_column(fields[:, 0])
+    pid, is_valid_pid = _integer_column(fields[:, 1], default=eid)
+    is_valid &= is_valid_pid
+    nids = np.zeros((len(eid), nnodes), dtype='int64')
+    for inode in range(nnodes):
+        nids[:, inode], is_valid_nid = _integer_column(fields[:, 2 + inode])
+        is_valid &= is_valid_nid
+
+    # theta_mcid may be an integer (mcid) or a float (theta)
+    itheta = 2 + nnodes
+    mcid, is_mcid = _integer_column(fields[:, itheta])
+    theta, is_valid_theta = _double_column(fields[:, itheta], default=0.)
+    zoffset, is_valid_zoffset = _double_column(fields[:, itheta + 1], default=0.)
+    is_valid &= (is_mcid | is_valid_theta) & is_valid_zoffset
+    if card_name == 'CTRIA3':
+        is_valid &= _blank_columns(fields[:, [7]])
+
+    ivalid = np.where(is_valid)[0]
+    theta_mcids = [mcidi if is_mcidi else thetai
+                   for mcidi, is_mcidi, thetai in zip(
+                       mcid[ivalid].tolist(), is_mcid[ivalid].tolist(), theta[ivalid].tolist())]
+    args = zip(eid[ivalid].tolist(), pid[ivalid].tolist(), nids[ivalid, :].tolist(),
+               theta_mcids, zoffset[ivalid].tolist())
+    if card_name == 'CTRIA3':
+        objs = [CTRIA3(eidi, pidi, nidsi, zoffset=zoffseti, theta_mcid=theta_mcidi)
+                for eidi, pidi, nidsi, theta_mcidi, zoffseti in args]
+    else:
+        objs = [CQUAD4(eidi, pidi, nidsi, theta_mcidi, zoffseti)
+                for eidi, pidi, nidsi, theta_mcidi, zoffseti in args]
+    return ivalid, objs
+
+
+def _create_solids(card_name: str, fields: np.ndarray) -> tuple[np.ndarray, list[Any]]:
+    """creates the CTETRA4/CPENTA6/CHEXA8s from the (ncards, nfields) field array"""
+    card_class, nnodes = {
+        'CTETRA': (CTETRA4, 4),
+        'CPENTA': (CPENTA6, 6),
+        'CHEXA': (CHEXA8, 8),
+    }[card_name]
+    eid, is_valid = _integer_column(fields[:, 0])
+    pid, is_valid_pid = _integer_column(fields[:, 1])
+    is_valid &= is_valid_pid
+    nids = np.zeros((len(eid), nnodes), dtype='int64')
+    for inode in range(nnodes):
+        nids[:, inode], is_valid_nid = _integer_column(fields[:, 2 + inode])
+        is_valid &= is_valid_nid
+    if fields.shape[1] > 2 + nnodes:
+        is_valid &= _blank_columns(fields[:, 2 + nnodes:])
+
+    ivalid = np.where(is_valid)[0]
+    objs = [card_class(eidi, pidi, nidsi)
+            for eidi, pidi, nidsi in zip(
+                eid[ivalid].tolist(), pid[ivalid].tolist(), nids[ivalid, :].tolist())]
+    return ivalid, objs
@@ -0,0 +1,210 @@
+"""
+Defines the INCLUDE file cache used by ``read_bdf(..., cache_dirname=...)``
+
+A mesh INCLUDE file (e.g., only GRID/CQUAD4/CHEXA cards) is parsed once
+and the card objects are pickled to the cache directory.  The cache file
+is keyed on the INCLUDE path and is valid when the modification time and
+size or the content hash (sha1) of the INCLUDE file match.
+
+When the cache is valid, the INCLUDE is replaced by a single placeholder
+card, so the lines aren't read, split into decks or parsed.  The card
+objects are then added in the place of the placeholder card in deck
+order, so the model and card_count are the same as without the cache.
+
+"""
+from __future__ import annotations
+import os
+import hashlib
+from pickle import load, dump, HIGHEST_PROTOCOL
+from typing import Any
+
+from cpylog import SimpleLogger
+
+import pyNastran
+
+#: the name of the card that holds the place of a cached INCLUDE file
+CACHED_INCLUDE_CARD = 'INCCACHE'
+
+#: increment when the cache file changes
+CACHE_VERSION = 1
+
+#: files with these words aren't cached
+NOT_CACHED_WORDS = ('INCLUDE', 'BEGIN', 'ENDDATA', 'CEND', 'ECHO', 'BAROR', 'BEAMOR')
+
+
+class IncludeCache:
+    """stores the card objects of the mesh INCLUDE files"""
+    def __init__(self, cache_dirname: str, encoding: str, log: SimpleLogger):
+        """
+        Creates the IncludeCache
+
+        Parameters
+        ----------
+        cache_dirname : str
+            the directory for the cache files; created if it doesn't exist
+        encoding : str
+            the unicode encoding
+        log : SimpleLogger
+            the logger
+
+        """
+        self.cache_dirname = cache_dirname
+        self.encoding = encoding
+        self.log = log
+
+        #: ifile : (abs_filename, include_comment, header)
+        #: the INCLUDE files that can be saved to the cache
+        self.uncached_files: dict[int, tuple[str, str, dict[str, Any]]] = {}
+
+        #: ifile : (header, cards)
+        #: the INCLUDE files that were loaded from the cache
+        self.cached_files: dict[int, tuple[dict[str, Any], list[tuple[str, Any]]]] = {}
+
+    def get_cache_filename(self, abs_filename: str) -> str:
+        """gets the cache filename for an INCLUDE file"""
+        path_hash = hashlib.sha1(abs_filename.encode('utf8')).hexdigest()[:16]
+        basename = os.path.basename(abs_filename)
+        return os.path.join(self.cache_dirname, f'{basename}.{path_hash}.pkl')
+
+    def _get_header(self, abs_filename: str) -> dict[str, Any]:
+        """gets the key of the cache file"""
+        stat = os.stat(abs_filename)
+        with open(abs_filename, 'rb') as include_file:
+            sha1 = hashlib.sha1(include_file.read()).hexdigest()
+        header = {
+            'version': CACHE_VERSION,
+            'pyNastran': pyNastran.__version__,
+            'filename': abs_filename,
+            'encoding': self.encoding,
+            'mtime': stat.st_mtime_ns,
+            'size': stat.st_size,
+            'sha1': sha1,
+        }
+        return header
+
+    def load(self, ifile: int, abs_filename: str) -> bool:
+        """
+        Loads the cached cards for an INCLUDE file
+
+        Parameters
+        ----------
+        ifile : int
+            the file index
+        abs_filename : str
+            the INCLUDE file
+
+        Returns
+        -------
+        is_cached : bool
+            the cache is valid and the cards were loaded
+
+        """
+        cache_filename = self.get_cache_filename(abs_filename)
+        if not os.path.exists(cache_filename) or not os.path.isfile(abs_filename):
+            return False
+
+        try:
+            with open(cache_filename, 'rb') as cache_file:
+                header = load(cache_file)
+                is_valid = (
+                    header['version'] == CACHE_VERSION and
+                    header['pyNastran'] == pyNastran.__version__ and
+                    header['filename'] == abs_filename and
+                    header['encoding'] == self.encoding)
+                if is_valid:
+                    stat = os.stat(abs_filename)
+                    if (header['mtime'], header['size']) != (stat.st_mtime_ns, stat.st_size):
+                        # the file was touched, so check the contents
+                        is_valid = (header['size'] == stat.st_size and
+                                    header['sha1'] == self._get_header(abs_filename)['sha1'])
+                if not is_valid:
+                    return False
+                cards = load(cache_file)
+        except Exception as error:  # a corrupt/old cache file is a cache miss
+            self.log.warning(f'failed to load the cache file {cache_filename!r}: {error}')
+            return False
+
+        self.log.debug(f'loading {abs_filename!r} from {cache_filename!r}')
+        self.cached_files[ifile] = (header, cards)
+        return True
+
+    def add_uncached_file(self, ifile: int, abs_filename: str,
+                          include_comment: str, lines: list[str]) -> None:
+        """
+        Flags an INCLUDE file that was read, so it may be saved to the cache
+
+        Parameters
+        ----------
+        ifile : int
+            the file index
+        abs_filename : str
+            the INCLUDE file
+        include_comment : str
+            the comment that precedes the INCLUDE lines
+        lines : list[str]
+            the lines of the INCLUDE file
+
+        """
+        upper_lines = ''.join(lines).upper()
+        if any(word in upper_lines for word in NOT_CACHED_WORDS):
+            return
+        header = self._get_header(abs_filename)
+        self.uncached_files[ifile] = (abs_filename, include_comment.strip()[1:], header)
+
+    def save(self, ifile: int, cards: list[tuple[str, Any]], comment: str) -> bool:
+        """
+        Saves the card objects of an INCLUDE file
+
+        Parameters
+        ----------
+        ifile : int
+            the file index
+        cards : list[(card_name, class_instance)]
+            the cards in deck order
+        comment : str
+            the unprocessed comment of the first card
+
+        Returns
+        -------
+        is_saved : bool
+            was the cache file written
+
+        """
+        abs_filename, include_comment, header = self.uncached_files.pop(ifile)
+        # the comment of the first card starts with the comments that precede
+        # the INCLUDE in the parent file, which aren't cached
+        icomment = comment.find(include_comment)
+        if icomment == -1:
+            return False
+        header['comment'] = comment[icomment + len(include_comment):]
+
+        cache_filename = self.get_cache_filename(abs_filename)
+        os.makedirs(self.cache_dirname, exist_ok=True)
+        self.log.debug(f'saving {abs_filename!r} to {cache_filename!r}')
+        with open(cache_filename, 'wb') as cache_file:
+            dump(header, cache_file, protocol=HIGHEST_PROTOCOL)
+            dump(cards, cache_file, protocol=HIGHEST_PROTOCOL)
+        return True
+
+    def pop_cards(self, ifile: int, comment: str) -> list[tuple[str, Any]]:
+        """
+        Gets the cached cards for an INCLUDE file
+
+        Parameters
+        ----------
+        ifile : int
+            the file index
+        comment : str
+            the unprocessed comment of the placeholder card, which
+            replaces the parent file comments on the first card
+
+        Returns
+        -------
+        cards : list[(card_name, class_instance)]
+            the cards in deck order
+
+        """
+        header, cards = self.cached_files.pop(ifile)
+        if cards:
+            cards[0][1].comment = comment + header['comment']
+        return cards
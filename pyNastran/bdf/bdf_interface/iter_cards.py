@@ -0,0 +1,444 @@
+"""
+Defines the streaming BDF reader, which goes file -> line -> card -> object
+without holding the deck as a list of lines or cards:
+ - iter_bdf_lines: yields the bulk data lines (INCLUDE files are read lazily)
+ - iter_bdf_card_lines: yields the unparsed cards
+ - iter_bdf_cards: yields the card objects
+ - read_bdf_stream: adds the cards to a BDF one at a time
+
+Only the lines of the current card are in memory, so a few card types
+may be pulled from a deck that doesn't fit in memory:
+
+.. code-block:: python
+
+   >>> for grid in iter_bdf_cards('fem.bdf', card_types=['GRID']):
+   ...     print(grid.nid, grid.xyz)
+
+The executive/case control decks are skipped and the main bulk data
+section ends at ENDDATA or at the first superelement/auxmodel section.
+
+"""
+from __future__ import annotations
+import os
+import sys
+from io import StringIO
+from collections import deque
+from itertools import count
+from typing import Any, Iterable, Iterator, Optional, Union, TYPE_CHECKING
+
+from cpylog import get_logger2
+
+from pyNastran.utils import _filename
+from pyNastran.bdf.bdf_interface.include_file import get_include_filename
+from pyNastran.bdf.bdf_interface.pybdf import (
+    _clean_comment, _is_begin_bulk, _is_bulk_data_line)
+from pyNastran.bdf.bdf_interface.parallel_cards import (
+    PARALLEL_SOLID_CLASSES, card_lines_to_card_obj)
+if TYPE_CHECKING:  # pragma: no cover
+    from cpylog import SimpleLogger
+    from pyNastran.bdf.bdf import BDF
+
+
+def iter_bdf_lines(bdf_filename: Union[str, StringIO],
+                   punch: Optional[bool]=False,
+                   read_includes: bool=True,
+                   encoding: Optional[str]=None,
+                   log: Optional[SimpleLogger]=None) -> Iterator[tuple[str, tuple[int, int]]]:
+    """
+    Yields the bulk data lines of a BDF
+
+    Parameters
+    ----------
+    bdf_filename : str / StringIO
+        the main bdf_filename
+    punch : bool / None; default=False
+        is this a punch file
+        None : guess
+        True : no executive/case control decks
+        False : executive/case control decks exist
+    read_includes : bool; default=True
+        should INCLUDE files be read
+    encoding : str; default=None -> system default
+        the unicode encoding
+    log : logger(); default=None
+        a logger
+
+    Yields
+    ------
+    line : str
+        the line; right stripped if punch is not True
+    ifile_iline : (int, int)
+        the file index and the line index in that file; the same as
+        read_bdf's bulk_data_ilines
+
+    """
+    if encoding is None:
+        encoding = sys.getdefaultencoding()
+    log = get_logger2(log, debug=False)
+
+    is_file_obj = hasattr(bdf_filename, 'read')
+    include_dir = '' if is_file_obj else os.path.dirname(os.path.abspath(bdf_filename))
+    lines = _iter_file_lines(bdf_filename, ifile=0, include_dir=include_dir,
+                             ifile_counter=count(1), active_filenames=[],
+                             read_includes=read_includes, encoding=encoding, log=log)
+
+    # like read_bdf, the lines of a punch file aren't stripped
+    is_stripped = punch is not True
+    is_bulk = punch is True
+    for line, ifile_iline in lines:
+        line_upper = line.split('$')[0].strip().upper()
+        if not is_bulk:
+            if punch is None and line_upper and _is_bulk_data_line(line):
+                # it's a punch file
+                punch = is_bulk = True
+            elif line_upper.startswith('BEGIN') and _is_begin_bulk(line_upper):
+                is_bulk = True
+                continue
+            else:
+                if line_upper:
+                    punch = False
+                continue
+
+        if line_upper.startswith('BEGIN'):
+            log.debug(f'stopping at {line.strip()!r}; only the main bulk data is read')
+            break
+        yield (line.rstrip() if is_stripped else line), ifile_iline
+        if line_upper.startswith('ENDDATA'):
+            break
+    lines.close()
+
+
+def _iter_file_lines(bdf_filename: Union[str, StringIO], ifile: int,
+                     include_dir: str, ifile_counter: Iterator[int],
+                     active_filenames: list[str],
+                     read_includes: bool, encoding: str,
+                     log: SimpleLogger) -> Iterator[tuple[str, tuple[int, int]]]:
+    """yields the lines of a file with the INCLUDE files spliced in"""
+    if hasattr(bdf_filename, 'read'):
+        yield from _iter_open_file_lines(
+            bdf_filename, ifile, include_dir, ifile_counter, active_filenames,
+            read_includes, encoding, log)
+        return
+
+    if bdf_filename in active_filenames:
+        msg = 'bdf_filename=%s is already active.\nactive_filenames=%s' % (
+            bdf_filename, active_filenames)
+        raise RuntimeError(msg)
+    log.debug('opening %r' % bdf_filename)
+    active_filenames.append(bdf_filename)
+    with open(_filename(bdf_filename), 'r', encoding=encoding) as bdf_file:
+        yield from _iter_open_file_lines(
+            bdf_file, ifile, include_dir, ifile_counter, active_filenames,
+            read_includes, encoding, log)
+    active_filenames.pop()
+
+
+def _iter_open_file_lines(bdf_file: Any, ifile: int,
+                          include_dir: str, ifile_counter: Iterator[int],
+                          active_filenames: list[str],
+                          read_includes: bool, encoding: str,
+                          log: SimpleLogger) -> Iterator[tuple[str, tuple[int, int]]]:
+    """see ``_iter_file_lines``"""
+    lines = enumerate(bdf_file)
+    for iline, line in lines:
+        line_stripped = line.rstrip('\r\n\t')
+        if not line_stripped.upper().startswith('INCLUDE'):
+            yield line, (ifile, iline)
+            continue
+
+        include_lines = _get_include_lines(lines, line_stripped)
+        if not read_includes:
+            continue
+        bdf_filename2 = get_include_filename(include_lines, include_dir=include_dir)
+        abs_filename2 = os.path.join(include_dir, bdf_filename2)
+        if not os.path.isfile(_filename(abs_filename2)):
+            raise IOError('No such bdf_filename: %r\ninclude_lines = %s' % (
+                abs_filename2, include_lines))
+
+        # the same comment as BDFInputPy._update_include
+        yield '\n$ INCLUDE processed:  %s\n' % bdf_filename2, (ifile, iline)
+        yield from _iter_file_lines(abs_filename2, next(ifile_counter), include_dir,
+                                    ifile_counter, active_filenames,
+                                    read_includes, encoding, log)
+
+
+def _get_include_lines(lines: Iterator[tuple[int, str]], line: str) -> list[str]:
+    """
+    Gets the lines for the include file; see ``BDFInputPy._get_include_lines``
+
+    INCLUDE 'Satellite_V02_INCLUDE:Satellite_V02_Panneau_Externe.dat'
+    INCLUDE '../../BULK/COORDS/satellite_V02_Coord.blk'
+    """
+    line_base = line.split('$')[0]
+    include_lines = [line_base.strip()]
+    if "'" not in line_base:
+        return include_lines
+
+    line_base = line_base[8:].strip()
+    if line_base.startswith("'") and line_base.endswith("'"):
+        return include_lines
+
+    while not line.split('$')[0].endswith("'"):
+        try:
+            unused_iline, line = next(lines)
+        except StopIteration:
+            msg = 'There was an invalid filename found while parsing (index).\n'
+            msg += 'include_lines = %s' % include_lines
+            raise IndexError(msg)
+        line = line.split('$')[0].strip()
+        include_lines.append(line)
+    return include_lines
+
+
+def iter_bdf_card_lines(bdf_filename: Union[str, StringIO],
+                        card_types: Optional[Iterable[str]]=None,
+                        punch: Optional[bool]=False,
+                        read_includes: bool=True,
+                        encoding: Optional[str]=None,
+                        log: Optional[SimpleLogger]=None) -> Iterator[list[Any]]:
+    """
+    Yields the unparsed bulk data cards of a BDF
+
+    Parameters
+    ----------
+    bdf_filename : str / StringIO
+        the main bdf_filename
+    card_types : list[str]; default=None -> all cards
+        the cards to yield (e.g., ['GRID', 'CQUAD4']); the replicated
+        cards (e.g., '=,*1') after a card in card_types are also yielded
+    punch / read_includes / encoding / log
+        see ``iter_bdf_lines``
+
+    Yields
+    ------
+    card : [card_name, comment, card_lines, (ifile, iline)]
+        the same form as BDF.get_bdf_cards; the ENDDATA card is the
+        last card
+
+    """
+    if card_types is not None:
+        card_types = set(card_types)
+
+    lines = iter_bdf_lines(bdf_filename, punch=punch, read_includes=read_includes,
+                           encoding=encoding, log=log)
+    card_name = None
+    ifile_iline = None
+    card_lines = []
+    full_comment = ''
+    backup_comment = ''
+    is_skipped = False
+    for line, ifile_iline_new in lines:
+        comment = ''
+        if '$' in line:
+            line, comment = line.split('$', 1)
+
+        card_name_new = line.split(',', 1)[0].split('\t', 1)[0][:8].rstrip().upper()
+        if card_name_new and card_name_new[0] not in ['+', '*']:
+            if card_lines:
+                yield [card_name, full_comment.rstrip(), card_lines, ifile_iline]
+            card_lines = []
+            full_comment = ''
+            ifile_iline = ifile_iline_new
+            card_name = card_name_new.rstrip(' *')
+            if card_name == 'ENDDATA':
+                if card_types is None or card_name in card_types:
+                    yield [card_name, '', [line], ifile_iline]
+                return
+            if '=' not in card_name:
+                # a replicated card is kept if the card before it is kept
+                is_skipped = card_types is not None and card_name not in card_types
+
+        comment = _clean_comment(comment)
+        if line.rstrip():
+            if is_skipped:
+                # the comments belong to the skipped card
+                backup_comment = ''
+                continue
+            card_lines.append(line)
+            if backup_comment:
+                if comment:
+                    full_comment += backup_comment + comment + '\n'
+                else:
+                    full_comment += backup_comment
+                backup_comment = ''
+            elif comment:
+                full_comment += comment + '\n'
+        elif comment:
+            backup_comment += comment + '\n'
+
+    if card_lines:
+        yield [card_name, (backup_comment + full_comment).rstrip(), card_lines, ifile_iline]
+
+
+def iter_bdf_cards(bdf_filename: Union[str, StringIO],
+                   card_types: Optional[Iterable[str]]=None,
+                   punch: Optional[bool]=False,
+                   read_includes: bool=True,
+                   encoding: Optional[str]=None,
+                   log: Optional[SimpleLogger]=None,
+                   debug: Optional[bool]=False) -> Iterator[Any]:
+    """
+    Yields the card objects of a BDF.  The cards aren't added to a model
+    or cross-referenced.
+
+    Cards that need the other cards in the deck (e.g., the CBAR/BAROR
+    defaults, the DMIG columns, replication) aren't supported; use
+    ``read_bdf_stream`` or ``iter_bdf_card_lines`` for those.
+
+    Parameters
+    ----------
+    bdf_filename : str / StringIO
+        the main bdf_filename
+    card_types : list[str]; default=None -> all supported cards
+        the cards to yield (e.g., ['GRID', 'CQUAD4'])
+    punch / read_includes / encoding / log
+        see ``iter_bdf_lines``
+    debug : bool; default=False
+        the debug level for the logger
+
+    Yields
+    ------
+    card : BaseCard
+        the card object (e.g., GRID, CQUAD4)
+
+    """
+    from pyNastran.bdf.bdf import BDF
+    model = BDF(log=log, debug=debug)
+    model.punch = punch
+    model._encoding = encoding if encoding is not None else sys.getdefaultencoding()
+    _parse_primary_file_header(model, bdf_filename)
+    card_parser = model._card_parser
+    if card_types is not None:
+        card_types = set(card_types)
+        unsupported_cards = [card_name for card_name in sorted(card_types)
+                             if card_name not in card_parser and
+                             card_name not in PARALLEL_SOLID_CLASSES]
+        if unsupported_cards:
+            raise NotImplementedError(f'iter_bdf_cards does not support {unsupported_cards}; '
+                                      'use read_bdf_stream')
+
+    cards = iter_bdf_card_lines(bdf_filename, card_types=card_types, punch=model.punch,
+                                read_includes=read_includes, encoding=model._encoding,
+                                log=model.log)
+    for card_name, comment, card_lines, unused_ifile_iline in cards:
+        if '=' in card_name:
+            raise NotImplementedError(f'iter_bdf_cards does not support replication\n{card_lines}')
+        if card_name in card_parser:
+            card_class = card_parser[card_name][0]
+        elif card_name in PARALLEL_SOLID_CLASSES:
+            card_class = None
+        else:
+            continue
+
+        card_obj = card_lines_to_card_obj(card_lines, card_name)
+        if card_class is None:
+            nfields, card_class_low, card_class_high = PARALLEL_SOLID_CLASSES[card_name]
+            card_class = card_class_low if len(card_obj) == nfields else card_class_high
+        yield card_class.add_card(card_obj, comment=comment)
+
+
+def read_bdf_stream(bdf_filename: Union[str, StringIO],
+                    card_types: Optional[Iterable[str]]=None,
+                    punch: Optional[bool]=False,
+                    read_includes: bool=True,
+                    encoding: Optional[str]=None,
+                    xref: bool=False,
+                    log: Optional[SimpleLogger]=None,
+                    debug: Optional[bool]=True,
+                    mode: str='msc') -> BDF:
+    """
+    Creates a BDF from the streamed bulk data, so the deck is never held
+    as a list of lines or cards.  The executive/case control decks aren't
+    read.
+
+    Parameters
+    ----------
+    bdf_filename : str / StringIO
+        the main bdf_filename
+    card_types : list[str]; default=None -> all cards
+        the cards to read (e.g., ['GRID', 'CQUAD4'])
+    punch / read_includes / encoding
+        see ``iter_bdf_lines``
+    xref : bool; default=False
+        should the bdf be cross referenced; typically not possible if
+        card_types is used
+    log : logger(); default=None
+        a logger
+    debug : bool; default=True
+        the debug level for the logger
+    mode : str; default='msc'
+        the type of Nastran
+
+    Returns
+    -------
+    model : BDF()
+        the model
+
+    """
+    from pyNastran.bdf.bdf import BDF, _check_replicated_cards
+    from pyNastran.bdf.bdf_interface.utils import fill_dmigs
+    model = BDF(log=log, debug=debug, mode=mode)
+    model.punch = punch
+    model._encoding = encoding if encoding is not None else sys.getdefaultencoding()
+    model.log.debug(f'---starting read_bdf_stream of {bdf_filename}---')
+    _parse_primary_file_header(model, bdf_filename)
+
+    cards = iter_bdf_card_lines(bdf_filename, card_types=card_types, punch=model.punch,
+                                read_includes=read_includes, encoding=model._encoding,
+                                log=model.log)
+    # the replicated cards only need the previous 2 cards
+    recent_cards = deque(maxlen=3)
+    for card in cards:
+        card_name, comment, card_lines, (ifile, unused_iline) = card
+        recent_cards.append(card)
+        if card_name == 'ENDDATA':
+            model.card_count['ENDDATA'] = 1
+            break
+        if '=' in card_name:
+            replicated_cards = model._expand_replication(
+                card_name, len(recent_cards) - 1, recent_cards, card_lines)
+            _check_replicated_cards(replicated_cards)
+            for replicated_card in replicated_cards:
+                model.add_card(replicated_card, replicated_card[0], comment=comment,
+                               is_list=True, has_none=True)
+            continue
+        if model.is_reject(card_name):
+            model.reject_card_lines(card_name, card_lines, comment=comment)
+        else:
+            model.add_card(card_lines, card_name, comment=comment, ifile=ifile,
+                           is_list=False, has_none=False)
+
+    model.pop_parse_errors()
+    fill_dmigs(model)
+    model.cross_reference(xref=xref)
+    model._xref = xref
+    model.log.debug(f'---finished read_bdf_stream of {bdf_filename}---')
+    return model
+
+
+def _parse_primary_file_header(model: BDF, bdf_filename: Union[str, StringIO]) -> None:
+    """
+    Extracts the encoding, nastran_format, and punch flag from the
+    $ pyNastran lines of the primary BDF; see
+    ``BDF._parse_primary_file_header``, which reads the entire file
+
+    """
+    from pyNastran.bdf.bdf import map_update
+    if hasattr(bdf_filename, 'read'):
+        header_lines = _read_header_lines(bdf_filename)
+        bdf_filename.seek(0)
+    else:
+        with open(_filename(bdf_filename), 'r', errors='replace') as bdf_file:
+            header_lines = _read_header_lines(bdf_file)
+    model._check_pynastran_header(header_lines, check_header=True)
+    map_update(model, model.nastran_format)
+
+
+def _read_header_lines(bdf_file: Any) -> list[str]:
+    """reads the comment lines at the top of the file"""
+    header_lines = []
+    for line in bdf_file:
+        if not line.startswith('$'):
+            break
+        header_lines.append(line)
+    return header_lines
@@ -0,0 +1,175 @@
+"""
+Defines the parallel bulk data parser used by ``read_bdf(..., n_workers=4)``
+
+The high count cards (e.g., GRID, CQUAD4, CTRIA3, CHEXA) don't depend
+on any other card, so they may be created in a process pool.  The cards
+are chunked by card type, the card objects are created in the workers
+and are then added to the model in the original order of the deck,
+so the model, ``card_count`` and the stored parsing errors are the same
+as for the serial reader.
+
+"""
+from __future__ import annotations
+from collections import defaultdict
+from concurrent.futures import ProcessPoolExecutor
+from typing import Any, Optional, TYPE_CHECKING
+
+from pyNastran.bdf.bdf_interface.utils import to_fields
+from pyNastran.bdf.bdf_interface.bdf_card import BDFCard
+from pyNastran.bdf.cards.utils import wipe_empty_fields
+from pyNastran.bdf.cards.nodes import GRID
+from pyNastran.bdf.cards.elements.shell import (
+    CQUAD4, CQUAD8, CQUADR, CSHEAR, CTRIA3, CTRIA6, CTRIAR)
+from pyNastran.bdf.cards.elements.rods import CROD, CONROD, CTUBE
+from pyNastran.bdf.cards.elements.solid import (
+    CTETRA4, CTETRA10, CPENTA6, CPENTA15, CHEXA8, CHEXA20, CPYRAM5, CPYRAM13)
+if TYPE_CHECKING:  # pragma: no cover
+    from pyNastran.bdf.bdf import BDF
+
+#: the cards that are created with card_class.add_card(card_obj)
+PARALLEL_CARD_CLASSES = {
+    'GRID': GRID,
+    'CROD': CROD, 'CONROD': CONROD, 'CTUBE': CTUBE,
+    'CTRIA3': CTRIA3, 'CTRIA6': CTRIA6, 'CTRIAR': CTRIAR,
+    'CQUAD4': CQUAD4, 'CQUAD8': CQUAD8, 'CQUADR': CQUADR, 'CSHEAR': CSHEAR,
+}
+
+#: the solid cards, where the class depends on the number of fields
+#: card_name : (nfields, low_order_class, high_order_class)
+PARALLEL_SOLID_CLASSES = {
+    'CTETRA': (7, CTETRA4, CTETRA10),
+    'CPYRAM': (8, CPYRAM5, CPYRAM13),
+    'CPENTA': (9, CPENTA6, CPENTA15),
+    'CHEXA': (11, CHEXA8, CHEXA20),
+}
+
+#: the minimum number of cards sent to a worker
+MIN_CHUNK_SIZE = 1000
+
+
+def card_lines_to_card_obj(card_lines: list[str], card_name: str) -> BDFCard:
+    """see ``BDF.create_card_object`` with is_list=False, has_none=False"""
+    card = wipe_empty_fields(to_fields(card_lines, card_name))
+    return BDFCard(card, has_none=False)
+
+
+def create_card_objects(card_name: str,
+                        cards: list[tuple[str, list[str]]]) -> list[tuple[Any, Optional[Exception]]]:
+    """
+    Creates the card objects for a chunk of a single card type
+
+    Parameters
+    ----------
+    card_name : str
+        the card_name -> 'GRID'
+    cards : list[(comment, card_lines)]
+        the unparsed cards
+
+    Returns
+    -------
+    objs : list[(class_instance, exception)]
+        class_instance : the card object; None if there was an error
+        exception : the parsing error; None if the card was created
+
+    """
+    objs = []
+    if card_name in PARALLEL_SOLID_CLASSES:
+        nfields, card_class_low, card_class_high = PARALLEL_SOLID_CLASSES[card_name]
+    else:
+        card_class = PARALLEL_CARD_CLASSES[card_name]
+
+    for comment, card_lines in cards:
+        try:
+            card_obj = card_lines_to_card_obj(card_lines, card_name)
+            if card_name in PARALLEL_SOLID_CLASSES:
+                card_class = card_class_low if len(card_obj) == nfields else card_class_high
+            objs.append((card_class.add_card(card_obj, comment=comment), None))
+        except (SyntaxError, AssertionError, KeyError, ValueError) as exception:
+            objs.append((None, exception))
+    return objs
+
+
+def get_parallel_card_names(model: BDF) -> set[str]:
+    """
+    Gets the cards that may be created in parallel.  A card must be
+    active and parsed with the default card class.
+
+    """
+    card_names = set()
+    card_parser = model._card_parser
+    card_parser_prepare = model._card_parser_prepare
+    for card_name, card_class in PARALLEL_CARD_CLASSES.items():
+        if card_name in model.cards_to_read and card_name in card_parser and \
+           card_parser[card_name][0] is card_class:
+            card_names.add(card_name)
+    for card_name in PARALLEL_SOLID_CLASSES:
+        if card_name in model.cards_to_read and card_name in card_parser_prepare and \
+           card_name not in card_parser:
+            card_names.add(card_name)
+    return card_names
+
+
+def parse_cards_parallel(model: BDF, cards_list: list[Any], n_workers: int,
+                         parsed_cards: Optional[dict[int, Any]]=None,
+                         ) -> dict[int, tuple[Any, Optional[Exception]]]:
+    """
+    Creates the high count cards in a process pool
+
+    Parameters
+    ----------
+    model : BDF
+        the model to add the cards to (used for the active cards)
+    cards_list : list[card]
+        card : [card_name, comment, card_lines, (ifile, iline)]
+    n_workers : int
+        the number of processes
+    parsed_cards : dict[icard] = (class_instance, exception); default=None
+        the cards that have already been created (e.g., by parse_cards_fast)
+
+    Returns
+    -------
+    parsed_cards : dict[icard] = (class_instance, exception)
+        icard : the index into cards_list
+        the cards that weren't parsed must be parsed by the serial reader
+
+    """
+    if parsed_cards is None:
+        parsed_cards = {}
+    if model._is_dynamic_syntax or model.echo:
+        return parsed_cards
+    card_names = get_parallel_card_names(model)
+
+    icards_by_name = defaultdict(list)
+    for icard, card in enumerate(cards_list):
+        card_name = card[0]
+        if card_name == 'ECHOON':
+            # the echo flag is stateful
+            return parsed_cards
+        if card_name in card_names and icard not in parsed_cards:
+            icards_by_name[card_name].append(icard)
+
+    ncards = sum(len(icards) for icards in icards_by_name.values())
+    if ncards == 0:
+        return parsed_cards
+
+    # split the cards into ~4 chunks per worker, so the workers stay busy
+    chunk_size = max(MIN_CHUNK_SIZE, -(-ncards // (4 * n_workers)))
+    chunk_icards = []
+    chunk_card_names = []
+    chunk_cards = []
+    for card_name, icards in icards_by_name.items():
+        for i0 in range(0, len(icards), chunk_size):
+            icards_chunk = icards[i0:i0+chunk_size]
+            chunk_icards.append(icards_chunk)
+            chunk_card_names.append(card_name)
+            chunk_cards.append([(cards_list[icard][1], cards_list[icard][2])
+                                for icard in icards_chunk])
+    model.log.debug(f'parsing {ncards:d} cards in {len(chunk_cards):d} chunks '
+                    f'with {n_workers:d} workers')
+
+    n_workers = min(n_workers, len(chunk_cards))
+    with ProcessPoolExecutor(max_workers=n_workers) as executor:
+        results = executor.map(create_card_objects, chunk_card_names, chunk_cards)
+        for icards_chunk, objs in zip(chunk_icards, results):
+            parsed_cards.update(zip(icards_chunk, objs))
+    return parsed_cards
@@ -37,6 +37,7 @@ from pyNastran.bdf import BULK_DATA_CARDS, CASE_BULK_CARDS
 from pyNastran.bdf.errors import AuxModelError, MissingDeckSections, SuperelementFlagError
 from pyNastran.bdf.bdf_interface.utils import _parse_pynastran_header
 from pyNastran.bdf.bdf_interface.include_file import get_include_filename
+from pyNastran.bdf.bdf_interface.include_cache import IncludeCache, CACHED_INCLUDE_CARD
 
 
 # these allow spaces
@@ -186,6 +187,9 @@ class BDFInputPy:
         self.log = get_logger2(log, debug)
         self.use_new_parser = False
 
+        #: the cache for the mesh INCLUDE files (see include_cache.py)
+        self.include_cache: Optional[IncludeCache] = None
+
     def get_lines(self, bdf_filename: Union[str, StringIO],
                   punch: Optional[bool]=False,
                   make_ilines: bool=True) -> tuple[list[str], list[str], list[str],
@@ -409,9 +413,14 @@ class BDFInputPy:
                 self.include_lines[jfile].append((include_lines, bdf_filename2))
 
                 if self.read_includes:
-                    lines, nlines, ilines = self._update_include(
-                        lines, nlines, ilines,
-                        include_lines, bdf_filename2, i, j, ifile, make_ilines=make_ilines)
+                    if self.include_cache is not None and make_ilines and \
+                       self.include_cache.load(ifile, os.path.join(self.include_dir, bdf_filename2)):
+                        lines, nlines, ilines = self._update_include_cached(
+                            lines, nlines, ilines, bdf_filename2, i, j, ifile)
+                    else:
+                        lines, nlines, ilines = self._update_include(
+                            lines, nlines, ilines,
+                            include_lines, bdf_filename2, i, j, ifile, make_ilines=make_ilines)
                     ifile += 1
                 else:
                     # remove the include lines
@@ -505,6 +514,9 @@ class BDFInputPy:
             #print('** %s' % line2)
 
         include_comment = '\n$ INCLUDE processed:  %s\n' % bdf_filename2
+        if self.include_cache is not None and make_ilines:
+            self.include_cache.add_uncached_file(
+                ifile, self.active_filenames[-1], include_comment, lines2)
         #for line in lines2:
             #print("  ?%s" % line.rstrip())
 
@@ -564,6 +576,24 @@ class BDFInputPy:
             #print("  *%s" % line.rstrip())
         return lines, nlines, ilines
 
+    def _update_include_cached(self, lines: list[str], nlines: int, ilines: np.ndarray,
+                               bdf_filename2: str, i: int, j: int, ifile: int):
+        """
+        Replaces an INCLUDE file that was loaded from the cache with a
+        placeholder card (see ``BDF._parse_cards_list``)
+        """
+        self._open_file_checks(bdf_filename2)
+        self.active_filenames.append(os.path.join(self.include_dir, bdf_filename2))
+        include_comment = '\n$ INCLUDE processed:  %s\n' % bdf_filename2
+        ilines = np.vstack([
+            ilines[:i+1, :],
+            _make_ilines(1, ifile),
+            ilines[j:, :],
+        ])
+        lines = lines[:i] + [include_comment, f'{CACHED_INCLUDE_CARD},{ifile:d}\n'] + lines[j:]
+        nlines += 1
+        return lines, nlines, ilines
+
     def _get_include_lines(self, lines: list[str], line: str,
                            i: int, nlines: int) -> tuple[int, list[str]]:
         """
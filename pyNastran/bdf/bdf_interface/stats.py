@@ -143,7 +143,7 @@ def get_bdf_stats(model: BDF, return_type: str='string',
         'sol', 'sol_iline', 'sol_method', 'cards_to_read', 'card_count',
         'superelement_models', 'wtmass', 'echo', 'force_echo_off',
         'read_includes', 'reject_cards', 'reject_count', 'punch',
-        'include_dir', 'include_filenames', 'save_file_structure',
+        'include_dir', 'include_filenames', 'save_file_structure', 'modified_ifiles',
         'rsolmap_to_str', 'nastran_format', 'nid_map', 'bdf_filename',
         'initial_superelement_models',
         'type_slot_str', 'dict_of_vars', 'code_block',
@@ -186,7 +186,7 @@ def get_bdf_stats(model: BDF, return_type: str='string',
         # ----
         #new
         'bolt', 'boltld', 'boltfor', 'boltseq', 'boltfrc',
-        'use_new_deck_parser',
+        'use_new_deck_parser', 'use_fast_card_parser',
 
     ] + list_attrs + card_dict_groups + scalar_attrs
     missed_attrs = []
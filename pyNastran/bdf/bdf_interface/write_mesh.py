@@ -15,6 +15,7 @@ from pyNastran.bdf.field_writer_16 import print_card_16
 from pyNastran.bdf.bdf_interface.attributes import BDFAttributes
 from pyNastran.bdf.bdf_interface.write_mesh_utils import (
     find_aero_location, write_dict, get_properties_by_element_type)
+from pyNastran.bdf.bdf_interface.write_mesh_bulk import write_cards_bulk
 from pyNastran.bdf.cards.nodes import write_xpoints
 
 try:
@@ -297,12 +298,7 @@ class WriteMesh(BDFAttributes):
                 for (eid, element) in sorted(self.elements.items()):
                     bdf_file.write(element.write_card_16(is_double))
             else:
-                for (eid, element) in sorted(self.elements.items()):
-                    try:
-                        bdf_file.write(element.write_card(size, is_double))
-                    except Exception:
-                        print(f'failed printing element...type={element.type} eid={eid}')
-                        raise
+                write_cards_bulk(bdf_file, self.elements, size, is_double)
         if self.ao_element_flags:
             for (eid, element) in sorted(self.ao_element_flags.items()):
                 bdf_file.write(element.write_card(size, is_double))
@@ -344,13 +340,8 @@ class WriteMesh(BDFAttributes):
             if eids:
                 bdf_file.write(prop.write_card(size, is_double))
                 eids.sort()
-                for eid in eids:
-                    element = self.elements[eid]
-                    try:
-                        bdf_file.write(element.write_card(size, is_double))
-                    except Exception:
-                        print(f'failed printing element...type={element.type!r} eid={eid}')
-                        raise
+                elements = {eid: self.elements[eid] for eid in eids}
+                write_cards_bulk(bdf_file, elements, size, is_double)
                 eids_written += eids
             else:
                 missing_properties.append(prop.write_card(size, is_double))
@@ -886,7 +877,10 @@ class WriteMesh(BDFAttributes):
             bdf_file.write('$NODES\n')
             if self.grdset:
                 bdf_file.write(self.grdset.write_card(size))
-            write_dict(bdf_file, self.nodes, size, is_double, is_long_ids)
+            if is_long_ids:
+                write_dict(bdf_file, self.nodes, size, is_double, is_long_ids)
+            else:
+                write_cards_bulk(bdf_file, self.nodes, size, is_double, card_type='node')
 
     #def _write_nodes_associated(self, bdf_file, size=8, is_double=False):
         #"""
@@ -1040,8 +1034,7 @@ class WriteMesh(BDFAttributes):
                     #raise
             else:
                 for prop_group in prop_groups:
-                    for unused_pid, prop in sorted(prop_group.items()):
-                        bdf_file.write(prop.write_card(size, is_double))
+                    write_cards_bulk(bdf_file, prop_group, size, is_double, card_type='property')
 
             if is_big_properties:
                 for unused_pid, prop in sorted(self.big_properties.items()):
@@ -1139,12 +1132,7 @@ class WriteMesh(BDFAttributes):
                         print(f'failed printing element...type={element.type} eid={eid}')
                         raise
             else:
-                for (eid, element) in sorted(self.rigid_elements.items()):
-                    try:
-                        bdf_file.write(element.write_card(size, is_double))
-                    except Exception:
-                        print(f'failed printing element...type={element.type} eid={eid}')
-                        raise
+                write_cards_bulk(bdf_file, self.rigid_elements, size, is_double)
         if self.plotels:
             bdf_file.write('$PLOT ELEMENTS\n')
             write_dict(bdf_file, self.plotels, size, is_double, is_long_ids)
@@ -0,0 +1,279 @@
+"""
+Defines the bulk writing used by ``BDF.write_bdf`` for the GRIDs, the
+high count elements (e.g., CQUAD4, CTRIA3, CHEXA, CBAR, RBE2) and the
+common properties.
+
+Rather than calling ``card.write_card(size, is_double)`` for each card,
+the ids, coordinates and connectivity of each card type are stacked and
+the float fields are formatted as an array (see field_writer_array.py).
+The output is the same as ``card.write_card``, which is used for the
+cards that aren't supported (e.g., a GRID with a PS field, a CQUAD4 with
+a THETA/MCID) and the cards are written in chunks.
+
+"""
+from __future__ import annotations
+from collections import defaultdict
+from typing import Any, Callable, Optional
+
+import numpy as np
+
+from pyNastran.bdf import MAX_INT
+from pyNastran.bdf.field_writer_array import (
+    print_floats_8, print_floats_16, print_scientific_doubles,
+    print_cards_8, print_cards_16)
+from pyNastran.bdf.cards.nodes import GRID
+from pyNastran.bdf.cards.elements.shell import CQUAD4, CTRIA3
+from pyNastran.bdf.cards.elements.solid import CTETRA4, CPENTA6, CHEXA8
+from pyNastran.bdf.cards.elements.bars import CBAR
+from pyNastran.bdf.cards.elements.beam import CBEAM
+from pyNastran.bdf.cards.elements.rigid import RBE2
+from pyNastran.bdf.cards.properties.shell import PSHELL
+from pyNastran.bdf.cards.properties.solid import PSOLID
+
+#: the number of cards that are written at once
+CHUNK_SIZE = 100_000
+
+
+def write_cards_bulk(bdf_file: Any, cards: dict[int, Any],
+                     size: int=8, is_double: bool=False,
+                     card_type: str='element') -> None:
+    """
+    Writes a dictionary of cards (e.g., model.nodes) in sorted order
+
+    Parameters
+    ----------
+    bdf_file : file
+        the file object
+    cards : dict[int, card]
+        the cards to write
+    size : int; {8, 16}
+        the field size
+    is_double : bool; default=False
+        False : small field
+        True : large field
+    card_type : str; default='element'
+        the name used in the error message (e.g., 'element', 'property')
+
+    """
+    ids = sorted(cards)
+    for i0 in range(0, len(ids), CHUNK_SIZE):
+        chunk = [cards[idi] for idi in ids[i0:i0 + CHUNK_SIZE]]
+        msgs = get_cards_bulk(chunk, size, is_double)
+        for i, (msg, card) in enumerate(zip(msgs, chunk)):
+            if msg is not None:
+                continue
+            try:
+                msgs[i] = card.write_card(size, is_double)
+            except Exception:
+                print(f'failed printing {card_type}...type={card.type} id={ids[i0 + i]}')
+                raise
+        bdf_file.write(''.join(msgs))
+
+
+def get_cards_bulk(cards: list[Any], size: int=8,
+                   is_double: bool=False) -> list[Optional[str]]:
+    """
+    Gets the strings of the supported cards
+
+    Parameters
+    ----------
+    cards : list[card]
+        the cards
+    size : int; {8, 16}
+        the field size
+    is_double : bool; default=False
+        False : small field
+        True : large field
+
+    Returns
+    -------
+    msgs : list[str/None]
+        the card strings; None if card.write_card must be used
+
+    """
+    icards_by_class = defaultdict(list)
+    for i, card in enumerate(cards):
+        icards_by_class[type(card)].append(i)
+
+    msgs = [None] * len(cards)
+    for card_class, icards in icards_by_class.items():
+        if card_class not in BULK_WRITE_CARDS:
+            continue
+        card_msgs = BULK_WRITE_CARDS[card_class]([cards[i] for i in icards], size, is_double)
+        for i, msg in zip(icards, card_msgs):
+            msgs[i] = msg
+    return msgs
+
+
+def _get_grids(nodes: list[GRID], size: int, is_double: bool) -> list[Optional[str]]:
+    """gets the GRID strings; same as GRID.write_card"""
+    msgs = [None] * len(nodes)
+    try:
+        data = [(node.comment, node.nid, node.Cp(), node.Cd(), node.ps, node.SEid())
+                for node in nodes]
+        xyz = np.array([node.xyz for node in nodes], dtype='float64')
+    except (TypeError, ValueError):
+        return msgs
+    if xyz.shape != (len(nodes), 3):
+        return msgs
+
+    if size == 8:
+        xyz_fields = print_floats_8(xyz.ravel())
+        for i, (comment, nid, cp, cd, ps, seid) in enumerate(data):
+            if cd != 0 or ps != '' or seid != 0 or not isinstance(cp, int):
+                # written with the cd/ps/seid fields
+                continue
+            cps = '        ' if cp == 0 else '%8i' % cp
+            msgs[i] = '%sGRID    %8i%8s%s%s%s\n' % (
+                comment, nid, cps, *xyz_fields[3*i:3*i+3])
+        return msgs
+
+    xyz_fields = print_scientific_doubles(xyz.ravel()) if is_double else print_floats_16(xyz.ravel())
+    for i, (comment, nid, cp, cd, ps, seid) in enumerate(data):
+        if not (isinstance(cp, int) and isinstance(cd, int) and
+                isinstance(ps, str) and isinstance(seid, int)):
+            continue
+        cps = '                ' if cp == 0 else '%16i' % cp
+        cds = '                ' if cd == 0 else '%16i' % cd
+        seids = '                ' if seid == 0 else '%16i' % seid
+        msgs[i] = ('%sGRID*   %16i%16s%16s%16s\n'
+                   '*       %16s%16s%16s%16s\n' % (
+                       comment, nid, cps, *xyz_fields[3*i:3*i+3], cds, ps, seids))
+    return msgs
+
+
+def _get_element_data(elem: Any) -> Optional[tuple[Any, ...]]:
+    """
+    gets the (comment, eid, pid, nid1, nid2, ...) of an element
+    without blank nodes; same as (elem.eid, elem.Pid(), *elem.node_ids)
+    """
+    nids = elem.nodes if elem.nodes_ref is None else elem.node_ids
+    if None in nids or 0 in nids:
+        # elem.node_ids raises the error
+        return None
+    pid = elem.pid if elem.pid_ref is None else elem.pid_ref.pid
+    return (elem.comment, elem.eid, pid, *nids)
+
+
+def _get_solid_elements(card_name: str, nnodes: int) -> Callable[..., list[Optional[str]]]:
+    """gets the function that writes a CTETRA4/CPENTA6/CHEXA8"""
+    nfields = 2 + nnodes
+    fmt = '%%s%-8s' % card_name + '%8d' * min(nfields, 8) + '\n'
+    if nfields > 8:
+        fmt += '        ' + '%8d' * (nfields - 8) + '\n'
+
+    def _get_solids(elements: list[Any], size: int, is_double: bool) -> list[Optional[str]]:
+        """gets the solid element strings; same as write_card"""
+        msgs = [None] * len(elements)
+        for i, elem in enumerate(elements):
+            data = _get_element_data(elem)
+            if data is not None:
+                msgs[i] = fmt % data
+        return msgs
+    return _get_solids
+
+
+def _get_shell_elements(card_name: str, nnodes: int) -> Callable[..., list[Optional[str]]]:
+    """
+    gets the function that writes a CTRIA3/CQUAD4 with blank optional
+    fields (THETA/MCID, ZOFFS, TFLAG, Ti)
+    """
+    fmt = '%%s%-8s' % card_name + '%8d' * (2 + nnodes) + '\n'
+    defaults = [0.0, 0] + [1.0] * nnodes
+    blank_values = [(None, default) for default in defaults]
+
+    # the CQUAD4 is written in large field format with a blank THETA/MCID
+    # and ZOFFS unless all the optional fields are the defaults
+    is_large_field = (card_name == 'CQUAD4')
+    fmt16 = '%sCQUAD4* %16i%16i%16i%16i\n*       %16i%16i' + ' ' * 32 + '\n'
+
+    def _get_shells(elements: list[Any], size: int, is_double: bool) -> list[Optional[str]]:
+        """gets the shell element strings; same as write_card"""
+        msgs = [None] * len(elements)
+        for i, elem in enumerate(elements):
+            theta_mcid = elem.theta_mcid
+            if nnodes == 3:
+                values = [elem.zoffset, elem.tflag, elem.T1, elem.T2, elem.T3]
+            else:
+                values = [elem.zoffset, elem.tflag, elem.T1, elem.T2, elem.T3, elem.T4]
+            is_default = (theta_mcid == 0.0 and values == defaults)
+            if not is_default:
+                # the fields are blank (set_blank_if_default)
+                is_blank = (
+                    (theta_mcid is None or (isinstance(theta_mcid, float) and theta_mcid == 0.0)) and
+                    all(map(tuple.__contains__, blank_values, values)))
+                if not is_blank:
+                    continue
+
+            data = _get_element_data(elem)
+            if data is None:
+                continue
+            if is_large_field and size == 16 and not is_default:
+                msgs[i] = fmt16 % data
+            else:
+                msgs[i] = fmt % data
+        return msgs
+    return _get_shells
+
+
+def _get_repr_cards(get_size: Callable[[Any, int], int]) -> Callable[..., list[Optional[str]]]:
+    """
+    gets the function that writes a card with print_card_8/print_card_16
+
+    Parameters
+    ----------
+    get_size : func(card, size) -> size
+        the field size that card.write_card uses
+
+    """
+    def _get_cards(cards: list[Any], size: int, is_double: bool) -> list[Optional[str]]:
+        """gets the card strings; same as write_card"""
+        msgs = [None] * len(cards)
+        try:
+            icards_by_size = {8: [], 16: []}
+            for i, card in enumerate(cards):
+                icards_by_size[get_size(card, size)].append(i)
+
+            for sizei, print_cards in [(8, print_cards_8), (16, print_cards_16)]:
+                icards = icards_by_size[sizei]
+                if not icards:
+                    continue
+                cards_fields = [cards[i].repr_fields() for i in icards]
+                for i, msg in zip(icards, print_cards(cards_fields)):
+                    msgs[i] = cards[i].comment + msg
+        except Exception:
+            # an invalid card; write_card raises the error
+            return [None] * len(cards)
+        return msgs
+    return _get_cards
+
+
+def _get_cbeam_size(elem: CBEAM, size: int) -> int:
+    """the field size of CBEAM.write_card"""
+    if size == 8 and max(elem.eid, max(elem.node_ids)) > MAX_INT:
+        return 16
+    return size
+
+
+def _get_pshell_size(prop: PSHELL, size: int) -> int:
+    """the field size of PSHELL.write_card"""
+    mid_max = max([0 if mid is None else mid for mid in prop.material_ids])
+    if max(prop.pid, mid_max) > MAX_INT:
+        return 16
+    return size
+
+
+#: card_class : func(cards, size, is_double) -> msgs
+BULK_WRITE_CARDS = {
+    GRID: _get_grids,
+    CTRIA3: _get_shell_elements('CTRIA3', 3),
+    CQUAD4: _get_shell_elements('CQUAD4', 4),
+    CTETRA4: _get_solid_elements('CTETRA', 4),
+    CPENTA6: _get_solid_elements('CPENTA', 6),
+    CHEXA8: _get_solid_elements('CHEXA', 8),
+    CBAR: _get_repr_cards(lambda elem, size: size),
+    CBEAM: _get_repr_cards(_get_cbeam_size),
+    RBE2: _get_repr_cards(lambda elem, size: 8),
+    PSHELL: _get_repr_cards(_get_pshell_size),
+    PSOLID: _get_repr_cards(lambda prop, size: 8),
+}
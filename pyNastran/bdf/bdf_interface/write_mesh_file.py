@@ -6,8 +6,10 @@ This file defines:
 """
 from __future__ import annotations
 import os
+import shutil
+import hashlib
 from collections import defaultdict
-from typing import Union, Optional, Any, TYPE_CHECKING
+from typing import Union, Optional, Any, Iterator, TYPE_CHECKING
 
 import numpy as np
 from pyNastran.bdf.field_writer_8 import print_card_8
@@ -34,12 +36,48 @@ class WriteMeshs(WriteMesh):
         """creates methods for writing cards"""
         WriteMesh.__init__(self)
 
+        # the change journal for write_bdfs(..., incremental=True)
+        #  - the cards in each file when the BDF was read
+        #  - a hash of the fields/comments of the cards in each file
+        #  - the files with a card that was flagged as modified
+        self._ifile_cards: dict[int, list[Any]] = {}
+        self._ifile_card_hashes: dict[int, str] = {}
+        self.modified_ifiles: set[int] = set()
+
+    def _set_unmodified_files(self) -> None:
+        """saves the cards in each file after the BDF is read"""
+        self._ifile_cards = get_ifile_cards(self)
+        self._ifile_card_hashes = {ifile: hash_cards(cards)
+                                   for ifile, cards in self._ifile_cards.items()}
+        self.modified_ifiles = set()
+
+    def mark_card_modified(self, card: Any) -> None:
+        """
+        Flags the file of a card, so ``write_bdfs(..., incremental=True)``
+        regenerates that file.
+
+        Cards that are added, deleted, replaced, or modified in place are
+        found automatically, so this is only needed for a change that
+        isn't in the fields/comment of the card.
+
+        .. code-block:: python
+
+           pshell = model.properties[10]
+           pshell.t = 0.2
+           model.mark_card_modified(pshell)
+
+        """
+        ifile = getattr(card, 'ifile', None)
+        if ifile is not None:
+            self.modified_ifiles.add(ifile)
+
     def write_bdfs(self, out_files_map: dict[str, str],
                    relative_dirname: PathLike='',
                    encoding: Optional[str]=None,
                    size: int=8, is_double: bool=False,
                    enddata: Optional[bool]=None, close: bool=True,
-                   is_windows: Optional[bool]=None) -> None:
+                   is_windows: Optional[bool]=None,
+                   incremental: bool=False, link_files: bool=False) -> None:
         """
         Writes the BDF.
 
@@ -72,6 +110,18 @@ class WriteMeshs(WriteMesh):
                 files, so the format for a BDF that will run on Linux and
                 Windows is different.
             None : Check the platform
+        incremental : bool; default=False
+            Only regenerate the files that changed since the BDF was read
+            with ``read_bdf(..., save_file_structure=True)``.  The other
+            INCLUDE files are copied from the original files.
+            The main file, files with an added/deleted/modified card,
+            files flagged with ``mark_card_modified``, and files with an
+            INCLUDE that is renamed or moved are regenerated.  A card is
+            modified if its fields or comment are different than when the
+            BDF was read.
+        link_files : bool; default=False
+            hardlink the unmodified files instead of copying them
+            (requires incremental=True)
 
         out_files_map[fem.active_filenames[0]] = bdf_filename[:-4] + "_NEW" + bdf_filename[-4:]
         for ifile, include_filenames in model.include_filenames.items():
@@ -94,6 +144,15 @@ class WriteMeshs(WriteMesh):
         ifile_out_filenames = _map_filenames_to_ifile_filname_dict(
             out_files_map, self.active_filenames)
         ifile0 = list(sorted(ifile_out_filenames))[0]
+        if incremental:
+            if not self.save_file_structure:
+                raise RuntimeError('write_bdfs(..., incremental=True) requires '
+                                   'read_bdf(..., save_file_structure=True)')
+            unmodified_ifiles = _get_unmodified_ifiles(self, out_files_map, ifile_out_filenames)
+            for ifile in unmodified_ifiles:
+                out_filename = ifile_out_filenames.pop(ifile)
+                _copy_unmodified_file(self.active_filenames[ifile], out_filename, link_files)
+            self.log.debug(f'copied {len(unmodified_ifiles)} unmodified files')
         #print('ifile_out_filenames =', ifile_out_filenames)
 
         out_filename0 = ifile_out_filenames[ifile0]
@@ -232,7 +291,7 @@ class WriteMeshs(WriteMesh):
             write_bdfs_dict(bdf_files, self.nsmadds, size, is_double, is_long_ids)
             write_bdfs_dict(bdf_files, self.nsmadds, size, is_double, is_long_ids)
             for monitor_point in self.monitor_points:
-                bdf_files[monitor_point.ifile].write(monitor_point.write_card(size, is_double))
+                _write_card(bdf_files, monitor_point, size, is_double)
         self.zona.write_bdf(bdf_files[0], size=8, is_double=False)
 
     def _write_aero_control_file(self, bdf_files: Any, size: int=8, is_double: bool=False,
@@ -256,7 +315,7 @@ class WriteMeshs(WriteMesh):
         if self.aeros or self.trims or self.divergs:
             # static aero
             if self.aeros:
-                bdf_files[self.aeros.ifile].write(self.aeros.write_card(size, is_double))
+                _write_card(bdf_files, self.aeros, size, is_double)
 
             write_bdfs_dict(bdf_files, self.trims, size, is_double, is_long_ids)
             write_bdfs_dict(bdf_files, self.divergs, size, is_double, is_long_ids)
@@ -268,7 +327,7 @@ class WriteMeshs(WriteMesh):
         """Writes the flutter cards"""
         if (write_aero_in_flutter and self.aero) or self.flfacts or self.flutters or self.mkaeros:
             if write_aero_in_flutter:
-                bdf_files[self.aero.ifile].write(self.aero.write_card(size, is_double))
+                _write_card(bdf_files, self.aero, size, is_double)
             write_bdfs_dict(bdf_files, self.flutters, size, is_double, is_long_ids)
             write_bdfs_dict(bdf_files, self.flfacts, size, is_double, is_long_ids)
             write_bdfs_list(bdf_files, self.mkaeros, size, is_double, is_long_ids)
@@ -279,7 +338,7 @@ class WriteMeshs(WriteMesh):
         if (write_aero_in_gust and self.aero) or self.gusts:
             if write_aero_in_gust:
                 for (unused_id, aero) in sorted(self.aero.items()):
-                    bdf_files[aero.ifile].write(aero.write_card(size, is_double))
+                    _write_card(bdf_files, aero, size, is_double)
             write_bdfs_dict(bdf_files, self.gusts, size, is_double, is_long_ids)
 
     def _write_common_file(self, bdf_files: Any, size: int=8, is_double: bool=False,
@@ -326,9 +385,9 @@ class WriteMeshs(WriteMesh):
         size, is_long_ids = self._write_mesh_long_ids_size(size, is_long_ids)
         if self.suport or self.suport1:
             for suport in self.suport:
-                bdf_files[suport.ifile].write(suport.write_card(size, is_double))
+                _write_card(bdf_files, suport, size, is_double)
             for unused_suport_id, suport in sorted(self.suport1.items()):
-                bdf_files[suport.ifile].write(suport.write_card(size, is_double))
+                _write_card(bdf_files, suport, size, is_double)
 
         if self.spcs or self.spcadds or self.spcoffs:
             #bdf_file.write('$SPCs\n')
@@ -375,6 +434,8 @@ class WriteMeshs(WriteMesh):
         for (unused_id, coord) in sorted(self.coords.items()):
             if unused_id != 0:
                 bdf_file = bdf_files[coord.ifile]
+                if bdf_file is None:
+                    continue
                 try:
                     bdf_file.write(coord.write_card(size, is_double))
                 except RuntimeError:
@@ -487,16 +548,16 @@ class WriteMeshs(WriteMesh):
 
         if self._is_axis_symmetric:
             if self.axic:
-                bdf_files[self.axic.ifile].write(self.axic.write_card(size, is_double))
+                _write_card(bdf_files, self.axic, size, is_double)
             if self.axif:
-                bdf_files[self.axif.ifile].write(self.axif.write_card(size, is_double))
+                _write_card(bdf_files, self.axif, size, is_double)
             write_bdfs_dict(bdf_files, self.ringaxs, size, is_double, is_long_ids)
             write_bdfs_dict(bdf_files, self.ringfl, size, is_double, is_long_ids)
             write_bdfs_dict(bdf_files, self.gridb, size, is_double, is_long_ids)
 
         self._write_grids_file(bdf_files, size=size, is_double=is_double)
         if self.seqgp:
-            bdf_files[self.seqgp.ifile].write(self.seqgp.write_card(size, is_double))
+            _write_card(bdf_files, self.seqgp, size, is_double)
 
         #if 0:  # not finished
             #self._write_nodes_associated(bdf_file, size, is_double)
@@ -507,7 +568,7 @@ class WriteMeshs(WriteMesh):
         size, is_long_ids = self._write_mesh_long_ids_size(size, is_long_ids)
         if self.nodes:
             if self.grdset:
-                bdf_files[self.grdset.ifile].write(self.grdset.write_card(size))
+                _write_card(bdf_files, self.grdset, size, False)
             write_bdfs_dict(bdf_files, self.nodes, size, is_double, is_long_ids)
 
     def _write_optimization_file(self, bdf_files: Any, size: int=8, is_double: bool=False,
@@ -534,17 +595,19 @@ class WriteMeshs(WriteMesh):
             write_bdfs_dict_list(bdf_files, self.dvgrids, size, is_double, is_long_ids)
 
             for (unused_id, dscreen) in sorted(self.dscreen.items()):
-                bdf_files[dscreen.ifile].write(str(dscreen))
+                if bdf_files[dscreen.ifile] is not None:
+                    bdf_files[dscreen.ifile].write(str(dscreen))
 
             for (unused_id, equation) in sorted(self.dequations.items()):
-                bdf_files[equation.ifile].write(str(equation))
+                if bdf_files[equation.ifile] is not None:
+                    bdf_files[equation.ifile].write(str(equation))
 
             if self.dtable is not None:
-                bdf_files[self.dtable.ifile].write(self.dtable.write_card(size, is_double))
+                _write_card(bdf_files, self.dtable, size, is_double)
             if self.doptprm is not None:
-                bdf_files[self.doptprm.ifile].write(self.doptprm.write_card(size, is_double))
+                _write_card(bdf_files, self.doptprm, size, is_double)
             if self.modtrak is not None:
-                bdf_files[self.modtrak.ifile].write(self.modtrak.write_card(size, is_double))
+                _write_card(bdf_files, self.modtrak, size, is_double)
 
     def _write_params_file(self, bdf_files: Any, size: int=8, is_double: bool=False,
                            is_long_ids: Optional[bool]=None) -> None:
@@ -697,7 +760,7 @@ class WriteMeshs(WriteMesh):
             write_bdfs_dict(bdf_files, self.views, size, is_double, is_long_ids)
             write_bdfs_dict(bdf_files, self.view3ds, size, is_double, is_long_ids)
             if self.radset:
-                bdf_files[self.radset.ifile].write(self.radset.write_card(size, is_double))
+                _write_card(bdf_files, self.radset, size, is_double)
             write_bdfs_dict(bdf_files, self.radcavs, size, is_double, is_long_ids)
 
 
@@ -768,12 +831,119 @@ def write_bdfs_dict_list(bdf_files, cards, size, is_double, is_long_ids):
 def write_bdfs_list(bdf_files, cards, size, is_double, is_long_ids):
     """writes a list by ifile"""
     assert isinstance(cards, list), cards
-    if is_long_ids:
-        for card in cards:
-            bdf_files[card.ifile].write_card_16(size, is_double)
-    else:
+    for card in cards:
+        bdf_file = bdf_files[card.ifile]
+        if bdf_file is None:
+            continue
+        if is_long_ids:
+            bdf_file.write(card.write_card_16(is_double))
+        else:
+            bdf_file.write(card.write_card(size, is_double))
+
+def _write_card(bdf_files, card, size, is_double):
+    """writes a single card to its file"""
+    bdf_file = bdf_files[card.ifile]
+    if bdf_file is not None:
+        bdf_file.write(card.write_card(size, is_double))
+
+def get_ifile_cards(model) -> dict[int, list[Any]]:
+    """
+    Gets the cards in each file (ifile) of a model that was read with
+    ``save_file_structure=True``
+
+    Returns
+    -------
+    ifile_cards : dict[ifile] = cards
+        the card objects in a fixed order
+    """
+    ifile_cards = defaultdict(list)
+    for slot in model._slot_to_type_map:
+        for card in _iter_slot_cards(getattr(model, slot, None)):
+            ifile = getattr(card, 'ifile', None)
+            if ifile is not None:
+                ifile_cards[ifile].append(card)
+    return dict(ifile_cards)
+
+def _iter_slot_cards(cards: Any) -> Iterator[Any]:
+    """iterates over the cards in a card/list/dict/dict of dicts slot"""
+    if isinstance(cards, dict):
+        for card in cards.values():
+            yield from _iter_slot_cards(card)
+    elif isinstance(cards, list):
         for card in cards:
-            bdf_files[card.ifile].write_card(size, is_double)
+            yield from _iter_slot_cards(card)
+    elif cards is not None:
+        yield cards
+
+def hash_cards(cards: list[Any]) -> str:
+    """
+    Hashes the fields and comments of a list of cards, so a card that's
+    modified in place (e.g., ``pshell.t = 0.2``) may be found
+    """
+    sha1 = hashlib.sha1()
+    for card in cards:
+        sha1.update(repr(card.raw_fields()).encode('utf8'))
+        sha1.update(card.comment.encode('utf8'))
+    return sha1.hexdigest()
+
+def _get_unmodified_ifiles(model, out_files_map: dict[str, str],
+                           ifile_out_filenames: dict[int, str]) -> list[int]:
+    """
+    Gets the files that may be copied for ``write_bdfs(..., incremental=True)``
+
+    A file is modified if:
+     - it is the main file (the header, case control, and ENDDATA)
+     - it has a card that was flagged with ``mark_card_modified``
+     - a card was added/deleted/replaced
+     - the fields/comment of a card changed (see ``hash_cards``)
+     - it has an INCLUDE that is renamed or the file is moved
+       (so the copied INCLUDE would be wrong)
+    """
+    ifile_cards = get_ifile_cards(model)
+    out_abspaths = {os.path.abspath(in_filename): os.path.abspath(out_filename)
+                    for in_filename, out_filename in out_files_map.items()}
+    unmodified_ifiles = []
+    for ifile, out_filename in sorted(ifile_out_filenames.items()):
+        if ifile == 0 or ifile in model.modified_ifiles:
+            continue
+        if hasattr(out_filename, 'write'):
+            continue
+
+        cards0 = model._ifile_cards.get(ifile, [])
+        cards = ifile_cards.get(ifile, [])
+        if len(cards0) != len(cards) or any(card0 is not card
+                                            for card0, card in zip(cards0, cards)):
+            continue
+        if hash_cards(cards) != model._ifile_card_hashes.get(ifile):
+            continue
+
+        include_filenames = model.include_filenames.get(ifile, [])
+        if include_filenames:
+            in_abspath = os.path.abspath(model.active_filenames[ifile])
+            is_moved = os.path.dirname(in_abspath) != os.path.dirname(os.path.abspath(out_filename))
+            is_renamed = any(
+                out_abspaths.get(os.path.abspath(include_filename),
+                                 os.path.abspath(include_filename)) != os.path.abspath(include_filename)
+                for include_filename in include_filenames)
+            if is_moved or is_renamed:
+                continue
+        unmodified_ifiles.append(ifile)
+    return unmodified_ifiles
+
+def _copy_unmodified_file(in_filename: str, out_filename: str, link_files: bool) -> None:
+    """copies (or hardlinks) an unmodified file for ``write_bdfs``"""
+    if os.path.exists(out_filename):
+        if os.path.samefile(in_filename, out_filename):
+            return
+        os.remove(out_filename)
+    if link_files:
+        try:
+            os.link(in_filename, out_filename)
+            return
+        except OSError:
+            # e.g., a different drive or the file system doesn't support links
+            pass
+    shutil.copyfile(in_filename, out_filename)
 
 def _map_filenames_to_ifile_filname_dict(out_filenames: dict[str, str],
                                          active_filenames: list[str]) -> dict[int, str]:
@@ -815,4 +985,5 @@ def write_xpoints_file(bdf_files, cardtype, points, comment=''):
     """writes SPOINTs/EPOINTs"""
     assert isinstance(points, dict), points
     for point_id, point in points.items():
-        bdf_files[point.ifile].write(point.write_card())
+        if bdf_files[point.ifile] is not None:
+            bdf_files[point.ifile].write(point.write_card())
@@ -10,15 +10,15 @@ import numpy as np
 from scipy.sparse import coo_matrix  # type: ignore
 
 from pyNastran.utils.numpy_utils import integer_types
-from pyNastran.femutils.utils import unique2d
 from pyNastran.bdf.cards.base_card import BaseCard
-from pyNastran.bdf.field_writer_8 import print_card_8
-from pyNastran.bdf.field_writer_16 import print_card_16
-from pyNastran.bdf.field_writer_double import print_card_double
+from pyNastran.bdf.field_writer_8 import print_card_8, print_field_8, print_float_8
+from pyNastran.bdf.field_writer_16 import print_card_16, print_field_16, print_float_16
+from pyNastran.bdf.field_writer_double import print_card_double, print_scientific_double
 
 from pyNastran.bdf.bdf_interface.assign_type import (
     integer, integer_or_blank, double, string, string_or_blank,
-    parse_components, interpret_value, integer_double_string_or_blank)
+    parse_components, interpret_value, integer_double_string_or_blank,
+    double_from_str)
 if TYPE_CHECKING:  # pragma: no cover
     from pyNastran.bdf.bdf_interface.bdf_card import BDFCard
     from pyNastran.bdf.bdf import BDF
@@ -656,6 +656,71 @@ class NastranMatrix(BaseCard):
         #if self.is_complex:
             #self.Complex(double(card, v, 'complex')
 
+    def _add_columns(self, card_comments: list[tuple[BDFCard, str]]) -> None:
+        """
+        Adds all the column entries of the matrix at once
+
+        The fields are cast with numpy instead of one field at a time.
+        If a field can't be cast (e.g., a blank real value), the cards
+        are read with ``_add_column``, so the error message is the same.
+        """
+        try:
+            GCj, GCi, reals, complexs = _parse_columns(
+                [card_obj for card_obj, unused_comment in card_comments],
+                self.is_complex, self.is_polar)
+        except (ValueError, SyntaxError):
+            for card_obj, comment in card_comments:
+                self._add_column(card_obj, comment=comment)
+            return
+
+        for unused_card_obj, comment in card_comments:
+            if comment:
+                if hasattr(self, '_comment'):
+                    self.comment += comment
+                else:
+                    self.comment = comment
+
+        if len(self.GCi):
+            # there are already some columns
+            GCj = np.vstack([np.asarray(self.GCj).reshape(-1, 2), GCj])
+            GCi = np.vstack([np.asarray(self.GCi).reshape(-1, 2), GCi])
+            reals = np.hstack([self.Real, reals])
+            if self.is_complex:
+                complexs = np.hstack([self.Complex, complexs])
+        self.GCj = GCj
+        self.GCi = GCi
+        self.Real = reals
+        if self.is_complex:
+            self.Complex = complexs
+
+    def get_sparse_matrix(self, apply_symmetry: bool=True,
+                          sparse_format: str='csc') -> tuple[Any, np.ndarray, np.ndarray]:
+        """
+        Builds the matrix as a scipy.sparse matrix
+
+        Parameters
+        ----------
+        apply_symmetry : bool; default=True
+            If the matrix is symmetric (ifo=6), the terms that are
+            off the diagonal are mirrored.
+        sparse_format : str; default='csc'
+            the scipy.sparse format (e.g., 'csc', 'csr', 'coo')
+
+        Returns
+        -------
+        M : scipy.sparse matrix
+            the matrix
+        row_gc : (nrows, 2) int ndarray
+            the (grid, component) of each row
+        col_gc : (ncols, 2) int ndarray
+            the (grid, component) of each column
+
+        Square and symmetric matrices use the same (grid, component)
+        order for the rows and columns.
+        """
+        return get_sparse_matrix(self, apply_symmetry=apply_symmetry,
+                                 sparse_format=sparse_format)
+
     def get_matrix(self, is_sparse: bool=False,
                    apply_symmetry: bool=True) -> tuple[np.ndarray | scipy.coomatrix,
                                                        dict[int, tuple[int, int]],
@@ -801,7 +866,12 @@ class NastranMatrix(BaseCard):
                 size = 16
             del Gi, Gj
 
-        if self.is_complex:
+        GCi = np.asarray(self.GCi)
+        GCj = np.asarray(self.GCj)
+        if (GCi.ndim == 2 and GCj.ndim == 2 and
+                GCi.dtype.kind in 'iu' and GCj.dtype.kind in 'iu'):
+            msg += _write_columns(self, GCj, GCi, size, is_double)
+        elif self.is_complex:
             if self.is_polar:
                 for (GCi, GCj, reali, complexi) in zip(self.GCi, self.GCj, self.Real, self.Complex):
                     magi = sqrt(reali**2 + complexi**2)
@@ -846,6 +916,155 @@ class NastranMatrix(BaseCard):
         #assert isinstance(self.Real[0], (list, np.ndarray)), msg
         return msg
 
+def _parse_columns(cards: list[BDFCard], is_complex: bool,
+                   is_polar: bool) -> tuple[np.ndarray, np.ndarray,
+                                            np.ndarray, np.ndarray | None]:
+    """
+    Casts the column cards of a DMIG, DMIJ, DMIJI, DMIK
+
+    Returns
+    -------
+    GCj : (nterms, 2) int ndarray
+        the (grid, component) of the column
+    GCi : (nterms, 2) int ndarray
+        the (grid, component) of the row
+    reals : (nterms, ) float ndarray
+        the real terms
+    complexs : (nterms, ) float ndarray; None
+        the imaginary terms
+
+    Raises
+    ------
+    ValueError : a field couldn't be cast (e.g., a blank real field)
+
+    """
+    gj_fields = []
+    cj_fields = []
+    nterms_per_card = []
+    term_fields = []
+    for card in cards:
+        nfields = len(card)
+        nterms = (nfields - 5) // 4
+        if (nfields - 5) % 4 in [2, 3]:  # real/complex
+            nterms += 1
+        if nterms <= 0:
+            raise ValueError('nloops=%s' % nterms)
+
+        fields = card.card[5:nfields]
+        nterm_fields = 4 * nterms
+        if len(fields) < nterm_fields:
+            fields = fields + [None] * (nterm_fields - len(fields))
+        else:
+            fields = fields[:nterm_fields]
+        gj_fields.append(card.field(2))
+        cj_fields.append(card.field(3))
+        nterms_per_card.append(nterms)
+        term_fields.extend(fields)
+
+    Gj = np.repeat(_parse_int_fields(gj_fields), nterms_per_card)
+    Cj = np.repeat(_parse_int_fields(cj_fields, default=0), nterms_per_card)
+    Gi = _parse_int_fields(term_fields[0::4])
+    Ci = _parse_int_fields(term_fields[1::4], default=0)
+    if Cj.min() < 0 or Cj.max() > 6 or Ci.min() < 0 or Ci.max() > 6:
+        raise ValueError('C must be between [0, 6]')
+
+    reals = _parse_float_fields(term_fields[2::4])
+    complexs = None
+    if is_complex:
+        complexs = _parse_float_fields(term_fields[3::4])
+        if is_polar:
+            mag = reals
+            phase = np.radians(complexs)
+            reals = mag * np.cos(phase)
+            complexs = mag * np.sin(phase)
+    GCj = np.column_stack([Gj, Cj])
+    GCi = np.column_stack([Gi, Ci])
+    return GCj, GCi, reals, complexs
+
+def _parse_int_fields(svalues: list[Any], default: int | None=None) -> np.ndarray:
+    """casts a list of integer fields; blank fields use the default"""
+    if None in svalues:
+        if default is None:
+            raise ValueError('a blank integer field was found')
+        svalues = [default if svalue is None else svalue for svalue in svalues]
+    values = np.array(svalues)
+    if values.dtype.kind == 'f':
+        raise ValueError('a float was found in an integer field')
+    return values.astype('int64')
+
+def _parse_float_fields(svalues: list[Any]) -> np.ndarray:
+    """casts a list of float fields; integers and blanks aren't allowed"""
+    if None in svalues or '' in svalues:
+        raise ValueError('a blank float field was found')
+    values = np.array(svalues)
+    if values.dtype.kind == 'f':
+        if any(isinstance(svalue, integer_types) for svalue in svalues):
+            raise ValueError('an integer was found in a float field')
+        return values.astype('float64')
+    if values.dtype.kind != 'U':
+        raise ValueError('an integer was found in a float field')
+    if np.char.isdigit(values).any():  # 1, not +1, or -1
+        raise ValueError('an integer was found in a float field')
+    try:
+        return values.astype('float64')
+    except ValueError:
+        # Nastran-style exponents (e.g., 1.0-3, 1.0D+3)
+        return np.array([double_from_str(svalue) for svalue in values.tolist()])
+
+def _write_columns(matrix: NastranMatrix, GCj: np.ndarray, GCi: np.ndarray,
+                   size: int, is_double: bool) -> str:
+    """
+    Writes the column cards (one term per card) of a DMIG, DMIJ, DMIJI, DMIK
+
+    The cards are written directly from the (grid, component) arrays,
+    so it's the same output as ``print_card_8``, ``print_card_16``,
+    and ``print_card_double``.
+    """
+    reals = np.asarray(matrix.Real)
+    if matrix.is_complex:
+        complexs = np.asarray(matrix.Complex)
+        if matrix.is_polar:
+            reals, complexs = _real_imag_to_mag_phase(reals, complexs)
+        values2 = complexs.tolist()
+    else:
+        values2 = [None] * len(reals)
+    values1 = reals.tolist()
+
+    gj = GCj[:, 0].tolist()
+    cj = GCj[:, 1].tolist()
+    gi = GCi[:, 0].tolist()
+    ci = GCi[:, 1].tolist()
+    lines = []
+    if size == 8:
+        head = '%-8s' % matrix.type + print_field_8(matrix.name)
+        for gji, cji, gii, cii, value1, value2 in zip(gj, cj, gi, ci, values1, values2):
+            line = '%s%8d%8d        %8d%8d%s' % (
+                head, gji, cji, gii, cii, print_float_8(value1))
+            if value2 is not None:
+                line += print_float_8(value2)
+            lines.append(line.rstrip(' ') + '\n')
+    else:
+        if is_double:
+            print_float = print_scientific_double
+        else:
+            print_float = print_float_16
+        head = '%-8s' % (matrix.type + '*') + print_field_16(matrix.name)
+        for gji, cji, gii, cii, value1, value2 in zip(gj, cj, gi, ci, values1, values2):
+            line1 = '%s%16d%16d' % (head, gji, cji)
+            line2 = '%16d%16d%s' % (gii, cii, print_float(value1))
+            if value2 is not None:
+                line2 += print_float(value2)
+            lines.append(line1.rstrip(' ') + '\n*       ' + line2.rstrip(' ') + '\n')
+    return ''.join(lines)
+
+def _real_imag_to_mag_phase(reals: np.ndarray,
+                            complexs: np.ndarray) -> tuple[np.ndarray, np.ndarray]:
+    """converts the real/imaginary terms to magnitude/phase (degrees)"""
+    mag = np.sqrt(reals ** 2 + complexs ** 2)
+    phase = np.degrees(np.arctan2(complexs, reals))
+    phase[reals == 0.0] = 0.0
+    return mag, phase
+
 def _determine_size_double_from_tin(tin: int,
                                     size: int, is_double: bool) -> tuple[int, bool]:
     """
@@ -2327,53 +2546,96 @@ def _get_row_col_map_1d(matrix, GCi, GCj, ifo: int):
 
 def _get_row_col_map_2d(matrix, GCi, GCj, ifo):
     """helper for ``get_row_col_map``"""
-    rows = {}
-    rows_reversed = {}
-
-    cols = {}
-    cols_reversed = {}
-    #print('i0=%s j0=%s' % (i, j))
-    #nrows = len(GCi)
-    #ncols = len(GCj)
-    #rows_array = np.zeros((nrows, 2), dtype='int32')
-    #cols_array = np.zeros((ncols, 2), dtype='int32')
-    #for i, (nid, comp) in enumerate(GCi):
-        ##print('i=%s nid=%s comp=%s nrows=%s rows_array.shape=%s' % (
-            ##i, nid, comp, nrows, str(rows_array.shape)))
-        #rows_array[i, :] = [nid, comp]
-    #print('rows_array = \n%s' % rows_array)
-
-    #for j, (nid, comp) in enumerate(GCj):
-        #cols_array[j, :] = [nid, comp]
-
-    i = 0
-    for gc in GCi:
-        tgc = tuple(gc)
-        if tgc not in rows:
-            rows[tgc] = i
-            rows_reversed[i] = tgc
-            i += 1
+    unused_irow, unused_jcol, row_gc, col_gc = _get_row_col_index_2d(
+        GCi, GCj, is_shared=(ifo == 6))
 
+    rows_reversed = {i: tuple(gc) for i, gc in enumerate(row_gc.tolist())}
+    rows = {gc: i for i, gc in rows_reversed.items()}
     if ifo == 6:
         # symmetric
-        for gc in GCj:
-            tgc = tuple(gc)
-            if tgc not in rows:
-                rows[tgc] = i
-                rows_reversed[i] = tgc
-                i += 1
         cols = rows
         cols_reversed = rows_reversed
     else:
-        j = 0
-        for gc in GCj:
-            tgc = tuple(gc)
-            if tgc not in cols:
-                cols[tgc] = j
-                cols_reversed[j] = tgc
-                j += 1
+        cols_reversed = {j: tuple(gc) for j, gc in enumerate(col_gc.tolist())}
+        cols = {gc: j for j, gc in cols_reversed.items()}
     return rows, cols, rows_reversed, cols_reversed
 
+def _get_row_col_index_2d(GCi, GCj,
+                          is_shared: bool) -> tuple[np.ndarray, np.ndarray,
+                                                    np.ndarray, np.ndarray]:
+    """
+    Gets the row/column index of each term
+
+    Parameters
+    ----------
+    GCi / GCj : (nterms, 2) int ndarray
+        the (grid, component) of the row/column of each term
+    is_shared : bool
+        the rows and columns use the same (grid, component) order
+
+    Returns
+    -------
+    irow / jcol : (nterms, ) int ndarray
+        the row/column index of each term
+    row_gc / col_gc : (nrows/ncols, 2) int ndarray
+        the (grid, component) of each row/column in the order they
+        first appear
+
+    """
+    if is_shared:
+        nterms = len(GCi)
+        index, row_gc = _gc_first_index(np.vstack([GCi, GCj]))
+        irow = index[:nterms]
+        jcol = index[nterms:]
+        col_gc = row_gc
+    else:
+        irow, row_gc = _gc_first_index(GCi)
+        jcol, col_gc = _gc_first_index(GCj)
+    return irow, jcol, row_gc, col_gc
+
+def _gc_first_index(GC: np.ndarray) -> tuple[np.ndarray, np.ndarray]:
+    """
+    Maps each (grid, component) to the order it first appears in
+
+    Returns
+    -------
+    index : (n, ) int ndarray
+        the location of each (grid, component) in unique_gc
+    unique_gc : (nunique, 2) int ndarray
+        the unique (grid, component) pairs in the order they first appear
+
+    """
+    GC = np.asarray(GC)
+    if GC.dtype.kind not in 'iu':
+        # the components haven't been filled in (e.g., None)
+        gc_map = {}
+        index = np.zeros(len(GC), dtype='int64')
+        for i, gc in enumerate(GC):
+            tgc = tuple(gc)
+            index[i] = gc_map.setdefault(tgc, len(gc_map))
+        unique_gc = np.array(list(gc_map), dtype=GC.dtype)
+        return index, unique_gc
+
+    if GC.ndim == 2 and len(GC) and GC.min() >= 0:
+        # a single integer key is much faster than a unique row search
+        ncomp = GC[:, 1].max() + 1
+        key = GC[:, 0].astype('int64') * ncomp + GC[:, 1]
+        unused_ukey, ifirst, inverse = np.unique(
+            key, return_index=True, return_inverse=True)
+    else:
+        unused_ugc, ifirst, inverse = np.unique(
+            GC, axis=0, return_index=True, return_inverse=True)
+
+    # np.unique sorts the values, so put them back in the order
+    # they first appear
+    iorder = np.argsort(ifirst)
+    nunique = len(ifirst)
+    rank = np.zeros(nunique, dtype='int64')
+    rank[iorder] = np.arange(nunique)
+    index = rank[inverse.ravel()]
+    unique_gc = GC[ifirst[iorder]]
+    return index, unique_gc
+
 def _fill_sparse_matrix(matrix: DMIG, nrows: int, ncols: int,
                         apply_symmetry: bool) -> coo_matrix:
     """helper method for ``get_matrix``"""
@@ -2400,7 +2662,6 @@ def _fill_sparse_matrix(matrix: DMIG, nrows: int, ncols: int,
         if matrix.matrix_form == 6:  # symmetric
             ngc = GCi.shape[0]
             GCij = np.vstack([GCi, GCj])
-            uGCij, idx = unique2d(GCij, return_index=True)
             rows_cols, nrows = gc_to_index(GCij)
             ncols = nrows
 
@@ -2448,70 +2709,34 @@ def _fill_sparse_matrix(matrix: DMIG, nrows: int, ncols: int,
         shape=(nrows, ncols), dtype=dtype)
     return sparse_matrix
 
-def _build_gc_map(GC: np.ndarray) -> dict[tuple[int, int], int]:
-    """helper method for ``gc_to_index``"""
-    i = 0
-    gc_map = {}
-    for gc in GC:
-        tgc = tuple(gc)
-        if tgc in gc_map:
-            continue
-        gc_map[tgc] = i
-        i += 1
-    return gc_map
-
 def gc_to_index(GC: np.ndarray) -> tuple[np.ndarray, int]:
     """helper method for ``_fill_sparse_matrix``"""
-    gc_map = _build_gc_map(GC)
-    ngrid_map = len(gc_map)
-    ngrid = GC.shape[0]
-    index = np.zeros(ngrid, dtype='int32')
-    for i, gc in enumerate(GC):
-        tgc = tuple(gc)
-        j = gc_map[tgc]
-        index[i] = j
-    return index, ngrid_map
+    index, unique_gc = _gc_first_index(GC)
+    return index.astype('int32'), len(unique_gc)
 
 def _fill_dense_rectangular_matrix(matrix: DMIG,
-                                   nrows: int, ncols: int, ndim: int,
-                                   rows: dict[Any, int], cols: dict[Any, int],
-                                   apply_symmetry: bool) -> Any:
+                                   nrows: int, ncols: int,
+                                   irow: np.ndarray, jcol: np.ndarray,
+                                   apply_symmetry: bool) -> np.ndarray:
     """helper method for ``get_matrix``"""
-    if matrix.is_complex:
-        dense_mat = _fill_dense_rectangular_matrix_complex(
-            matrix, nrows, ncols, ndim, rows, cols, apply_symmetry)
-    else:
-        dense_mat = _fill_dense_rectangular_matrix_real(
-            matrix, nrows, ncols, ndim, rows, cols, apply_symmetry)
-        assert isinstance(dense_mat, np.ndarray), type(dense_mat)
-    return dense_mat
-
-def _fill_dense_rectangular_matrix_complex(matrix: DMIG,
-                                           nrows: int, ncols: int, ndim: int,
-                                           rows: dict[Any, int], cols: dict[Any, int],
-                                           apply_symmetry: bool) -> np.ndarray:
-    """helper method for ``_fill_dense_rectangular_matrix``"""
     dense_mat = np.zeros((nrows, ncols), dtype=matrix.tin_dtype)
-    real_imag = matrix.Real + 1j * matrix.Complex
+    data = _get_matrix_data(matrix).astype(dense_mat.dtype)
+
+    # repeated (row, column) terms are summed
+    np.add.at(dense_mat, (irow, jcol), data)
     if matrix.matrix_form == 6 and apply_symmetry:  # symmetric
-        is_diagonal, not_diagonal = _get_diagonal_symmetric(matrix)
-        for (gcj, real_imagi) in zip(matrix.GCj[is_diagonal], real_imag[is_diagonal]):
-            j = cols[(gcj[0], gcj[1])]
-            dense_mat[j, j] += real_imagi
-
-        for (gcj, gci, real_imagi) in zip(matrix.GCj[not_diagonal], matrix.GCi[not_diagonal],
-                                          real_imag[not_diagonal]):
-            i = rows[(gci[0], gci[1])]
-            j = cols[(gcj[0], gcj[1])]
-            dense_mat[i, j] += real_imagi
-            dense_mat[j, i] += real_imagi
-    else:
-        for (gcj, gci, real_imagi) in zip(matrix.GCj, matrix.GCi, real_imag):
-            i = rows[(gci[0], gci[1])]
-            j = cols[(gcj[0], gcj[1])]
-            dense_mat[i, j] += real_imagi
+        unused_is_diagonal, not_diagonal = _get_diagonal_symmetric(matrix)
+        np.add.at(dense_mat, (jcol[not_diagonal], irow[not_diagonal]),
+                  data[not_diagonal])
     return dense_mat
 
+def _get_matrix_data(matrix: DMIG) -> np.ndarray:
+    """gets the real/complex terms of the matrix"""
+    reals = np.asarray(matrix.Real)
+    if matrix.is_complex:
+        return reals + 1j * np.asarray(matrix.Complex)
+    return reals
+
 def _get_diagonal_symmetric(matrix: DMIG) -> tuple[np.ndarray, np.ndarray]:
     """helper for ``apply_symmetry``"""
     assert matrix.GCi.ndim == 2, matrix.GCi.ndim
@@ -2522,84 +2747,6 @@ def _get_diagonal_symmetric(matrix: DMIG) -> tuple[np.ndarray, np.ndarray]:
     not_diagonal = ~is_diagonal
     return is_diagonal, not_diagonal
 
-def _fill_dense_rectangular_matrix_real(matrix: DMIG,
-                                        nrows: int, ncols: int, ndim: int,
-                                        rows: dict[Any, int], cols: dict[Any, int],
-                                        apply_symmetry: bool) -> np.ndarray:
-    """helper method for ``_fill_dense_rectangular_matrix``"""
-    dense_mat = np.zeros((nrows, ncols), dtype=matrix.tin_dtype)
-    if matrix.matrix_form == 6 and apply_symmetry:  # symmetric
-        is_diagonal, not_diagonal = _get_diagonal_symmetric(matrix)
-        try:
-            for (gcj, reali) in zip(matrix.GCj[is_diagonal], matrix.Real[is_diagonal]):
-                i = rows[tuple(gcj)]
-                dense_mat[i, i] += reali
-
-            for (gcj, gci, reali) in zip(matrix.GCj[not_diagonal], matrix.GCi[not_diagonal], matrix.Real[not_diagonal]):
-                i = rows[tuple(gci)]
-                j = cols[tuple(gcj)]
-                dense_mat[i, j] += reali
-                dense_mat[j, i] += reali
-        except IndexError:
-            msg = ('name=%s ndim=%s i=%s j=%s matrix_type=%s '
-                   'is_polar=%s ncols=%s M.shape=%s\n' % (
-                       matrix.name, ndim, i, j, matrix.matrix_type,
-                       matrix.is_polar, matrix.ncols, dense_mat.shape))
-            msg += 'Rows:\n'
-            for i, row in enumerate(rows):
-                msg += 'i=%s row=%s\n' % (i, row)
-            raise RuntimeError(msg)
-    else:
-        try:
-            for (gcj, gci, reali) in zip(matrix.GCj, matrix.GCi, matrix.Real):
-                tgci = tuple(gci)
-                tgcj = tuple(gcj)
-                i = rows[tgci]
-                j = cols[tgcj]
-                dense_mat[i, j] += reali
-        except KeyError:
-            msg = ('name=%s ndim=%s gci=%s gcj=%s matrix_type=%s '
-                   'is_polar=%s ncols=%s M.shape=%s\n\n' % (
-                       matrix.name, ndim, str(gci), str(gcj), matrix.matrix_type,
-                       matrix.is_polar, matrix.ncols, dense_mat.shape))
-
-            gci2 = (gci[0], gci[1])
-            gcj2 = (gcj[0], gcj[1])
-            if gci2 in rows:
-                msg += 'gci/row_key=%s found\n' % str(gci2)
-            else:
-                msg += 'gci/row_key=%s not found\n' % str(gci2)
-                msg += 'Rows:\n'
-                for i, row in enumerate(rows):
-                    msg += '  i=%s row=%s\n' % (i, row)
-
-            if gcj2 in cols:
-                msg += '\ngcj/col_key=%s found\n' % str(gcj2)
-            else:
-                msg += '\ngcj/col_key=%s not found\n' % str(gcj2)
-                msg += 'Cols:\n'
-                for j, col in enumerate(cols):
-                    msg += '  j=%s row=%s\n' % (j, col)
-            msg += '\n'
-            print(msg)
-            raise KeyError(msg)
-
-        except IndexError:
-            msg = ('name=%s ndim=%s i=%s j=%s matrix_type=%s '
-                   'is_polar=%s ncols=%s M.shape=%s\n' % (
-                       matrix.name, ndim, i, j, matrix.matrix_type,
-                       matrix.is_polar, matrix.ncols, dense_mat.shape))
-            msg += 'Rows:\n'
-            for i, row in enumerate(rows):
-                msg += '  i=%s row=%s\n' % (i, row)
-
-            msg += '\nCols:\n'
-            for j, row in enumerate(cols):
-                msg += '  j=%s row=%s\n' % (j, row)
-            raise RuntimeError(msg)
-    return dense_mat
-
-
 def _fill_dense_column_matrix(matrix: DMIG,
                               nrows: int, ncols: int, ndim: int,
                               rows: dict[Any, int], cols: dict[Any, int],
@@ -2758,6 +2905,62 @@ def get_dmi_matrix(matrix: DMI,
         #raise RuntimeError(matrix.get_stats())
     return M, None, None
 
+def get_sparse_matrix(matrix: DMIG,
+                      apply_symmetry: bool=True,
+                      sparse_format: str='csc') -> tuple[Any, np.ndarray, np.ndarray]:
+    """
+    Builds the matrix as a scipy.sparse matrix
+
+    Parameters
+    ----------
+    apply_symmetry : bool; default=True
+        If the matrix is symmetric (matrix_form=6), the terms that are
+        off the diagonal are mirrored.
+    sparse_format : str; default='csc'
+        the scipy.sparse format (e.g., 'csc', 'csr', 'coo')
+
+    Returns
+    -------
+    M : scipy.sparse matrix
+        the matrix; repeated terms are summed
+    row_gc : (nrows, 2) int ndarray
+        the (grid, component) of each row
+    col_gc : (ncols, 2) int ndarray
+        the (grid, component) of each column
+
+    """
+    GCi = np.asarray(matrix.GCi)
+    GCj = np.asarray(matrix.GCj)
+    is_symmetric = matrix.matrix_form == 6
+    if GCi.ndim == 1:
+        # DMI; the rows/columns are 1-based
+        irow = GCi.astype('int64') - 1
+        jcol = GCj.astype('int64') - 1
+        nrows = max(irow.max() + 1, getattr(matrix, 'nrows', 0) or 0)
+        ncols = max(jcol.max() + 1, matrix.ncols or 0)
+        if matrix.matrix_form in {1, 6}:
+            nrows = ncols = max(nrows, ncols)
+        row_gc = np.arange(1, nrows + 1)
+        col_gc = np.arange(1, ncols + 1)
+    else:
+        # square and symmetric matrices share the (grid, component) order
+        irow, jcol, row_gc, col_gc = _get_row_col_index_2d(
+            GCi, GCj, is_shared=(matrix.matrix_form in {1, 6}))
+        nrows = len(row_gc)
+        ncols = len(col_gc)
+
+    data = _get_matrix_data(matrix)
+    if is_symmetric and apply_symmetry:
+        not_diagonal = (irow != jcol)
+        irow, jcol = (np.hstack([irow, jcol[not_diagonal]]),
+                      np.hstack([jcol, irow[not_diagonal]]))
+        data = np.hstack([data, data[not_diagonal]])
+
+    sparse_matrix = coo_matrix(
+        (data, (irow, jcol)),
+        shape=(nrows, ncols), dtype=matrix.tin_dtype)
+    return sparse_matrix.asformat(sparse_format), row_gc, col_gc
+
 def get_matrix(self: DMIG,
                is_sparse: bool=False,
                apply_symmetry: bool=False) -> tuple[Any,
@@ -2785,6 +2988,24 @@ def get_matrix(self: DMIG,
         dictionary of keys=columnID, values=(Grid,Component) for the matrix
 
     """
+    GCi = np.asarray(self.GCi)
+    GCj = np.asarray(self.GCj)
+    if not is_sparse and GCi.ndim == 2:
+        #assert isinstance(self, (DMIG, DMIK, DMIJ, DMIJI)), type(self)
+        irow, jcol, row_gc, col_gc = _get_row_col_index_2d(
+            GCi, GCj, is_shared=(self.matrix_form == 6))
+        nrows = len(row_gc)
+        ncols = len(col_gc)
+        assert nrows > 0, 'nrows=%s' % nrows
+        assert ncols > 0, 'ncols=%s' % ncols
+        M = _fill_dense_rectangular_matrix(self, nrows, ncols, irow, jcol, apply_symmetry)
+        rows_reversed = {i: tuple(gc) for i, gc in enumerate(row_gc.tolist())}
+        if self.matrix_form == 6:
+            cols_reversed = rows_reversed
+        else:
+            cols_reversed = {j: tuple(gc) for j, gc in enumerate(col_gc.tolist())}
+        return M, rows_reversed, cols_reversed
+
     nrows, ncols, ndim, rows, cols, rows_reversed, cols_reversed = get_row_col_map(
         self, self.GCi, self.GCj, self.matrix_form)
 
@@ -2793,14 +3014,9 @@ def get_matrix(self: DMIG,
         #assert isinstance(self, (DMIG, DMIK, DMIJI)), type(self)
         M = _fill_sparse_matrix(self, nrows, ncols, apply_symmetry)
     else:
-        if ndim == 1:
-            #assert isinstance(self, int), type(self)
-            M = _fill_dense_column_matrix(self, nrows, ncols, ndim, rows, cols, apply_symmetry)
-            assert isinstance(M, np.ndarray), type(M)
-        else:
-            #assert isinstance(self, (DMIG, DMIK, DMIJ, DMIJI)), type(self)
-            M = _fill_dense_rectangular_matrix(self, nrows, ncols, ndim, rows, cols, apply_symmetry)
-            assert isinstance(M, np.ndarray), type(M)
+        #assert isinstance(self, int), type(self)
+        M = _fill_dense_column_matrix(self, nrows, ncols, ndim, rows, cols, apply_symmetry)
+        assert isinstance(M, np.ndarray), type(M)
     return M, rows_reversed, cols_reversed
 
 
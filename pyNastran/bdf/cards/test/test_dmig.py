@@ -581,6 +581,82 @@ class TestDMIGReal(unittest.TestCase):
         get_matrices(model)
         #kaax = model.dmigs['KAAX'].get_matrix(is_sparse=True)
 
+    def test_dmig_get_sparse_matrix(self):
+        """tests the scipy.sparse matrix matches the dense matrix"""
+        model = BDF(debug=False, log=None, mode='msc')
+        GCi = [
+            [1, 1], [1, 2], [1, 3],
+            [1, 2], [1, 3],
+            [1, 3],
+            [1, 3],
+        ]
+        GCj = [
+            [1, 1], [1, 1], [1, 1],
+            [1, 2], [1, 2],
+            [1, 3],
+            [1, 3],
+        ]
+        Real = [1., 2., 3., 4., 5., 6., 7.]
+        test = model.add_dmig('TEST', 6, 2, 2, 0, None,
+                              GCj, GCi, Real, Complex=None, comment='')
+
+        A_expected = np.array([
+            [1., 2., 3.],
+            [2., 4., 5.],
+            [3., 5., 13.],
+        ])
+        A1, row_gc, col_gc = test.get_sparse_matrix()
+        assert A1.format == 'csc', A1.format
+        assert np.array_equal(A1.toarray(), A_expected)
+        assert np.array_equal(row_gc, [[1, 1], [1, 2], [1, 3]])
+        assert np.array_equal(col_gc, row_gc)
+
+        A2, unused_rows, unused_cols = test.get_matrix(is_sparse=False, apply_symmetry=True)
+        assert np.array_equal(A2, A_expected)
+
+        A3 = test.get_sparse_matrix(apply_symmetry=False, sparse_format='csr')[0]
+        assert A3.format == 'csr', A3.format
+        assert np.array_equal(A3.toarray(), np.tril(A_expected))
+
+    def test_dmig_add_columns(self):
+        """tests the column cards are cast all at once"""
+        model = BDF(debug=False, log=None, mode='msc')
+        lines = [
+            ['DMIG', 'REAL', '0', '2', '1', None, None, None, '2'],
+            ['DMIG', 'REAL', '1', '1', None, '1', '1', '1.0', None,
+             '2', None, '2.0-3', None, '3', '2', '-3'],
+            ['DMIG', 'REAL', '2', None, None, '1', '1', '4.', None],
+
+            ['DMIG', 'IMAG', '0', '2', '3', None, '1', None, '1'],
+            ['DMIG', 'IMAG', '1', '1', None, '1', '1', '1.0', '90.'],
+            ['DMIG', 'IMAG', '2', '1', None, '2', '1', '2.0', '0.'],
+        ]
+        for line in lines:
+            model.add_card(line, 'DMIG')
+        fill_dmigs(model)
+
+        real = model.dmig['REAL']
+        assert np.array_equal(real.GCj, [[1, 1], [1, 1], [1, 1], [2, 0]])
+        assert np.array_equal(real.GCi, [[1, 1], [2, 0], [3, 2], [1, 1]])
+        assert np.allclose(real.Real, [1.0, 2.0e-3, -3., 4.])
+
+        imag = model.dmig['IMAG']
+        assert np.allclose(imag.Real, [0., 2.])
+        assert np.allclose(imag.Complex, [1., 0.])
+
+        msg = real.write_card(size=8)
+        assert 'DMIG        REAL       1       1               3       2     -3.\n' in msg, msg
+        model2 = save_load_deck(model)
+        assert np.allclose(model2.dmig['REAL'].Real, real.Real)
+        assert np.allclose(model2.dmig['IMAG'].Complex, imag.Complex)
+
+        # a blank real value is an error
+        model = BDF(debug=False, log=None, mode='msc')
+        model.add_card(['DMIG', 'BAD', '0', '1', '1', None, None, None, '1'], 'DMIG')
+        model.add_card(['DMIG', 'BAD', '1', '1', None, '1', '1', None], 'DMIG')
+        with self.assertRaises(SyntaxError):
+            fill_dmigs(model)
+
     def test_dmig_rectangular(self):
         """testing symmetric DMIGs"""
         model = BDF(debug=False, log=None, mode='msc')
@@ -14,7 +14,7 @@ from pyNastran.bdf.mesh_utils.convert import convert
 from pyNastran.bdf.mesh_utils.bdf_renumber import bdf_renumber
 from pyNastran.bdf.mesh_utils.mirror_mesh import bdf_mirror
 from pyNastran.bdf.mesh_utils.mass_properties import (
-    mass_properties, mass_properties_nsm, mass_properties_breakdown)
+    mass_properties, _mass_properties_elementwise, mass_properties_nsm, mass_properties_breakdown)
 from pyNastran.bdf.mesh_utils.forces_moments import get_load_arrays, get_pressure_array
 from pyNastran.bdf.mesh_utils.export_caero_mesh import export_caero_mesh
 
@@ -207,7 +207,7 @@ def _run_mass_properties(model2, nnodes, nelements, run_mass_properties=True):
 
     if nelements > 1 and nnodes == 0:  # pragma: no cover
         raise RuntimeError('no nodes exist')
-    mass1, cg1, inertia1 = mass_properties(model2, reference_point=None, sym_axis=None)
+    mass1, cg1, inertia1 = _mass_properties_elementwise(model2, reference_point=None, sym_axis=None)
     mass2, cg2, inertia2 = mass_properties_nsm(model2, reference_point=None, sym_axis=None)
     #if not quiet:
         #if model2.wtmass != 1.0:
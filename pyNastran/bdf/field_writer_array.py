@@ -0,0 +1,226 @@
+"""
+Defines functions for writing arrays of 8/16 character fields.
+
+The output is the same as calling the scalar functions on each value
+(e.g., print_float_8), but the common values (the ones written with
+fixed point) are formatted as a group with a single string format.
+"""
+from typing import Callable, Optional
+
+import numpy as np
+from numpy import float32, float64
+
+from pyNastran.utils.numpy_utils import integer_types
+from pyNastran.bdf.cards.utils import wipe_empty_fields
+from pyNastran.bdf.field_writer_8 import print_float_8
+from pyNastran.bdf.field_writer_16 import print_float_16
+from pyNastran.bdf.field_writer_double import print_scientific_double
+
+
+def print_floats_8(values: np.ndarray) -> list[str]:
+    """
+    Prints floats in nastran 8-character width syntax
+
+    Parameters
+    ----------
+    values : (n, ) float ndarray
+        the values to print
+
+    Returns
+    -------
+    fields : list[str]
+        the 8-character strings; same as print_float_8
+
+    """
+    return _print_floats(values, 8, print_float_8)
+
+
+def print_floats_16(values: np.ndarray) -> list[str]:
+    """
+    Prints floats in nastran 16-character width syntax
+
+    Parameters
+    ----------
+    values : (n, ) float ndarray
+        the values to print
+
+    Returns
+    -------
+    fields : list[str]
+        the 16-character strings; same as print_float_16
+
+    """
+    return _print_floats(values, 16, print_float_16)
+
+
+def print_scientific_doubles(values: np.ndarray) -> list[str]:
+    """
+    Prints floats in 16-character scientific double precision
+
+    Parameters
+    ----------
+    values : (n, ) float ndarray
+        the values to print
+
+    Returns
+    -------
+    fields : list[str]
+        the 16-character strings; same as print_scientific_double
+
+    """
+    values = np.asarray(values, dtype='float64').ravel()
+    fields = np.empty(len(values), dtype=object)
+    is_negative = values < 0.
+    for fmt, ivalues in [('%16.9e\n', np.flatnonzero(is_negative)),
+                         ('%16.10e\n', np.flatnonzero(~is_negative))]:
+        if len(ivalues) == 0:
+            continue
+        svalues = (fmt * len(ivalues)) % tuple(values[ivalues].tolist())
+        svalues = svalues.replace('e', 'D').replace('-0.0000000000D+00', '0.0000000000D+00')
+        fields[ivalues] = svalues.split('\n')[:-1]
+    return fields.tolist()
+
+
+def _print_floats(values: np.ndarray, width: int,
+                  print_float: Callable[[float], str]) -> list[str]:
+    """
+    Prints floats in nastran 8/16-character width syntax
+
+    The fixed point values are grouped by the number of decimal places,
+    which follows print_float_8/print_float_16:
+     - positive: 0.001 <= value < 1 has width-1 decimal places,
+       1 <= value < 10 has width-2 decimal places, ...
+     - negative: -1 < value <= -0.01 has width-2 decimal places,
+       -10 < value <= -1 has width-3 decimal places, ...
+
+    The remaining values (e.g., 1e-8, 1e10, nan) use print_float.
+
+    """
+    values = np.asarray(values, dtype='float64').ravel()
+    nvalues = len(values)
+    fields = np.empty(nvalues, dtype=object)
+
+    ndecimals = np.full(nvalues, -1, dtype='int32')
+    abs_values = np.abs(values)
+    for is_sign, min_value, max_decimals in [(values > 0., 0.001, width - 1),
+                                             (values < 0., 0.01, width - 2)]:
+        edges = [min_value] + [10. ** i for i in range(max_decimals)]
+        iedge = np.searchsorted(edges, abs_values, side='right') - 1
+        is_fixed = is_sign & (iedge >= 0) & (iedge < max_decimals)
+        ndecimals[is_fixed] = max_decimals - iedge[is_fixed]
+
+    # 0. is common (e.g., the z coordinate of a plate)
+    ndecimals[values == 0.] = 0
+    for ndecimal in np.unique(ndecimals).tolist():
+        ivalues = np.flatnonzero(ndecimals == ndecimal)
+        if ndecimal == 0:
+            fields[ivalues] = '%*s' % (width, '0.')
+            continue
+        if ndecimal == -1:
+            fields[ivalues] = [print_float(value) for value in values[ivalues].tolist()]
+            continue
+        svalues = (f'%.{ndecimal}f\n' * len(ivalues)) % tuple(values[ivalues].tolist())
+        svalues = svalues.replace('-0.', '-.').split('\n')
+        svalues.pop()
+        fields[ivalues] = [f'{svalue.strip("0"):>{width}}' for svalue in svalues]
+    return fields.tolist()
+
+
+def print_cards_8(cards_fields: list[list[Optional[int | float | str]]]) -> list[str]:
+    """
+    Prints nastran-style cards with 8-character width fields
+
+    Parameters
+    ----------
+    cards_fields : list[list[int/float/str/None]]
+        the fields of each card (no trailing Nones)
+
+    Returns
+    -------
+    cards : list[str]
+        the cards; same as print_card_8
+
+    """
+    float_fields = iter(print_floats_8(_get_float_fields(cards_fields, (float, float32, float64))))
+    cards = []
+    for fields in cards_fields:
+        out = '%-8s' % fields[0]
+        for i in range(1, len(fields)):
+            value = fields[i]
+            if isinstance(value, int):
+                field = '%8i' % value
+            elif isinstance(value, (float, float32, float64)):
+                field = next(float_fields)
+            elif value is None:
+                field = '        '
+            else:
+                field = '%8s' % value
+            if len(field) != 8:
+                msg = 'field=%r is not 8 characters long...raw_value=%r' % (field, value)
+                raise RuntimeError(msg)
+            out += field
+            if i % 8 == 0:  # allow 1+8 fields per line
+                out = out.rstrip(' ')
+                if out[-1] == '\n':  # empty line
+                    out += '+'
+                out += '\n        '
+        cards.append(out.rstrip(' \n+') + '\n')
+    return cards
+
+
+def print_cards_16(cards_fields: list[list[Optional[int | float | str]]]) -> list[str]:
+    """
+    Prints nastran-style cards with 16-character width fields
+
+    Parameters
+    ----------
+    cards_fields : list[list[int/float/str/None]]
+        the fields of each card (no trailing Nones)
+
+    Returns
+    -------
+    cards : list[str]
+        the cards; same as print_card_16
+
+    """
+    cards_fields = [wipe_empty_fields(fields) for fields in cards_fields]
+    float_fields = iter(print_floats_16(_get_float_fields(cards_fields, (float, float32))))
+    cards = []
+    for fields in cards_fields:
+        nfields_main = len(fields) - 1  # chop off the card name
+        if nfields_main % 8 != 0:
+            fields += [None] * (8 - nfields_main % 8)
+
+        out = '%-8s' % (fields[0] + '*')
+        for i in range(1, len(fields)):
+            value = fields[i]
+            if isinstance(value, integer_types):
+                field = '%16s' % value
+            elif isinstance(value, (float, float32)):
+                field = next(float_fields)
+            elif value is None:
+                field = '                '
+            else:
+                field = '%16s' % value
+            if len(field) != 16:
+                msg = 'field=%r is not 16 characters long...rawValue=%r' % (field, value)
+                raise RuntimeError(msg)
+            out += field
+            if i % 4 == 0:  # allow 1+4 fields per line
+                out = out.rstrip(' ')
+                if out[-1] == '\n':  # empty line
+                    out += '*'
+                out += '\n*       '
+        out = out.rstrip(' *')  # removes one continuation star
+        if not out.endswith('\n'):
+            out += '\n'
+        cards.append(out)
+    return cards
+
+
+def _get_float_fields(cards_fields: list[list[Optional[int | float | str]]],
+                      float_types: tuple[type, ...]) -> np.ndarray:
+    """gets the float fields in the order they're written (ints are checked first)"""
+    return np.array([value for fields in cards_fields for value in fields[1:]
+                     if not isinstance(value, integer_types) and isinstance(value, float_types)],
+                    dtype='float64')
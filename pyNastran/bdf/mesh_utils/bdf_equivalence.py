@@ -15,6 +15,8 @@ from typing import Union, Optional, TYPE_CHECKING
 import numpy as np
 from numpy.linalg import norm  # type: ignore
 import scipy
+from scipy.sparse import coo_matrix
+from scipy.sparse.csgraph import connected_components
 from scipy.spatial import KDTree
 
 from pyNastran.nptyping_interface import NDArrayNint, NDArrayN3float
@@ -84,6 +86,9 @@ def bdf_equivalence_nodes(bdf_filename: str,
     method: str; default='new'
         'new': doesn't require neq_max; new in v1.3
         'old': use neq_max; used in v1.2
+        'tree': doesn't require neq_max; array-based, so it's intended
+                for large models; chains of close nodes (e.g., 1-2 and
+                2-3 are within tol) are collapsed to the lowest node id
     log : logger(); default=None
         bdf logging
 
@@ -204,6 +209,12 @@ def _bdf_equivalence_nodes(bdf_filename: str, tol: float,
     log = model.log
     log.debug(f'bdf_equivalence_nodes; tol={tol}')
 
+    if method == 'tree':
+        nids_old, nids_new = _eq_nodes_tree(nodes_xyz, nids, tol, node_set=node_set)
+        _eq_nodes_final_tree(nids_old, nids_new, model)
+        nid_pairs = list(zip(nids_new.tolist(), nids_old.tolist()))
+        return model, nid_pairs
+
     nid_pairs = _nodes_xyz_nids_to_nid_pairs(
         nodes_xyz, nids, all_node_set,
         tol, log, inew,
@@ -513,6 +524,71 @@ def _eq_nodes_final(nid_pairs: list[tuple[int, int]],
         #skip_nodes.append(nid2)
     return
 
+def _eq_nodes_tree(nodes_xyz: NDArrayN3float,
+                   nids: NDArrayNint,
+                   tol: float,
+                   node_set: Optional[list[NDArrayNint]]=None) -> tuple[NDArrayNint,
+                                                                       NDArrayNint]:
+    """
+    Finds the nodes to equivalence without looping over the nodes
+
+    Parameters
+    ----------
+    nodes_xyz : (nnodes, 3) float ndarray
+        the xyzs to equivalence
+    nids : (nnodes,) int ndarray
+        the sorted node ids
+    tol : float
+        the spherical equivalence tolerance
+    node_set : list[(n, ) int ndarray]; default=None
+        the sets of nodes to consider; nodes are only equivalenced
+        to nodes in the same set
+
+    Returns
+    -------
+    nids_old : (nmerged, ) int ndarray
+        the node ids that are removed
+    nids_new : (nmerged, ) int ndarray
+        the node id that nids_old are equivalenced to, which is the
+        lowest node id of the group of connected nodes
+
+    """
+    idtype = nids.dtype
+    if tol < 0.0 or len(nids) < 2:
+        return np.array([], dtype=idtype), np.array([], dtype=idtype)
+
+    kdt = _get_tree(nodes_xyz)
+    ipairs = kdt.query_pairs(tol, output_type='ndarray')
+    if node_set is not None:
+        nid_pairs = nids[ipairs]
+        is_valid = np.zeros(len(ipairs), dtype='bool')
+        for seti in node_set:
+            is_valid |= np.isin(nid_pairs[:, 0], seti) & np.isin(nid_pairs[:, 1], seti)
+        ipairs = ipairs[is_valid, :]
+
+    # union-find on the pairs, so chains of nodes are a single group
+    nnodes = len(nids)
+    npairs = len(ipairs)
+    graph = coo_matrix((np.ones(npairs, dtype='int8'), (ipairs[:, 0], ipairs[:, 1])),
+                       shape=(nnodes, nnodes))
+    unused_ngroups, igroup = connected_components(graph, directed=False)
+
+    # the nids are sorted, so the first node of each group has the lowest id
+    unused_groups, ifirst = np.unique(igroup, return_index=True)
+    inew = ifirst[igroup]
+    iold = np.flatnonzero(inew != np.arange(nnodes))
+    return nids[iold], nids[inew[iold]]
+
+
+def _eq_nodes_final_tree(nids_old: NDArrayNint,
+                         nids_new: NDArrayNint,
+                         model: BDF) -> None:
+    """apply nodal equivalencing from ``_eq_nodes_tree`` to model"""
+    nodes = model.nodes
+    for nid_old, nid_new in zip(nids_old.tolist(), nids_new.tolist()):
+        _update_grid(nodes[nid_new], nodes[nid_old])
+
+
 def _update_grid(node1: GRID, node2: GRID) -> None:
     """helper method for _eq_nodes_final"""
     node2.nid = node1.nid
@@ -0,0 +1,523 @@
+"""
+defines:
+ - quality = get_element_quality(model, xyz_cid0=None, chunk_size=1_000_000)
+ - quality = get_connectivity_quality(xyz_cid0, family, inode, chunk_size=1_000_000)
+ - out = tri_quality_array(p1, p2, p3)
+ - out = quad_quality_array(p1, p2, p3, p4)
+ - out = solid_quality_array(xyz, faces)
+ - write_quality_csv(csv_filename, quality)
+ - msg = get_quality_summary(quality)
+
+The metrics are the same ones used by the GUI (``tri_quality`` and
+``quad_quality`` in ``delete_bad_elements``), but are calculated on
+(nelements, nnodes) connectivity arrays instead of element objects.
+Angles are in radians.
+
+"""
+from __future__ import annotations
+from typing import TextIO, TYPE_CHECKING
+import numpy as np
+if TYPE_CHECKING:  # pragma: no cover
+    from pyNastran.bdf.bdf import BDF
+
+PIOVER2 = np.pi / 2.
+PIOVER3 = np.pi / 3.
+
+QUALITY_NAMES = [
+    'area', 'taper_ratio', 'area_ratio', 'max_skew_angle', 'max_aspect_ratio',
+    'min_interior_angle', 'max_interior_angle', 'dideal_theta',
+    'min_edge_length', 'max_warp_angle',
+]
+ANGLE_NAMES = {'max_skew_angle', 'min_interior_angle', 'max_interior_angle',
+               'dideal_theta', 'max_warp_angle'}
+
+# the corner nodes of the higher order elements are used
+TRI_TYPES = {
+    'CTRIA3', 'CTRIAR', 'CTRIA6', 'CTRIAX', 'CTRAX3', 'CTRAX6',
+    'CPLSTN3', 'CPLSTN6', 'CPLSTS3', 'CPLSTS6',
+}
+QUAD_TYPES = {
+    'CQUAD4', 'CQUADR', 'CQUAD1', 'CSHEAR', 'CQUAD8', 'CQUAD', 'CQUADX',
+    'CQUADX4', 'CQUADX8', 'CPLSTN4', 'CPLSTN8', 'CPLSTS4', 'CPLSTS8',
+}
+LINE_TYPES = {'CBAR', 'CBEAM', 'CROD', 'CONROD', 'CTUBE'}
+ETYPE_TO_FAMILY = {
+    'CTETRA': 'tetra',
+    'CPENTA': 'penta',
+    'CHEXA': 'hexa',
+    'CPYRAM': 'pyram',
+    # the CTRIAX6 is numbered around the perimeter
+    'CTRIAX6': 'tri',
+}
+ETYPE_TO_FAMILY.update({etype: 'tri' for etype in TRI_TYPES})
+ETYPE_TO_FAMILY.update({etype: 'quad' for etype in QUAD_TYPES})
+ETYPE_TO_FAMILY.update({etype: 'line' for etype in LINE_TYPES})
+
+# the face angles are independent of the normal direction
+#      4
+#    / | \
+#   /  |  \
+#  3-------2
+#   \  |   /
+#    \ | /
+#      1
+CTETRA_FACES = (
+    (0, 1, 2),
+    (0, 3, 1),
+    (0, 3, 2),
+    (1, 3, 2),
+)
+#        /4-----3
+#       /       /
+#      /  5    /
+#    /    \   /
+#   /      \ /
+# 1---------2
+CPYRAM_FACES = (
+    (0, 1, 2, 3),
+    (1, 4, 2),
+    (2, 4, 3),
+    (0, 3, 4),
+    (0, 4, 1),
+)
+#       /6
+#     /  | \
+#   /    |   \
+# 3\     |     \
+# |  \   /4-----5
+# |    \/       /
+# |   /  \     /
+# |  /    \   /
+# | /      \ /
+# 1---------2
+CPENTA_FACES = (
+    (0, 2, 1),
+    (3, 4, 5),
+    (0, 1, 4, 3),
+    (1, 2, 5, 4),
+    (0, 3, 5, 2),
+)
+#      8----7
+#     /|   /|
+#    / |  / |
+#   /  5-/--6
+# 4-----3   /
+# |  /  |  /
+# | /   | /
+# 1-----2
+CHEXA_FACES = (
+    (0, 3, 2, 1),
+    (4, 5, 6, 7),
+    (0, 1, 5, 4),
+    (1, 2, 6, 5),
+    (2, 3, 7, 6),
+    (3, 0, 4, 7),
+)
+FAMILY_NNODES = {
+    'line': 2, 'tri': 3, 'quad': 4,
+    'tetra': 4, 'pyram': 5, 'penta': 6, 'hexa': 8,
+}
+SOLID_FACES = {
+    'tetra': CTETRA_FACES,
+    'pyram': CPYRAM_FACES,
+    'penta': CPENTA_FACES,
+    'hexa': CHEXA_FACES,
+}
+
+
+def get_element_quality(model: BDF, xyz_cid0: np.ndarray=None,
+                        chunk_size: int=1_000_000) -> dict[str, np.ndarray]:
+    """
+    Gets the quality metrics for the shell, solid, and line elements
+
+    Parameters
+    ----------
+    model : BDF()
+        the model object
+    xyz_cid0 : (nnodes, 3) float ndarray; default=None
+        the xyz coordinates in cid=0 sorted by node id
+        None: calculate it
+    chunk_size : int; default=1_000_000
+        the number of elements to process at once; limits the memory
+
+    Returns
+    -------
+    quality : dict[str, ndarray]
+        eid : (nelements, ) int ndarray
+            the sorted element ids
+        etype : (nelements, ) str ndarray
+            the element type
+        area, taper_ratio, ... : (nelements, ) float ndarray
+            the metrics in QUALITY_NAMES; NaN if it doesn't apply
+            (e.g., the taper ratio of a CTRIA3)
+
+    """
+    if xyz_cid0 is None:
+        xyz_cid0 = model.get_xyz_in_coord(cid=0, fdtype='float64')
+    nids = np.array(sorted(model.nodes), dtype='int64')
+
+    eids = []
+    etypes = []
+    family_nodes = {family: [] for family in FAMILY_NNODES}
+    family_ielement = {family: [] for family in FAMILY_NNODES}
+    ielement = 0
+    for eid, elem in sorted(model.elements.items()):
+        etype = elem.type
+        try:
+            family = ETYPE_TO_FAMILY[etype]
+        except KeyError:
+            continue
+        node_ids = elem.node_ids
+        if etype == 'CTRIAX6':
+            node_ids = node_ids[0:6:2]
+        else:
+            node_ids = node_ids[:FAMILY_NNODES[family]]
+        eids.append(eid)
+        etypes.append(etype)
+        family_nodes[family].append(node_ids)
+        family_ielement[family].append(ielement)
+        ielement += 1
+
+    nelements = len(eids)
+    quality = {
+        'eid': np.array(eids, dtype='int64'),
+        'etype': np.array(etypes),
+    }
+    for name in QUALITY_NAMES:
+        quality[name] = np.full(nelements, np.nan, dtype='float64')
+
+    for family, node_ids in family_nodes.items():
+        if len(node_ids) == 0:
+            continue
+        node_ids = np.array(node_ids, dtype='int64')
+        inode = np.searchsorted(nids, node_ids)
+        ielement = np.array(family_ielement[family], dtype='int64')
+        family_quality = get_connectivity_quality(
+            xyz_cid0, family, inode, chunk_size=chunk_size)
+        for name, values in family_quality.items():
+            quality[name][ielement] = values
+    return quality
+
+
+def get_connectivity_quality(xyz_cid0: np.ndarray, family: str, inode: np.ndarray,
+                             chunk_size: int=1_000_000) -> dict[str, np.ndarray]:
+    """
+    Gets the quality metrics for a single element family
+
+    Parameters
+    ----------
+    xyz_cid0 : (nnodes, 3) float ndarray
+        the xyz coordinates in cid=0
+    family : str
+        'line', 'tri', 'quad', 'tetra', 'pyram', 'penta', 'hexa'
+    inode : (nelements, nnodes) int ndarray
+        the corner node indices into xyz_cid0
+    chunk_size : int; default=1_000_000
+        the number of elements to process at once; limits the memory
+
+    Returns
+    -------
+    quality : dict[str, ndarray]
+        the metrics in QUALITY_NAMES; NaN if it doesn't apply
+
+    """
+    nelements, nnodes = inode.shape
+    assert nnodes == FAMILY_NNODES[family], (family, inode.shape)
+    quality = {name: np.full(nelements, np.nan, dtype='float64')
+               for name in QUALITY_NAMES}
+    for i0 in range(0, nelements, chunk_size):
+        i1 = min(i0 + chunk_size, nelements)
+        xyz = xyz_cid0[inode[i0:i1, :], :].astype('float64', copy=False)
+        points = [xyz[:, i, :] for i in range(nnodes)]
+        if family == 'tri':
+            (area, max_skew, aspect_ratio, min_theta, max_theta,
+             dideal_theta, min_edge_length) = tri_quality_array(*points)
+            out = {
+                'area': area, 'max_skew_angle': max_skew,
+                'max_aspect_ratio': aspect_ratio,
+                'min_interior_angle': min_theta, 'max_interior_angle': max_theta,
+                'dideal_theta': dideal_theta, 'min_edge_length': min_edge_length,
+            }
+        elif family == 'quad':
+            out = dict(zip(QUALITY_NAMES, quad_quality_array(*points)))
+        elif family == 'line':
+            out = {'min_edge_length': np.linalg.norm(points[1] - points[0], axis=1)}
+        else:
+            min_theta, max_theta, dideal_theta, min_edge_length = solid_quality_array(
+                xyz, SOLID_FACES[family])
+            out = {
+                'min_interior_angle': min_theta, 'max_interior_angle': max_theta,
+                'dideal_theta': dideal_theta, 'min_edge_length': min_edge_length,
+            }
+        for name, values in out.items():
+            quality[name][i0:i1] = values
+    return quality
+
+
+def _dot(a: np.ndarray, b: np.ndarray) -> np.ndarray:
+    """row-wise dot product"""
+    return np.einsum('ij,ij->i', a, b)
+
+
+def _norm(a: np.ndarray) -> np.ndarray:
+    """row-wise norm"""
+    return np.sqrt(_dot(a, a))
+
+
+def tri_quality_array(p1: np.ndarray, p2: np.ndarray, p3: np.ndarray,
+                      ) -> tuple[np.ndarray, np.ndarray, np.ndarray, np.ndarray,
+                                 np.ndarray, np.ndarray, np.ndarray]:
+    """
+    gets the quality metrics for a set of tris
+
+    Parameters
+    ----------
+    p1, p2, p3 : (ntri, 3) float ndarray
+        the corner points
+
+    Returns
+    -------
+    area, max_skew, aspect_ratio, min_theta, max_theta, dideal_theta, min_edge_length
+
+    """
+    #    3
+    #    / \
+    # e3/   \ e2
+    #  /    /\
+    # /    /  \
+    # 1---/----2
+    #    e1
+    e1 = (p1 + p2) / 2.
+    e2 = (p2 + p3) / 2.
+    e3 = (p3 + p1) / 2.
+    e21 = e2 - e1
+    e31 = e3 - e1
+    e32 = e3 - e2
+
+    e3_p2 = e3 - p2
+    e2_p1 = e2 - p1
+    e1_p3 = e1 - p3
+
+    v21 = p2 - p1
+    v32 = p3 - p2
+    v13 = p1 - p3
+    length21 = _norm(v21)
+    length32 = _norm(v32)
+    length13 = _norm(v13)
+    lengths = np.column_stack([length21, length32, length13])
+    min_edge_length = lengths.min(axis=1)
+    area = 0.5 * _norm(np.cross(v21, v13))
+
+    with np.errstate(divide='ignore', invalid='ignore'):
+        # the skew angles are supplementary pairs, so we only need 3
+        cos_skew = np.column_stack([
+            _dot(e2_p1, e31) / (_norm(e2_p1) * _norm(e31)),
+            _dot(e3_p2, e21) / (_norm(e3_p2) * _norm(e21)),
+            _dot(e1_p3, e32) / (_norm(e1_p3) * _norm(e32)),
+        ])
+        skew = np.arccos(np.clip(cos_skew, -1., 1.))
+        max_skew = PIOVER2 - np.minimum(skew, np.pi - skew).min(axis=1)
+
+        cos_theta = np.column_stack([
+            _dot(v21, -v13) / (length21 * length13),
+            _dot(v32, -v21) / (length32 * length21),
+            _dot(v13, -v32) / (length13 * length32),
+        ])
+        thetas = np.arccos(np.clip(cos_theta, -1., 1.))
+        min_theta = thetas.min(axis=1)
+        max_theta = thetas.max(axis=1)
+        dideal_theta = np.maximum(max_theta - PIOVER3, PIOVER3 - min_theta)
+        aspect_ratio = lengths.max(axis=1) / min_edge_length
+
+    # a collapsed edge has no angles
+    izero = (min_edge_length == 0.0)
+    if izero.any():
+        aspect_ratio[izero] = np.nan
+        min_theta[izero] = np.nan
+        max_theta[izero] = np.nan
+        dideal_theta[izero] = np.nan
+    return area, max_skew, aspect_ratio, min_theta, max_theta, dideal_theta, min_edge_length
+
+
+def quad_quality_array(p1: np.ndarray, p2: np.ndarray,
+                       p3: np.ndarray, p4: np.ndarray) -> tuple[np.ndarray, ...]:
+    """
+    gets the quality metrics for a set of quads
+
+    Parameters
+    ----------
+    p1, p2, p3, p4 : (nquad, 3) float ndarray
+        the corner points
+
+    Returns
+    -------
+    area, taper_ratio, area_ratio, max_skew, aspect_ratio,
+    min_theta, max_theta, dideal_theta, min_edge_length, max_warp
+
+    """
+    v21 = p2 - p1
+    v32 = p3 - p2
+    v43 = p4 - p3
+    v14 = p1 - p4
+    v31 = p3 - p1
+    v42 = p4 - p2
+    v41 = -v14
+    length21 = _norm(v21)
+    length32 = _norm(v32)
+    length43 = _norm(v43)
+    length14 = _norm(v14)
+    lengths = np.column_stack([length21, length32, length43, length14])
+    min_edge_length = lengths.min(axis=1)
+
+    normal = np.cross(v31, v42)
+    area = 0.5 * _norm(normal)
+
+    # the corner areas (the parallelograms at each corner)
+    cross1 = np.cross(v14, v21)
+    cross2 = np.cross(v21, v32)
+    cross3 = np.cross(v32, v43)
+    cross4 = np.cross(v43, v14)
+    areas = np.column_stack([
+        _norm(cross1), _norm(cross2), _norm(cross3), _norm(cross4)])
+
+    with np.errstate(divide='ignore', invalid='ignore'):
+        # the ratio of the ideal area to the actual area
+        # this is an hourglass check
+        min_area = areas.min(axis=1)
+        area_ratio = np.maximum(area / min_area, areas.max(axis=1) / area)
+        area_ratio[min_area == 0.] = np.nan
+
+        half_areas = 0.5 * areas
+        aavg = half_areas.mean(axis=1)
+        taper_ratio = np.abs(half_areas - aavg[:, np.newaxis]).sum(axis=1) / aavg
+
+        #    e3
+        # 4-------3
+        # |       |
+        # |e4     |  e2
+        # 1-------2
+        #     e1
+        e13 = (p3 + p4) / 2. - (p1 + p2) / 2.
+        e42 = (p2 + p3) / 2. - (p4 + p1) / 2.
+        cos_skew = _dot(e13, e42) / (_norm(e13) * _norm(e42))
+        skew = np.arccos(np.clip(cos_skew, -1., 1.))
+        max_skew = PIOVER2 - np.minimum(skew, np.pi - skew)
+
+        aspect_ratio = lengths.max(axis=1) / min_edge_length
+
+        cos_theta = np.column_stack([
+            _dot(v21, -v14) / (length21 * length14),
+            _dot(v32, -v21) / (length32 * length21),
+            _dot(v43, -v32) / (length43 * length32),
+            _dot(v14, -v43) / (length14 * length43),
+        ])
+
+        # a corner with a flipped local normal is reentrant (theta > 180)
+        signs = np.column_stack([
+            np.sign(_dot(cross1, normal)),
+            np.sign(_dot(cross2, normal)),
+            np.sign(_dot(cross3, normal)),
+            np.sign(_dot(cross4, normal)),
+        ])
+        theta = signs * np.arccos(np.clip(cos_theta, -1., 1.)) + np.where(signs < 0, 2*np.pi, 0.)
+        min_theta = theta.min(axis=1)
+        max_theta = theta.max(axis=1)
+        dideal_theta = np.maximum(max_theta - PIOVER2, PIOVER2 - min_theta)
+
+        # warp angle
+        # split the quad both ways and take the worst angle between the triangles
+        # 4---3    4---3
+        # | / |    | \ |
+        # |/  |    |  \|
+        # 1---2    1---2
+        n123 = np.cross(v21, v31)
+        n134 = np.cross(v31, v41)
+        n124 = np.cross(v21, v41)
+        n234 = np.cross(v32, v42)
+        cos_warp = np.column_stack([
+            _dot(n123, n134) / (_norm(n123) * _norm(n134)),
+            _dot(n124, n234) / (_norm(n124) * _norm(n234)),
+        ])
+        max_warp = np.arccos(np.clip(cos_warp, -1., 1.)).max(axis=1)
+
+    out = (area, taper_ratio, area_ratio, max_skew, aspect_ratio,
+           min_theta, max_theta, dideal_theta, min_edge_length, max_warp)
+    return out
+
+
+def solid_quality_array(xyz: np.ndarray,
+                        faces: tuple[tuple[int, ...], ...],
+                        ) -> tuple[np.ndarray, np.ndarray, np.ndarray, np.ndarray]:
+    """
+    gets the interior face angles for a set of solid elements
+
+    Parameters
+    ----------
+    xyz : (nelements, nnodes, 3) float ndarray
+        the corner points of each element
+    faces : tuple[tuple[int, ...], ...]
+        the node indices of each tri/quad face (e.g., CHEXA_FACES)
+
+    Returns
+    -------
+    min_theta, max_theta, dideal_theta, min_edge_length
+
+    """
+    thetas = []
+    dthetas = []
+    edge_lengths = []
+    with np.errstate(divide='ignore', invalid='ignore'):
+        for face in faces:
+            nface = len(face)
+            ideal_theta = PIOVER3 if nface == 3 else PIOVER2
+            points = xyz[:, face, :]
+            # v[:, j] is the edge from node j to node j+1
+            edges = np.roll(points, -1, axis=1) - points
+            lengths = np.linalg.norm(edges, axis=2)
+            # the angle at node j is between the edge to node j+1
+            # and the edge back to node j-1
+            cos_theta = (
+                np.einsum('ijk,ijk->ij', edges, -np.roll(edges, 1, axis=1)) /
+                (lengths * np.roll(lengths, 1, axis=1)))
+            theta = np.arccos(np.clip(cos_theta, -1., 1.))
+            thetas.append(theta)
+            dthetas.append(np.abs(theta - ideal_theta))
+            edge_lengths.append(lengths)
+    thetas = np.hstack(thetas)
+    min_theta = thetas.min(axis=1)
+    max_theta = thetas.max(axis=1)
+    dideal_theta = np.hstack(dthetas).max(axis=1)
+    min_edge_length = np.hstack(edge_lengths).min(axis=1)
+    return min_theta, max_theta, dideal_theta, min_edge_length
+
+
+def write_quality_csv(csv_filename: str, quality: dict[str, np.ndarray]) -> None:
+    """writes the element quality to a csv file with the angles in degrees"""
+    with open(csv_filename, 'w') as csv_file:
+        _write_quality_csv(csv_file, quality)
+
+
+def _write_quality_csv(csv_file: TextIO, quality: dict[str, np.ndarray]) -> None:
+    """writes the element quality to an open csv file"""
+    csv_file.write('# eid, etype, ' + ', '.join(QUALITY_NAMES) + '\n')
+    data = np.column_stack([
+        np.degrees(quality[name]) if name in ANGLE_NAMES else quality[name]
+        for name in QUALITY_NAMES])
+    for eid, etype, row in zip(quality['eid'], quality['etype'], data):
+        csv_file.write(f'{eid}, {etype}, ' + ', '.join(f'{value:g}' for value in row) + '\n')
+
+
+def get_quality_summary(quality: dict[str, np.ndarray]) -> str:
+    """gets the min/mean/max of each metric with the angles in degrees"""
+    msg = f'nelements = {len(quality["eid"])}\n'
+    msg += f'{"metric":<20s} {"count":>10s} {"min":>12s} {"mean":>12s} {"max":>12s}\n'
+    for name in QUALITY_NAMES:
+        values = quality[name]
+        values = values[np.isfinite(values)]
+        if len(values) == 0:
+            continue
+        if name in ANGLE_NAMES:
+            values = np.degrees(values)
+        msg += (f'{name:<20s} {len(values):>10d} {values.min():>12.4g} '
+                f'{values.mean():>12.4g} {values.max():>12.4g}\n')
+    return msg
@@ -4,6 +4,8 @@ Defines:
       find the net force/moment on the model
   - sum_forces_moments_elements
       find the net force/moment on the model for a subset of elements
+  - get_static_force_vectors
+      find the static force vector for each subcase
 
 """
 from __future__ import annotations
@@ -15,11 +17,18 @@ from numpy.linalg import norm  # type: ignore
 from pyNastran.utils.numpy_utils import integer_types
 from pyNastran.bdf.utils import get_xyz_cid0_dict, transform_load
 from pyNastran.bdf.cards.loads.static_loads import update_pload4_vector, PLOAD, PLOAD2, PLOAD4
+from pyNastran.bdf.mesh_utils.mass_properties import _get_xyz_cid0_array, _get_element_node_xyz
 if TYPE_CHECKING:  # pragma: no cover
     from pyNastran.nptyping_interface import NDArray3float
     from pyNastran.bdf.bdf import BDF, Subcase
 
 
+# the shells with a PLOAD4 SURF load that are summed as arrays
+_PLOAD4_SHELL_NFACE = {
+    'CTRIA3': 3, 'CTRIA6': 3, 'CTRIAR': 3,
+    'CQUAD4': 4, 'CQUAD8': 4, 'CQUAD': 4, 'CQUADR': 4, 'CSHEAR': 4,
+}
+
 def isnan(value):
     return value is None or np.isnan(value)
 
@@ -81,6 +90,10 @@ def sum_forces_moments(model: BDF,
     M = array([0., 0., 0.])
     xyz = get_xyz_cid0_dict(model, xyz_cid0=xyz_cid0)
 
+    # the nodal forces and PLOAD4s are summed as arrays after the loop
+    force_nids = []
+    forces = []
+    pload4s = []
     unsupported_types = set()
     for load, scale in zip(loads, scale_factors):
         #if load.type not in ['FORCE1']:
@@ -93,26 +106,12 @@ def sum_forces_moments(model: BDF,
                 f = load.mag * cp_ref.transform_vector_to_global(load.xyz) * scale
             else:
                 f = load.mag * load.xyz * scale
-
-            node = model.Node(load.node_id)
-            r = xyz[node.nid] - p
-            m = cross(r, f)
-            F += f
-            M += m
-        elif load.type == 'FORCE1':
-            f = load.mag * load.xyz * scale
-            node = model.Node(load.node_id)
-            r = xyz[node.nid] - p
-            m = cross(r, f)
-            F += f
-            M += m
-        elif load.type == 'FORCE2':
+            force_nids.append(load.node_id)
+            forces.append(f)
+        elif load.type in ['FORCE1', 'FORCE2']:
             f = load.mag * load.xyz * scale
-            node = model.Node(load.node_id)
-            r = xyz[node.nid] - p
-            m = cross(r, f)
-            F += f
-            M += m
+            force_nids.append(load.node_id)
+            forces.append(f)
         elif load.type == 'MOMENT':
             if load.Cid() != 0:
                 cp = load.cid_ref
@@ -171,7 +170,7 @@ def sum_forces_moments(model: BDF,
                     model.log.warning('case=%s etype=%r loadtype=%r not supported' % (
                         loadcase_id, elem.type, load.type))
         elif load.type == 'PLOAD4':
-            _pload4_total(loadcase_id, load, scale, xyz, F, M, p)
+            pload4s.append((load, scale))
 
         elif load.type == 'GRAV':
             if include_grav:  # this will be super slow
@@ -188,6 +187,8 @@ def sum_forces_moments(model: BDF,
             # we collect them so we only get one print
             unsupported_types.add(load.type)
 
+    _sum_nodal_forces(force_nids, forces, xyz, F, M, p)
+    _sum_pload4s(loadcase_id, pload4s, xyz, F, M, p)
     for load_type in unsupported_types:
         model.log.warning('case=%s loadtype=%r not supported' % (loadcase_id, load_type))
 
@@ -226,9 +227,9 @@ def _pload1_bar_beam(model, unused_loadcase_id, load, elem, scale, xyz, F, M, p)
     p2 = load.p2 * scale
 
     nodes = elem.node_ids
-    n1, n2 = xyz[nodes[0]], xyz[nodes[1]]
-    n1 += elem.wa
-    n2 += elem.wb
+    # the offsets are added to copies, so the node positions aren't modified
+    n1 = xyz[nodes[0]] + elem.wa
+    n2 = xyz[nodes[1]] + elem.wb
 
     bar_vector = n2 - n1
     L = norm(bar_vector)
@@ -412,10 +413,9 @@ def sum_forces_moments_elements(model: BDF,
         raise RuntimeError('loadcase_id must be an integer; loadcase_id=%r' % loadcase_id)
     p = _get_load_summation_point(model, p0, cid=0)
 
-    if eids is None:
-        eids = list(model.element_ids)
-    if nids is None:
-        nids = list(model.node_ids)
+    # sets are used for the (many) membership checks
+    eids = set(model.element_ids) if eids is None else set(eids)
+    nids = set(model.node_ids) if nids is None else set(nids)
 
     #for (key, load_case) in model.loads.items():
         #if key != loadcase_id:
@@ -429,6 +429,10 @@ def sum_forces_moments_elements(model: BDF,
 
     xyz = get_xyz_cid0_dict(model, xyz_cid0)
 
+    # the nodal forces and PLOAD4s are summed as arrays after the loop
+    force_nids = []
+    forces = []
+    pload4s = []
     unsupported_types = set()
     shell_elements = {
         'CTRIA3', 'CQUAD4', 'CTRIAR', 'CQUADR',
@@ -449,12 +453,8 @@ def sum_forces_moments_elements(model: BDF,
                 f = load.mag * cp_ref.transform_vector_to_global(load.xyz) * scale
             else:
                 f = load.mag * load.xyz * scale
-
-            node = model.Node(load.node_id)
-            r = xyz[node.nid] - p
-            m = cross(r, f)
-            F += f
-            M += m
+            force_nids.append(load.node_id)
+            forces.append(f)
 
         elif load.type == 'FORCE1':
             not_found_nid = False
@@ -466,11 +466,8 @@ def sum_forces_moments_elements(model: BDF,
                 continue
 
             f = load.mag * load.xyz * scale
-            node = model.Node(load.node_id)
-            r = xyz[node.nid] - p
-            m = cross(r, f)
-            F += f
-            M += m
+            force_nids.append(load.node_id)
+            forces.append(f)
         elif load.type == 'FORCE2':
             not_found_nid = False
             for nid in load.node_ids:
@@ -481,11 +478,8 @@ def sum_forces_moments_elements(model: BDF,
                 continue
 
             f = load.mag * load.xyz * scale
-            node = model.Node(load.node_id)
-            r = xyz[node.nid] - p
-            m = cross(r, f)
-            F += f
-            M += m
+            force_nids.append(load.node_id)
+            forces.append(f)
         elif load.type == 'MOMENT':
             not_found_nid = False
             for nid in load.node_ids:
@@ -579,7 +573,7 @@ def sum_forces_moments_elements(model: BDF,
                     raise NotImplementedError('case=%s etype=%r loadtype=%r not supported' % (
                         loadcase_id, elem.type, loadtype))
         elif loadtype == 'PLOAD4':
-            _pload4_elements(loadcase_id, load, scale, eids, xyz, F, M, p)
+            pload4s.append((load, scale))
 
         elif loadtype == 'GRAV':
             if include_grav:  # this will be super slow
@@ -600,6 +594,8 @@ def sum_forces_moments_elements(model: BDF,
             # we collect them so we only get one print
             unsupported_types.add(loadtype)
 
+    _sum_nodal_forces(force_nids, forces, xyz, F, M, p)
+    _sum_pload4s(loadcase_id, pload4s, xyz, F, M, p, eids=eids)
     for loadtype in unsupported_types:
         model.log.warning('case=%s loadtype=%r not supported' % (loadcase_id, loadtype))
     #model.log.info("case=%s F=%s M=%s\n" % (loadcase_id, F, M))
@@ -638,8 +634,9 @@ def _bar_eq_pload1(model: BDF, load, elem, xyz, Ldir,
             force_dir = array([0., 1., 0.])
         elif load.Type == 'FZ' and x1 == x2:
             force_dir = array([0., 0., 1.])
-        F += p1 * force_dir
-        M += cross(r - p, F)
+        force = p1 * force_dir
+        F += force
+        M += cross(r - p, force)
     elif load.Type in ['MX', 'MY', 'MZ']:
         if load.Type == 'MX' and x1 == x2:
             moment_dir = array([1., 0., 0.])
@@ -666,14 +663,15 @@ def _bar_eq_pload1(model: BDF, load, elem, xyz, Ldir,
             force_dir = k
         #print('    force_dir =', force_dir, load.Type)
         try:
-            F += p1 * force_dir
+            force = p1 * force_dir
         except FloatingPointError:
             msg = 'eid = %s\n' % elem.eid
             msg += 'i = %s\n' % Ldir
             msg += 'force_dir = %s\n' % force_dir
             msg += 'load = \n%s' % str(load)
             raise FloatingPointError(msg)
-        M += cross(r - p, F)
+        F += force
+        M += cross(r - p, force)
         del force_dir
 
     elif load.Type in ['MXE', 'MYE', 'MZE']:
@@ -699,26 +697,111 @@ def _bar_eq_pload1(model: BDF, load, elem, xyz, Ldir,
     return F, M
 
 
-def _pload4_total(loadcase_id, load, scale, xyz, F, M, p):
-    """helper method for ``sum_forces_moments``"""
-    assert load.line_load_dir == 'NORM', f'line_load_dir = {load.line_load_dir!r}'
-    for elem in load.eids_ref:
-        fi, mi = _pload4_helper(loadcase_id, load, scale, elem, xyz, p)
-        F += fi
-        M += mi
-    return F, M
+def _sum_nodal_forces(nids: list[int], forces: list[np.ndarray],
+                      xyz: dict[int, np.ndarray], F, M, p) -> None:
+    """
+    helper method for ``sum_forces_moments`` and ``sum_forces_moments_elements``
 
-def _pload4_elements(loadcase_id, load, scale, eids, xyz, F, M, p):
-    """helper method for ``sum_forces_moments_elements``"""
-    assert load.line_load_dir == 'NORM', f'line_load_dir = {load.line_load_dir!r}'
-    for elem in load.eids_ref:
-        eid = elem.eid
-        if eid not in eids:
+    Sums the FORCE, FORCE1, and FORCE2 loads (already in the global
+    frame and scaled) using a single cross product.
+
+    """
+    nforces = len(nids)
+    if nforces == 0:
+        return
+    forces_array = np.array(forces, dtype='float64').reshape(nforces, 3)
+    r = np.array([xyz[nid] for nid in nids], dtype='float64').reshape(nforces, 3) - p
+    F += forces_array.sum(axis=0)
+    M += cross(r, forces_array).sum(axis=0)
+
+def _sum_pload4s(loadcase_id: int, pload4s: list[tuple[PLOAD4, float]],
+                 xyz: dict[int, np.ndarray], F, M, p,
+                 eids: Optional[set[int]]=None) -> None:
+    """
+    helper method for ``sum_forces_moments`` and ``sum_forces_moments_elements``
+
+    The SURF pressures on triangular/quadrilateral shells are grouped
+    across all the PLOAD4s, so the face areas, normals, and centroids are
+    calculated once as arrays.  The remaining faces (e.g., solids and
+    LINE loads) use ``_pload4_helper``.
+
+    Parameters
+    ----------
+    pload4s : list[(PLOAD4, scale)]
+        the PLOAD4s and their scale factors
+    eids : set[int]; default=None -> all
+        the elements to consider
+
+    """
+    # nface: (elements, iload)
+    shell_faces = {
+        3: ([], []),
+        4: ([], []),
+    }
+    load_pressures = []
+    load_dirs = []
+    load_scales = []
+    nan_dir = np.full(3, np.nan)
+    for load, scale in pload4s:
+        assert load.line_load_dir == 'NORM', f'line_load_dir = {load.line_load_dir!r}'
+        is_surf = load.surf_or_line == 'SURF'
+        if is_surf:
+            # nan -> use the element normal
+            iload = len(load_scales)
+            load_pressures.append(load.pressures[:4])
+            load_dirs.append(update_pload4_vector(load, nan_dir, load.Cid()))
+            load_scales.append(scale)
+
+        for elem in load.eids_ref:
+            if eids is not None and elem.eid not in eids:
+                continue
+            nface = _PLOAD4_SHELL_NFACE.get(elem.type) if is_surf else None
+            if nface is None:
+                fi, mi = _pload4_helper(loadcase_id, load, scale, elem, xyz, p)
+                F += fi
+                M += mi
+                continue
+            elements, iloads = shell_faces[nface]
+            elements.append(elem)
+            iloads.append(iload)
+
+    if len(shell_faces[3][0]) == 0 and len(shell_faces[4][0]) == 0:
+        return
+    nids, xyz_cid0 = _get_xyz_cid0_array(xyz)
+    load_pressures = np.array(load_pressures, dtype='float64')
+    load_dirs = np.array(load_dirs, dtype='float64')
+    load_scales = np.array(load_scales, dtype='float64')
+    for nface, (elements, iloads) in shell_faces.items():
+        if len(elements) == 0:
             continue
-        fi, mi = _pload4_helper(loadcase_id, load, scale, elem, xyz, p)
-        F += fi
-        M += mi
-    return F, M
+        xyzs = _get_element_node_xyz(elements, nface, nids, xyz_cid0)
+        if nface == 3:
+            axb = cross(xyzs[:, 0, :] - xyzs[:, 1, :], xyzs[:, 0, :] - xyzs[:, 2, :])
+        else:
+            axb = cross(xyzs[:, 0, :] - xyzs[:, 2, :], xyzs[:, 1, :] - xyzs[:, 3, :])
+        nunit = norm(axb, axis=1)
+        izero = np.flatnonzero(nunit == 0.)
+        if len(izero):
+            elem = elements[izero[0]]
+            raise FloatingPointError(f'PLOAD4: case={loadcase_id} eid={elem.eid} has '
+                                     f'zero area; nodes={elem.node_ids[:nface]}')
+        area = 0.5 * nunit
+        normal = axb / nunit[:, np.newaxis]
+        face_centroid = xyzs.sum(axis=1) / nface
+
+        # mean pressure; see ``_mean_pressure_on_pload4``
+        iloads = np.array(iloads, dtype='int32')
+        pressures = load_pressures[iloads, :nface]
+        pressure = np.where(pressures.min(axis=1) != pressures.max(axis=1),
+                            pressures.mean(axis=1), pressures[:, 0])
+
+        load_dir = load_dirs[iloads, :]
+        is_normal = np.isnan(load_dir[:, 0])
+        load_dir[is_normal, :] = normal[is_normal, :]
+
+        fi = (pressure * area * load_scales[iloads])[:, np.newaxis] * load_dir
+        F += fi.sum(axis=0)
+        M += cross(face_centroid - p, fi).sum(axis=0)
 
 def _get_pload4_area_centroid_normal_nface(loadcase_id: int, load: PLOAD4, elem, xyz):
     """gets the nodes, area, face_centroid, normal, and nface"""
@@ -1003,19 +1086,59 @@ def get_static_force_vector_from_subcase_id(model: BDF, subcase_id: int):
 
     """
     load_id, ndof_per_grid, ndof = _get_loadid_ndof(model, subcase_id)
-    if load_id in model.load_combinations:
-        loads = model.load_combinations[load_id]
-        for load in loads:
-            scale = load.scale
-            F = np.zeros([ndof], dtype='float64')
-            for load_id, loads_ref, scalei in zip(load.load_ids, load.load_ids_ref, load.scale_factors):
-                Fi = _Fg_vector_from_loads(
-                    model, loads_ref, ndof_per_grid, ndof)
-                F += Fi * (scale * scalei)
-            # print(load.get_stats())
-    else:
-        loads = model.loads[load_id]
-        F = _Fg_vector_from_loads(model, loads, ndof_per_grid, ndof)
+    F = _Fg_vector_from_load_id(model, load_id, ndof_per_grid, ndof)
+    return F
+
+def get_static_force_vectors(model: BDF,
+                             subcase_ids: Optional[list[int]]=None,
+                             fdtype: str='float64') -> dict[int, np.ndarray]:
+    """
+    Gets the static force vector for each subcase
+
+    The LOAD cards are reduced to a single list of loads and scale
+    factors, so the nested combinations are applied with the loads.
+    The DOF map is built once and is shared by all the subcases.
+
+    Parameters
+    ----------
+    model : BDF()
+        a cross-referenced BDF object
+    subcase_ids : list[int]; default=None -> all
+        the subcases to consider
+    fdtype : str; default='float64'
+        the type of the force vectors
+
+    Returns
+    -------
+    forces : dict[subcase_id] = (ndof, ) float ndarray
+        the force vector for each subcase; zeros if there is no LOAD
+
+    """
+    if subcase_ids is None:
+        subcase_ids = [subcase_id for subcase_id in sorted(model.subcases)
+                       if subcase_id > 0]
+    dof_map = _get_dof_map(model)
+    forces = {}
+    for subcase_id in subcase_ids:
+        load_id, ndof_per_grid, ndof = _get_loadid_ndof(model, subcase_id)
+        forces[subcase_id] = _Fg_vector_from_load_id(
+            model, load_id, ndof_per_grid, ndof, fdtype=fdtype, dof_map=dof_map)
+    return forces
+
+def _Fg_vector_from_load_id(model: BDF, load_id: Optional[int],
+                            ndof_per_grid: int, ndof: int,
+                            fdtype: str='float64',
+                            dof_map=None) -> np.ndarray:
+    """
+    helper method for ``get_static_force_vector_from_subcase_id`` and
+    ``get_static_force_vectors``
+    """
+    if load_id is None:
+        return np.zeros([ndof], dtype=fdtype)
+    loads, scale_factors, unused_is_grav = model.get_reduced_loads(
+        load_id, skip_scale_factor0=True)
+    F = _Fg_vector_from_loads(model, loads, ndof_per_grid, ndof, fdtype=fdtype,
+                              scale_factors=scale_factors, dof_map=dof_map)
     return F
 
 def get_ndof(model: BDF, subcase: Subcase) -> tuple[int, int, int]:
@@ -1023,7 +1146,7 @@ def get_ndof(model: BDF, subcase: Subcase) -> tuple[int, int, int]:
     ndof_per_grid = 6
     if 'HEAT' in subcase:
         ndof_per_grid = 1
-    ngrid = model.card_count['GRID'] if 'GRID' in model.card_count else 0
+    ngrid = model.card_count['GRID'] if 'GRID' in model.card_count else len(model.nodes)
     nspoint = len(model.spoints) # if 'SPOINT' in model.card_count else 0
     nepoint = len(model.epoints) # if 'EPOINT' in model.card_count else 0
     ndof = ngrid * ndof_per_grid + nspoint + nepoint
@@ -1073,26 +1196,50 @@ def _get_dof_map(model: BDF) -> dict[tuple[int, int], int]:
     return dof_map, ps
 
 def _Fg_vector_from_loads(model: BDF, loads, ndof_per_grid: int, ndof: int,
-                          fdtype: str='float64'):
+                          fdtype: str='float64',
+                          scale_factors: Optional[list[float]]=None,
+                          dof_map=None):
     """
     helper method for ``get_static_force_vector_from_subcase_id``
     requires cross-referencing
+
+    Parameters
+    ----------
+    scale_factors : list[float]; default=None -> 1.0
+        the scale factor on each load (e.g., from ``get_reduced_loads``)
+    dof_map : (dict[(nid, dof)] = irow, ps); default=None
+        the precomputed output of ``_get_dof_map``
+
     """
-    dof_map, unused_ps = _get_dof_map(model)
+    if dof_map is None:
+        dof_map = _get_dof_map(model)
+    dof_map, unused_ps = dof_map
+    if scale_factors is None:
+        scale_factors = [1.] * len(loads)
     Fg = np.zeros([ndof], dtype=fdtype)
     skipped_load_types = set([])
     not_static_loads = []
     show_force_warning = True
     log = model.log
-    for load in loads:
+
+    # the FORCE/MOMENT loads in the nodal output frame are added as a group
+    force_irows = []
+    force_values = []
+    for load, scale in zip(loads, scale_factors):
         loadtype = load.type
-        if load.type in ['FORCE', 'MOMENT']:
-            offset = 1 if load.type[0] == 'F' else 4
-            show_force_warning = _add_force(Fg, dof_map, model, load, offset, ndof_per_grid, cid=load.cid, show_warning=show_force_warning)
-        elif load.type in ['FORCE1', 'MOMENT1',
-                           'FORCE2', 'MOMENT2']:
-            offset = 1 if load.type[0] == 'F' else 4
-            show_force_warning = _add_force(Fg, dof_map, model, load, offset, ndof_per_grid, cid=0, show_warning=show_force_warning)
+        if loadtype in ['FORCE', 'MOMENT',
+                        'FORCE1', 'MOMENT1',
+                        'FORCE2', 'MOMENT2']:
+            offset = 1 if loadtype[0] == 'F' else 4
+            cid = load.cid if loadtype in ['FORCE', 'MOMENT'] else 0
+            if load.node_ref.cd == cid:
+                nid = load.node
+                force_irows.append([dof_map[(nid, dof+offset)] for dof in range(3)])
+                force_values.append(load.mag * load.xyz * scale)
+            else:
+                show_force_warning = _add_force(
+                    Fg, dof_map, model, load, offset, ndof_per_grid, cid=cid,
+                    show_warning=show_force_warning, scale=scale)
 
         elif loadtype == 'SLOAD':
             for nid, mag in zip(load.nodes, load.mags):
@@ -1102,15 +1249,21 @@ def _Fg_vector_from_loads(model: BDF, loads, ndof_per_grid: int, ndof: int,
                     print('spoints =', model.spoints)
                     print('dof_map =', dof_map)
                     raise
-                Fg[irow] += mag
+                Fg[irow] += mag * scale
         elif loadtype in not_static_loads:
             continue
         elif loadtype == 'PLOAD':
-            _add_pload(Fg, dof_map, model, load)
+            _add_pload(Fg, dof_map, model, load, scale=scale)
         elif loadtype == 'PLOAD2':
-            _add_pload2(Fg, dof_map, model, load)
+            _add_pload2(Fg, dof_map, model, load, scale=scale)
         else:
             skipped_load_types.add(load.type)
+
+    if force_irows:
+        nforces = len(force_irows)
+        np.add.at(Fg,
+                  np.array(force_irows, dtype='int64').ravel(),
+                  np.array(force_values, dtype='float64').reshape(nforces * 3))
     if skipped_load_types:
         skipped_load_types = list(skipped_load_types)
         skipped_load_types.sort()
@@ -1126,7 +1279,8 @@ def _force_to_local(cd_ref, vector):
 
 
 def _add_force(Fg: np.ndarray, dof_map: dict[tuple[int, int], int], model: BDF,
-               load, offset: int, ndof_per_grid: int, cid: int=0, show_warning: bool=True):
+               load, offset: int, ndof_per_grid: int, cid: int=0, show_warning: bool=True,
+               scale: float=1.0):
     """adds the FORCE/MOMENT loads to Fg"""
     #cid = load.cid
     nid = load.node
@@ -1190,15 +1344,15 @@ def _add_force(Fg: np.ndarray, dof_map: dict[tuple[int, int], int], model: BDF,
     #       SPOINTs have a DOF of 0
     for dof in range(3):
         irow = dof_map[(nid, dof+offset)]
-        Fg[irow] += fglobal[dof]
+        Fg[irow] += fglobal[dof] * scale
     return show_warning
 
 def _add_pload2(Fg: np.ndarray, dof_map: dict[int, int],
-                model: BDF, load: PLOAD2) -> None:
+                model: BDF, load: PLOAD2, scale: float=1.0) -> None:
     """adds the PLOAD2 loads to Fg"""
     #PLOAD2       150     1.5       1    THRU       7
     #print(load.get_stats())
-    pressure = load.pressure
+    pressure = load.pressure * scale
     for element in load.eids_ref:
         area = element.Area()
         normal = element.Normal()
@@ -1216,9 +1370,8 @@ def _add_pload2(Fg: np.ndarray, dof_map: dict[int, int],
             #model.log.warning('PLOAD2 havent been verified')
 
 def _add_pload(Fg: np.ndarray, dof_map: dict[int, int],
-               model: BDF, load: PLOAD) -> None:
+               model: BDF, load: PLOAD, scale: float=1.0) -> None:
     """adds the PLOAD loads to Fg"""
-    scale = 1.0
     #print(load)
     #PLOAD        300     10.     302     303     403     402
     #PLOAD        300     10.     401     402     500
@@ -9,9 +9,10 @@ Defines:
 from __future__ import annotations
 from itertools import count
 from collections import defaultdict
-from typing import cast, Optional, Any, TYPE_CHECKING
+from operator import attrgetter
+from typing import cast, Callable, Optional, Any, TYPE_CHECKING
 
-from numpy import array, cross, dot
+from numpy import array, cross
 from numpy.linalg import norm  # type: ignore
 import numpy as np
 
@@ -21,7 +22,9 @@ from pyNastran.utils.mathematics import integrate_positive_unit_line
 CHECK_MASS = False  # should additional checks be done
 
 if TYPE_CHECKING:  # pragma: no cover
-    from pyNastran.bdf.bdf import BDF, NSM1, CQUAD4, CBAR, CBEAM, CROD, CONROD, CTRIA3, Element
+    from pyNastran.bdf.bdf import (
+        BDF, NSM1, CQUAD4, CBAR, CBEAM, CROD, CONROD, CTRIA3, Element,
+        PBEAM, PBEAML, PBCOMP)
 
 NO_MASS = {
     # has mass
@@ -204,6 +207,24 @@ def mass_properties(model: BDF,
         moment of inertia array([Ixx, Iyy, Izz, Ixy, Ixz, Iyz]); wtmass is considered
 
     .. seealso:: model.mass_properties
+    .. note:: this is ``mass_properties_nsm`` without the NSM
+
+    """
+    mass, cg, I = mass_properties_nsm(
+        model, element_ids=element_ids, mass_ids=mass_ids, nsm_id=None,
+        reference_point=reference_point,
+        sym_axis=sym_axis, scale=scale, inertia_reference=inertia_reference)
+    return mass, cg, I
+
+def _mass_properties_elementwise(model: BDF,
+                                 element_ids=None, mass_ids=None,
+                                 reference_point=None,
+                                 sym_axis=None, scale=None, inertia_reference: str='cg'):
+    """
+    Calculates mass properties one element at a time.
+    This is the reference for ``mass_properties``.
+
+    .. see:: mass_properties
 
     """
     reference_point, is_cg = _update_reference_point(
@@ -265,7 +286,7 @@ def mass_properties_no_xref(model, element_ids=None, mass_ids=None,
 def _mass_properties(model: BDF, elements: list[Element], masses: list[int],
                      reference_point: np.ndarray,
                      is_cg: bool) -> tuple[float, np.ndarray, np.ndarray]:
-    """helper method for ``mass_properties``"""
+    """helper method for ``_mass_properties_elementwise``"""
     mass = 0.
     cg = array([0., 0., 0.])
     inertia = array([0., 0., 0., 0., 0., 0., ])
@@ -280,7 +301,7 @@ def _mass_properties(model: BDF, elements: list[Element], masses: list[int],
                 centroid, m, dI = element.centroid_mass_inertia()
                 di_list = [dI[0][0], dI[1][1], dI[2][2], dI[0][1], dI[0][2], dI[1][2]]
                 mass = _increment_inertia(centroid, reference_point, m, mass, cg, inertia)
-                inertia = [i1 + di for i1, di in zip(inertia, di_list)]
+                inertia += di_list
                 continue
 
             try:
@@ -421,6 +442,30 @@ def _increment_inertia(centroid: np.ndarray, reference_point: np.ndarray,
     cg += m * centroid
     return mass
 
+def _increment_inertia_array(centroids: np.ndarray, reference_point: np.ndarray,
+                             masses: np.ndarray, mass: float,
+                             cg: np.ndarray,
+                             inertia: np.ndarray) -> float:
+    """vectorized version of ``_increment_inertia``"""
+    if len(masses) == 0:
+        return mass
+    dxyz = centroids - reference_point
+    x = dxyz[:, 0]
+    y = dxyz[:, 1]
+    z = dxyz[:, 2]
+    x2 = x * x
+    y2 = y * y
+    z2 = z * z
+    inertia[0] += masses @ (y2 + z2)  # Ixx
+    inertia[1] += masses @ (x2 + z2)  # Iyy
+    inertia[2] += masses @ (x2 + y2)  # Izz
+    inertia[3] += masses @ (x * y)    # Ixy
+    inertia[4] += masses @ (x * z)    # Ixz
+    inertia[5] += masses @ (y * z)    # Iyz
+    mass += float(masses.sum())
+    cg += masses @ centroids
+    return mass
+
 def mass_properties_nsm(model: BDF, element_ids=None, mass_ids=None, nsm_id=None,
                         reference_point=None,
                         sym_axis=None, scale=None, inertia_reference: str='cg',
@@ -515,6 +560,7 @@ def mass_properties_nsm(model: BDF, element_ids=None, mass_ids=None, nsm_id=None
         model, reference_point, inertia_reference)
 
     xyz = _get_xyz_cid0_dict(model, xyz_cid0_dict)
+    nids, xyz_cid0 = _get_xyz_cid0_array(xyz)
     element_ids, unused_elements, mass_ids, unused_masses = _mass_properties_elements_init(
         model, element_ids, mass_ids)
 
@@ -529,6 +575,8 @@ def mass_properties_nsm(model: BDF, element_ids=None, mass_ids=None, nsm_id=None
 
     all_mass_ids = np.array(list(model.masses.keys()), dtype=idtype)
     all_mass_ids.sort()
+    element_ids = np.asarray(element_ids, dtype=idtype)
+    mass_ids = np.asarray(mass_ids, dtype=idtype)
 
     #element_nsms, property_nsms = _get_nsm_data(model, nsm_id, debug=debug)
     #def _increment_inertia0(centroid, reference_point, m, mass, cg, I):
@@ -558,7 +606,7 @@ def mass_properties_nsm(model: BDF, element_ids=None, mass_ids=None, nsm_id=None
         mass, cg, inertia = _get_mass_nsm(
             model, element_ids, mass_ids,
             all_eids, all_mass_ids, etypes_skipped,
-            etype, eids, xyz,
+            etype, eids, xyz, nids, xyz_cid0,
             length_eids_pids, nsm_centroids_length, lengths,
             area_eids_pids, nsm_centroids_area, areas,
             mass, cg, inertia, reference_point)
@@ -595,10 +643,206 @@ def _get_xyz_cid0_dict(model: BDF,
         xyz = {}
         for nid, node in model.nodes.items():
             xyz[nid] = node.get_position()
+        for nid, node in model.gridb.items():
+            xyz[nid] = node.get_position()
     else:
         xyz = xyz_cid0_dict
     return xyz
 
+def _get_xyz_cid0_array(xyz: dict[int, np.ndarray]) -> tuple[np.ndarray, np.ndarray]:
+    """gets the sorted node ids and the nodal positions as arrays"""
+    nids = np.array(list(xyz.keys()), dtype='int64')
+    xyz_cid0 = np.array(list(xyz.values()), dtype='float64').reshape(len(nids), 3)
+    isort = np.argsort(nids)
+    return nids[isort], xyz_cid0[isort, :]
+
+def _get_element_node_xyz(elements: list[Element], nnodes: int,
+                          nids: np.ndarray, xyz_cid0: np.ndarray) -> np.ndarray:
+    """gets the (nelements, nnodes, 3) positions of the first nnodes of each element"""
+    node_ids = np.array([elem.node_ids[:nnodes] for elem in elements],
+                        dtype='int64').reshape(len(elements), nnodes)
+    return _get_node_xyz(node_ids, nids, xyz_cid0)
+
+def _get_node_xyz(node_ids: np.ndarray,
+                  nids: np.ndarray, xyz_cid0: np.ndarray) -> np.ndarray:
+    """gets the positions of an array of node ids"""
+    inode = np.searchsorted(nids, node_ids)
+    inode[inode == len(nids)] = 0
+    is_missing = (nids[inode] != node_ids) if len(nids) else np.ones(node_ids.shape, dtype='bool')
+    if is_missing.any():
+        raise KeyError(np.unique(node_ids[is_missing]).tolist())
+    return xyz_cid0[inode, :]
+
+def _get_property_values(elements: list[Element], pids: np.ndarray,
+                         func: Callable[[Element], float]) -> np.ndarray:
+    """evaluates func on one element of each property and maps the value to all the elements"""
+    unused_upids, ifirst, ipid = np.unique(pids, return_index=True, return_inverse=True)
+    values = np.array([func(elements[ielem]) for ielem in ifirst.tolist()], dtype='float64')
+    return values[ipid]
+
+def _get_shell_mass_per_area(elements: list[Element], pids: np.ndarray,
+                             thickness_names: tuple[str, ...],
+                             skip_types: set[str]) -> tuple[np.ndarray, np.ndarray]:
+    """
+    Gets the mass per area of CTRIA3/CQUAD4-style elements
+
+    Returns
+    -------
+    mass_per_area : (nelements, ) float ndarray
+        the mass per area
+    is_mass : (nelements, ) bool ndarray
+        False for elements with a skipped property (e.g., PLPLANE)
+
+    """
+    upids, ifirst, ipid = np.unique(pids, return_index=True, return_inverse=True)
+    nupids = len(upids)
+    is_pshell = np.zeros(nupids, dtype='bool')
+    is_skipped = np.zeros(nupids, dtype='bool')
+    mass_per_area = np.zeros(nupids, dtype='float64')
+    thickness = np.zeros(nupids, dtype='float64')
+    rho = np.zeros(nupids, dtype='float64')
+    nsm = np.zeros(nupids, dtype='float64')
+    for i, ielem in enumerate(ifirst.tolist()):
+        prop = elements[ielem].pid_ref
+        if prop.type == 'PSHELL':
+            is_pshell[i] = True
+            thickness[i] = prop.Thickness()
+            rho[i] = prop.Rho()
+            nsm[i] = prop.nsm
+        elif prop.type in ['PCOMP', 'PCOMPG']:
+            mass_per_area[i] = prop.get_mass_per_area()
+        elif prop.type in skip_types:
+            is_skipped[i] = True
+        else:
+            raise NotImplementedError(prop.type)
+
+    mpa = mass_per_area[ipid]
+    ishell = np.flatnonzero(is_pshell[ipid])
+    if len(ishell):
+        get_thickness = attrgetter(*thickness_names)
+        shells = [elements[ielem] for ielem in ishell.tolist()]
+        tflag = np.array([elem.tflag for elem in shells])
+        is_valid = (tflag == 0) | (tflag == 1)
+        if not is_valid.all():  # pragma: no cover
+            raise RuntimeError('tflag=%r' % tflag[~is_valid][0])
+
+        # None -> nan -> the property thickness
+        ipid_shell = ipid[ishell]
+        ti = thickness[ipid_shell][:, np.newaxis]
+        tnode = np.array([get_thickness(elem) for elem in shells], dtype='float64')
+        tnode = np.where(tflag[:, np.newaxis] == 1, tnode * ti, tnode)
+        tnode = np.where(np.isnan(tnode), ti, tnode)
+        tsum = tnode[:, 0].copy()
+        for itnode in range(1, tnode.shape[1]):
+            tsum += tnode[:, itnode]
+        assert (tsum > 0.).all(), 't=%s' % tnode[tsum <= 0.][0]
+        t = tsum / tnode.shape[1]
+        mpa[ishell] = nsm[ipid_shell] + rho[ipid_shell] * t
+    return mpa, ~is_skipped[ipid]
+
+def _add_area_length_mass(ptype: str, eids: np.ndarray, pids: np.ndarray,
+                          area_length: np.ndarray,
+                          mass_per_area_length: np.ndarray,
+                          centroids: np.ndarray,
+                          element_ids: np.ndarray,
+                          area_length_eids_pids: dict[str, list[tuple[int, int]]],
+                          area_lengths: dict[str, list[float]],
+                          nsm_centroids: dict[str, list[np.ndarray]],
+                          mass: float, cg: np.ndarray, inertia: np.ndarray,
+                          reference_point: np.ndarray) -> float:
+    """stores the area/length of the elements for the NSM cards and adds their mass"""
+    if len(eids) == 0:
+        return mass
+    area_length_eids_pids[ptype].extend(np.column_stack([eids, pids]).tolist())
+    area_lengths[ptype].extend(area_length.tolist())
+    nsm_centroids[ptype].extend(centroids.tolist())
+
+    is_selected = np.isin(eids, element_ids)
+    masses = area_length[is_selected] * mass_per_area_length[is_selected]
+    mass = _increment_inertia_array(centroids[is_selected, :], reference_point,
+                                    masses, mass, cg, inertia)
+    return mass
+
+def _get_line_mass(model: BDF, nids: np.ndarray, xyz_cid0: np.ndarray,
+                   element_ids: np.ndarray, all_eids: np.ndarray,
+                   length_eids_pids, lengths, nsm_centroids_length,
+                   etype: str, eids: list[int],
+                   mass: float, cg: np.ndarray, inertia: np.ndarray,
+                   reference_point: np.ndarray) -> float:
+    """helper method for ``get_mass_new`` for CROD, CONROD, CTUBE and CBAR"""
+    eids2 = get_sub_eids(all_eids, eids, etype)
+    elements = [model.elements[eid] for eid in eids2.tolist()]
+    xyz = _get_element_node_xyz(elements, 2, nids, xyz_cid0)
+    centroid = (xyz[:, 0, :] + xyz[:, 1, :]) / 2.
+    length = norm(xyz[:, 1, :] - xyz[:, 0, :], axis=1)
+    if etype == 'CONROD':
+        ptype = 'CONROD'
+        pids = np.full(len(eids2), -42, dtype=eids2.dtype)  # faked number
+        mpl = np.array([elem.MassPerLength() for elem in elements], dtype='float64')
+    else:
+        pids = np.array([elem.pid for elem in elements], dtype=eids2.dtype)
+        if etype == 'CROD':
+            ptype = 'PROD'
+            mpl = _get_property_values(elements, pids, lambda elem: elem.MassPerLength())
+        else:
+            ptype = 'PTUBE' if etype == 'CTUBE' else 'PBAR'
+            mpl = _get_property_values(elements, pids,
+                                       lambda elem: elem.pid_ref.MassPerLength())
+    mass = _add_area_length_mass(
+        ptype, eids2, pids, length, mpl, centroid, element_ids,
+        length_eids_pids, lengths, nsm_centroids_length,
+        mass, cg, inertia, reference_point)
+    return mass
+
+def _get_solid_mass(model: BDF, nids: np.ndarray, xyz_cid0: np.ndarray,
+                    element_ids: np.ndarray, all_eids: np.ndarray,
+                    etype: str, eids: list[int],
+                    mass: float, cg: np.ndarray, inertia: np.ndarray,
+                    reference_point: np.ndarray) -> float:
+    """helper method for ``get_mass_new`` for CTETRA, CPYRAM, CPENTA and CHEXA"""
+    eids2 = get_sub_eids(all_eids, eids, etype)
+    eids2 = eids2[np.isin(eids2, element_ids)]
+    if len(eids2) == 0:
+        return mass
+    elements = [model.elements[eid] for eid in eids2.tolist()]
+    if etype == 'CTETRA':
+        xyz = _get_element_node_xyz(elements, 4, nids, xyz_cid0)
+        xyz1, xyz2, xyz3, xyz4 = xyz[:, 0, :], xyz[:, 1, :], xyz[:, 2, :], xyz[:, 3, :]
+        centroid = (xyz1 + xyz2 + xyz3 + xyz4) / 4.
+        #V = -dot(n1 - n4, cross(n2 - n4, n3 - n4)) / 6.
+        volume = -np.einsum('ij,ij->i', xyz1 - xyz4, cross(xyz2 - xyz4, xyz3 - xyz4)) / 6.
+    elif etype == 'CPYRAM':
+        xyz = _get_element_node_xyz(elements, 5, nids, xyz_cid0)
+        xyz1, xyz2, xyz3, xyz4, xyz5 = (xyz[:, i, :] for i in range(5))
+        centroid1 = (xyz1 + xyz2 + xyz3 + xyz4) / 4.
+        area1 = 0.5 * norm(cross(xyz3 - xyz1, xyz4 - xyz2), axis=1)
+        centroid = (centroid1 + xyz5) / 2.
+        volume = area1 / 3. * norm(centroid1 - xyz5, axis=1)
+    elif etype == 'CPENTA':
+        xyz = _get_element_node_xyz(elements, 6, nids, xyz_cid0)
+        xyz1, xyz2, xyz3, xyz4, xyz5, xyz6 = (xyz[:, i, :] for i in range(6))
+        area1 = 0.5 * norm(cross(xyz3 - xyz1, xyz2 - xyz1), axis=1)
+        area2 = 0.5 * norm(cross(xyz6 - xyz4, xyz5 - xyz4), axis=1)
+        centroid1 = (xyz1 + xyz2 + xyz3) / 3.
+        centroid2 = (xyz4 + xyz5 + xyz6) / 3.
+        centroid = (centroid1 + centroid2) / 2.
+        volume = (area1 + area2) / 2. * norm(centroid1 - centroid2, axis=1)
+    else:
+        xyz = _get_element_node_xyz(elements, 8, nids, xyz_cid0)
+        xyz1, xyz2, xyz3, xyz4, xyz5, xyz6, xyz7, xyz8 = (xyz[:, i, :] for i in range(8))
+        centroid1 = (xyz1 + xyz2 + xyz3 + xyz4) / 4.
+        area1 = 0.5 * norm(cross(xyz3 - xyz1, xyz4 - xyz2), axis=1)
+        centroid2 = (xyz5 + xyz6 + xyz7 + xyz8) / 4.
+        area2 = 0.5 * norm(cross(xyz7 - xyz5, xyz8 - xyz6), axis=1)
+        volume = (area1 + area2) / 2. * norm(centroid1 - centroid2, axis=1)
+        centroid = (centroid1 + centroid2) / 2.
+
+    pids = np.array([elem.pid for elem in elements], dtype=eids2.dtype)
+    rho = _get_property_values(elements, pids, lambda elem: elem.Rho())
+    mass = _increment_inertia_array(centroid, reference_point, rho * volume,
+                                    mass, cg, inertia)
+    return mass
+
 def _get_nid_xyzcid0(model: BDF) -> tuple[np.ndarray, np.ndarray]:
     out = model.get_xyz_in_coord_array(cid=0, fdtype='float64', idtype='int32')
     nid_cp_cd, xyz_cid0, unused_xyz_cp, unused_icd_transform, unused_icp_transform = out
@@ -620,9 +864,10 @@ def get_sub_eids(all_eids: np.ndarray,
     return eids2
 
 def _get_mass_nsm(model: BDF,
-                  element_ids: list[int], mass_ids: list[int],
+                  element_ids: np.ndarray, mass_ids: np.ndarray,
                   all_eids: np.ndarray, all_mass_ids: np.ndarray, etypes_skipped: set[str],
                   etype: str, eids: list[int], xyz: dict[int, np.ndarray],
+                  nids: np.ndarray, xyz_cid0: np.ndarray,
                   #length
                   length_eids_pids: dict[str, list[tuple[int, int]]],
                   nsm_centroids_length: dict[str, list[np.ndarray]],
@@ -635,74 +880,28 @@ def _get_mass_nsm(model: BDF,
                   mass: float, cg: np.ndarray, I: np.ndarray,
                   reference_point: np.ndarray) -> tuple[float, np.ndarray, np.ndarray]:
     """helper method for ``mass_properties_nsm``"""
-    element_ids_set = set(element_ids)
-    mass_ids_set = set(mass_ids)
-    if etype in {'CROD', 'CONROD'}:
-        eids2 = get_sub_eids(all_eids, eids, etype)
-        for eid in eids2:
-            elem = model.elements[eid]
-            n1, n2 = elem.node_ids
-            length = norm(xyz[n2] - xyz[n1])
-            centroid = (xyz[n1] + xyz[n2]) / 2.
-            mpl = elem.MassPerLength()
-            if elem.type == 'CONROD':
-                #nsm = property_nsms[nsm_id]['CONROD'][eid] + element_nsms[nsm_id][eid]
-                length_eids_pids['CONROD'].append((eid, -42))  # faked number
-                lengths['CONROD'].append(length)
-                nsm_centroids_length['CONROD'].append(centroid)
-            else:
-                pid = elem.pid
-                #nsm = property_nsms[nsm_id]['PROD'][pid] + element_nsms[nsm_id][eid]
-                length_eids_pids['PROD'].append((eid, pid))
-                nsm_centroids_length['PROD'].append(centroid)
-                lengths['PROD'].append(length)
-            #m = (mpl + nsm) * length
-            massi = mpl * length
-            #if massi != elem.Mass():  # pragma: no cover
-                #msg = 'mass_new=%s mass_old=%s\n%s' % (massi, elem.Mass(), str(elem))
-                #raise RuntimeError(msg)
-            if eid in element_ids_set:
-                mass = _increment_inertia(centroid, reference_point, massi, mass, cg, I)
-    elif etype == 'CTUBE':
-        eids2 = get_sub_eids(all_eids, eids, etype)
-        for eid in eids2:
-            elem = model.elements[eid]
-            pid = elem.pid
-            n1, n2 = elem.node_ids
-            length = norm(xyz[n2] - xyz[n1])
-            centroid = (xyz[n1] + xyz[n2]) / 2.
-            mpl = elem.pid_ref.MassPerLength()
-            length_eids_pids['PTUBE'].append((eid, pid))
-            lengths['PTUBE'].append(length)
-            #nsm = property_nsms[nsm_id]['PTUBE'][pid] + element_nsms[nsm_id][eid]
-            #m = (mpl + nsm) * length
-            massi = mpl * length
-            #if massi != elem.Mass():  # pragma: no cover
-                #msg = 'mass_new=%s mass_old=%s\n%s' % (massi, elem.Mass(), str(elem))
-                #raise RuntimeError(msg)
-            if eid in element_ids_set:
-                mass = _increment_inertia(centroid, reference_point, massi, mass, cg, I)
-    elif etype == 'CBAR':
-        mass = _get_cbar_mass(
-            model, xyz, element_ids_set, all_eids,
+    element_ids_set = set(element_ids.tolist())
+    if etype in {'CROD', 'CONROD', 'CTUBE', 'CBAR'}:
+        mass = _get_line_mass(
+            model, nids, xyz_cid0, element_ids, all_eids,
             length_eids_pids, lengths, nsm_centroids_length,
-            eids, mass, cg, I, reference_point)
+            etype, eids, mass, cg, I, reference_point)
 
     elif etype == 'CBEAM':
         mass = _get_cbeam_mass(
-            model, xyz, element_ids_set, all_eids,
+            model, nids, xyz_cid0, element_ids, all_eids,
             length_eids_pids, lengths, nsm_centroids_length,
             eids, mass, cg, I, reference_point)
 
     elif etype in {'CTRIA3', 'CTRIA6', 'CTRIAR'}:
         mass = _get_tri_mass(
-            model, xyz, element_ids_set, all_eids,
+            model, nids, xyz_cid0, element_ids, all_eids,
             area_eids_pids, areas, nsm_centroids_area,
             eids, mass, cg, I, reference_point)
 
     elif etype in {'CQUAD4', 'CQUAD8', 'CQUADR'}:
         mass = _get_quad_mass(
-            model, xyz, element_ids_set, all_eids,
+            model, nids, xyz_cid0, element_ids, all_eids,
             area_eids_pids, areas, nsm_centroids_area,
             eids, mass, cg, I, reference_point)
 
@@ -736,121 +935,36 @@ def _get_mass_nsm(model: BDF,
 
     elif etype == 'CSHEAR':
         mass = _get_cshear_mass(
-            model, xyz, element_ids_set, all_eids,
+            model, nids, xyz_cid0, element_ids, all_eids,
             area_eids_pids, areas, nsm_centroids_area,
             eids, mass, cg, I, reference_point, etype)
 
     elif etype == 'CONM2':
         eids2 = get_sub_eids(all_mass_ids, eids, etype)
-        for eid in eids2:
-            elem = model.masses[eid]
-            centroid, m, dI = elem.centroid_mass_inertia()
-            di_list = [dI[0][0], dI[1][1], dI[2][2], dI[0][1], dI[0][2], dI[1][2]]
-            if eid in mass_ids_set:
-                mass = _increment_inertia(centroid, reference_point, m, mass, cg, I)
-                I = [i1 + di for i1, di in zip(I, di_list)]
+        eids2 = eids2[np.isin(eids2, mass_ids)]
+        if len(eids2):
+            centroids = np.zeros((len(eids2), 3), dtype='float64')
+            masses = np.zeros(len(eids2), dtype='float64')
+            dinertia = np.zeros((3, 3), dtype='float64')
+            for i, eid in enumerate(eids2.tolist()):
+                centroids[i, :], masses[i], dI = model.masses[eid].centroid_mass_inertia()
+                dinertia += dI
+            mass = _increment_inertia_array(centroids, reference_point, masses, mass, cg, I)
+            I += dinertia[[0, 1, 2, 0, 0, 1], [0, 1, 2, 1, 2, 2]]
 
     elif etype in {'CONM1', 'CMASS1', 'CMASS2', 'CMASS3', 'CMASS4'}:
         eids2 = get_sub_eids(all_mass_ids, eids, etype)
-        for eid in eids2:
-            elem = model.masses[eid]
-            m = elem.Mass()
-            centroid = elem.Centroid()
-            if eid in mass_ids_set:
-                mass = _increment_inertia(centroid, reference_point, m, mass, cg, I)
-    elif etype == 'CTETRA':
-        eids2 = get_sub_eids(all_eids, eids, etype)
-        for eid in eids2:
-            elem = model.elements[eid]
-            n1, n2, n3, n4 = elem.node_ids[:4]
-            centroid = (xyz[n1] + xyz[n2] + xyz[n3] + xyz[n4]) / 4.
-            #V = -dot(n1 - n4, cross(n2 - n4, n3 - n4)) / 6.
-            volume = -dot(xyz[n1] - xyz[n4], cross(xyz[n2] - xyz[n4], xyz[n3] - xyz[n4])) / 6.
-            m = elem.Rho() * volume
-            #if m != elem.Mass() or not np.array_equal(centroid, elem.Centroid()):  # pragma: no cover
-                #msg = 'mass_new=%s mass_old=%s\n' % (m, elem.Mass())
-                #msg += 'centroid_new=%s centroid_old=%s\n%s' % (
-                    #str(centroid), str(elem.Centroid()), str(elem))
-                #raise RuntimeError(msg)
-            if eid in element_ids_set:
-                mass = _increment_inertia(centroid, reference_point, m, mass, cg, I)
-
-    elif etype == 'CPYRAM':
-        eids2 = get_sub_eids(all_eids, eids, etype)
-        for eid in eids2:
-            elem = model.elements[eid]
-            n1, n2, n3, n4, n5 = elem.node_ids[:5]
-            centroid1 = (xyz[n1] + xyz[n2] + xyz[n3] + xyz[n4]) / 4.
-            area1 = 0.5 * norm(cross(xyz[n3]-xyz[n1], xyz[n4]-xyz[n2]))
-            centroid5 = xyz[n5]
-
-            #V = (l * w) * h / 3
-            #V = A * h / 3
-            centroid = (centroid1 + centroid5) / 2.
-
-            #(n1, n2, n3, n4, n5) = self.get_node_positions()
-            #area1, c1 = area_centroid(n1, n2, n3, n4)
-            #volume = area1 / 3. * norm(c1 - n5)
-            volume = area1 / 3. * norm(centroid1 - centroid5)
-            m = elem.Rho() * volume
-            if CHECK_MASS and (m != elem.Mass() or not np.array_equal(centroid, elem.Centroid())):  # pragma: no cover
-                msg = 'mass_new=%s mass_old=%s\n' % (m, elem.Mass())
-                msg += 'centroid_new=%s centroid_old=%s\n%s' % (
-                    str(centroid), str(elem.Centroid()), str(elem))
-                raise RuntimeError(msg)
-            #print('*eid=%s type=%s mass=%s rho=%s V=%s' % (
-                #elem.eid, 'CPYRAM', m, elem.Rho(), volume))
-            if eid in element_ids_set:
-                mass = _increment_inertia(centroid, reference_point, m, mass, cg, I)
-
-    elif etype == 'CPENTA':
-        eids2 = get_sub_eids(all_eids, eids, etype)
-        for eid in eids2:
-            elem = model.elements[eid]
-            n1, n2, n3, n4, n5, n6 = elem.node_ids[:6]
-            area1 = 0.5 * norm(cross(xyz[n3] - xyz[n1], xyz[n2] - xyz[n1]))
-            area2 = 0.5 * norm(cross(xyz[n6] - xyz[n4], xyz[n5] - xyz[n4]))
-            centroid1 = (xyz[n1] + xyz[n2] + xyz[n3]) / 3.
-            centroid2 = (xyz[n4] + xyz[n5] + xyz[n6]) / 3.
-            centroid = (centroid1 + centroid2) / 2.
-            volume = (area1 + area2) / 2. * norm(centroid1 - centroid2)
-            m = elem.Rho() * volume
-            #if m != elem.Mass() or not np.array_equal(centroid, elem.Centroid()):  # pragma: no cover
-                #msg = 'mass_new=%s mass_old=%s\n' % (m, elem.Mass())
-                #msg += 'centroid_new=%s centroid_old=%s\n%s' % (
-                    #str(centroid), str(elem.Centroid()), str(elem))
-                #raise RuntimeError(msg)
-            #print('*eid=%s type=%s mass=%s rho=%s V=%s' % (
-                #elem.eid, 'CPENTA', m, elem.Rho(), volume))
-            if eid in element_ids_set:
-                mass = _increment_inertia(centroid, reference_point, m, mass, cg, I)
-
-    elif etype in ['CHEXA', 'CHEXA1', 'CHEXA2']:
-        eids2 = get_sub_eids(all_eids, eids, etype)
-        for eid in eids2:
-            elem = model.elements[eid]
-            n1, n2, n3, n4, n5, n6, n7, n8 = elem.node_ids[:8]
-            #(A1, c1) = area_centroid(n1, n2, n3, n4)
-            centroid1 = (xyz[n1] + xyz[n2] + xyz[n3] + xyz[n4]) / 4.
-            area1 = 0.5 * norm(cross(xyz[n3] - xyz[n1], xyz[n4] - xyz[n2]))
-            #(A2, c2) = area_centroid(n5, n6, n7, n8)
-            centroid2 = (xyz[n5] + xyz[n6] + xyz[n7] + xyz[n8]) / 4.
-            area2 = 0.5 * norm(cross(xyz[n7] - xyz[n5], xyz[n8] - xyz[n6]))
-
-            volume = (area1 + area2) / 2. * norm(centroid1 - centroid2)
-            m = elem.Rho() * volume
-            centroid = (centroid1 + centroid2) / 2.
-            #if m != elem.Mass() or not np.array_equal(centroid, elem.Centroid()):  # pragma: no cover
-                #msg = 'mass_new=%s mass_old=%s\n' % (m, elem.Mass())
-                #msg = 'centroid_new=%s centroid_old=%s\n%s' % (
-                    #str(centroid), str(elem.Centroid()), str(elem))
-                #raise RuntimeError(msg)
-            #print('*centroid1=%s centroid2=%s' % (str(centroid1), str(centroid2)))
-            #print('*area1=%s area2=%s length=%s' % (area1, area2, norm(centroid1 - centroid2)))
-            #print('*eid=%s type=%s mass=%s rho=%s V=%s' % (
-                #elem.eid, 'CHEXA', m, elem.Rho(), volume))
-            if eid in element_ids_set:
-                mass = _increment_inertia(centroid, reference_point, m, mass, cg, I)
+        eids2 = eids2[np.isin(eids2, mass_ids)]
+        masses_ = [model.masses[eid] for eid in eids2.tolist()]
+        masses = np.array([elem.Mass() for elem in masses_], dtype='float64')
+        centroids = np.array([elem.Centroid() for elem in masses_],
+                             dtype='float64').reshape(len(masses_), 3)
+        mass = _increment_inertia_array(centroids, reference_point, masses, mass, cg, I)
+
+    elif etype in {'CTETRA', 'CPYRAM', 'CPENTA', 'CHEXA', 'CHEXA1', 'CHEXA2'}:
+        mass = _get_solid_mass(
+            model, nids, xyz_cid0, element_ids, all_eids,
+            etype, eids, mass, cg, I, reference_point)
 
     elif etype == 'CBEND':
         model.log.info('elem.type=%s mass is innaccurate' % etype)
@@ -858,7 +972,12 @@ def _get_mass_nsm(model: BDF,
         eids2 = get_sub_eids(all_eids, eids, etype)
         for eid in eids2:
             elem = model.elements[eid]
-            m = elem.Mass()
+            try:
+                m = elem.Mass()
+            except Exception:
+                model.log.warning("could not get the inertia for element/property\n%s%s" % (
+                    elem, elem.pid_ref))
+                continue
             centroid = elem.Centroid()
             if eid in element_ids_set:
                 mass = _increment_inertia(centroid, reference_point, m, mass, cg, I)
@@ -918,155 +1037,175 @@ def _mass_catch_all(model: BDF, etype: str, etypes_skipped: set[str],
             etypes_skipped.add(etype)
     return mass
 
-def _get_cbar_mass(model: BDF, xyz: dict[int, np.ndarray],
-                   element_ids_set: set[int], all_eids: np.ndarray,
-                   length_eids_pids, lengths, nsm_centroids_length,
-                   eids: list[int],
-                   mass: float, cg: np.ndarray, I: np.ndarray,
-                   reference_point) -> float:
-    """helper method for ``get_mass_new``"""
-    eids2 = get_sub_eids(all_eids, eids, 'CBAR')
-    for eid in eids2:
-        elem = model.elements[eid]
-        pid = elem.pid
-        n1, n2 = elem.node_ids
-        centroid = (xyz[n1] + xyz[n2]) / 2.
-        length: float = norm(xyz[n2] - xyz[n1])
-        mpl = elem.pid_ref.MassPerLength()
-        length_eids_pids['PBAR'].append((eid, pid))
-        lengths['PBAR'].append(length)
-        nsm_centroids_length['PBAR'].append(centroid)
-        #nsm = property_nsms[nsm_id]['PBAR'][pid] + element_nsms[nsm_id][eid]
-        #m = (mpl + nsm) * length
-        massi = mpl * length
-        #if massi != elem.Mass() or not np.array_equal(centroid, elem.Centroid()):  # pragma: no cover
-            #msg = 'mass_new=%s mass_old=%s\n' % (massi, elem.Mass())
-            #msg += 'centroid_new=%s centroid_old=%s\n%s' % (
-                #str(centroid), str(elem.Centroid()), str(elem))
-            #raise RuntimeError(msg)
-        if eid in element_ids_set:
-            mass = _increment_inertia(centroid, reference_point, massi, mass, cg, I)
-    return mass
-
-def _get_cbeam_mass(model, xyz, element_ids, all_eids,
+def _get_cbeam_mass(model: BDF, nids: np.ndarray, xyz_cid0: np.ndarray,
+                    element_ids: np.ndarray, all_eids: np.ndarray,
                     length_eids_pids, lengths, nsm_centroids_length,
-                    eids, mass, cg, inertia, reference_point):
+                    eids: list[int],
+                    mass: float, cg: np.ndarray, inertia: np.ndarray,
+                    reference_point: np.ndarray) -> float:
     """helper method for ``get_mass_new``"""
     eids2 = get_sub_eids(all_eids, eids, 'CBEAM')
-    for eid in eids2:
-        elem = model.elements[eid]
-        prop = elem.pid_ref
-        pid = elem.pid
-        n1, n2 = elem.node_ids
-        xyz1 = xyz[n1]
-        xyz2 = xyz[n2]
-        centroid = (xyz1 + xyz2) / 2.
-        length = norm(xyz2 - xyz1)
-
-        is_failed, out = elem.get_axes(model)
-        if is_failed:
-            model.log.error(out)
-            raise RuntimeError(out)
-
-        _v, _ihat, jhat, khat, wa, wb = out
-        p1 = xyz1 + wa
-        p2 = xyz2 + wb
-        if prop.type == 'PBEAM':
-            rho = prop.Rho()
-
-            # we don't call the MassPerLength method so we can put the NSM centroid
-            # on a different axis (the PBEAM is weird)
-            mass_per_lengths = []
-            nsm_per_lengths = []
-            for (area, nsm) in zip(prop.A, prop.nsm):
-                mass_per_lengths.append(area * rho)
-                nsm_per_lengths.append(nsm)
-            mass_per_length = integrate_positive_unit_line(prop.xxb, mass_per_lengths)
-            nsm_per_length = integrate_positive_unit_line(prop.xxb, nsm_per_lengths)
-            nsm_n1 = (p1 + jhat * prop.m1a + khat * prop.m2a)
-            nsm_n2 = (p2 + jhat * prop.m1b + khat * prop.m2b)
-            nsm_centroid = (nsm_n1 + nsm_n2) / 2.
-            #if nsm != 0.:
-                #p1_nsm = p1 + prop.ma
-                #p2_nsm = p2 + prop.mb
-        elif prop.type == 'PBEAML':
-            mass_per_lengths = prop.get_mass_per_lengths()
-            #mass_per_length = prop.MassPerLength() # includes simplified nsm
-
-            # m1a, m1b, m2a, m2b=0.
-            nsm_centroid = (p1 + p2) / 2.
-
-            # mass_per_length already includes nsm
-            mass_per_length = integrate_positive_unit_line(prop.xxb, mass_per_lengths)
-            nsm_per_length = 0.
-
-            #nsm_centroid = np.zeros(3) # TODO: what is this...
-            #nsm = prop.nsm[0] * length # TODO: simplified
-        elif prop.type == 'PBCOMP':
-            mass_per_length = prop.MassPerLength()
-            nsm_per_length = prop.nsm
-            nsm_n1 = (p1 + jhat * prop.m1 + khat * prop.m2)
-            nsm_n2 = (p2 + jhat * prop.m1 + khat * prop.m2)
-            nsm_centroid = (nsm_n1 + nsm_n2) / 2.
-        elif prop.type == 'PBMSECT':
-            continue
-            #mass_per_length = prop.MassPerLength()
-            #m = mass_per_length * length
-            #nsm = prop.nsm
-        else:  # pragma: no cover
-            raise NotImplementedError(prop.type)
+    elements = [model.elements[eid] for eid in eids2.tolist()]
+    pids = np.array([elem.pid for elem in elements], dtype=eids2.dtype)
+
+    # mass/length, nsm/length and the NSM offsets (m1a, m2a, m1b, m2b)
+    unused_upids, ifirst, ipid = np.unique(pids, return_index=True, return_inverse=True)
+    prop_values = np.array([_get_cbeam_mass_per_length(elements[ielem].pid_ref)
+                            for ielem in ifirst.tolist()], dtype='float64').reshape(len(ifirst), 6)
+    prop_values = prop_values[ipid, :]
+    is_mass = ~np.isnan(prop_values[:, 0])  # PBMSECT
+    if not is_mass.all():
+        eids2 = eids2[is_mass]
+        pids = pids[is_mass]
+        elements = [elem for elem, is_massi in zip(elements, is_mass.tolist()) if is_massi]
+        prop_values = prop_values[is_mass, :]
+    if len(eids2) == 0:
+        return mass
+    mass_per_length, nsm_per_length, m1a, m2a, m1b, m2b = prop_values.T
 
-        #mpl = elem.pid_ref.MassPerLength()
-        #m = mpl * length
-
-        length_eids_pids['PBEAM'].append((eid, pid))
-        lengths['PBEAM'].append(length)
-        nsm_centroids_length['PBEAM'].append(nsm_centroid)
-        m = mass_per_length * length
-        nsm = nsm_per_length * length
-        if CHECK_MASS and ((m + nsm) != elem.Mass() or not np.array_equal(centroid, elem.Centroid())):  # pragma: no cover
-            msg = 'CBEAM; eid=%s; %s pid=%s; m/L=%s nsm/L=%s; length=%s\n' % (
-                eid, pid, prop.type, mass_per_length, nsm_per_length, length)
-            msg += 'mass_new=%s mass_old=%s\n' % (m, elem.Mass())
-            msg += 'centroid_new=%s centroid_old=%s\n%s' % (
-                str(centroid), str(elem.Centroid()), str(elem))
-            raise RuntimeError(msg)
+    xyz1, xyz2, jhat, khat, wa, wb = _get_cbeam_axes(model, elements, nids, xyz_cid0)
+    centroid = (xyz1 + xyz2) / 2.
+    length = norm(xyz2 - xyz1, axis=1)
 
-        if eid not in element_ids:
-            continue
-        #nsm = (nsm_per_length + nsmi) * length
-        (x, y, z) = centroid - reference_point
-        (xm, ym, zm) = nsm_centroid - reference_point
-        x2 = x * x
-        y2 = y * y
-        z2 = z * z
-        xm2 = xm * xm
-        ym2 = ym * ym
-        zm2 = zm * zm
-
-        # Ixx, Iyy, Izz, Ixy, Ixz, Iyz
-        inertia[0] += m * (y2 + z2) + nsm * (ym2 + zm2)
-        inertia[1] += m * (x2 + z2) + nsm * (xm2 + zm2)
-        inertia[2] += m * (x2 + y2) + nsm * (xm2 + ym2)
-        inertia[3] += m * x * y + nsm * xm * ym
-        inertia[4] += m * x * z + nsm * xm * zm
-        inertia[5] += m * y * z + nsm * ym * zm
-        massi = m + nsm
-        mass += massi
-        cg += m * centroid + nsm * nsm_centroid
-        #print('length=%s mass=%s mass_per_length=%s nsm_per_length=%s m=%s nsm=%s centroid=%s nsm_centroid=%s' % (
-            #length, mass, mass_per_length, nsm_per_length, m, nsm, centroid, nsm_centroid))
-        if CHECK_MASS and massi != elem.Mass():  # pragma: no cover
-            msg = 'mass_new=%s mass_old=%s\n' % (massi, elem.Mass())
-            msg += 'centroid_new=%s centroid_old=%s\n%s' % (
-                str(centroid), str(elem.Centroid()), str(elem))
-            raise RuntimeError(msg)
+    # the PBEAM NSM is on a different axis than the structural mass
+    p1 = xyz1 + wa
+    p2 = xyz2 + wb
+    nsm_n1 = p1 + jhat * m1a[:, np.newaxis] + khat * m2a[:, np.newaxis]
+    nsm_n2 = p2 + jhat * m1b[:, np.newaxis] + khat * m2b[:, np.newaxis]
+    nsm_centroid = (nsm_n1 + nsm_n2) / 2.
+
+    length_eids_pids['PBEAM'].extend(np.column_stack([eids2, pids]).tolist())
+    lengths['PBEAM'].extend(length.tolist())
+    nsm_centroids_length['PBEAM'].extend(nsm_centroid.tolist())
+
+    is_selected = np.isin(eids2, element_ids)
+    length = length[is_selected]
+    mass = _increment_inertia_array(centroid[is_selected, :], reference_point,
+                                    mass_per_length[is_selected] * length,
+                                    mass, cg, inertia)
+    mass = _increment_inertia_array(nsm_centroid[is_selected, :], reference_point,
+                                    nsm_per_length[is_selected] * length,
+                                    mass, cg, inertia)
     return mass
 
+def _get_cbeam_mass_per_length(prop: PBEAM | PBEAML | PBCOMP) -> tuple[float, float,
+                                                                      float, float,
+                                                                      float, float]:
+    """
+    Gets the mass/length, the nsm/length and the NSM offsets
+    (m1a, m2a, m1b, m2b) of a CBEAM property; NaN for a PBMSECT
+    """
+    if prop.type == 'PBEAM':
+        rho = prop.Rho()
+
+        # we don't call the MassPerLength method so we can put the NSM centroid
+        # on a different axis (the PBEAM is weird)
+        mass_per_lengths = [area * rho for area in prop.A]
+        mass_per_length = integrate_positive_unit_line(prop.xxb, mass_per_lengths)
+        nsm_per_length = integrate_positive_unit_line(prop.xxb, prop.nsm)
+        out = (mass_per_length, nsm_per_length, prop.m1a, prop.m2a, prop.m1b, prop.m2b)
+    elif prop.type == 'PBEAML':
+        # mass_per_length already includes nsm; m1a, m1b, m2a, m2b=0.
+        mass_per_lengths = prop.get_mass_per_lengths()
+        mass_per_length = integrate_positive_unit_line(prop.xxb, mass_per_lengths)
+        out = (mass_per_length, 0., 0., 0., 0., 0.)
+    elif prop.type == 'PBCOMP':
+        out = (prop.MassPerLength(), prop.nsm, prop.m1, prop.m2, prop.m1, prop.m2)
+    elif prop.type == 'PBMSECT':
+        out = (np.nan, 0., 0., 0., 0., 0.)
+    else:  # pragma: no cover
+        raise NotImplementedError(prop.type)
+    return out
+
+def _get_cbeam_axes(model: BDF, elements: list[CBEAM],
+                    nids: np.ndarray, xyz_cid0: np.ndarray) -> tuple[np.ndarray, np.ndarray,
+                                                                     np.ndarray, np.ndarray,
+                                                                     np.ndarray, np.ndarray]:
+    """
+    Gets the axes and the offsets of the CBEAMs, while respecting the OFFT flag.
+    This is a vectorized version of ``CBEAM.get_axes``.
+
+    Returns
+    -------
+    xyz1 / xyz2 : (n, 3) float ndarray
+        the xyz locations for node 1 / 2
+    jhat / khat : (n, 3) float ndarray
+        the y/z axes of the CBEAMs
+    wa / wb : (n, 3) float ndarray
+        the offset vectors at A/B in the global frame
+
+    """
+    nelements = len(elements)
+    eids_bit = [elem.eid for elem in elements if elem.bit is not None]
+    if eids_bit:
+        raise RuntimeError(f'CBEAM bit is not supported; eids={eids_bit}')
+
+    node_ids = np.array([elem.node_ids for elem in elements], dtype='int64').reshape(nelements, 2)
+    xyz = _get_node_xyz(node_ids, nids, xyz_cid0)
+    xyz1 = xyz[:, 0, :]
+    xyz2 = xyz[:, 1, :]
+    cd = np.array([[model.nodes[nid].Cd() for nid in nodes] for nodes in node_ids.tolist()],
+                  dtype='int64').reshape(nelements, 2)
+    offt = np.array([list(elem.offt) for elem in elements]).reshape(nelements, 3)
+    wa = np.array([elem.wa for elem in elements], dtype='float64').reshape(nelements, 3)
+    wb = np.array([elem.wb for elem in elements], dtype='float64').reshape(nelements, 3)
+    is_invalid = ~np.isin(offt[:, 0], ['G', 'B']) | ~np.isin(offt[:, 1:], ['G', 'B', 'O']).all(axis=1)
+    if is_invalid.any():
+        eids_invalid = [elem.eid for elem, is_invalidi in zip(elements, is_invalid) if is_invalidi]
+        raise RuntimeError(f'CBEAM offt is not supported; eids={eids_invalid}')
+
+    # v is the vector to G0 or X in the CD frame of end A
+    g0 = np.array([elem.g0 if elem.g0 else 0 for elem in elements], dtype='int64')
+    is_x = (g0 == 0)
+    v = np.zeros((nelements, 3), dtype='float64')
+    if not is_x.all():
+        v[~is_x, :] = _get_node_xyz(g0[~is_x], nids, xyz_cid0) - xyz1[~is_x, :]
+    if is_x.any():
+        ix = np.where(is_x)[0]
+        v[ix, :] = np.array([elements[i].x for i in ix.tolist()], dtype='float64')
+        for cd1 in np.unique(cd[ix, 0]).tolist():
+            if cd1 == 0:
+                continue
+            ixi = ix[cd[ix, 0] == cd1]
+            v[ixi, :] = model.Coord(cd1)._transform_node_to_global_array(v[ixi, :])
+
+    # rotate v, wa, wb from the CD frame ('G') to the basic frame
+    for vector, is_global, cdi in [(v, offt[:, 0] == 'G', cd[:, 0]),
+                                   (wa, offt[:, 1] == 'G', cd[:, 0]),
+                                   (wb, offt[:, 2] == 'G', cd[:, 1])]:
+        is_rotated = is_global & (cdi != 0)
+        for cid in np.unique(cdi[is_rotated]).tolist():
+            irotate = is_rotated & (cdi == cid)
+            coord = model.Coord(cid)
+            vector[irotate, :] = coord.transform_node_to_global_assuming_rectangular(
+                vector[irotate, :])
+
+    # wa/wb are not considered in ihat
+    i = xyz2 - xyz1
+    length = norm(i, axis=1)
+    if (length == 0.).any():
+        eids_zero = [elem.eid for elem, lengthi in zip(elements, length) if lengthi == 0.]
+        raise ValueError(f'CBEAM length is 0.0; eids={eids_zero}')
+    ihat = i / length[:, np.newaxis]
+    vhat = v / norm(v, axis=1)[:, np.newaxis]
+    z = cross(ihat, vhat)
+    khat = z / norm(z, axis=1)[:, np.newaxis]
+    jhat = cross(khat, ihat)
+
+    # 'O' offsets are in the element frame
+    for vector, is_offset in [(wa, offt[:, 1] == 'O'),
+                              (wb, offt[:, 2] == 'O')]:
+        if is_offset.any():
+            vector[is_offset, :] = (
+                vector[is_offset, 0, np.newaxis] * ihat[is_offset, :] +
+                vector[is_offset, 1, np.newaxis] * jhat[is_offset, :] +
+                vector[is_offset, 2, np.newaxis] * khat[is_offset, :])
+    return xyz1, xyz2, jhat, khat, wa, wb
+
 def _get_cbeam_mass_no_nsm(model: BDF, elem: CBEAM,
                            mass: float, cg: np.ndarray, inertia: np.ndarray,
                            reference_point: np.ndarray) -> float:
-    """helper method for mass_properties"""
+    """helper method for ``_mass_properties_elementwise``"""
     prop = elem.pid_ref
     xyz1, xyz2 = elem.get_node_positions()
     centroid = (xyz1 + xyz2) / 2.
@@ -1157,8 +1296,8 @@ def _get_cbeam_mass_no_nsm(model: BDF, elem: CBEAM,
     return mass
 
 def _get_tri_mass(model: BDF,
-                  xyz: dict[int, np.ndarray],
-                  element_ids: set[int], all_eids: np.ndarray,
+                  nids: np.ndarray, xyz_cid0: np.ndarray,
+                  element_ids: np.ndarray, all_eids: np.ndarray,
                   #area
                   area_eids_pids: dict[str, list[tuple[int, int]]],
                   areas: dict[str, list[float]],
@@ -1168,70 +1307,26 @@ def _get_tri_mass(model: BDF,
                   reference_point: np.ndarray) -> float:
     """helper method for ``get_mass_new``"""
     eids2 = get_sub_eids(all_eids, eids, 'tri')
-    for eid in eids2:
-        elem = model.elements[eid]
-        n1, n2, n3 = elem.node_ids[:3]
-        prop = elem.pid_ref
-        pid = elem.pid
-        centroid = (xyz[n1] + xyz[n2] + xyz[n3]) / 3.
-        area: float = 0.5 * norm(cross(xyz[n1] - xyz[n2], xyz[n1] - xyz[n3]))
-        #areas_prop[pid] += area
-        if prop.type == 'PSHELL':
-            tflag = elem.tflag
-            ti = prop.Thickness()
-            if tflag == 0:
-                # absolute
-                t1 = ti if elem.T1 is None else elem.T1
-                t2 = ti if elem.T2 is None else elem.T2
-                t3 = ti if elem.T3 is None else elem.T3
-            elif tflag == 1:
-                # relative
-                t1 = ti if elem.T1 is None else elem.T1 * ti
-                t2 = ti if elem.T2 is None else elem.T2 * ti
-                t3 = ti if elem.T3 is None else elem.T3 * ti
-            else:  # pragma: no cover
-                raise RuntimeError('tflag=%r' % tflag)
-            assert t1 + t2 + t3 > 0., 't1=%s t2=%s t3=%s' % (t1, t2, t3)
-            t = (t1 + t2 + t3) / 3.
-
-            # m/A = rho * A * t + nsm
-            #mass_per_area = elem.nsm + rho * elem.t
-
-            #areas_prop[pid] += area
-            mpa = prop.nsm + prop.Rho() * t
-            #mpa = elem.pid_ref.MassPerArea()
-        elif prop.type in ['PCOMP', 'PCOMPG']:
-            # TODO: do PCOMPs even support differential thickness?
-            #       I don't think so...
-
-            #rho_t = prop.get_rho_t()
-            #nsm = prop.nsm
-            #rho_t = [mat.Rho() * t for (mat, t) in zip(prop.mids_ref, prop.ts)]
-            #mpa = sum(rho_t) + nsm
-
-            # works for PCOMP
-            # F:\Program Files\Siemens\NXNastran\nxn10p1\nxn10p1\nast\tpl\cqr3compbuck.dat
-            mpa = prop.get_mass_per_area()
-        elif prop.type in ['PLPLANE', 'PPLANE']:
-            continue
-        else:
-            raise NotImplementedError(prop.type)
-        area_eids_pids['PSHELL'].append((eid, pid))
-        areas['PSHELL'].append(area)
-
-        nsm_centroids_area['PSHELL'].append(centroid)
-        #nsm = property_nsms[nsm_id]['PSHELL'][pid] + element_nsms[nsm_id][eid]
-        #m = area * (mpa + nsm)
-        massi = area * mpa
-        if CHECK_MASS and not np.array_equal(centroid, elem.Centroid()):  # pragma: no cover
-            msg = 'centroid_new=%s centroid_old=%s\n%s' % (
-                str(centroid), str(elem.Centroid()), str(elem))
-            raise RuntimeError(msg)
-        if eid in element_ids:
-            mass = _increment_inertia(centroid, reference_point, massi, mass, cg, inertia)
+    elements = [model.elements[eid] for eid in eids2.tolist()]
+    pids = np.array([elem.pid for elem in elements], dtype=eids2.dtype)
+
+    # m/A = rho * t + nsm, where t is the average of T1-T3 (tflag=0: absolute, 1: relative)
+    mpa, is_mass = _get_shell_mass_per_area(
+        elements, pids, ('T1', 'T2', 'T3'), {'PLPLANE', 'PPLANE'})
+    xyz = _get_element_node_xyz(elements, 3, nids, xyz_cid0)
+    xyz1, xyz2, xyz3 = xyz[:, 0, :], xyz[:, 1, :], xyz[:, 2, :]
+    centroid = (xyz1 + xyz2 + xyz3) / 3.
+    area = 0.5 * norm(cross(xyz1 - xyz2, xyz1 - xyz3), axis=1)
+    mass = _add_area_length_mass(
+        'PSHELL', eids2[is_mass], pids[is_mass], area[is_mass], mpa[is_mass],
+        centroid[is_mass, :], element_ids,
+        area_eids_pids, areas, nsm_centroids_area,
+        mass, cg, inertia, reference_point)
     return mass
 
-def _get_quad_mass(model: BDF, xyz: dict[int, np.ndarray], element_ids: set[int], all_eids: np.ndarray,
+def _get_quad_mass(model: BDF,
+                   nids: np.ndarray, xyz_cid0: np.ndarray,
+                   element_ids: np.ndarray, all_eids: np.ndarray,
                    #area
                    area_eids_pids: dict[str, list[tuple[int, int]]],
                    areas: dict[str, list[float]],
@@ -1241,88 +1336,26 @@ def _get_quad_mass(model: BDF, xyz: dict[int, np.ndarray], element_ids: set[int]
                    reference_point: np.ndarray) -> float:
     """helper method for ``get_mass_new``"""
     eids2 = get_sub_eids(all_eids, eids, 'quad')
-    for eid in eids2:
-        elem = model.elements[eid]
-        n1, n2, n3, n4 = elem.node_ids[:4]
-        prop = elem.pid_ref
-        pid = prop.pid
-        centroid = (xyz[n1] + xyz[n2] + xyz[n3] + xyz[n4]) / 4.
-        x31 = xyz[n3] - xyz[n1]
-        x42 = xyz[n4] - xyz[n2]
-        area: float = 0.5 * norm(cross(x31, x42))
-
-        if prop.type == 'PSHELL':
-            tflag = elem.tflag
-            ti = prop.Thickness()
-            if tflag == 0:
-                # absolute
-                t1 = ti if elem.T1 is None else elem.T1
-                t2 = ti if elem.T2 is None else elem.T2
-                t3 = ti if elem.T3 is None else elem.T3
-                t4 = ti if elem.T4 is None else elem.T4
-            elif tflag == 1:
-                # relative
-                t1 = ti if elem.T1 is None else elem.T1 * ti
-                t2 = ti if elem.T2 is None else elem.T2 * ti
-                t3 = ti if elem.T3 is None else elem.T3 * ti
-                t4 = ti if elem.T4 is None else elem.T4 * ti
-            else:  # pragma: no cover
-                raise RuntimeError('tflag=%r' % tflag)
-            assert t1 + t2 + t3 + t4 > 0., 't1=%s t2=%s t3=%s t4=%s' % (t1, t2, t3, t4)
-            t = (t1 + t2 + t3 + t4) / 4.
-
-            # m/A = rho * A * t + nsm
-            #mass_per_area = model.nsm + rho * model.t
-
-            #areas_prop[pid] += area
-            rho = prop.Rho()
-            mpa = prop.nsm + rho * t
-            #mpa = elem.pid_ref.MassPerArea()
-            #m = mpa * area
-        elif prop.type in ['PCOMP', 'PCOMPG']:
-            # PCOMP, PCOMPG
-            #rho_t = prop.get_rho_t()
-            #nsm = prop.nsm
-            #rho_t = [mat.Rho() * t for (mat, t) in zip(prop.mids_ref, prop.ts)]
-            #mpa = sum(rho_t) + nsm
-            mpa = prop.get_mass_per_area()
-        elif prop.type in ['PLPLANE', 'PPLANE', 'PMIC']:
-            continue
-            #raise NotImplementedError(prop.type)
-        else:
-            raise NotImplementedError(prop.type)
-        area_eids_pids['PSHELL'].append((eid, pid))
-        areas['PSHELL'].append(area)
-        nsm_centroids_area['PSHELL'].append(centroid)
-        #nsm = property_nsms[nsm_id]['PSHELL'][pid] + element_nsms[nsm_id][eid]
-        #m = area * (mpa + nsm)
-        m = area * mpa
-        if CHECK_MASS and not np.array_equal(centroid, elem.Centroid()):  # pragma: no cover
-            msg = 'centroid_new=%s centroid_old=%s\n%s' % (
-                str(centroid), str(elem.Centroid()), str(elem))
-            raise RuntimeError(msg)
-        #elem = model.elements[eid]
-
-        #mass_expected = elem.Mass()
-        #if not np.allclose(m, mass_expected):  # pragma: no cover
-            #msg = 'massi=%s expected=%s' % (m, mass_expected)
-            #for node in elem.nodes_ref:
-                #node.comment = ''
-            #elem.comment = ''
-            #prop.comment = ''
-            #prop.mid1_ref.comment = ''
-            #msg += elem.get_stats()
-            #msg += prop.get_stats()
-            #msg += prop.mid_ref.get_stats()
-            #raise RuntimeError(msg)
-        #print('eid=%s type=%s mass=%s; area=%s mpa=%s'  % (elem.eid, elem.type, m, area, mpa))
-        if eid in element_ids:
-            mass = _increment_inertia(centroid, reference_point, m, mass, cg, inertia)
+    elements = [model.elements[eid] for eid in eids2.tolist()]
+    pids = np.array([elem.pid for elem in elements], dtype=eids2.dtype)
+
+    # m/A = rho * t + nsm, where t is the average of T1-T4 (tflag=0: absolute, 1: relative)
+    mpa, is_mass = _get_shell_mass_per_area(
+        elements, pids, ('T1', 'T2', 'T3', 'T4'), {'PLPLANE', 'PPLANE', 'PMIC'})
+    xyz = _get_element_node_xyz(elements, 4, nids, xyz_cid0)
+    xyz1, xyz2, xyz3, xyz4 = xyz[:, 0, :], xyz[:, 1, :], xyz[:, 2, :], xyz[:, 3, :]
+    centroid = (xyz1 + xyz2 + xyz3 + xyz4) / 4.
+    area = 0.5 * norm(cross(xyz3 - xyz1, xyz4 - xyz2), axis=1)
+    mass = _add_area_length_mass(
+        'PSHELL', eids2[is_mass], pids[is_mass], area[is_mass], mpa[is_mass],
+        centroid[is_mass, :], element_ids,
+        area_eids_pids, areas, nsm_centroids_area,
+        mass, cg, inertia, reference_point)
     return mass
 
 def _get_cshear_mass(model: BDF,
-                     xyz: dict[int, np.ndarray],
-                     element_ids_set: set[int],
+                     nids: np.ndarray, xyz_cid0: np.ndarray,
+                     element_ids: np.ndarray,
                      all_eids: np.ndarray,
                      area_eids_pids, areas, nsm_centroids_area,
                      eids: list[int],
@@ -1331,29 +1364,18 @@ def _get_cshear_mass(model: BDF,
                      etype: str) -> float:
     """helper method for ``get_mass_new``"""
     eids2 = get_sub_eids(all_eids, eids, etype)
-    for eid in eids2:
-        elem = model.elements[eid]
-        n1, n2, n3, n4 = elem.node_ids
-        prop = elem.pid_ref
-        pid = elem.pid
-        centroid = (xyz[n1] + xyz[n2] + xyz[n3] + xyz[n4]) / 4.
-        area: float = 0.5 * norm(cross(xyz[n3] - xyz[n1], xyz[n4] - xyz[n2]))
-        mpa = prop.MassPerArea()
-
-        area_eids_pids['PSHEAR'].append((eid, pid))
-        areas['PSHEAR'].append(area)
-        nsm_centroids_area['PSHEAR'].append(centroid)
-
-        #nsm = property_nsms[nsm_id]['PSHEAR'][pid] + element_nsms[nsm_id][eid]
-        #m = area * (mpa + nsm)
-        m = area * mpa
-        #if m != elem.Mass() or not np.array_equal(centroid, elem.Centroid()):  # pragma: no cover
-            #msg = 'mass_new=%s mass_old=%s\n' % (m, elem.Mass())
-            #msg += 'centroid_new=%s centroid_old=%s\n%s' % (
-                #str(centroid), str(elem.Centroid()), str(elem))
-            #raise RuntimeError(msg)
-        if eid in element_ids_set:
-            mass = _increment_inertia(centroid, reference_point, m, mass, cg, I)
+    elements = [model.elements[eid] for eid in eids2.tolist()]
+    pids = np.array([elem.pid for elem in elements], dtype=eids2.dtype)
+    mpa = _get_property_values(elements, pids, lambda elem: elem.pid_ref.MassPerArea())
+
+    xyz = _get_element_node_xyz(elements, 4, nids, xyz_cid0)
+    xyz1, xyz2, xyz3, xyz4 = xyz[:, 0, :], xyz[:, 1, :], xyz[:, 2, :], xyz[:, 3, :]
+    centroid = (xyz1 + xyz2 + xyz3 + xyz4) / 4.
+    area = 0.5 * norm(cross(xyz3 - xyz1, xyz4 - xyz2), axis=1)
+    mass = _add_area_length_mass(
+        'PSHEAR', eids2, pids, area, mpa, centroid, element_ids,
+        area_eids_pids, areas, nsm_centroids_area,
+        mass, cg, I, reference_point)
     return mass
 
 def _setup_apply_nsm(area_eids_pids: dict[str, np.ndarray],
@@ -1509,15 +1531,12 @@ def _combine_prop_weighted_area_length_simple(model: BDF,
         if debug:
             model.log.debug('dividing by %s=%s' % (word, area_sum))
 
-    for eid, areai, centroid in zip(eids, area, centroids):
-        #area_sum += areai
-        m = nsm_value * areai
-        if debug:  # pragma: no cover
+    masses = nsm_value * area
+    if debug:  # pragma: no cover
+        for eid, areai, m in zip(eids, area, masses):
             model.log.debug('  eid=%s %si=%s nsm_value=%s mass=%s %s=%s' % (
                 eid, word, areai, nsm_value, m, word, areai))
-        #elem = model.elements[eid]
-        #assert np.allclose(m, elem.Mass()), elem.get_stats()
-        mass = _increment_inertia(centroid, reference_point, m, mass, cg, I)
+    mass = _increment_inertia_array(centroids, reference_point, masses, mass, cg, I)
     if debug:  # pragma: no cover
         model.log.debug('mass = %s' % mass)
     return mass
@@ -1555,14 +1574,12 @@ def _combine_prop_weighted_area_length(
         centroids = nsm_centroidsi[ipid, :]
 
         area2 = area / area_sum
-        for areai, centroid in zip(area2, centroids):
-            #print('  areai=%s area_sum=%s nsm_value=%s' % (areai*area_sum, area_sum, nsm_value))
-            m = nsm_value * areai
-            if debug:  # pragma: no cover
+        masses = nsm_value * area2
+        if debug:  # pragma: no cover
+            for areai, m in zip(area2, masses):
                 model.log.debug('  %si=%s %s_sum=%s nsm_value=%s mass=%s' % (
                     word, areai*area_sum, word, area_sum, nsm_value, m))
-            #assert np.allclose(m, elem.Mass()), elem.get_stats()
-            mass = _increment_inertia(centroid, reference_point, m, mass, cg, I)
+        mass = _increment_inertia_array(centroids, reference_point, masses, mass, cg, I)
     return mass
 
 def _apply_nsm(model: BDF, nsm_id: int,
@@ -2036,12 +2053,8 @@ def _nsm1_element(model: BDF, nsm: NSM1,
         #area_sum_str = ''
         area_length_actual2 = area_length_actual
 
-    for eid, area_lengthi, centroid in zip(eids_actual, area_length_actual2, nsm_centroid):
-        massi = nsm_value * area_lengthi
-        #if debug:  # pragma: no cover
-            #print('  eid=%s %si=%s %snsm_value=%s mass=%s' % (
-                #eid, word, area_lengthi, area_sum_str, nsm_value, massi))
-        mass = _increment_inertia(centroid, reference_point, massi, mass, cg, I)
+    masses = nsm_value * area_length_actual2
+    mass = _increment_inertia_array(nsm_centroid, reference_point, masses, mass, cg, I)
     return mass
 
 def _get_sym_axis(model, sym_axis):
@@ -8,7 +8,8 @@ from cpylog import SimpleLogger
 
 import pyNastran
 from pyNastran.bdf.bdf import BDF, read_bdf
-from pyNastran.bdf.mesh_utils.bdf_equivalence import bdf_equivalence_nodes
+from pyNastran.bdf.mesh_utils.bdf_equivalence import (
+    bdf_equivalence_nodes, _bdf_equivalence_nodes, _simplify_node_set)
 from pyNastran.bdf.mesh_utils.find_closest_nodes import find_closest_nodes
 
 PKG_PATH = Path(pyNastran.__path__[0])
@@ -118,6 +119,14 @@ class TestEquiv(unittest.TestCase):
         node_ids = list(sorted(model.nodes))
         assert node_ids == [1, 2, 10], node_ids
 
+        bdf_equivalence_nodes(bdf_filename, bdf_filename_out, tol,
+                              renumber_nodes=False, xref=True,
+                              node_set=None, crash_on_collapse=False,
+                              log=log, debug=False, method='tree')
+        model = save_check_nodes(bdf_filename_out, log, nnodes=3, skip_cards=['CTRIA3'])
+        node_ids = list(sorted(model.nodes))
+        assert node_ids == [1, 2, 10], node_ids
+
         os.remove(bdf_filename)
 
     def test_eq2(self):
@@ -457,6 +466,46 @@ class TestEquiv(unittest.TestCase):
         model2 = read_bdf(bdf_filename_out, debug=None)
         assert len(model2.nodes) == 3, model2.nodes
 
+    def test_eq_tree(self):
+        """the tree method collapses chains of nodes and respects the node_sets"""
+        log = SimpleLogger(level='error')
+        model = BDF(debug=False, log=log)
+        # 1-2 and 2-3 are close, but 1-3 isn't
+        model.add_grid(1, [0., 0., 0.])
+        model.add_grid(2, [0.08, 0., 0.])
+        model.add_grid(3, [0.16, 0., 0.])
+        model.add_grid(4, [1., 0., 0.])
+        model.add_grid(5, [1., 0., 0.])
+        model.add_grid(6, [1., 0., 0.])
+        model.add_ctria3(1, 1, [1, 4, 6])
+        model.add_ctria3(2, 1, [3, 5, 2])
+        model.add_pshell(1, mid1=1, t=0.1)
+        model.add_mat1(1, 3.0e7, None, 0.3)
+        model.cross_reference()
+
+        tol = 0.1
+        model, nid_pairs = _bdf_equivalence_nodes(model, tol, method='tree', log=log)
+        assert nid_pairs == [(1, 2), (1, 3), (4, 5), (4, 6)], nid_pairs
+        assert model.elements[2].node_ids == [1, 4, 1], model.elements[2].node_ids
+
+        model2 = BDF(debug=False, log=log)
+        for nid in [1, 2, 3]:
+            model2.add_grid(nid, [0., 0., 0.])
+        node_set = [[1, 2], [3]]
+        model2, nid_pairs = _bdf_equivalence_nodes(
+            model2, tol, node_set=_simplify_node_set(node_set), method='tree', log=log)
+        assert nid_pairs == [(1, 2)], nid_pairs
+
+        model3 = BDF(debug=False, log=log)
+        for nid in [1, 2, 3]:
+            model3.add_grid(nid, [float(nid), 0., 0.])
+        bdf_filename_out = DIRNAME / 'eq_tree.bdf'
+        bdf_equivalence_nodes(model3, bdf_filename_out, tol, method='tree', log=log)
+        model4 = BDF(debug=False, log=log)
+        model4.read_bdf(bdf_filename_out)
+        assert len(model4.nodes) == 3, list(model4.nodes)
+        os.remove(bdf_filename_out)
+
 def save_check_nodes(bdf_filename, log, nnodes, skip_cards=None):
     model = BDF(log=log, debug=False)
     model.disable_cards(skip_cards)
@@ -4,7 +4,8 @@ import os
 import numpy as np
 import pyNastran
 from pyNastran.bdf.bdf import BDF
-from pyNastran.bdf.mesh_utils.mass_properties import mass_properties
+from pyNastran.bdf.mesh_utils.mass_properties import (
+    mass_properties, mass_properties_nsm, _mass_properties_elementwise)
 from pyNastran.utils import object_methods
 
 PKG_PATH = pyNastran.__path__[0]
@@ -163,5 +164,87 @@ class TestMass(unittest.TestCase):
         assert np.allclose(mass, 0.005311658333), 'mass=%s' % mass
         assert np.allclose(mass2, 2.050833333), 'mass2=%s' % mass2
 
+    def test_mass_nsm_vectorized(self):
+        """the grouped element mass matches the element by element mass"""
+        model = BDF(debug=False, log=None)
+        model.log.level = 'error'
+        for i in range(3):
+            for j in range(3):
+                nid = 3 * i + j + 1
+                model.add_grid(nid, [float(i), float(j), 0.1 * i * j])
+                model.add_grid(nid + 10, [float(i), float(j), 1.])
+        model.add_cquad4(1, 1, [1, 4, 5, 2], tflag=0, T1=0.2, T3=0.3)
+        model.add_cquad4(2, 1, [2, 5, 6, 3], tflag=1, T2=2.0)
+        model.add_ctria3(3, 2, [4, 7, 8])
+        model.add_ctria3(4, 1, [4, 8, 5], tflag=1, T1=0.5, T2=0.5, T3=0.5)
+        model.add_chexa(5, 10, [1, 4, 5, 2, 11, 14, 15, 12])
+        model.add_ctetra(6, 10, [5, 6, 8, 15])
+        model.add_cpenta(7, 10, [2, 5, 3, 12, 15, 13])
+        model.add_crod(8, 20, [7, 8])
+        model.add_conrod(9, 1, [8, 9], A=2.0)
+        model.add_cbar(10, 30, [1, 2], [0., 0., 1.], None)
+        model.add_conm2(11, 9, 2.0, X=[0.1, 0.2, 0.3], I=[1., 0.1, 2., 0.2, 0.3, 3.])
+        model.add_pshell(1, mid1=1, t=0.1, nsm=0.2)
+        model.add_pshell(2, mid1=1, t=0.3)
+        model.add_psolid(10, 1)
+        model.add_prod(20, 1, A=3.0)
+        model.add_pbar(30, 1, A=1.5)
+        model.add_mat1(1, 3.0e7, None, 0.3, rho=0.1)
+        model.cross_reference()
+
+        for inertia_reference in ['cg', 'ref']:
+            mass1, cg1, inertia1 = _mass_properties_elementwise(
+                model, reference_point=[1., 2., 3.], inertia_reference=inertia_reference)
+            mass2, cg2, inertia2 = mass_properties_nsm(
+                model, reference_point=[1., 2., 3.], inertia_reference=inertia_reference)
+            assert np.allclose(mass1, mass2), (mass1, mass2)
+            assert np.allclose(cg1, cg2), (cg1, cg2)
+            assert np.allclose(inertia1, inertia2), (inertia1, inertia2)
+
+        mass1, cg1, inertia1 = _mass_properties_elementwise(model, element_ids=[1, 4, 6, 9])
+        mass2, cg2, inertia2 = mass_properties(model, element_ids=[1, 4, 6, 9])
+        assert np.allclose(mass1, mass2), (mass1, mass2)
+        assert np.allclose(cg1, cg2), (cg1, cg2)
+        assert np.allclose(inertia1, inertia2), (inertia1, inertia2)
+
+    def test_mass_cbeam_vectorized(self):
+        """the grouped CBEAM mass matches the element by element mass with offsets"""
+        model = BDF(debug=False, log=None)
+        model.log.level = 'error'
+        model.add_cord2r(1, [1., 2., 3.], [1., 2., 4.], [2., 3., 3.])
+        model.add_grid(1, [0., 0., 0.])
+        model.add_grid(2, [1., 0., 0.], cd=1)
+        model.add_grid(3, [1., 1., 0.], cd=1)
+        model.add_grid(4, [2., 1., 1.])
+        model.add_grid(5, [0., 1., 2.])
+        model.add_cbeam(1, 1, [1, 2], [0., 1., 0.], None)
+        model.add_cbeam(2, 1, [2, 3], [0., 0., 1.], None, offt='GOG',
+                        wa=[0.1, 0.2, 0.3], wb=[0.3, 0.2, 0.1])
+        model.add_cbeam(3, 2, [3, 4], None, 5, offt='BGO',
+                        wa=[0.1, 0., 0.3], wb=[0., 0.2, 0.1])
+        model.add_cbeam(4, 3, [4, 1], None, 5, offt='GOO',
+                        wa=[0.1, 0.2, 0.], wb=[0.2, 0., 0.1])
+        model.add_cbeam(5, 1, [1, 4], [1., 0., 1.], None, offt='BBB',
+                        wa=[0.1, 0.1, 0.1], wb=[0., 0., 0.2])
+        model.add_pbeam(1, 1, [0., 1.], ['YES', 'YES'], [1., 2.], [1., 1.], [1., 1.],
+                        [0., 0.], [1., 1.], nsm=[0.5, 0.3],
+                        m1a=0.2, m2a=0.1, m1b=0.3, m2b=0.4)
+        model.add_pbeaml(2, 1, 'ROD', [0.], [[0.5]], nsm=[0.2])
+        model.add_pbcomp(3, 1, [0.1], [0.2], [0.5], [1], area=2.0, nsm=0.7, m1=0.3, m2=0.2)
+        model.add_mat1(1, 3.0e7, None, 0.3, rho=0.1)
+        model.cross_reference()
+
+        for element_ids in [None, [2, 4, 5]]:
+            mass1, cg1, inertia1 = _mass_properties_elementwise(
+                model, element_ids=element_ids, reference_point=[1., 2., 3.],
+                inertia_reference='ref')
+            mass2, cg2, inertia2 = mass_properties(
+                model, element_ids=element_ids, reference_point=[1., 2., 3.],
+                inertia_reference='ref')
+            assert mass1 > 0., mass1
+            assert np.allclose(mass1, mass2), (mass1, mass2)
+            assert np.allclose(cg1, cg2), (cg1, cg2)
+            assert np.allclose(inertia1, inertia2), (inertia1, inertia2)
+
 if __name__ == '__main__':  # pragma: no cover
     unittest.main()
@@ -11,7 +11,10 @@ from cpylog import SimpleLogger
 import pyNastran
 from pyNastran.bdf.bdf import read_bdf
 from pyNastran.bdf.mesh_utils.collapse_bad_quads import convert_bad_quads_to_tris
-from pyNastran.bdf.mesh_utils.delete_bad_elements import delete_bad_shells, get_bad_shells
+from pyNastran.bdf.mesh_utils.delete_bad_elements import (
+    delete_bad_shells, get_bad_shells, tri_quality, quad_quality)
+from pyNastran.bdf.mesh_utils.element_quality import (
+    get_element_quality, get_connectivity_quality, get_quality_summary)
 
 PKG_PATH = pyNastran.__path__[0]
 MODEL_PATH = os.path.abspath(os.path.join(PKG_PATH, '..', 'models'))
@@ -361,6 +364,73 @@ class TestMeshQuality(unittest.TestCase):
         assert model.card_count['CTRIA3'] == 1, model.card_count
         os.remove(bdf_filename)
 
+    def test_element_quality_array(self):
+        """the vectorized quality matches the element-by-element quality"""
+        bdf_filename = os.path.join(MODEL_PATH, 'bwb', 'bwb_saero.bdf')
+        log = SimpleLogger(level='error')
+        model = read_bdf(bdf_filename, log=log, xref=False)
+        quality = get_element_quality(model)
+        assert np.array_equal(quality['eid'], sorted(model.elements)), quality['eid']
+
+        xyz_cid0 = model.get_xyz_in_coord(cid=0, fdtype='float64')
+        nids = np.array(sorted(model.nodes))
+        tri_names = ['area', 'max_skew_angle', 'max_aspect_ratio', 'min_interior_angle',
+                     'max_interior_angle', 'dideal_theta', 'min_edge_length']
+        quad_names = ['area', 'taper_ratio', 'area_ratio', 'max_skew_angle',
+                      'max_aspect_ratio', 'min_interior_angle', 'max_interior_angle',
+                      'dideal_theta', 'min_edge_length', 'max_warp_angle']
+        ntri = 0
+        nquad = 0
+        for i, (eid, etype) in enumerate(zip(quality['eid'], quality['etype'])):
+            elem = model.elements[eid]
+            if etype == 'CTRIA3':
+                points = xyz_cid0[np.searchsorted(nids, elem.node_ids), :]
+                out = tri_quality(*points)
+                names = tri_names
+                ntri += 1
+            elif etype == 'CQUAD4':
+                points = xyz_cid0[np.searchsorted(nids, elem.node_ids), :]
+                out = quad_quality(elem, *points)
+                names = quad_names
+                nquad += 1
+            else:
+                continue
+            for name, value in zip(names, out):
+                assert np.allclose(quality[name][i], value, atol=1e-7, equal_nan=True), (eid, name)
+        assert ntri > 0 and nquad > 0, (ntri, nquad)
+        get_quality_summary(quality)
+
+    def test_solid_quality_array(self):
+        """a unit cube and a sheared cube"""
+        xyz = np.array([
+            [0., 0., 0.],
+            [1., 0., 0.],
+            [1., 1., 0.],
+            [0., 1., 0.],
+            [0., 0., 1.],
+            [1., 0., 1.],
+            [1., 1., 1.],
+            [0., 1., 1.],
+            [1., 0., 1.],
+            [2., 0., 1.],
+            [2., 1., 1.],
+            [1., 1., 1.],
+        ])
+        inode = np.array([
+            [0, 1, 2, 3, 4, 5, 6, 7],
+            [0, 1, 2, 3, 8, 9, 10, 11],
+        ])
+        quality = get_connectivity_quality(xyz, 'hexa', inode, chunk_size=1)
+        assert np.allclose(np.degrees(quality['min_interior_angle']), [90., 45.])
+        assert np.allclose(np.degrees(quality['max_interior_angle']), [90., 135.])
+        assert np.allclose(np.degrees(quality['dideal_theta']), [0., 45.])
+        assert np.allclose(quality['min_edge_length'], [1., 1.])
+        assert np.isnan(quality['area']).all()
+
+        quality = get_connectivity_quality(xyz, 'tetra', inode[:1, :4])
+        assert np.allclose(np.degrees(quality['min_interior_angle']), [45.])
+        assert np.allclose(np.degrees(quality['max_interior_angle']), [90.])
+
 
 if __name__ == '__main__':  # pragma: no cover
     unittest.main()
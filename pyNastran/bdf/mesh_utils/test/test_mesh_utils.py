@@ -55,6 +55,15 @@ class TestMeshUtilsCmdLine(unittest.TestCase):
         args = ['bdf', 'stats', str(bdf_filename)]
         cmd_line(args, quiet=True)
 
+    def test_bdf_quality(self):
+        """tests ```bdf quality```"""
+        bdf_filename = MODEL_PATH / 'sol_101_elements' / 'static_solid_shell_bar.bdf'
+        csv_filename = DIRNAME / 'quality.csv'
+        args = ['bdf', 'quality', str(bdf_filename), '-o', str(csv_filename)]
+        cmd_line(args, quiet=True)
+        assert os.path.exists(csv_filename)
+        os.remove(csv_filename)
+
     def test_bdf_diff(self):
         """tests ```bdf diff```"""
         bdf_filename1 = MODEL_PATH / 'sol_101_elements' / 'static_solid_shell_bar.bdf'
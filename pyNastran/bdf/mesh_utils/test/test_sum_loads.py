@@ -6,8 +6,11 @@ import numpy as np
 
 import pyNastran
 from pyNastran.bdf.bdf import BDF
-from pyNastran.bdf.bdf import GRID
-from pyNastran.bdf.mesh_utils.loads import sum_forces_moments, sum_forces_moments_elements
+from pyNastran.bdf.bdf import GRID, CaseControlDeck
+from pyNastran.bdf.mesh_utils.loads import (
+    sum_forces_moments, sum_forces_moments_elements,
+    get_static_force_vector_from_subcase_id, get_static_force_vectors,
+    _pload4_helper)
 model_path = os.path.join(pyNastran.__path__[0], '..', 'models')
 
 
@@ -478,5 +481,109 @@ class TestLoadSum(unittest.TestCase):
         self.assertTrue(allclose(M2_expected, M1), 'loadcase_id=%s M_expected=%s M1=%s' % (loadcase_id, M2_expected, M1))
 
 
+    def test_loads_sum_pload4_vectorized(self):
+        """tests the PLOAD4 shell faces that are summed as arrays"""
+        model = BDF(log=None, debug=False)
+        model.add_grid(1, [0., 0., 0.])
+        model.add_grid(2, [1., 0., 0.])
+        model.add_grid(3, [1., 1., 0.5])
+        model.add_grid(4, [0., 1., 0.])
+        model.add_grid(5, [2., 0., 0.])
+        model.add_grid(6, [2., 2., 1.])
+        model.add_ctria3(1, 1, [1, 2, 3])
+        model.add_cquad4(2, 1, [2, 5, 6, 3])
+        model.add_cquad4(3, 1, [1, 2, 3, 4])
+        model.add_pshell(1, mid1=1, t=0.1)
+        model.add_mat1(1, 3.0e7, None, 0.3)
+
+        # constant, varying, and nvector pressures
+        model.add_pload4(10, [1, 2], [2., 2., 2., 2.])
+        model.add_pload4(10, [3], [1., 2., 3., 4.])
+        model.add_pload4(11, [1, 2, 3], [3., None, None, None], nvector=[1., 1., 0.])
+        model.add_force(11, 4, 5., [0., 0., 1.])
+        model.add_moment(11, 4, 2., [1., 0., 0.])
+        model.add_load(12, 2., [3., -1.], [10, 11])
+
+        model.sol = 101
+        lines = ['SUBCASE 1', '  LOAD = 10', 'SUBCASE 2', '  LOAD = 12']
+        model.case_control_deck = CaseControlDeck(lines, log=model.log)
+        model.cross_reference()
+
+        p0 = array([0.5, -0.5, 1.])
+        xyz = {nid: node.get_position() for nid, node in model.nodes.items()}
+        for loadcase_id in [10, 11, 12]:
+            loads, scale_factors, unused_is_grav = model.get_reduced_loads(loadcase_id)
+            F_expected = np.zeros(3)
+            M_expected = np.zeros(3)
+            for load, scale in zip(loads, scale_factors):
+                if load.type == 'PLOAD4':
+                    for elem in load.eids_ref:
+                        fi, mi = _pload4_helper(loadcase_id, load, scale, elem, xyz, p0)
+                        F_expected += fi
+                        M_expected += mi
+                elif load.type == 'FORCE':
+                    f = load.mag * load.xyz * scale
+                    F_expected += f
+                    M_expected += cross(xyz[load.node] - p0, f)
+                else:
+                    M_expected += load.mag * load.xyz * scale
+
+            F1, M1 = sum_forces_moments(model, p0, loadcase_id)
+            F2, M2 = sum_forces_moments_elements(model, p0, loadcase_id, None, None)
+            assert np.allclose(F1, F_expected), 'F1=%s F_expected=%s' % (F1, F_expected)
+            assert np.allclose(M1, M_expected), 'M1=%s M_expected=%s' % (M1, M_expected)
+            assert np.allclose(F1, F2), 'F1=%s F2=%s' % (F1, F2)
+            assert np.allclose(M1, M2), 'M1=%s M2=%s' % (M1, M2)
+
+        # a subset of the elements
+        loadcase_id = 10
+        F1, M1 = sum_forces_moments_elements(model, p0, loadcase_id, [3], [])
+        load = model.loads[loadcase_id][1]
+        F_expected, M_expected = _pload4_helper(
+            loadcase_id, load, 1.0, model.elements[3], xyz, p0)
+        assert np.allclose(F1, F_expected), 'F1=%s F_expected=%s' % (F1, F_expected)
+        assert np.allclose(M1, M_expected), 'M1=%s M_expected=%s' % (M1, M_expected)
+
+        # LOAD = 12 is 2*(3*LOAD10 - LOAD11)
+        forces = get_static_force_vectors(model)
+        assert sorted(forces) == [1, 2], forces
+        assert np.array_equal(forces[2], get_static_force_vector_from_subcase_id(model, 2))
+        assert forces[2][3*6 + 2] == -10., forces[2]  # FORCE on node 4
+        assert forces[2][3*6 + 3] == -4., forces[2]  # MOMENT on node 4
+        assert np.abs(forces[1]).max() == 0., forces[1]  # PLOAD4s are not in Fg
+
+    def test_loads_sum_force_pload1(self):
+        """tests a FORCE with PLOAD1s on an offset CBAR"""
+        model = BDF(log=None, debug=False)
+        model.add_grid(1, [0., 0., 0.])
+        model.add_grid(2, [2., 0., 0.])
+        model.add_cbar(1, 1, [1, 2], [0., 1., 0.], None,
+                       wa=[0., 0., 1.], wb=[0., 0., 1.])
+        model.add_pbar(1, 1, A=1.0)
+        model.add_mat1(1, 3.0e7, None, 0.3)
+
+        model.add_force(10, 2, 5., [0., 1., 0.])
+        model.add_pload1(10, 1, 'FZ', 'FR', 0.5, 3.)
+        model.add_pload1(10, 1, 'FX', 'FR', 0.25, 2.)
+        model.cross_reference()
+
+        # the PLOAD1s act at (1., 0., 1.) and (0.5, 0., 1.)
+        p0 = array([0., 0., 0.])
+        F_expected = array([2., 5., 3.])
+        M_expected = (
+            cross([2., 0., 0.], [0., 5., 0.]) +
+            cross([1., 0., 1.], [0., 0., 3.]) +
+            cross([0.5, 0., 1.], [2., 0., 0.]))
+        for unused_i in range(2):
+            F1, M1 = sum_forces_moments(model, p0, 10)
+            F2, M2 = sum_forces_moments_elements(model, p0, 10, None, None)
+            assert np.allclose(F1, F_expected), 'F1=%s F_expected=%s' % (F1, F_expected)
+            assert np.allclose(M1, M_expected), 'M1=%s M_expected=%s' % (M1, M_expected)
+            assert np.allclose(F2, F_expected), 'F2=%s F_expected=%s' % (F2, F_expected)
+            assert np.allclose(M2, M_expected), 'M2=%s M_expected=%s' % (M2, M_expected)
+
+        # the bar offsets aren't added to the nodes
+        assert np.array_equal(model.nodes[2].get_position(), [2., 0., 0.])
+
 if __name__ == '__main__':  # pragma: no cover
     unittest.main()
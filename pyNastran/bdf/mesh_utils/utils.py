@@ -7,6 +7,7 @@ defines:
     bdf export_mcids IN_BDF_FILENAME [-o OUT_GEOM_FILENAME]\n'
     bdf split_cbars_by_pin_flags IN_BDF_FILENAME [-o OUT_BDF_FILENAME]\n'
     bdf flutter UNITS [-o OUT_BDF_FILENAME]
+    bdf quality      IN_BDF_FILENAME [-o OUT_CSV_FILENAME]
 
 """
 import os
@@ -314,6 +315,54 @@ def cmd_line_stats(argv=None, quiet: bool=False) -> None:
     #for card_name, ncards in model.card_count.items():
 
 
+def cmd_line_quality(argv=None, quiet: bool=False) -> None:
+    """command line interface to ``get_element_quality``"""
+    if argv is None:  # pragma: no cover
+        argv = sys.argv
+
+    msg = (
+        'Usage:\n'
+        '  bdf quality IN_BDF_FILENAME [-o OUT_CSV_FILENAME] [--punch]\n'
+        '  bdf quality -h | --help\n'
+        '  bdf quality -v | --version\n'
+        '\n'
+
+        "Positional Arguments:\n"
+        "  IN_BDF_FILENAME   path to input BDF/DAT/NAS file\n"
+        '\n'
+
+        'Options:\n'
+        '  -o OUT, --output OUT_CSV_FILENAME  path to output CSV file (default=quality.csv)\n'
+        '  --punch                            flag to identify a *.pch/*.inc file\n'
+        '\n'
+
+        'Info:\n'
+        '  -h, --help      show this help message and exit\n'
+        "  -v, --version   show program's version number and exit\n"
+    )
+    filter_no_args(msg, argv, quiet=quiet)
+
+    ver = str(pyNastran.__version__)
+    data = docopt(msg, version=ver, argv=argv[1:])
+
+    bdf_filename, punch, log = _get_bdf_filename_punch_log(data, quiet)
+    if not quiet:  # pragma: no cover
+        print(data)
+    csv_filename = data['--output']
+    if csv_filename is None:
+        csv_filename = 'quality.csv'
+
+    from pyNastran.bdf.bdf import read_bdf
+    from pyNastran.bdf.mesh_utils.element_quality import (
+        get_element_quality, write_quality_csv, get_quality_summary)
+    model = read_bdf(bdf_filename, xref=False, punch=punch, log=log)
+    quality = get_element_quality(model)
+    write_quality_csv(csv_filename, quality)
+    log.info(f'wrote {csv_filename}')
+    if not quiet:  # pragma: no cover
+        print(get_quality_summary(quality))
+
+
 def cmd_line_bin(argv=None, quiet=False) -> None:  # pragma: no cover
     """bins the model into nbins"""
     if argv is None:  # pragma: no cover
@@ -1397,6 +1446,7 @@ CMD_MAPS = {
     'flip_shell_normals': cmd_line_flip_shell_normals,
     'flutter': cmd_line_create_flutter,
     'stats': cmd_line_stats,
+    'quality': cmd_line_quality,
 }
 
 dev = True
@@ -1439,6 +1489,7 @@ def cmd_line(argv=None, quiet: bool=False) -> None:
         '  bdf export_caero_mesh           IN_BDF_FILENAME [-o OUT_BDF_FILENAME] [--punch] [--subpanels] [--pid PID]\n'
         '  bdf split_cbars_by_pin_flags    IN_BDF_FILENAME [-o OUT_BDF_FILENAME] [--punch] [-p PIN_FLAGS_CSV_FILENAME]\n'
         '  bdf stats                       IN_BDF_FILENAME [--punch]\n'
+        '  bdf quality                     IN_BDF_FILENAME [-o OUT_CSV_FILENAME] [--punch]\n'
     )
 
     if dev:
@@ -1467,6 +1518,7 @@ def cmd_line(argv=None, quiet: bool=False) -> None:
         '  bdf export_caero_mesh  -h | --help\n'
         '  bdf split_cbars_by_pin_flags    -h | --help\n'
         '  bdf stats                       -h | --help\n'
+        '  bdf quality                     -h | --help\n'
     )
     if dev:
         msg += (
@@ -5,7 +5,7 @@ from pyNastran.bdf.bdf import BDF
 from pyNastran.bdf.cards.dmig import NastranMatrix
 from pyNastran.bdf.bdf_interface.compare_card_content import compare_card_content
 from pyNastran.bdf.mesh_utils.mass_properties import (
-    mass_properties, mass_properties_nsm)  #, mass_properties_breakdown
+    _mass_properties_elementwise, mass_properties_nsm)  #, mass_properties_breakdown
 
 
 def compare(fem1: BDF,
@@ -135,7 +135,7 @@ def get_element_stats(fem1: BDF,
 def check_mass(fem1: BDF, run_mass: bool=True, quiet: bool=False):
     if not run_mass:
         return
-    mass1, cg1, inertia1 = mass_properties(fem1, reference_point=None, sym_axis=None)
+    mass1, cg1, inertia1 = _mass_properties_elementwise(fem1, reference_point=None, sym_axis=None)
     mass2, cg2, inertia2 = mass_properties_nsm(fem1, reference_point=None, sym_axis=None)
     #mass3, cg3, inertia3 = mass_properties_breakdown(fem1)[:3]
     if not quiet:
@@ -157,7 +157,7 @@ def check_mass(fem1: BDF, run_mass: bool=True, quiet: bool=False):
         print('  Ixx=%s, Iyy=%s, Izz=%s \n  Ixy=%s, Ixz=%s, Iyz=%s' % tuple(inertia1))
 
     reference_point = [10., 10., 10.]
-    mass1, cg1, inertia1 = mass_properties(fem1, reference_point=reference_point, sym_axis=None)
+    mass1, cg1, inertia1 = _mass_properties_elementwise(fem1, reference_point=reference_point, sym_axis=None)
     mass2, cg2, inertia2 = mass_properties_nsm(fem1, reference_point=reference_point, sym_axis=None)
     assert np.allclose(mass1, mass2), f'reference_point=[10., 10., 10.]; mass1={mass1} mass2={mass2}'
     assert np.allclose(cg1, cg2), f'reference_point=[10., 10., 10.]; mass={mass1} cg1={cg1} cg2={cg2}'
@@ -10,6 +10,11 @@ import pyNastran
 from pyNastran.utils import object_attributes, object_methods
 #from pyNastran.bdf.cards.collpase_card import collapse_thru_by
 from pyNastran.bdf.bdf import BDF, read_bdf, CrossReferenceError
+from pyNastran.bdf.bdf_interface.iter_cards import (
+    iter_bdf_card_lines, iter_bdf_cards, read_bdf_stream)
+from pyNastran.bdf.bdf_interface.bulk_xref import (
+    IdLookup, cross_reference_nodes_bulk, cross_reference_elements_bulk)
+from pyNastran.bdf.bdf_interface.write_mesh_bulk import write_cards_bulk
 from pyNastran.bdf.write_path import write_include, _split_path
 from pyNastran.bdf.mesh_utils.mass_properties import mass_properties
 from pyNastran.bdf.mesh_utils.forces_moments import get_forces_moments_array
@@ -393,6 +398,296 @@ class TestBDFUnit(Tester):
         assert _etype_to_eids_pids_nids is None, _etype_to_eids_pids_nids
         assert len(etype_pid_to_eids_nids) == 1, list(etype_pid_to_eids_nids.keys())
 
+    def test_bdf_parallel(self):
+        """checks read_bdf(..., n_workers=2) is the same as the serial reader"""
+        log = SimpleLogger(level='error', encoding='utf-8')
+        bdf_filename = MODEL_PATH / 'solid_bending' / 'solid_bending.bdf'
+        model1 = read_bdf(bdf_filename, log=log)
+        model2 = read_bdf(bdf_filename, log=log, n_workers=2)
+        assert model1.card_count == model2.card_count, model2.card_count
+        assert list(model1.nodes) == list(model2.nodes)
+        assert list(model1.elements) == list(model2.elements)
+        for eid, elem in model1.elements.items():
+            elem2 = model2.elements[eid]
+            assert elem.type == elem2.type, (elem.type, elem2.type)
+            assert elem.node_ids == elem2.node_ids, (elem.node_ids, elem2.node_ids)
+        assert np.array_equal(model1.get_xyz_in_coord(), model2.get_xyz_in_coord())
+
+        # the parsing errors are stored in the same order
+        lines = [
+            'SOL 101\n',
+            'CEND\n',
+            'BEGIN BULK\n',
+            'GRID,1,,0.,0.,0.\n',
+            'GRID,2,,1.,0.,0.\n',
+            'GRID,3,,cat,0.,0.\n',
+            'CTRIA3,10,1,1,2,3\n',
+            'CTRIA3,11,1,1,2,cat\n',
+            'CHEXA,12,1,1,2,3,4,5,6,\n',
+            ',7,8\n',
+            'ENDDATA\n',
+        ]
+        models = []
+        for n_workers in (1, 2):
+            model = BDF(log=log)
+            model.set_error_storage(nparse_errors=100, stop_on_parsing_error=False)
+            model.read_bdf(StringIO(''.join(lines)), xref=False, validate=False,
+                           n_workers=n_workers)
+            models.append(model)
+        model1, model2 = models
+        assert model1.card_count == model2.card_count, model2.card_count
+        assert model1._stored_parse_errors == model2._stored_parse_errors, model2._stored_parse_errors
+        assert len(model2._stored_parse_errors) == 2, model2._stored_parse_errors
+        cards = [card for card, unused_error in model2._stored_parse_errors]
+        assert cards == [['GRID', '3', None, 'cat', '0.', '0.'],
+                         ['CTRIA3', '11', '1', '1', '2', 'cat']], cards
+        assert list(model2.nodes) == [1, 2], list(model2.nodes)
+        assert list(model2.elements) == [10, 12], list(model2.elements)
+
+    def test_bdf_fast_card_parser(self):
+        """checks the columnar GRID/shell/solid parser vs. the standard parser"""
+        log = SimpleLogger(level='error', encoding='utf-8')
+        def card8(*fields):
+            return ''.join('%-8s' % field for field in fields).rstrip() + '\n'
+
+        lines = [
+            'SOL 101\n',
+            'CEND\n',
+            'BEGIN BULK\n',
+            '$ node 1\n',
+            card8('GRID', 1, '', '0.', '0.', '0.'),
+            card8('GRID', 2, 1, '1.', '0.', '-.5', 2),
+            card8('GRID', 3, '', '1.-3', '1.', '0.'),
+            'GRID,4,,0.,1.,0.\n',
+            card8('GRID', 5, '', '1.', '1.', '0.', '', 123),
+            'GRID*   %16s%16s%16s%16s\n' % (6, 0, '1.0', '2.0'),
+            '*       %16s%16s\n' % ('3.0', 0),
+            card8('GRID', 7, '', '2.', '0.', '0.'),
+            card8('GRID', 8, '', '2.', '1.', '0.'),
+            card8('CTRIA3', 10, 1, 1, 2, 3),
+            card8('CTRIA3', 11, '', 1, 2, 3, 2, '.1'),
+            card8('CQUAD4', 12, 1, 1, 2, 3, 4, '45.0'),
+            card8('CQUAD4', 13, 1, 1, 2, 3, 4),
+            card8('', '', 1, '.2', '.3', '.4', '.5'),
+            card8('CTETRA', 20, 2, 1, 2, 3, 5),
+            card8('CPENTA', 21, 2, 1, 2, 3, 4, 5, 6),
+            card8('CHEXA', 22, 2, 1, 2, 3, 4, 5, 6),
+            card8('', 7, 8),
+            card8('CHEXA', 23, 2, 1, 2, 3, 4, 5, 6),
+            card8('', 7, 8, 1),
+            'ENDDATA\n',
+        ]
+        models = []
+        for use_fast_card_parser in (False, True):
+            model = BDF(log=log)
+            model.use_fast_card_parser = use_fast_card_parser
+            model.set_error_storage(nparse_errors=100, stop_on_parsing_error=False)
+            model.read_bdf(StringIO(''.join(lines)), xref=False, validate=False)
+            models.append(model)
+        model1, model2 = models
+        assert model1.card_count == model2.card_count, model2.card_count
+        assert list(model1.nodes) == list(model2.nodes)
+        assert list(model1.elements) == list(model2.elements)
+        assert model1._stored_parse_errors == model2._stored_parse_errors
+        for obj_dict1, obj_dict2 in [(model1.nodes, model2.nodes),
+                                     (model1.elements, model2.elements)]:
+            for key, obj1 in obj_dict1.items():
+                obj2 = obj_dict2[key]
+                assert obj1.type == obj2.type, (obj1.type, obj2.type)
+                assert obj1.comment == obj2.comment, (obj1.comment, obj2.comment)
+                assert obj1.repr_fields() == obj2.repr_fields(), (obj1, obj2)
+
+        assert model2.nodes[3].xyz[0] == 0.001, model2.nodes[3]
+        assert model2.nodes[6].cp == 0, model2.nodes[6]
+        assert model2.elements[11].pid == 11, model2.elements[11]
+        assert model2.elements[11].theta_mcid == 2, model2.elements[11]
+        assert model2.elements[12].theta_mcid == 45.0, model2.elements[12]
+        assert model2.elements[13].T1 == 0.2, model2.elements[13]
+        assert model2.elements[22].type == 'CHEXA', model2.elements[22]
+
+    def test_bdf_include_cache(self):
+        """checks read_bdf(..., cache_dirname=...) vs. the standard reader"""
+        log = SimpleLogger(level='error', encoding='utf-8')
+        unit_dir = TEST_PATH / 'unit'
+        main_filename = unit_dir / 'include_cache_main.bdf'
+        mesh_filename = unit_dir / 'include_cache_mesh.bdf'
+        cache_dirname = unit_dir / 'include_cache'
+        with open(main_filename, 'w') as bdf_file:
+            bdf_file.write(
+                'SOL 101\n'
+                'CEND\n'
+                'BEGIN BULK\n'
+                '$ parent\n'
+                "INCLUDE 'include_cache_mesh.bdf'\n"
+                'PSHELL,1,1,0.1\n'
+                'MAT1,1,3.0e7,,0.3\n'
+                'ENDDATA\n')
+        mesh_lines = [
+            '$ mesh\n',
+            'GRID,1,,0.,0.,0.\n',
+            'GRID,2,,1.,0.,0.\n',
+            'GRID,3,,1.,1.,0.\n',
+            'GRID,4,,0.,1.,0.\n',
+            '$ quad\n',
+            'CQUAD4,1,1,1,2,3,4\n',
+        ]
+        with open(mesh_filename, 'w') as bdf_file:
+            bdf_file.write(''.join(mesh_lines))
+
+        def check_models(model1, model2):
+            assert model1.card_count == model2.card_count, model2.card_count
+            for obj_dict1, obj_dict2 in [(model1.nodes, model2.nodes),
+                                         (model1.elements, model2.elements)]:
+                assert list(obj_dict1) == list(obj_dict2)
+                for key, obj1 in obj_dict1.items():
+                    obj2 = obj_dict2[key]
+                    assert obj1.comment == obj2.comment, (obj1.comment, obj2.comment)
+                    assert obj1.repr_fields() == obj2.repr_fields(), (obj1, obj2)
+
+        model1 = read_bdf(main_filename, log=log)
+        model2 = read_bdf(main_filename, log=log, cache_dirname=cache_dirname)
+        check_models(model1, model2)
+        assert len(os.listdir(cache_dirname)) == 1
+
+        # the mesh is loaded from the cache
+        model3 = read_bdf(main_filename, log=log, cache_dirname=cache_dirname)
+        check_models(model1, model3)
+        assert model3.nodes[1].comment == model1.nodes[1].comment
+        assert '$ parent' in model3.nodes[1].comment, model3.nodes[1].comment
+
+        # the mesh changed, so the INCLUDE is parsed
+        mesh_lines[2] = 'GRID,2,,2.,0.,0.\n'
+        with open(mesh_filename, 'w') as bdf_file:
+            bdf_file.write(''.join(mesh_lines))
+        model4 = read_bdf(main_filename, log=log, cache_dirname=cache_dirname)
+        assert model4.nodes[2].xyz[0] == 2.0, model4.nodes[2]
+        model5 = read_bdf(main_filename, log=log, cache_dirname=cache_dirname)
+        check_models(model4, model5)
+
+        for cache_filename in os.listdir(cache_dirname):
+            os.remove(cache_dirname / cache_filename)
+        os.rmdir(cache_dirname)
+        os.remove(main_filename)
+        os.remove(mesh_filename)
+
+    def test_bdf_stream(self):
+        """checks the streaming reader vs. read_bdf"""
+        log = SimpleLogger(level='error', encoding='utf-8')
+        bdf_filename = MODEL_PATH / 'elements' / 'static_elements.bdf'
+        model = read_bdf(bdf_filename, xref=False, log=log)
+        model2 = read_bdf_stream(bdf_filename, log=log)
+        assert model.card_count == model2.card_count, model2.card_count
+        for obj_dict1, obj_dict2 in [(model.nodes, model2.nodes),
+                                     (model.elements, model2.elements),
+                                     (model.properties, model2.properties)]:
+            assert list(obj_dict1) == list(obj_dict2)
+            for key, obj1 in obj_dict1.items():
+                assert str(obj1) == str(obj_dict2[key]), (obj1, obj_dict2[key])
+
+        cquad4s = list(iter_bdf_cards(bdf_filename, card_types=['CQUAD4'], log=log))
+        eids = [eid for eid, elem in model.elements.items() if elem.type == 'CQUAD4']
+        assert [elem.eid for elem in cquad4s] == eids
+        with self.assertRaises(NotImplementedError):
+            list(iter_bdf_cards(bdf_filename, card_types=['CBAR'], log=log))
+
+        lines = (
+            'SOL 101\n'
+            'CEND\n'
+            'BEGIN BULK\n'
+            '$ grid 1\n'
+            'GRID,1,,0.,0.,0.\n'
+            '=,*1,=,*1.,==\n'
+            'CONROD,10,1,2,100,1.0\n'
+            '$ grid 3\n'
+            'GRID,3,,2.,0.,0.\n'
+            'ENDDATA\n'
+            'GRID,4,,3.,0.,0.\n'
+        )
+        cards = list(iter_bdf_card_lines(StringIO(lines), card_types=['GRID', 'ENDDATA']))
+        card_names = [card[0] for card in cards]
+        assert card_names == ['GRID', '=', 'GRID', 'ENDDATA'], card_names
+        assert cards[2][1] == ' grid 3', cards[2]
+
+        model3 = read_bdf_stream(StringIO(lines), card_types=['GRID'], log=log)
+        assert list(model3.nodes) == [1, 2, 3], list(model3.nodes)
+        assert model3.nodes[2].xyz[0] == 1.0, model3.nodes[2]
+        assert model3.nodes[3].comment == '$ grid 3\n', model3.nodes[3].comment
+        assert 'CONROD' not in model3.card_count, model3.card_count
+
+    def test_bdf_xref_bulk(self):
+        """checks the bulk cross-referencing of the GRIDs/elements"""
+        log = SimpleLogger(level='error', encoding='utf-8')
+        model = BDF(log=log)
+        model.add_grid(1, [0., 0., 0.])
+        model.add_grid(2, [1., 0., 0.], cd=10)
+        model.add_grid(3, [1., 1., 0.])
+        model.add_grid(4, [0., 1., 0.])
+        model.add_spoint([5])
+        model.add_cord2r(10, [0., 0., 0.], [0., 0., 1.], [1., 0., 0.])
+        model.add_cquad4(1, 100, [1, 2, 3, 4])
+        model.add_ctria3(2, 100, [1, 2, 3], theta_mcid=10)
+        model.add_ctria6(3, 100, [1, 2, 3, None, None, None])
+        model.add_conrod(4, 1000, [1, 2], A=1.0)
+        model.add_celas2(5, 1.0, [5, 0])
+        model.add_pshell(100, mid1=1000, t=0.1)
+        model.add_mat1(1000, 3.0e7, None, 0.3)
+
+        eids = cross_reference_elements_bulk(model)
+        assert eids == {1, 2, 3, 4}, eids
+        assert cross_reference_nodes_bulk(model)
+        model.cross_reference()
+        assert model.nodes[2].cd_ref is model.coords[10]
+        assert model.elements[1].nodes_ref == [model.nodes[nid] for nid in [1, 2, 3, 4]]
+        assert model.elements[1].pid_ref is model.properties[100]
+        assert model.elements[2].theta_mcid_ref is model.coords[10]
+        assert model.elements[3].nodes_ref[3] is None
+        assert model.elements[4].mid_ref is model.materials[1000]
+
+        # the missing node/property is left for element.cross_reference
+        model.uncross_reference()
+        model.add_cquad4(6, 100, [1, 2, 3, 40])
+        model.add_ctria3(7, 200, [1, 2, 3])
+        model.add_ctria3(8, 100, [1, 2, 3], theta_mcid=20)
+        eids = cross_reference_elements_bulk(model)
+        assert eids == {1, 2, 3, 4}, eids
+        with self.assertRaises(CrossReferenceError):
+            model.cross_reference()
+
+        lookup = IdLookup({3: 'c', 1: 'a', 2: 'b'})
+        objs, is_found = lookup.get(np.array([[2, 4], [0, 1]]), allow_empty=True)
+        assert objs.tolist() == [['b', objs[0, 1]], [None, 'a']], objs
+        assert is_found.tolist() == [[True, False], [True, True]], is_found
+
+    def test_bdf_write_bulk(self):
+        """checks the bulk writer vs. write_card"""
+        log = SimpleLogger(level='error', encoding='utf-8')
+        model = BDF(log=log)
+        model.add_grid(1, [0., 0., 0.], comment='grid 1')
+        model.add_grid(2, [1.123456789, -0.5, 1e-9], cp=10)
+        model.add_grid(3, [1., 1., -12345.6], cd=10)
+        model.add_grid(4, [0., 1., 0.], ps='123')
+        model.add_cord2r(10, [0., 0., 0.], [0., 0., 1.], [1., 0., 0.])
+        model.add_cquad4(1, 100, [1, 2, 3, 4])
+        model.add_cquad4(2, 100, [1, 2, 3, 4], theta_mcid=10)
+        model.add_cquad4(3, 100, [1, 2, 3, 4], zoffset=0.1, tflag=0, T1=1.0)
+        model.add_ctria3(4, 100, [1, 2, 3], comment='ctria3')
+        model.add_ctetra(5, 200, [1, 2, 3, 4])
+        model.add_cpenta(6, 200, [1, 2, 3, 4, 5, 6])
+        model.add_chexa(7, 200, [1, 2, 3, 4, 5, 6, 7, 8])
+        model.add_cbar(8, 300, [1, 2], [0., 0., 1.], None)
+        model.add_cbeam(9, 400, [1, 2], [0., 1., 0.], None)
+        model.add_rbe2(10, 1, '123456', [2, 3])
+        model.add_pshell(100, mid1=1000, t=0.1)
+        model.add_psolid(200, 1000)
+
+        for size, is_double in [(8, False), (16, False), (16, True)]:
+            for cards in (model.nodes, model.elements, model.rigid_elements, model.properties):
+                bdf_file = StringIO()
+                write_cards_bulk(bdf_file, cards, size=size, is_double=is_double)
+                expected = ''.join(card.write_card(size, is_double)
+                                   for unused_key, card in sorted(cards.items()))
+                assert bdf_file.getvalue() == expected, (size, is_double, bdf_file.getvalue())
+
     def test_bdf_02(self):
         """checks plate_py.dat"""
         log = SimpleLogger(level='warning', encoding='utf-8')
@@ -8,7 +8,9 @@ from pyNastran.bdf.field_writer_8 import (print_field_8, print_float_8,
                                           set_blank_if_default, is_same, print_card_8,
                                           print_scientific_8)
 from pyNastran.bdf.field_writer_16 import print_field_16, print_card_16, print_float_16, print_scientific_16
-from pyNastran.bdf.field_writer_double import print_card_double
+from pyNastran.bdf.field_writer_double import print_card_double, print_scientific_double
+from pyNastran.bdf.field_writer_array import (
+    print_floats_8, print_floats_16, print_scientific_doubles, print_cards_8, print_cards_16)
 
 
 from pyNastran.bdf.bdf_interface.assign_type import interpret_value
@@ -482,6 +484,31 @@ class Testfield_writer_8(unittest.TestCase):
         unused_positive_output = [print_float_16(x) for x in nums]
         unused_negative_output = [print_float_16(-x) for x in nums]
 
+    def test_floats_array(self):
+        """checks the array writers vs. print_float_8/16 and print_card_8/16"""
+        nums = [0., -0., np.nan, 1., -1., 0.001, -0.01, 0.5, -0.5, 9.99999999,
+                99.9999999, -9.99999995, 0.99999999, 123.456, -0.0001234,
+                1e5, -1e5, 999999.5, -999999.5, 1e13, 1e14, -1e13]
+        for istart in np.arange(-16, 16):
+            nums.extend(np.logspace(istart, istart+1, num=50, base=10.0).tolist())
+            nums.extend((-np.logspace(istart, istart+1, num=50, base=10.0)).tolist())
+        nums = np.array(nums)
+
+        self.assertEqual(print_floats_8(nums), [print_float_8(num) for num in nums])
+        self.assertEqual(print_floats_16(nums), [print_float_16(num) for num in nums])
+        self.assertEqual(print_scientific_doubles(nums),
+                         [print_scientific_double(num) for num in nums])
+
+        cards_fields = [
+            ['DUMMY', 1, 2, 3, None, 4, 5, 6, 7, 8.],
+            ['DUMMY', 1, 'cat', -3.5, None, None, None, None, None, None, 1e-10],
+            ['PSHELL', 10, 100, 0.1, 100, None, 100, None, 0.0],
+        ]
+        self.assertEqual(print_cards_8(cards_fields),
+                         [print_card_8(fields) for fields in cards_fields])
+        self.assertEqual(print_cards_16(cards_fields),
+                         [print_card_16(fields) for fields in cards_fields])
+
 
 def compare(value_in):
     field = print_field_8(value_in)
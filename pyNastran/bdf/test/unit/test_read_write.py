@@ -64,6 +64,66 @@ class TestReadWriteFiles(unittest.TestCase):
         #os.remove('out_test_include2.bdf')
 
 
+    def test_write_bdfs_incremental(self):
+        """only the modified files are regenerated"""
+        log = SimpleLogger(level='warning', encoding='utf-8')
+        base_dir = os.path.join(TEST_PATH, 'include_bug')
+        bdf_filename = os.path.join(base_dir, 'main_input.bdf')
+        model = BDF(log=log, debug=False)
+        model.read_bdf(bdf_filename, save_file_structure=True)
+
+        # active_filenames = [main_input.bdf, nodeset1.bdf, nodeset1a.inc,
+        #                     nodeset2.bdf, nodeset2b.inc]
+        out_files_map = {}
+        for filename in model.active_filenames:
+            base, ext = os.path.splitext(filename)
+            out_files_map[filename] = base + '_INC' + ext
+        ifile_nodeset1a = 2
+        ifile_nodeset2b = 4
+        filename_nodeset1a = model.active_filenames[ifile_nodeset1a]
+        filename_nodeset2b = model.active_filenames[ifile_nodeset2b]
+
+        # the in place edit is found without mark_card_modified
+        grid = model.nodes[100017]
+        grid.xyz[2] = 42.
+        assert model.modified_ifiles == set(), model.modified_ifiles
+        model.write_bdfs(out_files_map, incremental=True)
+
+        # the unmodified leaf file is copied
+        with open(filename_nodeset1a, 'rb') as bdf_file:
+            lines_expected = bdf_file.read()
+        with open(out_files_map[filename_nodeset1a], 'rb') as bdf_file:
+            lines_actual = bdf_file.read()
+        assert lines_actual == lines_expected
+
+        # the modified file is regenerated
+        with open(out_files_map[filename_nodeset2b], 'r') as bdf_file:
+            lines = bdf_file.read()
+        assert '42.' in lines, lines
+        model2 = read_bdf(out_files_map[bdf_filename], log=log)
+        assert len(model2.nodes) == 20, len(model2.nodes)
+        assert model2.nodes[100017].xyz[2] == 42., model2.nodes[100017]
+
+        # an added card is found without mark_card_modified
+        grid = model.add_grid(100020, [1., 2., 3.])
+        grid.ifile = ifile_nodeset1a
+        model.write_bdfs(out_files_map, incremental=True, link_files=True)
+        model3 = read_bdf(out_files_map[bdf_filename], log=log)
+        assert len(model3.nodes) == 21, len(model3.nodes)
+        assert model3.nodes[100017].xyz[2] == 42., model3.nodes[100017]
+
+        # a flagged file is regenerated
+        model.mark_card_modified(model.nodes[100020])
+        assert model.modified_ifiles == {ifile_nodeset1a}, model.modified_ifiles
+
+        for out_filename in out_files_map.values():
+            os.remove(out_filename)
+
+        model4 = BDF(log=log, debug=False)
+        model4.read_bdf(bdf_filename)
+        with self.assertRaises(RuntimeError):
+            model4.write_bdfs(out_files_map, incremental=True)
+
     def test_isat_files(self):
         """read/writes the isat model with the file structure"""
         log = SimpleLogger(level='info', encoding='utf-8')
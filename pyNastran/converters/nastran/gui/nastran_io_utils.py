@@ -46,7 +46,8 @@ from pyNastran.bdf.cards.elements.solid import (
     CPYRAM5, CPYRAM13,
 )
 from pyNastran.bdf.mesh_utils.delete_bad_elements import (
-    tri_quality, quad_quality, get_min_max_theta)
+    tri_quality, quad_quality)
+from pyNastran.bdf.mesh_utils.element_quality import get_connectivity_quality
 from pyNastran.op2.op2_geom import OP2Geom
 
 #
@@ -148,77 +149,8 @@ def map_elements1_quality_helper(self,
     # 1------2
 
 
-    # these normals point inwards
-    #      4
-    #    / | \
-    #   /  |  \
-    #  3-------2
-    #   \  |   /
-    #    \ | /
-    #      1
-    _ctetra_faces = (
-        (0, 1, 2), # (1, 2, 3),
-        (0, 3, 1), # (1, 4, 2),
-        (0, 3, 2), # (1, 3, 4),
-        (1, 3, 2), # (2, 4, 3),
-    )
-
-    # these normals point inwards
-    #
-    #
-    #
-    #
-    #        /4-----3
-    #       /       /
-    #      /  5    /
-    #    /    \   /
-    #   /      \ /
-    # 1---------2
-    _cpyram_faces = (
-        (0, 1, 2, 3), # (1, 2, 3, 4),
-        (1, 4, 2), # (2, 5, 3),
-        (2, 4, 3), # (3, 5, 4),
-        (0, 3, 4), # (1, 4, 5),
-        (0, 4, 1), # (1, 5, 2),
-    )
-
-    # these normals point inwards
-    #       /6
-    #     /  | \
-    #   /    |   \
-    # 3\     |     \
-    # |  \   /4-----5
-    # |    \/       /
-    # |   /  \     /
-    # |  /    \   /
-    # | /      \ /
-    # 1---------2
-    _cpenta_faces = (
-        (0, 2, 1), # (1, 3, 2),
-        (3, 4, 5), # (4, 5, 6),
-
-        (0, 1, 4, 3), # (1, 2, 5, 4), # bottom
-        (1, 2, 5, 4), # (2, 3, 6, 5), # right
-        (0, 3, 5, 2), # (1, 4, 6, 3), # left
-    )
-
-    # these normals point inwards
-    #      8----7
-    #     /|   /|
-    #    / |  / |
-    #   /  5-/--6
-    # 4-----3   /
-    # |  /  |  /
-    # | /   | /
-    # 1-----2
-    _chexa_faces = (
-        (4, 5, 6, 7), # (5, 6, 7, 8),
-        (0, 3, 2, 1), # (1, 4, 3, 2),
-        (1, 2, 6, 5), # (2, 3, 7, 6),
-        (2, 3, 7, 6), # (3, 4, 8, 7),
-        (0, 4, 7, 3), # (1, 5, 8, 4),
-        (0, 6, 5, 4), # (1, 7, 6, 5),
-    )
+    # family -> [(i, inode1, inode2, ...), ...]
+    quality_rows = defaultdict(list)
     nid_to_pid_map = defaultdict(list)
     pid = 0
 
@@ -254,6 +186,8 @@ def map_elements1_quality_helper(self,
         area_ratioi = np.nan
         taper_ratioi = np.nan
         min_edge_lengthi = np.nan
+        # shells/solids are filled in after the loop
+        is_array_quality = False
 
         if isinstance(element, (CTRIA3, CTRIAR, CTRAX3, CPLSTN3)):
             if isinstance(element, (CTRIA3, CTRIAR)):
@@ -267,12 +201,8 @@ def map_elements1_quality_helper(self,
             _set_nid_to_pid_map(nid_to_pid_map, pid, node_ids)  # or blank?
 
             n1, n2, n3 = [nid_map[nid] for nid in node_ids]
-            p1 = xyz_cid0[n1, :]
-            p2 = xyz_cid0[n2, :]
-            p3 = xyz_cid0[n3, :]
-            out = tri_quality(p1, p2, p3)
-            (areai, max_skew, aspect_ratio,
-             min_thetai, max_thetai, dideal_thetai, min_edge_lengthi) = out
+            quality_rows['tri'].append((i, n1, n2, n3))
+            is_array_quality = True
 
             point_ids = elem.GetPointIds()
             point_ids.SetId(0, n1)
@@ -301,12 +231,8 @@ def map_elements1_quality_helper(self,
                 eid_to_nid_map[eid] = node_ids[:3]
 
             n1, n2, n3 = [nid_map[nid] for nid in node_ids[:3]]
-            p1 = xyz_cid0[n1, :]
-            p2 = xyz_cid0[n2, :]
-            p3 = xyz_cid0[n3, :]
-            out = tri_quality(p1, p2, p3)
-            (areai, max_skew, aspect_ratio,
-             min_thetai, max_thetai, dideal_thetai, min_edge_lengthi) = out
+            quality_rows['tri'].append((i, n1, n2, n3))
+            is_array_quality = True
             point_ids.SetId(0, n1)
             point_ids.SetId(1, n2)
             point_ids.SetId(2, n3)
@@ -341,12 +267,8 @@ def map_elements1_quality_helper(self,
             n1 = nid_map[node_ids[0]]
             n2 = nid_map[node_ids[2]]
             n3 = nid_map[node_ids[4]]
-            p1 = xyz_cid0[n1, :]
-            p2 = xyz_cid0[n2, :]
-            p3 = xyz_cid0[n3, :]
-            out = tri_quality(p1, p2, p3)
-            (areai, max_skew, aspect_ratio,
-             min_thetai, max_thetai, dideal_thetai, min_edge_lengthi) = out
+            quality_rows['tri'].append((i, n1, n2, n3))
+            is_array_quality = True
             point_ids.SetId(0, n1)
             point_ids.SetId(1, n2)
             point_ids.SetId(2, n3)
@@ -371,13 +293,8 @@ def map_elements1_quality_helper(self,
                 #print('nid_map = %s' % nid_map)
                 raise
                 #continue
-            p1 = xyz_cid0[n1, :]
-            p2 = xyz_cid0[n2, :]
-            p3 = xyz_cid0[n3, :]
-            p4 = xyz_cid0[n4, :]
-            out = quad_quality(element, p1, p2, p3, p4)
-            (areai, taper_ratioi, area_ratioi, max_skew, aspect_ratio,
-             min_thetai, max_thetai, dideal_thetai, min_edge_lengthi, max_warp) = out
+            quality_rows['quad'].append((i, n1, n2, n3, n4))
+            is_array_quality = True
 
             elem = vtkQuad()
             point_ids = elem.GetPointIds()
@@ -397,13 +314,8 @@ def map_elements1_quality_helper(self,
             _set_nid_to_pid_map_or_blank(nid_to_pid_map, pid, node_ids)
 
             n1, n2, n3, n4 = [nid_map[nid] for nid in node_ids[:4]]
-            p1 = xyz_cid0[n1, :]
-            p2 = xyz_cid0[n2, :]
-            p3 = xyz_cid0[n3, :]
-            p4 = xyz_cid0[n4, :]
-            out = quad_quality(element, p1, p2, p3, p4)
-            (areai, taper_ratioi, area_ratioi, max_skew, aspect_ratio,
-             min_thetai, max_thetai, dideal_thetai, min_edge_lengthi, max_warp) = out
+            quality_rows['quad'].append((i, n1, n2, n3, n4))
+            is_array_quality = True
             if None not in node_ids:
                 elem = vtkQuadraticQuad()
                 point_ids = elem.GetPointIds()
@@ -433,13 +345,8 @@ def map_elements1_quality_helper(self,
             _set_nid_to_pid_map_or_blank(nid_to_pid_map, pid, node_ids)
 
             n1, n2, n3, n4 = [nid_map[nid] for nid in node_ids[:4]]
-            p1 = xyz_cid0[n1, :]
-            p2 = xyz_cid0[n2, :]
-            p3 = xyz_cid0[n3, :]
-            p4 = xyz_cid0[n4, :]
-            out = quad_quality(element, p1, p2, p3, p4)
-            (areai, taper_ratioi, area_ratioi, max_skew, aspect_ratio,
-             min_thetai, max_thetai, dideal_thetai, min_edge_lengthi, max_warp) = out
+            quality_rows['quad'].append((i, n1, n2, n3, n4))
+            is_array_quality = True
             if None not in node_ids:
                 elem = vtkBiQuadraticQuad()
                 point_ids = elem.GetPointIds()
@@ -472,8 +379,8 @@ def map_elements1_quality_helper(self,
             point_ids.SetId(3, nid_map[node_ids[3]])
             grid.InsertNextCell(10, point_ids)
             #elem_nid_map = {nid:nid_map[nid] for nid in node_ids[:4]}
-            min_thetai, max_thetai, dideal_thetai, min_edge_lengthi = get_min_max_theta(
-                _ctetra_faces, node_ids[:4], nid_map, xyz_cid0)
+            quality_rows['tetra'].append([i] + [nid_map[nid] for nid in node_ids[:4]])
+            is_array_quality = True
 
         elif isinstance(element, CTETRA10):
             node_ids = element.node_ids
@@ -498,8 +405,8 @@ def map_elements1_quality_helper(self,
             point_ids.SetId(2, nid_map[node_ids[2]])
             point_ids.SetId(3, nid_map[node_ids[3]])
             grid.InsertNextCell(elem.GetCellType(), point_ids)
-            min_thetai, max_thetai, dideal_thetai, min_edge_lengthi = get_min_max_theta(
-                _ctetra_faces, node_ids[:4], nid_map, xyz_cid0)
+            quality_rows['tetra'].append([i] + [nid_map[nid] for nid in node_ids[:4]])
+            is_array_quality = True
 
         elif isinstance(element, CPENTA6):
             elem = vtkWedge()
@@ -515,8 +422,8 @@ def map_elements1_quality_helper(self,
             point_ids.SetId(4, nid_map[node_ids[4]])
             point_ids.SetId(5, nid_map[node_ids[5]])
             grid.InsertNextCell(13, point_ids)
-            min_thetai, max_thetai, dideal_thetai, min_edge_lengthi = get_min_max_theta(
-                _cpenta_faces, node_ids[:6], nid_map, xyz_cid0)
+            quality_rows['penta'].append([i] + [nid_map[nid] for nid in node_ids[:6]])
+            is_array_quality = True
 
         elif isinstance(element, CPENTA15):
             node_ids = element.node_ids
@@ -546,8 +453,8 @@ def map_elements1_quality_helper(self,
             point_ids.SetId(4, nid_map[node_ids[4]])
             point_ids.SetId(5, nid_map[node_ids[5]])
             grid.InsertNextCell(elem.GetCellType(), point_ids)
-            min_thetai, max_thetai, dideal_thetai, min_edge_lengthi = get_min_max_theta(
-                _cpenta_faces, node_ids[:6], nid_map, xyz_cid0)
+            quality_rows['penta'].append([i] + [nid_map[nid] for nid in node_ids[:6]])
+            is_array_quality = True
 
         elif isinstance(element, (CHEXA8, CIHEX1, CHEXA1)):
             node_ids = element.node_ids
@@ -565,8 +472,8 @@ def map_elements1_quality_helper(self,
             point_ids.SetId(6, nid_map[node_ids[6]])
             point_ids.SetId(7, nid_map[node_ids[7]])
             grid.InsertNextCell(12, point_ids)
-            min_thetai, max_thetai, dideal_thetai, min_edge_lengthi = get_min_max_theta(
-                _chexa_faces, node_ids[:8], nid_map, xyz_cid0)
+            quality_rows['hexa'].append([i] + [nid_map[nid] for nid in node_ids[:8]])
+            is_array_quality = True
 
         elif isinstance(element, (CHEXA20, CIHEX2)):
             node_ids = element.node_ids
@@ -605,8 +512,8 @@ def map_elements1_quality_helper(self,
             point_ids.SetId(6, nid_map[node_ids[6]])
             point_ids.SetId(7, nid_map[node_ids[7]])
             grid.InsertNextCell(elem.GetCellType(), point_ids)
-            min_thetai, max_thetai, dideal_thetai, min_edge_lengthi = get_min_max_theta(
-                _chexa_faces, node_ids[:8], nid_map, xyz_cid0)
+            quality_rows['hexa'].append([i] + [nid_map[nid] for nid in node_ids[:8]])
+            is_array_quality = True
 
         elif isinstance(element, CPYRAM5):
             node_ids = element.node_ids
@@ -622,8 +529,8 @@ def map_elements1_quality_helper(self,
             point_ids.SetId(4, nid_map[node_ids[4]])
             # etype = 14
             grid.InsertNextCell(elem.GetCellType(), point_ids)
-            min_thetai, max_thetai, dideal_thetai, min_edge_lengthi = get_min_max_theta(
-                _cpyram_faces, node_ids[:5], nid_map, xyz_cid0)
+            quality_rows['pyram'].append([i] + [nid_map[nid] for nid in node_ids[:5]])
+            is_array_quality = True
         elif isinstance(element, CPYRAM13):
             node_ids = element.node_ids
             pid = element.Pid()
@@ -654,8 +561,8 @@ def map_elements1_quality_helper(self,
             point_ids.SetId(3, nid_map[node_ids[3]])
             point_ids.SetId(4, nid_map[node_ids[4]])
             grid.InsertNextCell(elem.GetCellType(), point_ids)
-            min_thetai, max_thetai, dideal_thetai, min_edge_lengthi = get_min_max_theta(
-                _cpyram_faces, node_ids[:5], nid_map, xyz_cid0)
+            quality_rows['pyram'].append([i] + [nid_map[nid] for nid in node_ids[:5]])
+            is_array_quality = True
 
         elif etype in ('CBUSH', 'CBUSH1D', 'CFAST',
                        'CELAS1', 'CELAS2', 'CELAS3', 'CELAS4',
@@ -995,7 +902,7 @@ def map_elements1_quality_helper(self,
             pids[i] = pid
             pids_dict[eid] = pid
 
-        if np.isnan(max_thetai) and etype not in NO_THETA:
+        if np.isnan(max_thetai) and etype not in NO_THETA and not is_array_quality:
             print('eid=%s theta=%s...setting to 360. deg' % (eid, max_thetai))
             print(element.rstrip())
             if isinstance(element.nodes[0], integer_types):
@@ -1020,6 +927,20 @@ def map_elements1_quality_helper(self,
     #assert len(self.eid_map) > 0, self.eid_map
     #print('mapped elements')
 
+    quality_arrays = {
+        'area': area,
+        'taper_ratio': taper_ratio,
+        'area_ratio': area_ratio,
+        'max_skew_angle': max_skew_angle,
+        'max_aspect_ratio': max_aspect_ratio,
+        'min_interior_angle': min_interior_angle,
+        'max_interior_angle': max_interior_angle,
+        'dideal_theta': dideal_theta,
+        'min_edge_length': min_edge_length,
+        'max_warp_angle': max_warp_angle,
+    }
+    _fill_array_quality(log, xyz_cid0, quality_rows, quality_arrays)
+
     nelements = i
     self.gui.nelements = nelements
     #print('nelements=%s pids=%s' % (nelements, list(pids)))
@@ -1034,6 +955,26 @@ def map_elements1_quality_helper(self,
     )
     return out
 
+def _fill_array_quality(log: SimpleLogger,
+                        xyz_cid0: np.ndarray,
+                        quality_rows: dict[str, list[tuple[int, ...]]],
+                        quality_arrays: dict[str, np.ndarray]) -> None:
+    """fills the shell/solid quality with the vectorized metrics"""
+    for family, rows in quality_rows.items():
+        rows = np.array(rows, dtype='int64')
+        ielement = rows[:, 0]
+        quality = get_connectivity_quality(xyz_cid0, family, rows[:, 1:])
+        for name, values in quality.items():
+            quality_arrays[name][ielement] = values
+
+        max_theta = quality['max_interior_angle']
+        inan = np.isnan(max_theta)
+        if inan.any():
+            log.warning(f'{inan.sum()} {family} elements have an undefined '
+                        'interior angle...setting to 360. deg')
+            quality_arrays['max_interior_angle'][ielement[inan]] = 2 * np.pi
+
+
 def map_elements1_no_quality_helper(self,
                                     xyz_cid0: np.ndarray,
                                     nid_cp_cd: np.ndarray,
@@ -3,18 +3,17 @@ import copy
 from typing import Union, Optional, Any, TYPE_CHECKING
 
 import numpy as np
-import scipy.sparse as sci_sparse
 from scipy.sparse import csc_matrix
 
 from pyNastran.dev.solver.stiffness.shells import build_kbb_cquad4, build_kbb_cquad8
-from .utils import lambda1d, DOF_MAP
+from .utils import DOF_MAP, COO_TRIPLETS, add_coo, coo_to_csc, get_dofs
 #from pyNastran.bdf.cards.elements.bars import get_bar_vector, get_bar_yz_transform
 if TYPE_CHECKING:  # pragma: no cover
     from pyNastran.nptyping_interface import NDArrayNNfloat
     from pyNastran.bdf.bdf import (
         BDF,
         CELAS1, CELAS2, CELAS3, CELAS4,
-        CBAR, PBAR, PBARL, PBEAM, PBEAML, # , CBEAM
+        CBAR, CBEAM, PBAR, PBARL, PBEAM, PBEAML,
         MAT1,
     )
 
@@ -24,9 +23,15 @@ def build_Kgg(model: BDF, dof_map: DOF_MAP,
               ngrid: int,
               ndof_per_grid: int,
               idtype: str='int32', fdtype: str='float32') -> tuple[NDArrayNNfloat, Any]:
-    """[K] = d{P}/dx"""
+    """
+    [K] = d{P}/dx
+
+    The element matrices of each element type are calculated as a batch
+    and are stored as (rows, cols, values), which are summed into a
+    csc_matrix once.
+    """
     model.log.debug(f'starting build_Kgg')
-    Kbb = sci_sparse.dok_matrix((ndof, ndof), dtype=fdtype)
+    Kbb: COO_TRIPLETS = []
     #print(dof_map)
 
     #_get_loadid_ndof(model, subcase_id)
@@ -53,7 +58,8 @@ def build_Kgg(model: BDF, dof_map: DOF_MAP,
     nelements += build_kbb_cquad8(model, Kbb, dof_map,
                                   all_nids, xyz_cid0, idtype='int32', fdtype='float64')
     assert nelements > 0, nelements
-    Kbb2 = Kbb.tocsc()
+    Kbb2 = coo_to_csc(Kbb, ndof, fdtype=fdtype)
+    del Kbb
 
     #Kgg = Kbb_to_Kgg(model, Kbb, ngrid, ndof_per_grid, inplace=False)
     Kgg = Kbb_to_Kgg(model, Kbb2, ngrid, ndof_per_grid)
@@ -62,121 +68,84 @@ def build_Kgg(model: BDF, dof_map: DOF_MAP,
     return Kgg
 
 
-def _build_kbb_celas1(model: BDF, Kbb, dof_map: DOF_MAP) -> None:
+def _build_kbb_celas1(model: BDF, Kbb: COO_TRIPLETS, dof_map: DOF_MAP) -> int:
     """fill the CELAS1 Kbb matrix"""
     eids = model._type_to_id_map['CELAS1']
-    for eid in eids:
-        elem = model.elements[eid]
-        ki = elem.K()
-        #print(elem, ki)
-        #print(elem.get_stats())
-        _build_kbbi_celas12(Kbb, dof_map, elem, ki)
+    _build_kbb_celas12(Kbb, dof_map, [model.elements[eid] for eid in eids])
     return len(eids)
 
-def _build_kbb_celas2(model: BDF, Kbb, dof_map: DOF_MAP) -> int:
+def _build_kbb_celas2(model: BDF, Kbb: COO_TRIPLETS, dof_map: DOF_MAP) -> int:
     """fill the CELAS2 Kbb matrix"""
     eids = model._type_to_id_map['CELAS2']
-    #celas3s = model._type_to_id_map['CELAS3']
-    #celas4s = model._type_to_id_map['CELAS4']
-    for eid in eids:
-        elem = model.elements[eid]
-        ki = elem.K()
-        #print(elem, ki)
-        #print(elem.get_stats())
-        _build_kbbi_celas12(Kbb, dof_map, elem, ki)
+    _build_kbb_celas12(Kbb, dof_map, [model.elements[eid] for eid in eids])
     return len(eids)
 
-def _build_kbb_celas3(model: BDF, Kbb, dof_map: DOF_MAP) -> None:
+def _build_kbb_celas3(model: BDF, Kbb: COO_TRIPLETS, dof_map: DOF_MAP) -> int:
     """fill the CELAS3 Kbb matrix"""
     eids = model._type_to_id_map['CELAS3']
-    for eid in eids:
-        elem = model.elements[eid]
-        ki = elem.K()
-        #print(elem, ki)
-        #print(elem.get_stats())
-        _build_kbbi_celas34(Kbb, dof_map, elem, ki)
+    _build_kbb_celas34(Kbb, dof_map, [model.elements[eid] for eid in eids])
     return len(eids)
 
-def _build_kbb_celas4(model: BDF, Kbb, dof_map: DOF_MAP) -> None:
+def _build_kbb_celas4(model: BDF, Kbb: COO_TRIPLETS, dof_map: DOF_MAP) -> int:
     """fill the CELAS4 Kbb matrix"""
     eids = model._type_to_id_map['CELAS4']
-    for eid in eids:
-        elem = model.elements[eid]
-        ki = elem.K()
-        #print(elem, ki)
-        #print(elem.get_stats())
-        _build_kbbi_celas34(Kbb, dof_map, elem, ki)
+    _build_kbb_celas34(Kbb, dof_map, [model.elements[eid] for eid in eids])
     return len(eids)
 
-def _build_kbbi_celas12(Kbb, dof_map: DOF_MAP,
-                        elem: Union[CELAS1, CELAS2], ki: float) -> None:
-    """fill the CELASx Kbb matrix"""
-    nid1, nid2 = elem.nodes
-    c1, c2 = elem.c1, elem.c2
-    i = dof_map[(nid1, c1)]
-    j = dof_map[(nid2, c2)]
-    k = ki * np.array([[1, -1,],
-                       [-1, 1]])
-    ibe = [
-        (i, 0),
-        (j, 1),
-    ]
-    for ib1, ie1 in ibe:
-        for ib2, ie2 in ibe:
-            Kbb[ib1, ib2] += k[ie1, ie2]
-    #Kbb[j, i] += ki
-    #Kbb[i, j] += ki
-    #del i, j, ki, nid1, nid2, c1, c2
-
-def _build_kbbi_celas34(Kbb, dof_map: DOF_MAP,
-                        elem: Union[CELAS3, CELAS4], ki: float) -> None:
-    """fill the CELASx Kbb matrix"""
-    nid1, nid2 = elem.nodes
+def _build_kbb_celas12(Kbb: COO_TRIPLETS, dof_map: DOF_MAP,
+                       elements: list[Union[CELAS1, CELAS2]]) -> None:
+    """fill the CELAS1/CELAS2 Kbb matrix"""
+    if len(elements) == 0:
+        return
+    n_ijv = np.array([
+        (dof_map[(elem.nodes[0], elem.c1)], dof_map[(elem.nodes[1], elem.c2)])
+        for elem in elements], dtype='int32')
+    k = np.array([elem.K() for elem in elements], dtype='float64')
+    _add_kbb_springs(Kbb, n_ijv, k)
+
+def _build_kbb_celas34(Kbb: COO_TRIPLETS, dof_map: DOF_MAP,
+                       elements: list[Union[CELAS3, CELAS4]]) -> None:
+    """fill the CELAS3/CELAS4 Kbb matrix"""
+    if len(elements) == 0:
+        return
     #print(dof_map)
-    i = dof_map[(nid1, 0)]
-    j = dof_map[(nid2, 0)]
-    k = ki * np.array([[1, -1,],
-                       [-1, 1]])
-    ibe = [
-        (i, 0),
-        (j, 1),
-    ]
-    for ib1, ie1 in ibe:
-        for ib2, ie2 in ibe:
-            Kbb[ib1, ib2] += k[ie1, ie2]
-    #Kbb[j, i] += ki
-    #Kbb[i, j] += ki
-    #del i, j, ki, nid1, nid2, c1, c2
-
-def _build_kbb_cbar(model, Kbb, dof_map: DOF_MAP, fdtype: str='float64') -> int:
+    n_ijv = np.array([
+        (dof_map[(elem.nodes[0], 0)], dof_map[(elem.nodes[1], 0)])
+        for elem in elements], dtype='int32')
+    k = np.array([elem.K() for elem in elements], dtype='float64')
+    _add_kbb_springs(Kbb, n_ijv, k)
+
+def _add_kbb_springs(Kbb: COO_TRIPLETS, n_ijv: np.ndarray, k: np.ndarray) -> None:
+    """adds the (nelements, 2, 2) spring stiffness matrices"""
+    K = k[:, np.newaxis, np.newaxis] * np.array([[1., -1.],
+                                                 [-1., 1.]])
+    add_coo(Kbb, n_ijv, K)
+
+def _build_kbb_cbar(model: BDF, Kbb: COO_TRIPLETS, dof_map: DOF_MAP,
+                    fdtype: str='float64') -> int:
     """fill the CBAR Kbb matrix using an Euler-Bernoulli beam"""
     eids = model._type_to_id_map['CBAR']
     nelements = len(eids)
     if nelements == 0:
         return nelements
 
-    for eid in eids:
-        elem: CBAR = model.elements[eid]
-        nid1, nid2 = elem.nodes
-        is_passed, K = ke_cbar(model, elem, fdtype=fdtype)
-        assert is_passed
-
-        i1 = dof_map[(nid1, 1)]
-        i2 = dof_map[(nid2, 1)]
-        n_ijv = [
-            i1,
-            i1 + 1, i1 + 2,
-            i1 + 3, i1 + 4, i1 + 5,
-
-            i2,
-            i2 + 1, i2 + 2,
-            i2 + 3, i2 + 4, i2 + 5,
-        ]
-        for i, i1 in enumerate(n_ijv):
-            for j, i2 in enumerate(n_ijv):
-                ki = K[i, j]
-                if abs(ki) > 0.:
-                    Kbb[i1, i2] += ki
+    elements = [model.elements[eid] for eid in eids]
+    lengths = np.zeros(nelements, dtype=fdtype)
+    T = np.zeros((nelements, 3, 3), dtype=fdtype)
+    terms = np.zeros((nelements, 4), dtype=fdtype)
+    for i, elem in enumerate(elements):
+        is_failed, (unused_v, ihat, jhat, khat, wa, wb) = elem.get_axes(model)
+        assert is_failed is False
+        xyz1 = elem.nodes_ref[0].get_position() + wa
+        xyz2 = elem.nodes_ref[1].get_position() + wb
+        L = np.linalg.norm(xyz2 - xyz1)
+        pid_ref = elem.pid_ref
+        lengths[i] = L
+        T[i, :, :] = [ihat, jhat, khat]
+        terms[i, :] = _beami_stiffness_terms(
+            pid_ref, pid_ref.mid_ref, L, pid_ref.I11(), pid_ref.I22(),
+            k1=pid_ref.k1, k2=pid_ref.k2)
+    _add_kbb_beams(Kbb, dof_map, elements, lengths, T, terms, fdtype=fdtype)
     return nelements
 
 def ke_cbar(model: BDF, elem: CBAR, fdtype: str='float64'):
@@ -227,133 +196,87 @@ def ke_cbar(model: BDF, elem: CBAR, fdtype: str='float64'):
     is_passed = not is_failed
     return is_passed, K
 
-def _build_kbb_crod(model: BDF, Kbb, dof_map: DOF_MAP) -> None:
+def _build_kbb_crod(model: BDF, Kbb: COO_TRIPLETS, dof_map: DOF_MAP) -> int:
     """fill the CROD Kbb matrix"""
     eids = model._type_to_id_map['CROD']
-    for eid in eids:
-        elem = model.elements[eid]
-        pid_ref = elem.pid_ref
-        mat = pid_ref.mid_ref
-        _build_kbbi_conrod_crod(Kbb, dof_map, elem, mat)
+    elements = [model.elements[eid] for eid in eids]
+    mats = [elem.pid_ref.mid_ref for elem in elements]
+    _build_kbb_conrod_crod(Kbb, dof_map, elements, mats)
     return len(eids)
 
-def _build_kbb_ctube(model: BDF, Kbb, dof_map: DOF_MAP) -> None:
+def _build_kbb_ctube(model: BDF, Kbb: COO_TRIPLETS, dof_map: DOF_MAP) -> int:
     """fill the CTUBE Kbb matrix"""
     ctubes = model._type_to_id_map['CTUBE']
-    for eid in ctubes:
-        elem = model.elements[eid]
-        pid_ref = elem.pid_ref
-        mat = pid_ref.mid_ref
-        _build_kbbi_conrod_crod(Kbb, dof_map, elem, mat)
+    elements = [model.elements[eid] for eid in ctubes]
+    mats = [elem.pid_ref.mid_ref for elem in elements]
+    _build_kbb_conrod_crod(Kbb, dof_map, elements, mats)
     return len(ctubes)
 
-def _build_kbb_conrod(model: BDF, Kbb, dof_map: DOF_MAP) -> int:
+def _build_kbb_conrod(model: BDF, Kbb: COO_TRIPLETS, dof_map: DOF_MAP) -> int:
     """fill the CONROD Kbb matrix"""
     eids = model._type_to_id_map['CONROD']
-    for eid in eids:
-        elem = model.elements[eid]
-        mat = elem.mid_ref
-        _build_kbbi_conrod_crod(Kbb, dof_map, elem, mat)
+    elements = [model.elements[eid] for eid in eids]
+    mats = [elem.mid_ref for elem in elements]
+    _build_kbb_conrod_crod(Kbb, dof_map, elements, mats)
     return len(eids)
 
-def _build_kbbi_conrod_crod(Kbb, dof_map: DOF_MAP, elem, mat, fdtype='float64') -> None:
-    """fill the ith rod Kbb matrix"""
-    nid1, nid2 = elem.nodes
-    #mat = elem.mid_ref
-    xyz1 = elem.nodes_ref[0].get_position()
-    xyz2 = elem.nodes_ref[1].get_position()
+def _build_kbb_conrod_crod(Kbb: COO_TRIPLETS, dof_map: DOF_MAP,
+                           elements: list[Any], mats: list[MAT1],
+                           fdtype: str='float64') -> None:
+    """fill the rod Kbb matrix"""
+    nelements = len(elements)
+    if nelements == 0:
+        return
+
+    xyz1 = np.array([elem.nodes_ref[0].get_position() for elem in elements], dtype=fdtype)
+    xyz2 = np.array([elem.nodes_ref[1].get_position() for elem in elements], dtype=fdtype)
     dxyz12 = xyz1 - xyz2
-    L = np.linalg.norm(dxyz12)
-    E = mat.E
-    G = mat.G()
-    J = elem.J()
-    A = elem.Area()
-    #print(f'A = {A}')
-    E = elem.E()
+    L = np.linalg.norm(dxyz12, axis=1)
+    if L.min() == 0.:
+        ibad = np.flatnonzero(L == 0.)
+        eids = [elements[i].eid for i in ibad.tolist()]
+        raise ZeroDivisionError(f'eids={eids} have a length of 0')
+
+    G = np.array([mat.G() for mat in mats], dtype=fdtype)
+    J = np.array([elem.J() for elem in elements], dtype=fdtype)
+    A = np.array([elem.Area() for elem in elements], dtype=fdtype)
+    E = np.array([elem.E() for elem in elements], dtype=fdtype)
     #L = elem.Length()
     k_axial = A * E / L
     k_torsion = G * J / L
 
-    assert isinstance(k_axial, float), k_axial
-    assert isinstance(k_torsion, float), k_torsion
-    #Kbb[i, i] += ki[0, 0]
-    #Kbb[i, j] += ki[0, 1]
-    #Kbb[j, i] = ki[1, 0]
-    #Kbb[j, j] = ki[1, 1]
-    k = np.array([[1., -1.],
-                  [-1., 1.]])  # 1D rod
-    Lambda = lambda1d(dxyz12, debug=False)
-    K = Lambda.T @ k @ Lambda
-    #i11 = dof_map[(n1, 1)]
-    #i12 = dof_map[(n1, 2)]
-
-    #i21 = dof_map[(n2, 1)]
-    #i22 = dof_map[(n2, 2)]
-
-    nki, nkj = K.shape
-    K2 = np.zeros((nki*2, nkj*2), dtype=fdtype)
-
-    ni1 = dof_map[(nid1, 1)]
-    nj1 = dof_map[(nid2, 1)]
-
-    i1 = 0
-    i2 = 3 # dof_map[(n1, 2)]
-    if k_torsion == 0.0: # axial; 2D or 3D
-        K2 = K * k_axial
-        n_ijv = [
-            # axial
-            ni1, ni1 + 1, ni1 + 2,  # node 1
-            nj1, nj1 + 1, nj1 + 2,  # node 2
-        ]
-        dofs = np.array([
-            i1, i1+1, i1+2,
-            i2, i2+1, i2+2,
-        ], dtype='int32')
-    elif k_axial == 0.0: # torsion; assume 3D
-        K2 = K * k_torsion
-        n_ijv = [
-            # torsion
-            ni1 + 3, ni1 + 4, ni1 + 5,  # node 1
-            nj1 + 3, nj1 + 4, nj1 + 5,  # node 2
-        ]
-        dofs = np.array([
-            i1, i1+1, i1+2,
-            i2, i2+1, i2+2,
-        ], dtype='int32')
-    else:  # axial + torsion; assume 3D
-        # u1fx, u1fy, u1fz, u2fx, u2fy, u2fz
-        K2[:nki, :nki] = K * k_axial
-
-        # u1mx, u1my, u1mz, u2mx, u2my, u2mz
-        K2[nki:, nki:] = K * k_torsion
-
-        dofs = np.array([
-            i1, i1+1, i1+2,
-            i2, i2+1, i2+2,
-
-            i1+3, i1+4, i1+5,
-            i2+3, i2+4, i2+5,
-        ], dtype='int32')
-        n_ijv = [
-            # axial
-            ni1, ni1 + 1, ni1 + 2,  # node 1
-            nj1, nj1 + 1, nj1 + 2,  # node 2
-
-            # torsion
-            ni1 + 3, ni1 + 4, ni1 + 5,  # node 1
-            nj1 + 3, nj1 + 4, nj1 + 5,  # node 2
-        ]
-    for dof1, i1 in zip(dofs, n_ijv):
-        for dof2, i2 in zip(dofs, n_ijv):
-            ki = K2[dof1, dof2]
-            if abs(ki) > 0.:
-                #print(nij1, nij2, f'({i1}, {i2});', (dof1, dof2), ki)
-                Kbb[i1, i2] += ki
-        #print(K2)
-    #print(Kbb)
-    return
-
-def _build_kbb_cbeam(model: BDF, Kbb, dof_map: DOF_MAP,
+    # [Lambda]^T [k] [Lambda], where:
+    #   Lambda = [l,m,n,0,0,0]  2x6
+    #            [0,0,0,l,m,n]
+    #   k = [1, -1]
+    #       [-1, 1]
+    lmn = dxyz12 / L[:, np.newaxis]
+    lmn2 = lmn[:, :, np.newaxis] * lmn[:, np.newaxis, :]
+    K = np.zeros((nelements, 6, 6), dtype=fdtype)
+    K[:, :3, :3] = K[:, 3:, 3:] = lmn2
+    K[:, :3, 3:] = K[:, 3:, :3] = -lmn2
+
+    # u1fx, u1fy, u1fz, u2fx, u2fy, u2fz
+    # u1mx, u1my, u1mz, u2mx, u2my, u2mz
+    K2 = np.zeros((nelements, 12, 12), dtype=fdtype)
+    K2[:, :6, :6] = K * k_axial[:, np.newaxis, np.newaxis]
+    K2[:, 6:, 6:] = K * k_torsion[:, np.newaxis, np.newaxis]
+
+    nids = np.array([elem.nodes for elem in elements], dtype='int32')
+    inids = get_dofs(dof_map, nids, 1)
+    ni1 = inids[:, [0]]
+    nj1 = inids[:, [1]]
+    axial = np.arange(3)
+    torsion = np.arange(3, 6)
+    n_ijv = np.hstack([
+        # axial
+        ni1 + axial, nj1 + axial,  # node 1, node 2
+        # torsion
+        ni1 + torsion, nj1 + torsion,  # node 1, node 2
+    ])
+    add_coo(Kbb, n_ijv, K2)
+
+def _build_kbb_cbeam(model: BDF, Kbb: COO_TRIPLETS, dof_map: DOF_MAP,
                      all_nids, xyz_cid0, idtype='int32', fdtype='float64') -> int:
     """TODO: Timoshenko beam, warping, I12"""
     str(all_nids)
@@ -363,47 +286,65 @@ def _build_kbb_cbeam(model: BDF, Kbb, dof_map: DOF_MAP,
     if nelements == 0:
         return nelements
 
-    for eid in eids:
-        elem = model.elements[eid]
-        nid1, nid2 = elem.nodes
+    elements = [model.elements[eid] for eid in eids.tolist()]
+    lengths = np.zeros(nelements, dtype=fdtype)
+    T = np.zeros((nelements, 3, 3), dtype=fdtype)
+    terms = np.zeros((nelements, 4), dtype=fdtype)
+    for i, elem in enumerate(elements):
         xyz1 = elem.nodes_ref[0].get_position()
         xyz2 = elem.nodes_ref[1].get_position()
         dxyz = xyz2 - xyz1
         L = np.linalg.norm(dxyz)
         pid_ref = elem.pid_ref
-        mat = pid_ref.mid_ref
-        is_failed, (v, ihat, jhat, khat, wa, wb) = elem.get_axes(model)
+        is_failed, (unused_v, ihat, jhat, khat, unused_wa, unused_wb) = elem.get_axes(model)
         #print(wa, wb, ihat, jhat, khat)
         assert is_failed is False
-        T = np.vstack([ihat, jhat, khat])
-        z = np.zeros((3, 3), dtype=fdtype)
-        Teb = np.block([
-            [T, z, z, z],
-            [z, T, z, z],
-            [z, z, T, z],
-            [z, z, z, T],
-        ])
-        Iy = pid_ref.I11()
-        Iz = pid_ref.I22()
-        k1 = pid_ref.k1
-        k2 = pid_ref.k2
-        pa = elem.pa
-        pb = elem.pb
-        Ke = _beami_stiffness(pid_ref, mat, L, Iy, Iz, pa, pb, k1=k1, k2=k2)
-        K = Teb.T @ Ke @ Teb
-        i1 = dof_map[(nid1, 1)]
-        j1 = dof_map[(nid2, 1)]
-        n_ijv = [
-            i1, i1 + 1, i1 + 2, i1 + 3, i1 + 4, i1 + 5, # node 1
-            j1, j1 + 1, j1 + 2, j1 + 3, j1 + 4, j1 + 5, # node 2
-        ]
-        for i, i1 in enumerate(n_ijv):
-            for j, i2 in enumerate(n_ijv):
-                ki = K[i, j]
-                if abs(ki) > 0.:
-                    Kbb[i1, i2] += ki
+        lengths[i] = L
+        T[i, :, :] = [ihat, jhat, khat]
+        terms[i, :] = _beami_stiffness_terms(
+            pid_ref, pid_ref.mid_ref, L, pid_ref.I11(), pid_ref.I22(),
+            k1=pid_ref.k1, k2=pid_ref.k2)
+    _add_kbb_beams(Kbb, dof_map, elements, lengths, T, terms, fdtype=fdtype)
     return nelements
 
+def _add_kbb_beams(Kbb: COO_TRIPLETS, dof_map: DOF_MAP,
+                   elements: list[Union[CBAR, CBEAM]],
+                   L: np.ndarray, T: np.ndarray, terms: np.ndarray,
+                   fdtype: str='float64') -> None:
+    """
+    adds the CBAR/CBEAM stiffness matrices
+
+    Parameters
+    ----------
+    elements : list[CBAR/CBEAM]
+        the elements
+    L : (nelements, ) float ndarray
+        the length
+    T : (nelements, 3, 3) float ndarray
+        the [ihat, jhat, khat] element axes
+    terms : (nelements, 4) float ndarray
+        the [kaxial, ktorsion, ky, kz] stiffness terms
+
+    """
+    nelements = len(elements)
+    pa = [elem.pa for elem in elements]
+    pb = [elem.pb for elem in elements]
+    kaxial, ktorsion, ky, kz = terms.T
+    Ke = _beam_stiffness(L, kaxial, ktorsion, ky, kz, pa, pb, fdtype=fdtype)
+
+    # K = [Teb]^T [Ke] [Teb]
+    Teb = np.zeros((nelements, 12, 12), dtype=fdtype)
+    for i in range(0, 12, 3):
+        Teb[:, i:i+3, i:i+3] = T
+    K = np.transpose(Teb, (0, 2, 1)) @ Ke @ Teb
+
+    # node 1: i1, i1 + 1, ... i1 + 5
+    # node 2: j1, j1 + 1, ... j1 + 5
+    nids = np.array([elem.nodes for elem in elements], dtype='int32')
+    inids = get_dofs(dof_map, nids, 1)
+    n_ijv = (inids[:, :, np.newaxis] + np.arange(6)).reshape(nelements, 12)
+    add_coo(Kbb, n_ijv, K)
+
 def _beami_stiffness(prop: Union[PBAR, PBARL, PBEAM, PBEAML],
                      mat: MAT1,
                      L: float, Iy: float, Iz: float,
@@ -411,6 +352,17 @@ def _beami_stiffness(prop: Union[PBAR, PBARL, PBEAM, PBEAML],
                      k1: Optional[float]=None,
                      k2: Optional[float]=None):
     """gets the ith Euler-Bernoulli beam stiffness"""
+    kaxial, ktorsion, ky, kz = _beami_stiffness_terms(prop, mat, L, Iy, Iz, k1=k1, k2=k2)
+    K = _beam_stiffness(np.array([L]), np.array([kaxial]), np.array([ktorsion]),
+                        np.array([ky]), np.array([kz]), [pa], [pb])
+    return K[0, :, :]
+
+def _beami_stiffness_terms(prop: Union[PBAR, PBARL, PBEAM, PBEAML],
+                           mat: MAT1,
+                           L: float, Iy: float, Iz: float,
+                           k1: Optional[float]=None,
+                           k2: Optional[float]=None) -> tuple[float, float, float, float]:
+    """gets the ith Euler-Bernoulli beam kaxial, ktorsion, ky, kz"""
     E = mat.E()
     G = mat.G()
     A = prop.Area()
@@ -429,15 +381,26 @@ def _beami_stiffness(prop: Union[PBAR, PBARL, PBEAM, PBEAML],
     phiz = 1.0
     ky = E * Iy / (L * phiy)
     kz = E * Iz / (L * phiz)
-
-    K = np.zeros((12, 12), dtype='float64')
+    return kaxial, ktorsion, ky, kz
+
+def _beam_stiffness(L: np.ndarray,
+                    kaxial: np.ndarray, ktorsion: np.ndarray,
+                    ky: np.ndarray, kz: np.ndarray,
+                    pa: list[int], pb: list[int],
+                    fdtype: str='float64') -> np.ndarray:
+    """gets the (nelements, 12, 12) Euler-Bernoulli beam stiffness"""
+    nelements = len(L)
+    phiy = 1.0
+    phiz = 1.0
+    L2 = L * L
+    K = np.zeros((nelements, 12, 12), dtype=fdtype)
     # axial
-    K[0, 0] = K[6, 6] = kaxial
-    K[6, 0] = K[0, 6] = -kaxial
+    K[:, 0, 0] = K[:, 6, 6] = kaxial
+    K[:, 6, 0] = K[:, 0, 6] = -kaxial
 
     # torsion
-    K[3, 3] = K[9, 9] = ktorsion
-    K[9, 3] = K[3, 9] = -ktorsion
+    K[:, 3, 3] = K[:, 9, 9] = ktorsion
+    K[:, 9, 3] = K[:, 3, 9] = -ktorsion
 
     #Fx - 0, 6
     #Fy - 1, 7**
@@ -451,13 +414,13 @@ def _beami_stiffness(prop: Union[PBAR, PBARL, PBEAM, PBEAML],
     # 5  [6L  & 4L^2 & -6L & 2L^2
     # 7  [-12 &-6L   &  12 & -6L
     # 11 [6L  & 2L^2 & -6L & 4L^2
-    K[1, 1] = K[7, 7] = 12. * kz
-    K[1, 7] = K[1, 7] = -12. * kz
-    K[1, 5] = K[5, 1] = K[11, 1] = K[1, 11] = 6. * L * kz
+    K[:, 1, 1] = K[:, 7, 7] = 12. * kz
+    K[:, 1, 7] = K[:, 1, 7] = -12. * kz
+    K[:, 1, 5] = K[:, 5, 1] = K[:, 11, 1] = K[:, 1, 11] = 6. * L * kz
 
-    K[5, 7] = K[7, 5] = K[7, 11] = K[11, 7] = -6. * L * kz
-    K[5, 11] = K[11, 5] = 2. * L2 * kz * (2 - phiz)
-    K[5, 5] = K[11, 11] = 4. * L2 * kz * (4 + phiz)
+    K[:, 5, 7] = K[:, 7, 5] = K[:, 7, 11] = K[:, 11, 7] = -6. * L * kz
+    K[:, 5, 11] = K[:, 11, 5] = 2. * L2 * kz * (2 - phiz)
+    K[:, 5, 5] = K[:, 11, 11] = 4. * L2 * kz * (4 + phiz)
 
     #Fx - 0, 6
     #Fy - 1, 7
@@ -471,26 +434,28 @@ def _beami_stiffness(prop: Union[PBAR, PBARL, PBEAM, PBEAML],
     # 4  [6L  & 4L^2 & -6L & 2L^2
     # 8  [-12 &-6L   &  12 & -6L
     # 10 [6L  & 2L^2 & -6L & 4L^2
-    K[2, 2] = K[8, 8] = 12. * ky
-    K[2, 8] = K[2, 8] = -12. * ky
-    K[2, 4] = K[4, 2] = K[10, 2] = K[2, 10] = 6. * L * ky
-
-    K[4, 8] = K[8, 4] = K[8, 10] = K[10, 8] = -6. * L * ky
-    K[4, 10] = K[10, 4] = 2. * L * L * ky * (2. - phiy)
-    K[4, 4] = K[10, 10] = 4. * L * L * ky * (4. + phiy)
-
-    if pa != 0:
-        assert pa > 0
-        for pas in str(pa): # 123456
-            pai = int(pas) - 1 # 012345 (0-5)
-            K[pai, :] = 0
-            K[:, pai] = 0
-    if pb != 0:
-        assert pb > 0
-        for pbs in str(pb): # 123456
-            pbi = int(pbs) + 5 #  (6 - 11)
-            K[pbi, :] = 0
-            K[:, pbi] = 0
+    K[:, 2, 2] = K[:, 8, 8] = 12. * ky
+    K[:, 2, 8] = K[:, 2, 8] = -12. * ky
+    K[:, 2, 4] = K[:, 4, 2] = K[:, 10, 2] = K[:, 2, 10] = 6. * L * ky
+
+    K[:, 4, 8] = K[:, 8, 4] = K[:, 8, 10] = K[:, 10, 8] = -6. * L * ky
+    K[:, 4, 10] = K[:, 10, 4] = 2. * L * L * ky * (2. - phiy)
+    K[:, 4, 4] = K[:, 10, 10] = 4. * L * L * ky * (4. + phiy)
+
+    # pin flags; 123456 -> 0-5 (end a), 6-11 (end b)
+    is_free = np.zeros((nelements, 12), dtype='bool')
+    for i, (pai, pbi) in enumerate(zip(pa, pb)):
+        if pai != 0:
+            assert pai > 0
+            for pas in str(pai):
+                is_free[i, int(pas) - 1] = True
+        if pbi != 0:
+            assert pbi > 0
+            for pbs in str(pbi):
+                is_free[i, int(pbs) + 5] = True
+    if is_free.any():
+        is_fixed = ~is_free
+        K *= is_fixed[:, :, np.newaxis] & is_fixed[:, np.newaxis, :]
     return K
 
 def Kbb_to_Kgg(model: BDF, Kbb: NDArrayNNfloat,
@@ -498,25 +463,29 @@ def Kbb_to_Kgg(model: BDF, Kbb: NDArrayNNfloat,
     """does an in-place transformation"""
     assert isinstance(Kbb, (np.ndarray, csc_matrix)), type(Kbb)
     #assert isinstance(Kbb, (np.ndarray, csc_matrix, sci_sparse.dok.dok_matrix)), type(Kbb)
-    if not isinstance(Kbb, np.ndarray):
-        Kbb = Kbb.tolil()
-
     ndof = Kbb.shape[0]
     assert ndof > 0, f'ngrid={ngrid} card_count={model.card_count}'
     nids = model._type_to_id_map['GRID']
+    cd_nodes = [(i, nid) for i, nid in enumerate(nids) if model.nodes[nid].cd]
+
+    is_sparse = not isinstance(Kbb, np.ndarray)
+    if is_sparse and cd_nodes:
+        Kbb = Kbb.tolil()
 
     Kgg = Kbb
     if not inplace:
         Kgg = copy.deepcopy(Kgg)
 
-    for i, nid in enumerate(nids):
+    for i, nid in cd_nodes:
         node = model.nodes[nid]
-        if node.cd:
-            model.log.debug(f'node {nid} has a CD={node.cd}')
-            cd_ref = node.cd_ref
-            T = cd_ref.beta_n(n=2)
-            i1 = i * ndof_per_grid
-            i2 = (i+1) * ndof_per_grid
-            Ki = Kbb[i1:i2, i1:i2]
-            Kgg[i1:i2, i1:i2] = T.T @ Ki @ T
+        model.log.debug(f'node {nid} has a CD={node.cd}')
+        cd_ref = node.cd_ref
+        T = cd_ref.beta_n(n=2)
+        i1 = i * ndof_per_grid
+        i2 = (i+1) * ndof_per_grid
+        Ki = Kbb[i1:i2, i1:i2]
+        Kgg[i1:i2, i1:i2] = T.T @ Ki @ T
+
+    if is_sparse:
+        Kgg = Kgg.tocsc()
     return Kgg
@@ -4,7 +4,7 @@ import copy
 from datetime import date
 from collections import defaultdict
 from itertools import count
-from typing import Union, Any, TYPE_CHECKING
+from typing import Union, Optional, Any, TYPE_CHECKING
 
 import numpy as np
 import scipy as sp
@@ -22,7 +22,7 @@ from pyNastran.f06.tables.oload_resultant import Resultant
 from pyNastran.op2.op2 import OP2
 from pyNastran.op2.op2_interface.op2_classes import (
     RealDisplacementArray, RealSPCForcesArray, RealLoadVectorArray,
-    RealEigenvalues)
+    RealEigenvalues, RealEigenvectorArray)
 from pyNastran.op2.result_objects.grid_point_weight import make_grid_point_weight
 from pyNastran.bdf.mesh_utils.loads import _get_dof_map, get_ndof
 
@@ -32,6 +32,7 @@ from .recover.static_strain import recover_strain_101
 from .recover.strain_energy import recover_strain_energy_101
 from .recover.utils import get_plot_request
 from .build_stiffness import build_Kgg, DOF_MAP, Kbb_to_Kgg
+from .utils import COO_TRIPLETS, add_coo, coo_to_csc
 
 if TYPE_CHECKING:  #  pragma: no cover
     from pyNastran.dev.bdf_vectorized3.types import TextIOLike
@@ -55,6 +56,11 @@ class Solver:
         self.aset = None
         self.sset = None
 
+        # the stiffness matrix and its factorizations are reused by the
+        # subcases; reset by run
+        self._Kgg_cache = {}
+        self._factor_cache = {}
+
         base_name = os.path.splitext(model.bdf_filename)[0]
         self.f06_filename = base_name + '.solver.f06'
         self.op2_filename = base_name + '.solver.op2'
@@ -71,6 +77,8 @@ class Solver:
         }
         model.cross_reference()
         self._update_card_count()
+        self._Kgg_cache = {}
+        self._factor_cache = {}
 
         title = ''
         title = f'pyNastran {pyNastran.__version__}'
@@ -109,6 +117,16 @@ class Solver:
             end_flag = True
             f06_file.write(make_end(end_flag, end_options))
 
+    def _build_Kgg(self, dof_map: DOF_MAP, ndof: int, ngrid: int, ndof_per_grid: int,
+                   fdtype: str='float64') -> csc_matrix:
+        """builds [Kgg], which is shared by the subcases"""
+        key = (ndof, ngrid, ndof_per_grid, fdtype)
+        if key not in self._Kgg_cache:
+            self._Kgg_cache[key] = build_Kgg(self.model, dof_map,
+                                             ndof, ngrid, ndof_per_grid,
+                                             idtype='int32', fdtype=fdtype)
+        return self._Kgg_cache[key]
+
     def _update_card_count(self) -> None:
         for card_type, values in self.model._type_to_id_map.items():
             self.model.card_count[card_type] = len(values)
@@ -453,9 +471,7 @@ class Solver:
         ngrid, ndof_per_grid, ndof = get_ndof(model, subcase)
 
         gset_b = ps_to_sg_set(ndof, ps)
-        Kgg = build_Kgg(model, dof_map,
-                        ndof, ngrid, ndof_per_grid,
-                        idtype='int32', fdtype=fdtype)
+        Kgg = self._build_Kgg(dof_map, ndof, ngrid, ndof_per_grid, fdtype=fdtype)
         Mbb = build_Mbb(model, subcase, dof_map, ndof, fdtype=fdtype)
         #print(self.op2.grid_point_weight)
         reference_point, MO = grid_point_weight(model, Mbb, dof_map, ndof)
@@ -573,7 +589,7 @@ class Solver:
         del x0
 
         #print(Kgg)
-        self.Kgg = Kgg.toarray()
+        self.Kgg = Kgg
         K = partition_matrix(Kgg, [['a', aset], ['s', sset], ['0', set0]])
         Kaa = K['aa']
         Kss = K['ss']
@@ -612,7 +628,8 @@ class Solver:
 
         Fg_oload = Fg.copy()
         if is_aset:
-            xa_, ipositive, inegative = solve(Kaa, Fa_solve, aset, log, idtype=idtype)
+            xa_, ipositive, inegative = solve(Kaa, Fa_solve, aset, log, idtype=idtype,
+                                              factor_cache=self._factor_cache)
             Fa_ = Fa[ipositive]
 
             log.info(f'aset_ = {ipositive}')
@@ -858,46 +875,48 @@ class Solver:
         node_gridtype = _get_node_gridtype(model, idtype=idtype)
         ngrid, ndof_per_grid, ndof = get_ndof(self.model, subcase)
 
-        aset, sset, xa, xs, xg_out, eigenvalues = self._setup_modes(
+        aset, sset, xg_out, eigenvalues, generalized_mass, generalized_stiffness = self._setup_modes(
             model, subcase, dof_map, ndof, ngrid, ndof_per_grid,
             idtype=idtype, fdtype=fdtype)
 
         nmodes = len(eigenvalues)
         isubcase = subcase.id
-        mode_cycles = eigenvalues
-        unused_eigenvalues = RealEigenvalues(title, 'LAMA', nmodes=0)
-        #op2.eigenvalues[title] = eigenvalues
+        radians = np.sqrt(np.abs(eigenvalues))
+        cycles = radians / (2. * np.pi)
+        eigenvalues_obj = RealEigenvalues(title, 'LAMA', nmodes=nmodes)
+        eigenvalues_obj.mode = np.arange(1, nmodes + 1, dtype='int32')
+        eigenvalues_obj.extraction_order = np.arange(1, nmodes + 1, dtype='int32')
+        eigenvalues_obj.eigenvalues = eigenvalues
+        eigenvalues_obj.radians = radians
+        eigenvalues_obj.cycles = cycles
+        eigenvalues_obj.generalized_mass = generalized_mass
+        eigenvalues_obj.generalized_stiffness = generalized_stiffness
+        op2.eigenvalues[title] = eigenvalues_obj
 
         nnodes = node_gridtype.shape[0]
-        data = xg_out.reshape((nmodes, nnodes, 6))
+        data = xg_out.reshape((nmodes, nnodes, 6)).astype('float32')
         table_name = 'OUGV1'
         modes = np.arange(1, nmodes + 1, dtype=idtype)
-        unused_eigenvectors = RealDisplacementArray.add_modal_case(
-            table_name, node_gridtype, data, isubcase, modes, eigenvalues, mode_cycles,
+        eigenvectors = RealEigenvectorArray.add_modal_case(
+            table_name, node_gridtype, data, isubcase, modes,
+            eigenvalues.astype('float32'), cycles,
             is_sort1=True, is_random=False, is_msc=True, random_code=0,
             title=title, subtitle=subtitle, label=label)
-        #op2.eigenvectors[isubcase] = eigenvectors
+        eigenvectors.nonlinear_factor = 1
+        op2.eigenvectors[isubcase] = eigenvectors
 
         write_f06 = True
         if write_f06:
-            str(page_num)
-            #page_num = eigenvectors.write_f06(
-                #f06_file, header=None,
-                #page_stamp=page_stamp, page_num=page_num,
-                #is_mag_phase=False, is_sort1=True)
-            #f06_file.write('\n')
-        #fspc = Ksa @ xa + Kss @ xs
-        #Fs[ipositive] = Fsi
-
-        #Fg[aset] = Fa
-        #Fg[sset] = fspc
-        #log.debug(f'xa = {xa}')
-        #log.debug(f'Fs = {Fs}')
-        #log.debug(f'xg = {xg}')
-        #log.debug(f'Fg = {Fg}')
+            page_num = eigenvalues_obj.write_f06(
+                f06_file, header=[],
+                page_stamp=page_stamp, page_num=page_num)
+            f06_file.write('\n')
+            page_num = eigenvectors.write_f06(
+                f06_file, header=None,
+                page_stamp=page_stamp, page_num=page_num,
+                is_mag_phase=False, is_sort1=True)
+            f06_file.write('\n')
 
-        str(f06_file)
-        str(page_stamp)
         op2.write_op2(self.op2_filename, post=-1, endian=b'<', skips=None, nastran_format='nx')
         return end_options
         #raise NotImplementedError(subcase)
@@ -910,87 +929,61 @@ class Solver:
                      ndof_per_grid: int,
                      idtype: str='int32',
                      fdtype: str='float64'):
-        Kgg = build_Kgg(model, dof_map,
-                        ndof, ngrid,
-                        ndof_per_grid,
-                        idtype=idtype, fdtype=fdtype)
+        """
+        Solves [Kaa]{φ} = λ[Maa]{φ} for the modes of the METHOD
+
+        Returns
+        -------
+        aset : (naset, ) int ndarray
+            the a-set dofs
+        sset : (nsset, ) int ndarray
+            the s-set (SPC) dofs
+        xg_out : (nmodes, ndof) float ndarray
+            the mode shapes; the SPC'd and AUTOSPC'd dofs are 0
+        eigenvalues : (nmodes, ) float ndarray
+            the eigenvalues (ω^2) sorted in ascending order
+        generalized_mass : (nmodes, ) float ndarray
+            {φ}^T[Maa]{φ}
+        generalized_stiffness : (nmodes, ) float ndarray
+            {φ}^T[Kaa]{φ}
+
+        """
+        Kgg = self._build_Kgg(dof_map, ndof, ngrid, ndof_per_grid, fdtype=fdtype)
 
         Mbb = build_Mbb(model, subcase, dof_map, ndof, fdtype=fdtype)
         Mgg = Kbb_to_Kgg(model, Mbb, ngrid, ndof_per_grid)
         del Mbb
 
         gset = np.arange(ndof, dtype=idtype)
-        sset, sset_b, xg = self.build_xg(dof_map, ndof, subcase)
+        sset, unused_sset_b, unused_xg = self.build_xg(dof_map, ndof, subcase)
         aset = np.setdiff1d(gset, sset) # a = g-s
 
         # aset - analysis set
         # sset - SPC set
-        xa, xs = partition_vector2(xg, [['a', aset], ['s', sset]])
-        del xg
-        #print(f'xa = {xa}')
-        #print(f'xs = {xs}')
-        #print(Kgg)
-        M = partition_matrix(Mgg, [['a', aset], ['s', sset]])
-        Maa = M['aa']
-
-        K = partition_matrix(Kgg, [['a', aset], ['s', sset]])
-        Kaa = K['aa']
-        #Kss = K['ss']
-        #Kas = K['as']
-        #Ksa = K['sa']
-
-        #[Kaa]{xa} + [Kas]{xs} = {Fa}
-        #[Ksa]{xa} + [Kss]{xs} = {Fs}
-
-        #{xa} = [Kaa]^-1 * ({Fa} - [Kas]{xs})
-        #{Fs} = [Ksa]{xa} + [Kss]{xs}
+        Maa = Mgg[aset, :][:, aset]
+        Kaa = Kgg[aset, :][:, aset]
 
         # TODO: apply AUTOSPCs correctly
-        #print(Kaa)
-        #print(Kas)
-        #print(Kss)
-        #Maa_, ipositive, inegative, unused_sz_set = remove_rows(Maa, aset)
         Kaa_, ipositive, unused_inegative, unused_sz_set = remove_rows(Kaa, aset)
         Maa_ = Maa[ipositive, :][:, ipositive]
-        #Fs = np.zeros(ndof, dtype=fdtype)
-        #print(f'Fg = {Fg}')
-        #print(f'Fa = {Fa}')
-        #print(f'Fs = {Fs}')
-        #Fa_ = Fa[ipositive]
-        # [A]{x} = {b}
-        # [Kaa]{x} = {F}
-        # {x} = [Kaa][F]
-        #print(f'Kaa:\n{Kaa}')
-        #print(f'Fa: {Fa}')
-
-        #print(f'Kaa_:\n{Kaa_}')
-        #print(f'Fa_: {Fa_}')
-        #na = Kaa_.shape[0]
-        ndof_ = Kaa_.shape[0]
-        neigenvalues = 10
-        if ndof_ < neigenvalues:
-            eigenvalues, xa_ = sp.linalg.eigh(Kaa_.toarray(), Maa_)
-        else:
-            #If M is specified, solves ``A * x[i] = w[i] * M * x[i]``
-            eigenvalues, xa_ = sp.sparse.linalg.eigsh(
-                Kaa_, k=neigenvalues, M=Maa_,
-                sigma=None, which='LM', v0=None, ncv=None, maxiter=None, tol=0,
-                return_eigenvectors=True, Minv=None, OPinv=None, mode='normal')
+
+        method_id, unused_options = subcase['METHOD']
+        method = model.methods[method_id]
+
+        # the factorization only depends on the a-set (and the AUTOSPC'd dofs)
+        key = aset.tobytes() + b'|' + ipositive.tobytes()
+        eigenvalues, xa_ = solve_modes(Kaa_, Maa_, method, model.log,
+                                       factor_cache=self._factor_cache, key=key)
         nmodes = len(eigenvalues)
         model.log.debug(f'eigenvalues = {eigenvalues}')
-        #print(f'xa_ = {xa_} {xa_.shape}')
-        #xa2 = xa_.reshape(nmodes, na, na)
-
-        xg_out = np.full((nmodes, ndof), np.nan, dtype=fdtype)
-        xa_out = np.full((nmodes, len(xa)), np.nan, dtype=fdtype)
-        #xa[ipositive] = xa_
-        xa_out[:, ipositive] = xa_
-        xg = np.arange(ndof, dtype=fdtype)
-        #xg[aset] = xa
-        #xg[sset] = xs
-        xg_out[:, aset] = xa
-        xg_out[:, sset] = xs
-        return aset, sset, xa, xs, xg_out, eigenvalues
+
+        # {φ}^T[M]{φ} without densifying the matrices
+        generalized_mass = np.einsum('ij,ij->j', xa_, Maa_ @ xa_)
+        generalized_stiffness = np.einsum('ij,ij->j', xa_, Kaa_ @ xa_)
+
+        xg_out = np.zeros((nmodes, ndof), dtype=fdtype)
+        xg_out[:, aset[ipositive]] = xa_.T
+        return aset, sset, xg_out, eigenvalues, generalized_mass, generalized_stiffness
 
     #end_options = runner(
         #subcase, f06_file, page_stamp,
@@ -1047,8 +1040,9 @@ class Solver:
         node_gridtype = _get_node_gridtype(model, idtype=idtype)
         ngrid, ndof_per_grid, ndof = get_ndof(self.model, subcase)
 
-        aset, sset, xa, xs, eigenvalues = self._setup_modes(
-            model, dof_map, ndof, ngrid, ndof_per_grid, fdtype)
+        aset, sset, xg_out, eigenvalues, unused_mgen, unused_kgen = self._setup_modes(
+            model, subcase, dof_map, ndof, ngrid, ndof_per_grid,
+            idtype=idtype, fdtype=fdtype)
 
         isubcase = subcase.id
         mode_cycles = eigenvalues
@@ -1556,8 +1550,28 @@ def write_oload(Fb: NDArrayNfloat,
     page_num = oload.write_f06(f06_file, page_stamp, page_num)
     return page_num + 1
 
-def solve(Kaa, Fa_solve, aset, log, idtype='int32'):
-    """solves [K]{u} = {F}"""
+def solve(Kaa, Fa_solve, aset, log, idtype='int32',
+          factor_cache: Optional[dict[bytes, Any]]=None):
+    """
+    solves [K]{u} = {F}
+
+    Parameters
+    ----------
+    Kaa : (naset, naset) csc_matrix
+        the a-set stiffness matrix
+    Fa_solve : (naset, ) or (naset, nloads) float ndarray
+        the a-set load vector(s)
+    aset : (naset, ) int ndarray
+        the a-set dofs
+    log : SimpleLogger
+        the logger
+    idtype : str; default='int32'
+        the int type
+    factor_cache : dict[bytes, SuperLU]; default=None
+        the LU factorizations of [Kaa] for each a-set; reused for the
+        other load vectors (e.g., subcases) that use the same [Kaa]
+
+    """
     log.info("starting solve")
     Kaa_, ipositive, inegative, unused_sz_set = remove_rows(Kaa, aset, idtype=idtype)
 
@@ -1584,29 +1598,164 @@ def solve(Kaa, Fa_solve, aset, log, idtype='int32'):
     #print(f'Kaa:\n{Kaa}')
     #print(f'Fa: {Fa}')
 
-    log.debug(f'  Kaas_:\n{Kaa_.toarray()}')
     log.debug(f'  Kaa_:\n{Kaa_}')
     log.debug(f'  Fa_: {Fa_}')
-    xa_ = np.linalg.solve(Kaa_.toarray(), Fa_)
-    xas_ = sci_sparse.linalg.spsolve(Kaa_, Fa_)
-    #xas_ = np.linalg.solve(Kaas_.toarray(), Fa_)
-    sparse_error = np.linalg.norm(xa_ - xas_)
-    if sparse_error > 1e-12:
-        log.warning(f'  sparse_error = {sparse_error}')
+
+    # the factorization only depends on the a-set (and the AUTOSPC'd dofs)
+    key = np.asarray(aset).tobytes() + b'|' + ipositive.tobytes()
+    if factor_cache is not None and key in factor_cache:
+        log.debug('  reusing the factorization of Kaa_')
+        lu = factor_cache[key]
+    else:
+        lu = sci_sparse.linalg.splu(csc_matrix(Kaa_))
+        if factor_cache is not None:
+            factor_cache[key] = lu
+    xas_ = lu.solve(np.asarray(Fa_, dtype='float64'))
     log.info("finished solve")
     return xas_, ipositive, inegative
 
+#: the number of roots that are found when EIGRL ND and V2 are blank
+DEFAULT_NROOTS = 10
+
+#: the a-set size where the dense eigensolver is used
+MAX_DENSE_NDOF = 20
+
+def _get_eigenvalue_range(method) -> tuple[Optional[float], Optional[float],
+                                           Optional[int], str]:
+    """
+    Gets the eigenvalue range (λ=ω^2) of an EIGRL/EIGR
+
+    Returns
+    -------
+    lambda1 / lambda2 : float / None
+        the lower/upper eigenvalue; None if blank
+    nroots : int / None
+        the number of roots; None if blank
+    norm : str
+        the eigenvector normalization (MASS, MAX)
+
+    """
+    if method.type == 'EIGRL':
+        f1, f2, nroots, norm = method.v1, method.v2, method.nd, method.norm
+    elif method.type == 'EIGR':
+        f1, f2, nroots, norm = method.f1, method.f2, method.nd, method.norm
+    else:
+        raise NotImplementedError(method.get_stats())
+    lambda1 = None if f1 is None else (2 * np.pi * f1) ** 2
+    lambda2 = None if f2 is None else (2 * np.pi * f2) ** 2
+    if norm is None or norm == 'AF':
+        norm = 'MASS'
+    return lambda1, lambda2, nroots, norm
+
+def solve_modes(Kaa: csc_matrix, Maa: csc_matrix, method, log,
+                factor_cache: Optional[dict[bytes, Any]]=None,
+                key: bytes=b'') -> tuple[NDArrayNfloat, NDArrayNNfloat]:
+    """
+    solves [K]{φ} = λ[M]{φ} using the shift-invert Lanczos method
+
+    The shift is the lower bound of the EIGRL (V1) and [K] - σ[M] is
+    factored once.  If ND is blank, the number of roots is increased
+    until the upper bound (V2) is found.
+
+    Parameters
+    ----------
+    Kaa / Maa : (naset, naset) csc_matrix
+        the a-set stiffness/mass matrices (without the AUTOSPC'd dofs)
+    method : EIGRL / EIGR
+        the eigenvalue method (V1, V2, ND, NORM)
+    log : SimpleLogger
+        the logger
+    factor_cache : dict[bytes, SuperLU]; default=None
+        the LU factorizations of [K] - σ[M]; reused by the subcases
+    key : bytes; default=b''
+        the cache key of [Kaa]/[Maa] (e.g., the a-set)
+
+    Returns
+    -------
+    eigenvalues : (nmodes, ) float ndarray
+        the eigenvalues (ω^2) in ascending order
+    xa : (naset, nmodes) float ndarray
+        the normalized eigenvectors
+
+    """
+    lambda1, lambda2, nroots, norm = _get_eigenvalue_range(method)
+    ndof = Kaa.shape[0]
+    if ndof == 0:
+        raise RuntimeError('no residual structure found')
+
+    if ndof <= MAX_DENSE_NDOF:
+        eigenvalues, xa = sp.linalg.eigh(Kaa.toarray(), Maa.toarray())
+    else:
+        # shift below the lowest root, so the rigid body modes of a
+        # free-free model don't make [K] - σ[M] singular
+        sigma = -1.0 if lambda1 is None or lambda1 <= 0. else lambda1
+        keyi = key + b'|sigma=' + np.float64(sigma).tobytes()
+        if factor_cache is not None and keyi in factor_cache:
+            log.debug('  reusing the factorization of Kaa - sigma*Maa')
+            lu = factor_cache[keyi]
+        else:
+            lu = sci_sparse.linalg.splu(csc_matrix(Kaa - sigma * Maa))
+            if factor_cache is not None:
+                factor_cache[keyi] = lu
+        OPinv = sci_sparse.linalg.LinearOperator(
+            (ndof, ndof), matvec=lu.solve, dtype='float64')
+
+        kmax = ndof - 1
+        k = min(kmax, DEFAULT_NROOTS if nroots is None else nroots)
+        while 1:
+            eigenvalues, xa = sci_sparse.linalg.eigsh(
+                Kaa, k=k, M=Maa, sigma=sigma, which='LM', OPinv=OPinv)
+            is_all_roots = (nroots is not None or lambda2 is None or
+                            k == kmax or eigenvalues.max() > lambda2)
+            if is_all_roots:
+                break
+            k = min(kmax, 2 * k)
+        log.debug(f'  found {k} roots with sigma={sigma}')
+
+    isort = np.argsort(eigenvalues)
+    eigenvalues = eigenvalues[isort]
+    xa = xa[:, isort]
+    is_valid = np.ones(len(eigenvalues), dtype='bool')
+    if lambda1 is not None:
+        is_valid &= (eigenvalues >= lambda1)
+    if lambda2 is not None:
+        is_valid &= (eigenvalues <= lambda2)
+    eigenvalues = eigenvalues[is_valid][:nroots]
+    xa = xa[:, is_valid][:, :nroots]
+
+    if norm == 'MAX':
+        imax = np.abs(xa).argmax(axis=0)
+        xa = xa / xa[imax, np.arange(xa.shape[1])]
+    else:
+        generalized_mass = np.einsum('ij,ij->j', xa, Maa @ xa)
+        xa = xa / np.sqrt(generalized_mass)
+    return eigenvalues, xa
+
 def build_Mbb(model: BDF,
               subcase: Subcase,
               dof_map: DOF_MAP,
-              ndof: int, fdtype='float64') -> NDArrayNNfloat:
-    """builds the mass matrix in the basic frame, [Mbb]"""
+              ndof: int, fdtype='float64') -> csc_matrix:
+    """
+    builds the mass matrix in the basic frame, [Mbb]
+
+    The element mass matrices are stored as (rows, cols, values), which
+    are summed into a csc_matrix once.
+    """
     log = model.log
     log.info('starting build_Mbb')
     wtmass = model.get_param('WTMASS', 1.0)
-    #Mbb = np.eye(ndof, dtype=fdtype)
-    Mbb = np.zeros((ndof, ndof), dtype=fdtype)
-    #Mbb = np.eye(ndof, dtype='int32')
+    Mbb: COO_TRIPLETS = []
+
+    # the CONMx 6x6 mass matrices
+    conm_dofs = []
+    conm_mass_matrices = []
+
+    # the element dofs and masses, which are added by element type
+    #   rod : CROD, CONROD, CTUBE, CBAR, CBEAM
+    #   tri : CTRIA3
+    #   quad : CQUAD4
+    element_dofs = defaultdict(list)
+    element_masses = defaultdict(list)
     str(model)
     str(subcase)
     no_mass = {
@@ -1669,7 +1818,8 @@ def build_Mbb(model: BDF,
             else:  # pragma: no cover
                 print(elem.get_stats())
                 raise NotImplementedError(elem)
-            Mbb[i1:i1+6, i1:i1+6] += elem.mass_matrix
+            conm_dofs.append(np.arange(i1, i1 + 6))
+            conm_mass_matrices.append(elem.mass_matrix)
 
         if etype == 'CONM2':
             mass = elem.Mass()
@@ -1709,11 +1859,12 @@ def build_Mbb(model: BDF,
                 #[mass * X3, 41, -mass * X1,       -I21 - mass * X2 * X1,                   I22 + mass * X1 * X1 + mass * X3 * X3, -I32 - mass * X3 * X2]
                 #[-mass * X2, mass * X1, 52,       -I31 - mass * X3 * X1,                  -I32 - mass * X3 * X2,                   I33 + mass * X2 * X2 + mass * X1 * X1]
 
-                Mbb[i1:i1+3, i1:i1+3] += eye3 * mass
-                Mbb[i1:i1+3, i1+3:i1+6] += mx
-                Mbb[i1+3:i1+6, i1:i1+3] += mx.T
+                conm_dofs.append(np.arange(i1, i1 + 6))
+                conm_mass_matrices.append(np.block([
+                    [eye3 * mass, mx],
+                    [mx.T, I],
+                ]))
                 mass_total += mass
-                Mbb[i1+3:i1+6, i1+3:i1+6] += I
             else:  # pragma: no cover
                 print(elem.get_stats())
                 raise NotImplementedError(elem)
@@ -1747,8 +1898,8 @@ def build_Mbb(model: BDF,
 
             #Mbb[i1, j1] = Mbb[j1, i1] = \
             #Mbb[i1+1, j1+1] = Mbb[j1+1, i1+1] = mass / 6
-            iii, jjj = np.meshgrid(ii, ii)
-            Mbb[iii, jjj] += mass_rod_2x2 * mass
+            element_dofs['rod'].append(ii)
+            element_masses['rod'].append(mass)
             #ii = [i1, i1 + 1, j1, j1 + 1]
             #print(Mbb[ii, :][:, ii])
         elif etype in ['CBAR', 'CBEAM']:
@@ -1769,8 +1920,8 @@ def build_Mbb(model: BDF,
             #Mbb[i1+1, j1+1] = Mbb[j1+1, i1+1] = mass / 6
             ii = [i1, i1 + 1,
                   j1, j1 + 1]
-            iii, jjj = np.meshgrid(ii, ii)
-            Mbb[iii, jjj] += mass_rod_2x2 * mass
+            element_dofs['rod'].append(ii)
+            element_masses['rod'].append(mass)
         elif etype == 'CTRIA3':
             # TODO: verify
             # TODO: add rotary inertia
@@ -1784,8 +1935,8 @@ def build_Mbb(model: BDF,
                 i2, i2 + 1,
                 i3, i3 + 1,
             ]
-            iii, jjj = np.meshgrid(ii, ii)
-            Mbb[iii, jjj] += mass_tri * mass
+            element_dofs['tri'].append(ii)
+            element_masses['tri'].append(mass)
             #Mbb[i1, i1] = Mbb[i1+1, i1+1] = Mbb[i1+2, i1+2] = \
             #Mbb[i2, i2] = Mbb[i2+1, i2+1] = Mbb[i2+2, i2+2] = \
             #Mbb[i3, i3] = Mbb[i3+1, i3+1] = Mbb[i3+2, i3+2] = mass / 3
@@ -1827,8 +1978,8 @@ def build_Mbb(model: BDF,
                 i3, i3 + 1,
                 i4, i4 + 1,
             ]
-            iii, jjj = np.meshgrid(ii, ii)
-            Mbb[iii, jjj] += mass_quad_2x2 * mass
+            element_dofs['quad'].append(ii)
+            element_masses['quad'].append(mass)
             #if 0:  # pragma: no cover
                 #mass4 = mass / 9. # 4/36
                 #mass2 = mass / 18. # 2/36
@@ -1885,6 +2036,17 @@ def build_Mbb(model: BDF,
             print(elem.get_stats())
             raise NotImplementedError(elem)
 
+    if conm_dofs:
+        add_coo(Mbb, np.array(conm_dofs, dtype='int32'),
+                np.array(conm_mass_matrices, dtype=fdtype))
+    for name, mass_matrix in [('rod', mass_rod_2x2), ('tri', mass_tri), ('quad', mass_quad_2x2)]:
+        if name not in element_dofs:
+            continue
+        masses = np.array(element_masses[name], dtype=fdtype)
+        add_coo(Mbb, np.array(element_dofs[name], dtype='int32'),
+                masses[:, np.newaxis, np.newaxis] * mass_matrix)
+    Mbb = coo_to_csc(Mbb, ndof, fdtype=fdtype)
+
     if wtmass != 1.0:
         Mbb *= wtmass
 
@@ -1901,10 +2063,10 @@ def build_Mbb(model: BDF,
         #print(f'is_all_grids={is_all_grids} has_mass={has_mass}; can_dof_slice={can_dof_slice} Mbb.shape={Mbb.shape}')
         i = np.arange(0, ndof).reshape(ndof//6, 6)[:, :3].ravel()
         #print(Mbb[i, i])
-        massi = Mbb[i, i].sum()
+        massi = Mbb.diagonal()[i].sum()
         log.info(f'finished build_Mbb; M={massi:.6g}; mass_total={mass_total:.6g}')
     else:
-        Mbb = np.eye(ndof, dtype=fdtype)
+        Mbb = sci_sparse.identity(ndof, dtype=fdtype, format='csc')
         log.error(f'finished build_Mbb; faking mass; M={Mbb.sum()} ndof={ndof}')
     return Mbb
 
@@ -1963,7 +2125,7 @@ def grid_point_weight(model: BDF, Mbb, dof_map: DOF_MAP, ndof: int):
     #print(f'Mbb.shape = {Mbb.shape}')
     #print(f'D.shape = {D.shape}')
     #print(f'D.T =\n{D.T}')
-    M0 = D.T @ Mbb @ D
+    M0 = D.T @ (Mbb @ D)
     return reference_point, M0
 
 def dof_map_to_tr_set(dof_map, ndof: int) -> tuple[NDArrayNbool, NDArrayNbool]:
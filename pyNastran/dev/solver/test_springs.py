@@ -254,6 +254,123 @@ class TestSolverRod(unittest.TestCase):
         #with self.assertRaises(RuntimeError):
         solver.run()
 
+    def test_crod_subcases(self):
+        """Tests a CROD/PROD with 2 subcases that share the factorization"""
+        log = SimpleLogger(level='warning', encoding='utf-8')
+        model = BDF(log=log, mode='msc')
+        model.bdf_filename = TEST_DIR / 'crod_subcases.bdf'
+        L = 2.
+        model.add_grid(1, [0., 0., 0.])
+        model.add_grid(2, [L, 0., 0.])
+        nids = [1, 2]
+        eid = 1
+        pid = 2
+        mid = 3
+        E = 3.0e7
+        G = None
+        nu = 0.3
+        model.add_mat1(mid, E, G, nu, rho=0.1, a=0.0, tref=0.0, ge=0.0, St=0.0,
+                       Sc=0.0, Ss=0.0, mcsid=0)
+        A = 1.0
+        J = 2.0
+        model.add_crod(eid, pid, nids)
+        model.add_prod(pid, mid, A=A, j=J, c=0., nsm=0.)
+
+        spc_id = 3
+        nid = 2
+        mag_axial = 10.
+        model.add_force(2, nid, mag_axial, [1., 0., 0.], cid=0)
+
+        mag_torsion = 20.
+        model.add_force(4, nid, mag_axial, [1., 0., 0.], cid=0)
+        model.add_moment(4, nid, mag_torsion, [1., 0., 0.], cid=0)
+
+        components = 123456
+        nodes = 1
+        model.add_spc1(spc_id, components, nodes, comment='')
+        setup_case_control(model, extra_case_lines=[
+            'SUBCASE 2',
+            '  LOAD = 4',
+            '  SPC = 3',
+        ])
+        solver = Solver(model)
+        solver.run()
+
+        # the stiffness matrix is only factored once
+        assert len(solver._factor_cache) == 1, solver._factor_cache
+
+        G = E / (2 * (1 + nu))
+        kaxial = A * E / L
+        ktorsion = G * J / L
+        daxial = mag_axial / kaxial
+        dtorsion = mag_torsion / ktorsion
+        assert np.allclose(solver.xg[6], daxial), f'daxial={daxial} xg={solver.xg}'
+        assert np.allclose(solver.xg[9], dtorsion), f'dtorsion={dtorsion} xg={solver.xg}'
+        os.remove(solver.f06_filename)
+        os.remove(solver.op2_filename)
+
+    def test_crod_modes(self):
+        """Tests the axial modes of a chain of CRODs/CONM2s"""
+        log = SimpleLogger(level='warning', encoding='utf-8')
+        model = BDF(log=log, mode='msc')
+        model.bdf_filename = TEST_DIR / 'crod_modes.bdf'
+        nelements = 40
+        pid = 2
+        mid = 3
+        E = 3.0e7
+        mass = 2.0
+        model.add_mat1(mid, E, None, 0.3, rho=0.0)
+        model.add_prod(pid, mid, A=1.0, j=0.)
+        model.add_grid(1, [0., 0., 0.])
+        for eid in range(1, nelements + 1):
+            nid = eid + 1
+            model.add_grid(nid, [float(eid), 0., 0.])
+            model.add_crod(eid, pid, [eid, nid])
+            model.add_conm2(100 + nid, nid, mass=mass)
+
+        spc_id = 3
+        model.add_spc1(spc_id, 123456, [1])
+        model.add_spc1(spc_id, 23456, list(range(2, nelements + 2)))
+        model.add_eigrl(10, nd=5)
+        model.add_eigrl(11, v2=1000.)
+
+        lines = [
+            'DISP(PLOT,PRINT) = ALL',
+            'SPC = 3',
+            'SUBCASE 1',
+            '  METHOD = 10',
+            'SUBCASE 2',
+            '  METHOD = 11',
+        ]
+        model.case_control_deck = CaseControlDeck(lines, log=model.log)
+        model.sol = 103
+        solver = Solver(model)
+        solver.run()
+
+        # a fixed-free chain of springs
+        k = E / 1.
+        imode = np.arange(1, nelements + 1)
+        eigenvalues_expected = 4 * k / mass * np.sin(
+            (2 * imode - 1) * np.pi / (2 * (2 * nelements + 1))) ** 2
+
+        # both subcases have the same shift
+        assert len(solver._factor_cache) == 1, solver._factor_cache
+
+        eigenvectors1 = solver.op2.eigenvectors[1]
+        assert eigenvectors1.data.shape == (5, nelements + 1, 6), eigenvectors1.data.shape
+        assert np.allclose(eigenvectors1.eigns, eigenvalues_expected[:5])
+
+        # the second subcase has all the roots below V2
+        nmodes2 = (eigenvalues_expected <= (2 * np.pi * 1000.) ** 2).sum()
+        eigenvectors2 = solver.op2.eigenvectors[2]
+        # the eigenvalues are stored by title, so the last subcase is kept
+        eigenvalues2 = list(solver.op2.eigenvalues.values())[-1]
+        assert eigenvectors2.data.shape[0] == nmodes2, eigenvectors2.data.shape
+        assert np.allclose(eigenvalues2.eigenvalues, eigenvalues_expected[:nmodes2])
+        assert np.allclose(eigenvalues2.generalized_mass, 1.)
+        os.remove(solver.f06_filename)
+        os.remove(solver.op2_filename)
+
     def test_crod_torsion(self):
         """Tests a CROD/PROD"""
         log = SimpleLogger(level='warning', encoding='utf-8')
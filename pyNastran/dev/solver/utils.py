@@ -1,6 +1,7 @@
 from __future__ import annotations
 from typing import Any, TYPE_CHECKING
 import numpy as np
+from scipy.sparse import coo_matrix, csc_matrix
 
 if TYPE_CHECKING:  # pragma: no cover
     from pyNastran.bdf.bdf import BDF
@@ -9,6 +10,53 @@ if TYPE_CHECKING:  # pragma: no cover
 
 DOF_MAP = dict[tuple[int, int], int]
 
+#: the (rows, cols, values) of the element matrices (e.g., Kbb, Mbb)
+#: that are summed into a sparse matrix with coo_to_csc
+COO_TRIPLETS = list[tuple[np.ndarray, np.ndarray, np.ndarray]]
+
+def add_coo(coo: COO_TRIPLETS, n_ijv: np.ndarray, K: np.ndarray) -> None:
+    """
+    Adds a batch of element matrices
+
+    Parameters
+    ----------
+    coo : COO_TRIPLETS
+        the (rows, cols, values) that are appended to
+    n_ijv : (nelements, ndof) int ndarray
+        the global dofs of each element
+    K : (nelements, ndof, ndof) float ndarray
+        the element matrices
+
+    """
+    nelements, ndof = n_ijv.shape
+    assert K.shape == (nelements, ndof, ndof), f'K.shape={K.shape} n_ijv.shape={n_ijv.shape}'
+    rows = np.repeat(n_ijv, ndof, axis=1).ravel()
+    cols = np.tile(n_ijv, (1, ndof)).ravel()
+    values = K.ravel()
+    is_nonzero = (values != 0.)
+    coo.append((rows[is_nonzero], cols[is_nonzero], values[is_nonzero]))
+
+def coo_to_csc(coo: COO_TRIPLETS, ndof: int, fdtype: str='float64') -> csc_matrix:
+    """sums the element matrices into an (ndof, ndof) csc_matrix"""
+    if coo:
+        rows = np.hstack([rowsi for rowsi, unused_colsi, unused_valuesi in coo])
+        cols = np.hstack([colsi for unused_rowsi, colsi, unused_valuesi in coo])
+        values = np.hstack([valuesi for unused_rowsi, unused_colsi, valuesi in coo])
+    else:
+        rows = cols = np.zeros(0, dtype='int32')
+        values = np.zeros(0, dtype=fdtype)
+    matrix = coo_matrix((values.astype(fdtype, copy=False), (rows, cols)),
+                        shape=(ndof, ndof)).tocsc()
+    matrix.eliminate_zeros()
+    return matrix
+
+def get_dofs(dof_map: DOF_MAP, nids: np.ndarray, component: int,
+             idtype: str='int32') -> np.ndarray:
+    """gets the index of (nid, component) for an array of node ids"""
+    dofs = np.array([dof_map[(nid, component)] for nid in nids.ravel().tolist()],
+                    dtype=idtype)
+    return dofs.reshape(nids.shape)
+
 def get_ieids_eids(model: BDF, etype: str, eids_str,
                    idtype: str='int32') -> tuple[int, Any, Any, Any]:
     """helper for the stress/strain/force/displacment recovery"""
@@ -1,6 +1,15 @@
+import re
+from typing import TextIO
+
 import numpy as np
 from pyNastran.utils import object_attributes
 
+#: the number of rows that are formatted at once by write_f06_rows
+F06_CHUNK_SIZE = 100_000
+
+#: below this number of values/rows, the python string formatting is faster
+F06_MIN_ARRAY_SIZE = 200
+
 
 def write_float_10e(val: float) -> str:
     v2 = '%10.3E' % val
@@ -92,6 +101,368 @@ def write_floats_13e_long(vals: list[float]) -> list[str]:
     return vals2
 
 
+def write_floats_13e_array(vals: np.ndarray) -> np.ndarray:
+    """
+    writes an array of Nastran formatted 13.6 floats
+
+    The mantissa digits and exponents are calculated as arrays, so this
+    is much faster than write_floats_13e for a large number of values.
+
+    Parameters
+    ----------
+    vals : (n, ...) float ndarray
+        the values to write
+
+    Returns
+    -------
+    vals2 : (n, ...) bytes ndarray
+        the strings; same as write_floats_13e (e.g., b' 1.000000E+00',
+        b' 0.0'), which can be passed to write_f06_rows
+
+    """
+    vals = np.asarray(vals, dtype='float64')
+    shape = vals.shape
+    vals = vals.ravel()
+    if len(vals) < F06_MIN_ARRAY_SIZE:
+        vals2 = np.array(write_floats_13e(vals.tolist()), dtype='S')
+        return vals2.astype(f'S{max(13, vals2.dtype.itemsize)}').reshape(shape)
+
+    is_zero = (vals == 0.)
+    is_finite = np.isfinite(vals)
+    abs_vals = np.where(is_zero | ~is_finite, 1., np.abs(vals))
+
+    exponent = np.floor(np.log10(abs_vals)).astype('int64')
+    with np.errstate(all='ignore'):
+        # 1.234567E+00 -> 1234567
+        mantissa = _scale_by_power10(abs_vals, 6 - exponent)
+        is_tie = _is_tie(mantissa)
+        ishift = np.flatnonzero((mantissa >= 9999999.5) | (mantissa < 999999.5))
+        if len(ishift):
+            exponent[ishift] += np.where(mantissa[ishift] >= 9999999.5, 1, -1)
+            mantissa[ishift] = _scale_by_power10(abs_vals[ishift], 6 - exponent[ishift])
+            is_tie[ishift] |= _is_tie(mantissa[ishift])
+
+    # a (near) tie or a 3 digit exponent is written by python
+    is_python = ~is_finite | is_tie | (np.abs(exponent) >= 100)
+    mantissa[is_python] = 0.
+    exponent[is_python] = 0
+    mantissa = np.rint(mantissa).astype('uint32')
+    abs_exponent = np.abs(exponent)
+
+    chars = np.empty((len(vals), 13), dtype='uint8')
+    chars[:, 0] = np.where(vals < 0., np.uint8(ord('-')), np.uint8(ord(' ')))
+    chars[:, 1] = mantissa // 1000000 + 48
+    chars[:, 2] = ord('.')
+    mantissa %= 1000000
+    chars[:, 3:5] = _get_digits2(mantissa // 10000)
+    chars[:, 5:7] = _get_digits2(mantissa // 100 % 100)
+    chars[:, 7:9] = _get_digits2(mantissa % 100)
+    chars[:, 9] = ord('E')
+    chars[:, 10] = np.where(exponent < 0, np.uint8(ord('-')), np.uint8(ord('+')))
+    chars[:, 11:13] = _get_digits2(abs_exponent)
+    chars[is_zero] = np.frombuffer(b' 0.0'.ljust(13, b'\x00'), dtype='uint8')
+
+    vals2 = chars.view('S13').ravel()
+    ipython = np.flatnonzero(is_python)
+    if len(ipython):
+        svals = np.array(['%13.6E' % val for val in vals[ipython].tolist()], dtype='S')
+        vals2 = vals2.astype(f'S{max(13, svals.dtype.itemsize)}')
+        vals2[ipython] = svals
+    return vals2.reshape(shape)
+
+
+def write_f06_rows(f06_file: TextIO, fmt: str, columns: list[np.ndarray]) -> None:
+    """
+    Writes a table with a single string format for all the rows
+
+    This is the same as:
+        for row in zip(*columns):
+            f06_file.write(fmt % row)
+    but each field is rendered for all the rows at once into a block of
+    fixed-width text.  The format may use %s, %i, %d and %f with the
+    flag '-', a width and a precision (e.g., '%-13s', '%8i', '%8.4f');
+    '%.0s' skips a column.
+
+    Parameters
+    ----------
+    f06_file : file
+        the file object
+    fmt : str
+        the format of a row
+    columns : list[(nrows, ) ndarray]
+        the values of each field (e.g., the element ids, the strings
+        from write_floats_13e_array)
+
+    """
+    nrows = len(columns[0])
+    if nrows < F06_MIN_ARRAY_SIZE:
+        for row in zip(*_columns_to_lists(columns)):
+            f06_file.write(fmt % row)
+        return
+
+    for i0 in range(0, nrows, F06_CHUNK_SIZE):
+        columnsi = [np.asarray(column[i0:i0 + F06_CHUNK_SIZE]) for column in columns]
+        f06_file.write(_chars_to_str(_render_rows(fmt, columnsi)))
+
+
+def write_f06_rows_by_format(f06_file: TextIO, fmts: list[str], ifmt: np.ndarray,
+                             columns: list[np.ndarray]) -> None:
+    """
+    Writes a table where the format of a row is fmts[ifmt[irow]]
+
+    Each format takes all the columns, so a field that isn't written
+    is consumed with '%.0s' (or '%8.0s' for a blank 8 character field).
+    See write_f06_rows for the supported formats.
+
+    Parameters
+    ----------
+    f06_file : file
+        the file object
+    fmts : list[str]
+        the formats of the rows
+    ifmt : (nrows, ) int ndarray
+        the index into fmts for each row
+    columns : list[(nrows, ) ndarray]
+        the values of each field
+
+    """
+    nrows = len(ifmt)
+    if nrows < F06_MIN_ARRAY_SIZE:
+        for jfmt, row in zip(np.asarray(ifmt).tolist(), zip(*_columns_to_lists(columns))):
+            f06_file.write(fmts[jfmt] % row)
+        return
+
+    for i0 in range(0, nrows, F06_CHUNK_SIZE):
+        ifmti = ifmt[i0:i0 + F06_CHUNK_SIZE]
+        columnsi = [np.asarray(column[i0:i0 + F06_CHUNK_SIZE]) for column in columns]
+        irows_list = []
+        rows_list = []
+        for jfmt, fmt in enumerate(fmts):
+            irows = np.flatnonzero(ifmti == jfmt)
+            if len(irows):
+                irows_list.append(irows)
+                rows_list.append(_render_rows(fmt, [column[irows] for column in columnsi]))
+        if not rows_list:
+            continue
+        width = max(rows.shape[1] for rows in rows_list)
+        chars = np.zeros((len(ifmti), width), dtype='uint8')
+        for irows, rows in zip(irows_list, rows_list):
+            chars[irows, :rows.shape[1]] = rows
+        f06_file.write(_chars_to_str(chars))
+
+
+#: 10**i as an int
+POWER10 = 10 ** np.arange(19, dtype='int64')
+
+#: the characters of 00, 01, ..., 99 as a 2 byte int
+DIGITS2 = np.array([('%02i' % i).encode('ascii') for i in range(100)], dtype='S2').view('uint16')
+
+#: 10.**i as a float; inf for i > 308
+POWER10_FLOAT = np.array([float('1e%i' % i) for i in range(400)], dtype='float64')
+
+#: a printf field (e.g., %-13s, %8i, %8.4f, %%)
+_FIELD_REGEX = re.compile(r'%(-?)(\d*)(?:\.(\d+))?([a-zA-Z%])')
+
+
+def _scale_by_power10(vals: np.ndarray, exponent: np.ndarray) -> np.ndarray:
+    """vals * 10**exponent with a single rounding for |exponent| <= 22"""
+    power10 = POWER10_FLOAT[np.minimum(np.abs(exponent), len(POWER10_FLOAT) - 1)]
+    return np.where(exponent >= 0, vals * power10, vals / power10)
+
+
+def _get_digits2(values: np.ndarray) -> np.ndarray:
+    """gets the (n, 2) characters of '%02i' % value for 0 <= value < 100"""
+    return DIGITS2[values].view('uint8').reshape(len(values), 2)
+
+
+def _is_tie(scaled: np.ndarray) -> np.ndarray:
+    """
+    is the value (nearly) halfway between two integers, so the rounding
+    could be different than the exact decimal value that python uses
+    """
+    return ~(np.abs(scaled - np.floor(scaled) - 0.5) >= 1e-6)
+
+
+def _columns_to_lists(columns: list[np.ndarray]) -> list[list]:
+    """converts the columns to python values; bytes are decoded"""
+    lists = []
+    for column in columns:
+        column = np.asarray(column)
+        if column.dtype.kind == 'S':
+            column = np.char.decode(column, 'utf-8')
+        lists.append(column.tolist())
+    return lists
+
+
+def _chars_to_str(chars: np.ndarray) -> str:
+    """converts a (nrows, width) uint8 block to a string; 0 is dropped"""
+    return chars.tobytes().replace(b'\x00', b'').decode('utf-8')
+
+
+def _render_rows(fmt: str, columns: list[np.ndarray]) -> np.ndarray:
+    """
+    Renders fmt % row for each row
+
+    Returns
+    -------
+    chars : (nrows, width) uint8 ndarray
+        the characters of each row; a variable width field (e.g.,
+        '%s' of ' 0.0') is padded with 0
+
+    """
+    nrows = len(columns[0])
+    blocks = []
+    icolumn = 0
+    i0 = 0
+    for match in _FIELD_REGEX.finditer(fmt):
+        _add_literal(blocks, fmt[i0:match.start()], nrows)
+        i0 = match.end()
+        flag, width, precision, conversion = match.groups()
+        if conversion == '%':
+            _add_literal(blocks, '%', nrows)
+            continue
+        if icolumn == len(columns):
+            raise TypeError('not enough arguments for format string')
+        column = columns[icolumn]
+        icolumn += 1
+        width = int(width) if width else 0
+        if conversion == 's' and precision == '0':
+            _add_literal(blocks, ' ' * width, nrows)
+            continue
+
+        if conversion in 'id' and precision is None:
+            chars, nchars = _int_chars(column)
+        elif conversion == 'f':
+            chars, nchars = _fixed_chars(column, 6 if precision is None else int(precision))
+        elif conversion == 's' and precision is None:
+            chars, nchars = _str_chars(column)
+        else:
+            raise NotImplementedError(f'fmt={fmt!r} field={match.group(0)!r}')
+        blocks.append(_justify(chars, nchars, width, is_left=(flag == '-')))
+    _add_literal(blocks, fmt[i0:], nrows)
+    if icolumn != len(columns):
+        raise TypeError('not all arguments converted during string formatting')
+    if not blocks:
+        return np.zeros((nrows, 0), dtype='uint8')
+    return np.hstack(blocks)
+
+
+def _add_literal(blocks: list[np.ndarray], literal: str, nrows: int) -> None:
+    """adds the text between the fields"""
+    if literal:
+        chars = np.frombuffer(literal.encode('utf-8'), dtype='uint8')
+        blocks.append(np.broadcast_to(chars, (nrows, len(chars))))
+
+
+def _justify(chars: np.ndarray, nchars: np.ndarray, width: int,
+             is_left: bool) -> np.ndarray:
+    """
+    pads the left-aligned characters to the field width with spaces;
+    the characters after each value are 0
+    """
+    nrows, nchars_max = chars.shape
+    if width <= nchars_max and np.all(nchars == nchars_max):
+        return chars
+    out_width = max(width, nchars_max)
+    out = np.zeros((nrows, out_width), dtype='uint8')
+    out[:, :nchars_max] = chars
+    if is_left:
+        field = out[:, :width]
+        field[field == 0] = ord(' ')
+        return out
+
+    npad = np.maximum(width - nchars, 0)
+    irows = np.flatnonzero(npad)
+    if len(irows):
+        icol = np.arange(out_width)[np.newaxis, :] - npad[irows, np.newaxis]
+        shifted = np.take_along_axis(out[irows], np.maximum(icol, 0), axis=1)
+        shifted[icol < 0] = ord(' ')
+        out[irows] = shifted
+    return out
+
+
+def _str_chars(column: np.ndarray) -> tuple[np.ndarray, np.ndarray]:
+    """gets the characters of str(value)"""
+    if column.dtype.kind in 'iu':
+        return _int_chars(column)
+    if column.dtype.kind == 'S':
+        column = column.astype(f'S{max(1, column.dtype.itemsize)}')
+    else:
+        column = np.array([str(value).encode('utf-8') for value in column.tolist()], dtype='S')
+        column = column.astype(f'S{max(1, column.dtype.itemsize)}')
+    chars = column.view('uint8').reshape(len(column), column.dtype.itemsize)
+    nchars = (chars != 0).sum(axis=1)
+    return chars, nchars
+
+
+def _int_chars(column: np.ndarray) -> tuple[np.ndarray, np.ndarray]:
+    """gets the characters of '%i' % value"""
+    values = np.asarray(column).astype('int64')
+    is_negative = (values < 0).astype('int64')
+    abs_values = np.abs(values)
+    ndigits = np.maximum(np.searchsorted(POWER10, abs_values, side='right'), 1)
+    nchars = ndigits + is_negative
+
+    # the digit of each character; -1 is the sign
+    idigit = np.arange(nchars.max(initial=1))[np.newaxis, :] - is_negative[:, np.newaxis]
+    exponent = np.clip(ndigits[:, np.newaxis] - 1 - idigit, 0, 18)
+    chars = (abs_values[:, np.newaxis] // POWER10[exponent] % 10 + 48).astype('uint8')
+    chars[idigit < 0] = ord('-')
+    chars[idigit >= ndigits[:, np.newaxis]] = 0
+    return chars, nchars
+
+
+def _fixed_chars(column: np.ndarray, precision: int) -> tuple[np.ndarray, np.ndarray]:
+    """gets the characters of '%.{precision}f' % value"""
+    values = np.asarray(column, dtype='float64')
+    with np.errstate(all='ignore'):
+        scaled = np.abs(values) * 10. ** precision
+    is_python = ~np.isfinite(values) | (scaled >= 1e15)
+    scaled[is_python] = 0.
+    # a (near) tie is written by python
+    is_python |= _is_tie(scaled)
+
+    ivalues = np.rint(scaled).astype('int64')
+    integer = ivalues // POWER10[precision]
+    chars, nchars = _int_chars(integer)
+    is_negative = np.signbit(values)
+    if is_negative.any():
+        # the sign of -0.1 -> '-0'
+        sign = np.where(is_negative, ord('-'), 0).astype('uint8')
+        chars = np.hstack([sign[:, np.newaxis], chars])
+        nchars = nchars + is_negative
+        chars = _shift_left(chars, 1 - is_negative)
+
+    if precision:
+        decimals = np.zeros((len(values), precision + 1), dtype='uint8')
+        decimals[:, 0] = ord('.')
+        decimals[:, 1:] = ivalues[:, np.newaxis] // POWER10[precision - 1::-1] % 10 + 48
+        chars = np.hstack([chars, np.zeros(decimals.shape, dtype='uint8')])
+        irow = np.arange(len(values))[:, np.newaxis]
+        chars[irow, nchars[:, np.newaxis] + np.arange(precision + 1)] = decimals
+        nchars = nchars + precision + 1
+
+    ipython = np.flatnonzero(is_python)
+    if len(ipython):
+        fmt = f'%.{precision}f'
+        chars_python, nchars_python = _str_chars(
+            np.array([fmt % value for value in values[ipython].tolist()], dtype='S'))
+        width = max(chars.shape[1], chars_python.shape[1])
+        chars = np.hstack([chars, np.zeros((len(values), width - chars.shape[1]), dtype='uint8')])
+        chars[ipython] = 0
+        chars[ipython, :chars_python.shape[1]] = chars_python
+        nchars[ipython] = nchars_python
+    return chars, nchars
+
+
+def _shift_left(chars: np.ndarray, nshift: np.ndarray) -> np.ndarray:
+    """shifts the characters of each row to the left"""
+    icol = np.arange(chars.shape[1])[np.newaxis, :] + nshift[:, np.newaxis]
+    shifted = np.take_along_axis(chars, np.clip(icol, 0, chars.shape[1] - 1), axis=1)
+    shifted[icol >= chars.shape[1]] = 0
+    return shifted
+
+
 def write_imag_floats_13e(vals: list[float], is_mag_phase: bool) -> list[str]:
     vals2 = []
 
@@ -1,7 +1,11 @@
+import io
 import unittest
+
+import numpy as np
 from pyNastran.f06.f06_formatting import (
     write_floats_8p4f, write_floats_8p1e,
-    write_floats_10e, write_floats_12e,
+    write_floats_10e, write_floats_12e, write_floats_13e,
+    write_floats_13e_array, write_f06_rows, write_f06_rows_by_format,
     write_imag_floats_13e)
 from pyNastran.f06.f06_writer import (
     make_end, sorted_bulk_data_header, make_f06_header, make_stamp)
@@ -103,6 +107,49 @@ class TestF06Formatting(unittest.TestCase):
         self.assertEqual(actuali, expected, msg='\nactual  =%r len(actual)=%i\nexpected=%r len(expected)=%i' % (
             actuali, len(actuali), expected, len(expected)))
 
+    def test_write_floats_13e_array(self):
+        """write_floats_13e_array is the same as write_floats_13e"""
+        special = [0., -0., 1., -1., 10., 9.9999995, 1.2345675, 2.5e-7,
+                   1e-100, 1e100, 1e-300, np.nan, np.inf, -np.inf]
+        values = np.hstack([
+            special,
+            np.random.default_rng(42).standard_normal(1000) * 10. ** np.arange(-20, 20).repeat(25),
+        ])
+        expected = write_floats_13e(values.tolist())
+        actual = write_floats_13e_array(values.reshape(2, len(values) // 2))
+        assert actual.shape == (2, len(values) // 2)
+        self.assertEqual(np.char.decode(actual.ravel()).tolist(), expected)
+
+        # the small array path
+        actual = write_floats_13e_array(values[:len(special)])
+        self.assertEqual(np.char.decode(actual).tolist(), expected[:len(special)])
+
+    def test_write_f06_rows(self):
+        """write_f06_rows is the same as a loop over fmt % row"""
+        nrows = 1000
+        rng = np.random.default_rng(42)
+        eids = rng.integers(-10**9, 10**9, nrows)
+        values = rng.standard_normal(nrows) * 1000.
+        svalues = write_floats_13e_array(values)
+        words = np.array(['CEN/4', 'C', ''], dtype=object)[rng.integers(0, 3, nrows)]
+        columns = [eids, svalues, values, words]
+        python_columns = [eids.tolist(), np.char.decode(svalues).tolist(),
+                          values.tolist(), words.tolist()]
+
+        fmt = '0%8i %-13s %13s %8.4f %.0s%-6s|%%\n'
+        f06_file = io.StringIO()
+        write_f06_rows(f06_file, fmt, [eids, svalues, svalues, values, words, words])
+        expected = ''.join(fmt % row for row in zip(
+            *python_columns[:2], python_columns[1], *python_columns[2:], python_columns[3]))
+        self.assertEqual(f06_file.getvalue(), expected)
+
+        fmts = ['%-8i %s %5.2f %s\n', '%i%.0s%f%8.0s|\n']
+        ifmt = rng.integers(0, 2, nrows)
+        f06_file = io.StringIO()
+        write_f06_rows_by_format(f06_file, fmts, ifmt, columns)
+        expected = ''.join(fmts[jfmt] % row for jfmt, row in zip(ifmt, zip(*python_columns)))
+        self.assertEqual(f06_file.getvalue(), expected)
+
     def test_write_imag_floats_13e(self):
         """testing write_imag_floats_13e"""
         func = write_imag_floats_13e
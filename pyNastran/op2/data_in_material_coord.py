@@ -1,6 +1,7 @@
 """
 Defines:
  - data_in_material_coord(bdf, op2, in_place=False)
+ - get_shell_theta_rad(model, recompute=False)
 
 """
 from __future__ import annotations
@@ -27,6 +28,8 @@ stress_vectors = ['cquad4_stress', 'cquad8_stress', 'cquadr_stress',
                   'ctria3_stress', 'ctria6_stress', 'ctriar_stress']
 strain_vectors = ['cquad4_strain', 'cquad8_strain', 'cquadr_strain',
                   'ctria3_strain', 'ctria6_strain', 'ctriar_strain']
+QUAD_TYPES = {'CQUAD4', 'CQUAD8', 'CQUADR'}
+SHELL_TYPES = QUAD_TYPES | {'CTRIA3', 'CTRIA6', 'CTRIAR'}
 
 def transf_Mohr(Sxx: np.ndarray,
                 Syy: np.ndarray,
@@ -203,7 +206,8 @@ def data_in_material_coord(bdf: BDF, op2: OP2,
     log = bdf.log
 
     #eid_to_theta_rad = get_eid_to_theta_rad(bdf, debug)
-    eid_to_theta_rad = get_eid_to_theta_rad2(bdf, debug)
+    #eid_to_theta_rad = get_eid_to_theta_rad2(bdf, debug)
+    shell_theta_rad = get_shell_theta_rad(bdf)
     #assert len(eid_to_theta_rad) == len(eid_to_theta_rad2)
     #is_failed = False
     #for eid, theta1 in eid_to_theta_rad.items():
@@ -231,7 +235,7 @@ def data_in_material_coord(bdf: BDF, op2: OP2,
             _transform_shell_force(
                 vec_name,
                 vector, new_vector,
-                eid_to_theta_rad, log)
+                shell_theta_rad, log)
             if new_vector.data_frame is not None:
                 new_vector.build_dataframe()
 
@@ -243,7 +247,7 @@ def data_in_material_coord(bdf: BDF, op2: OP2,
             _transform_shell_stress(
                 vec_name,
                 vector, new_vector,
-                eid_to_theta_rad, log)
+                shell_theta_rad, log)
             if new_vector.data_frame is not None:
                 new_vector.build_dataframe()
 
@@ -255,7 +259,7 @@ def data_in_material_coord(bdf: BDF, op2: OP2,
             _transform_shell_strain(
                 vec_name,
                 vector, new_vector,
-                eid_to_theta_rad, log)
+                shell_theta_rad, log)
             if new_vector.data_frame is not None:
                 new_vector.build_dataframe()
     return op2_new
@@ -363,165 +367,136 @@ def get_eid_to_theta_rad(bdf: BDF, debug: bool) -> dict[int, float]:
     eid_to_theta_rad = dict([[eid, theta] for eid, theta in zip(eids, theta_rad)])
     return eid_to_theta_rad
 
-def _get_tri_nodes(nids: np.ndarray,
-                   xyz_cid0: np.ndarray,
-                   element_nodes: np.ndarray) -> tuple[np.ndarray, np.ndarray, np.ndarray]:
-    inode = np.searchsorted(nids, element_nodes)
-    g1 = xyz_cid0[inode[:, 0], :]
-    g2 = xyz_cid0[inode[:, 1], :]
-    g3 = xyz_cid0[inode[:, 2], :]
-    return g1, g2, g3
-
-def _get_quad_nodes(nids: np.ndarray,
-                    xyz_cid0: np.ndarray,
-                    element_nodes: np.ndarray) -> tuple[np.ndarray, np.ndarray, np.ndarray]:
-    inode = np.searchsorted(nids, element_nodes)
-    g1 = xyz_cid0[inode[:, 0], :]
-    g2 = xyz_cid0[inode[:, 1], :]
-    g3 = xyz_cid0[inode[:, 2], :]
-    g4 = xyz_cid0[inode[:, 3], :]
-    return g1, g2, g3, g4
-
 def get_eid_to_theta_rad2(model: BDF, debug: bool) -> dict[int, float]:
-    coords = model.coords
-    nid_cp_cd, xyz_cid0, *unused = model.get_xyz_in_coord_array(
-        cid=0, fdtype='float64', idtype='int32')
-    nids = nid_cp_cd[:, 0]
-    #eids = []
-    #theta_deg = []
-
-    #eid_theta_ = []
-    #val_theta_ = []
-    eid_tri_mcid_ = []
-    val_tri_mcid_ = []
-    eid_quad_mcid_ = []
-    val_quad_mcid_ = []
-
-    eid_tri_theta_ = []
-    val_tri_theta_ = []
-    eid_quad_theta_ = []
-    val_quad_theta_ = []
-
-    eid_to_theta_rad = {}
-    #etype_to_mcid = {}
-
-    node_tri_mcid_ = []
-    node_quad_mcid_ = []
-
-    node_tri_theta_ = []
-    node_quad_theta_ = []
-    for eid, elem in model.elements.items():
-        etype = elem.type
-        if etype in {'CQUAD4', 'CQUAD8', 'CQUADR'}:
-            theta_mcid = elem.theta_mcid
-            if isinstance(theta_mcid, float):
-                #eids.append(eid)
-                #theta_deg.append(theta_mcid)
-                eid_quad_theta_.append(eid)
-                val_quad_theta_.append(theta_mcid)
-                node_quad_theta_.append(elem.nodes[:4])
-                continue
-            eid_quad_mcid_.append(eid)
-            val_quad_mcid_.append(theta_mcid)
-            node_quad_mcid_.append(elem.nodes[:4])
-        elif etype in {'CTRIA3', 'CTRIA6', 'CTRIAR'}:
-            theta_mcid = elem.theta_mcid
-            if isinstance(theta_mcid, float):
-                #eids.append(eid)
-                #theta_deg.append(theta_mcid)
-                eid_tri_theta_.append(eid)
-                val_tri_theta_.append(theta_mcid)
-                node_tri_theta_.append(elem.nodes[:3])
-                continue
-            eid_tri_mcid_.append(eid)
-            val_tri_mcid_.append(theta_mcid)
-            node_tri_mcid_.append(elem.nodes[:3])
-        continue
-    #theta_rad = np.radians(theta_deg)
-
-    # put in dictionary form- maybe change later
-    #eid_to_theta_rad = {eid: theta for eid, theta in zip(eids, theta_rad)}
-
-
-    if len(eid_tri_theta_):
-        # the triangle theta is defined from the line g1-g2
-        eid_tri_theta = np.array(eid_tri_theta_, dtype='int32')
-        val_tri_theta_deg = np.array(val_tri_theta_, dtype='float64')
-        #node_tri_theta = np.array(node_tri_theta_, dtype='int32')
-        tri_theta_rad = np.radians(val_tri_theta_deg)
-
-        for eid, theta in zip(eid_tri_theta, tri_theta_rad):
-            eid_to_theta_rad[eid] = theta
-
-    if len(eid_quad_theta_):
-        # the quad theta hs
-        # For CQUAD4 elements which are not p-elements and not hyperelastic,
-        # the reference coordinate system is the default for output is the
-        # element coordinate system.
-        eid_quad_theta = np.array(eid_quad_theta_, dtype='int32')
-        val_quad_theta_deg = np.array(val_quad_theta_, dtype='float64')
-        node_quad_theta = np.array(node_quad_theta_, dtype='int32')
-        quad_theta_rad = np.radians(val_quad_theta_deg)
-
-        g1, g2, g3, g4 = _get_quad_nodes(nids, xyz_cid0, node_quad_theta)
-        g21 = g2 - g1
-        g12 = -g21
-
-        beta_rad = angle2vec(g3 - g1, g21)
-        gamma_rad = angle2vec(g4 - g2, g12)
-        alpha_rad = (beta_rad + gamma_rad) / 2.
-        theta_radi = alpha_rad - beta_rad
-        for eid, theta in zip(eid_quad_theta, quad_theta_rad+theta_radi):
-            eid_to_theta_rad[eid] = theta
-
+    """dictionary version of ``get_shell_theta_rad``"""
+    eids, theta_rad = get_shell_theta_rad(model, recompute=True)
+    eid_to_theta_rad = {eid: theta for eid, theta in zip(eids.tolist(), theta_rad.tolist())}
+    return eid_to_theta_rad
 
-    if len(eid_quad_mcid_):
-        eid_quad_mcid = np.array(eid_quad_mcid_, dtype='int32')
-        val_quad_mcid = np.array(val_quad_mcid_, dtype='int32')
-        node_quad_mcid = np.array(node_quad_mcid_, dtype='int32')
 
-        g1, g2, g3, g4 = _get_quad_nodes(nids, xyz_cid0, node_quad_mcid)
-        g42 = g4 - g2
-        g31 = g3 - g1
-        g21 = g2 - g1
-        g12 = -g21
-        normals = _get_normal(g31, g42)
+def get_shell_theta_rad(model: BDF, recompute: bool=False) -> tuple[np.ndarray, np.ndarray]:
+    """
+    Gets the angle from the element coordinate system to the material
+    coordinate system (THETA/MCID) of the CQUAD4, CQUAD8, CQUADR, CTRIA3,
+    CTRIA6, CTRIAR elements.
 
-        csysi = np.array([coords[mcid].i for mcid in val_quad_mcid])
-        imat = calc_imat(normals, csysi)
+    The angles are calculated for all the elements at once from the
+    connectivity/xyz arrays and are cached on the model, so they may be
+    reused for each OP2/subcase.  The cache is keyed on the element, node
+    and coord ids, so it's checked without gathering the geometry.
 
-        theta_radi = angle2vec(g21, imat)
-        # getting sign of THETA
-        check_normal = cross(g21, imat)
-        theta_radi *= np.sign((check_normal * normals).sum(axis=1))
-        beta_rad = angle2vec(g31, g21)
-        gamma_rad = angle2vec(g42, g12)
-        alpha_rad = (beta_rad + gamma_rad) / 2.
-        theta_radi += alpha_rad - beta_rad
-        for eid, theta in zip(eid_quad_mcid, theta_radi):
-            eid_to_theta_rad[eid] = theta
+    Parameters
+    ----------
+    model : BDF
+        the model
+    recompute : bool; default=False
+        rebuild the cached angles; required if the nodes, coords or
+        THETA/MCIDs were modified in place (without changing their ids)
 
-    if len(eid_tri_mcid_):
-        eid_tri_mcid = np.array(eid_tri_mcid_, dtype='int32')
-        val_tri_mcid = np.array(val_tri_mcid_, dtype='int32')
-        node_tri_mcid = np.array(node_tri_mcid_, dtype='int32')
-        #eids.append(eid_tri_mcid)
+    Returns
+    -------
+    eids : (nelements, ) int ndarray
+        the sorted element ids
+    theta_rad : (nelements, ) float ndarray
+        the material angle in radians
 
-        g1, g2, g3 = _get_tri_nodes(nids, xyz_cid0, node_tri_mcid)
+    """
+    key = (np.fromiter(model.elements, dtype='int64', count=len(model.elements)).tobytes(),
+           np.fromiter(model.nodes, dtype='int64', count=len(model.nodes)).tobytes(),
+           tuple(model.coords))
+    cache = getattr(model, '_shell_theta_rad', None)
+    if cache is not None and not recompute and cache[0] == key:
+        return cache[1]
+
+    # one pass over the elements to get the connectivity/THETA/MCIDs
+    eids_list = []
+    theta_mcids = []
+    is_quads = []
+    nodes_list = []
+    for eid, elem in model.elements.items():
+        if elem.type not in SHELL_TYPES:
+            continue
+        is_quadi = elem.type in QUAD_TYPES
+        eids_list.append(eid)
+        theta_mcids.append(0. if elem.theta_mcid is None else elem.theta_mcid)
+        is_quads.append(is_quadi)
+        # the triangles reuse g3 for g4 (only used by the quads)
+        nodes_list.append(elem.nodes[:4] if is_quadi else elem.nodes[:3] + [elem.nodes[2]])
+    nshells = len(eids_list)
+    eids = np.array(eids_list, dtype='int32')
+    is_quad = np.array(is_quads, dtype='bool')
+    is_mcid = np.array([isinstance(theta_mcid, integer_types) for theta_mcid in theta_mcids],
+                       dtype='bool')
+    theta_mcid = np.array(theta_mcids, dtype='float64').reshape(nshells)
+    nodes = np.array(nodes_list, dtype='int64').reshape(nshells, 4)
+
+    theta_rad = np.radians(theta_mcid)
+    theta_rad[is_mcid] = 0.
+    if nshells:
+        nid_cp_cd, xyz_cid0, *unused = model.get_xyz_in_coord_array(
+            cid=0, fdtype='float64', idtype='int32')
+        nids = nid_cp_cd[:, 0]
+        inode = np.searchsorted(nids, nodes)
+        g1 = xyz_cid0[inode[:, 0], :]
+        g2 = xyz_cid0[inode[:, 1], :]
+        g3 = xyz_cid0[inode[:, 2], :]
+        g4 = xyz_cid0[inode[:, 3], :]
         g21 = g2 - g1
-        normals = _get_normal(g21, g3 - g1)
-
-        csysi = np.array([coords[mcid].i for mcid in val_tri_mcid])
-        imat = calc_imat(normals, csysi)
+        g31 = g3 - g1
 
-        theta_radi = angle2vec(g21, imat)
-        # getting sign of THETA
-        check_normal = cross(g21, imat)
-        theta_radi *= np.sign((check_normal * normals).sum(axis=1))
-        for eid, theta in zip(eid_tri_mcid, theta_radi):
-            eid_to_theta_rad[eid] = theta
-    return eid_to_theta_rad
+        if is_mcid.any():
+            # the projection of the MCID x-axis onto the element
+            # relative to the g1-g2 line
+            normals = np.cross(g21, g31)
+            normals[is_quad] = np.cross(g31[is_quad], (g4 - g2)[is_quad])
+            normals /= np.linalg.norm(normals, axis=1)[:, np.newaxis]
+
+            imcid = np.flatnonzero(is_mcid)
+            mcids = theta_mcid[imcid].astype('int32')
+            umcids, imcids = np.unique(mcids, return_inverse=True)
+            coord_i = np.array([model.coords[mcid].i for mcid in umcids.tolist()])
+            csysi = coord_i[imcids, :]
+
+            normalsi = normals[imcid, :]
+            g21i = g21[imcid, :]
+            imat = calc_imat(normalsi, csysi)
+            theta_radi = angle2vec(g21i, imat)
+            # getting sign of THETA
+            check_normal = cross(g21i, imat)
+            theta_radi *= np.sign((check_normal * normalsi).sum(axis=1))
+            theta_rad[imcid] = theta_radi
+
+        if is_quad.any():
+            # the quad element x-axis bisects the diagonals
+            iquad = np.flatnonzero(is_quad)
+            g21q = g21[iquad, :]
+            beta_rad = angle2vec(g31[iquad, :], g21q)
+            gamma_rad = angle2vec((g4 - g2)[iquad, :], -g21q)
+            alpha_rad = (beta_rad + gamma_rad) / 2.
+            theta_rad[iquad] += alpha_rad - beta_rad
+
+    isort = np.argsort(eids)
+    out = (eids[isort], theta_rad[isort])
+    model._shell_theta_rad = (key, out)
+    return out
+
+
+def _get_theta_rad(shell_theta_rad: tuple[np.ndarray, np.ndarray],
+                   vec_eids: np.ndarray) -> np.ndarray:
+    """
+    Gets the angle of each row of a result
 
+    NOTE assuming thetarad=0 for elements that exist in the op2 but
+         not in the supplied bdf file
+    """
+    eids, theta_rad = shell_theta_rad
+    vec_theta_rad = np.zeros(len(vec_eids), dtype='float64')
+    if len(eids) == 0:
+        return vec_theta_rad
+    ieid = np.searchsorted(eids, vec_eids).clip(max=len(eids) - 1)
+    is_found = eids[ieid] == vec_eids
+    vec_theta_rad[is_found] = theta_rad[ieid[is_found]]
+    return vec_theta_rad
 
 
 def _get_normal(v1: np.ndarray, v2: np.ndarray) -> np.ndarray:
@@ -533,12 +508,12 @@ def _get_normal(v1: np.ndarray, v2: np.ndarray) -> np.ndarray:
 def _transform_shell_force(vec_name: str,
                            vector: Union[RealPlateForceArray, RealPlateBilinearForceArray],
                            new_vector: Union[RealPlateForceArray, RealPlateBilinearForceArray],
-                           eid_to_theta_rad: dict[int, float],
+                           shell_theta_rad: tuple[np.ndarray, np.ndarray],
                            log: SimpleLogger):
     vec_eids = get_eids_from_op2_vector(vector)
     #NOTE assuming thetarad=0 for elements that exist in the op2 but
     #     not in the supplied bdf file
-    vec_theta_rad = np.array([eid_to_theta_rad.get(eid, 0.0) for eid in vec_eids])
+    vec_theta_rad = _get_theta_rad(shell_theta_rad, vec_eids)
 
     if vec_eids.shape[0] == vector.data.shape[1] // 5:
         #log.debug(f'A: vec_eids.shape={vec_eids.shape} vector.data.shape={vector.data.shape}')
@@ -623,7 +598,7 @@ def _transform_shell_stress(
         vec_name: str,
         vector: RealPlateStressArray,
         new_vector: RealPlateStressArray,
-        eid_to_theta_rad: dict[int, float],
+        shell_theta_rad: tuple[np.ndarray, np.ndarray],
         log: SimpleLogger):
     vec_eids = get_eids_from_op2_vector(vector)
     check = (vec_eids != 0)
@@ -632,7 +607,7 @@ def _transform_shell_stress(
     vec_eids = vec_eids[check]
     #NOTE assuming thetarad=0 for elements that exist in the op2 but
     #     not in the supplied bdf file
-    vec_theta_rad = np.array([eid_to_theta_rad.get(eid, 0.0) for eid in vec_eids])
+    vec_theta_rad = _get_theta_rad(shell_theta_rad, vec_eids)
 
     # bottom and top in-plane stresses
     if vector.data.shape[2] > 3:
@@ -674,7 +649,7 @@ def _transform_shell_strain(
         vec_name: str,
         vector: RealPlateStrainArray,
         new_vector: RealPlateStrainArray,
-        eid_to_theta_rad: dict[int, float],
+        shell_theta_rad: tuple[np.ndarray, np.ndarray],
         log: SimpleLogger):
     vec_eids = get_eids_from_op2_vector(vector)
     check = (vec_eids != 0)
@@ -684,7 +659,7 @@ def _transform_shell_strain(
     vec_eids = vec_eids[check]
     #NOTE assuming thetarad=0 for elements that exist in the op2 but
     #     not in the supplied bdf file
-    theta_rad = np.array([eid_to_theta_rad.get(eid, 0.0) for eid in vec_eids])
+    theta_rad = _get_theta_rad(shell_theta_rad, vec_eids)
 
     # bottom and top in-plane strains
     if vector.data.shape[2] > 3:
@@ -0,0 +1,137 @@
+"""
+Benchmarks the vectorized (``use_vector=True``) vs. the unvectorized
+(``use_vector=False``) OES/OEF table 4 readers
+
+The time spent in the table 4 parser is summed by
+(table_name, element_name, result_type, sort_method), so the
+SORT1/SORT2 and real/complex/random paths are reported separately.
+
+Usage::
+
+    python bench_vectorized_results.py [OP2_FILENAME ...] [--nrepeat N]
+
+If no OP2 is given, the OP2s in the pyNastran models folder are used.
+
+"""
+import os
+import sys
+import glob
+import time
+import argparse
+from collections import defaultdict
+from typing import Callable
+
+import pyNastran
+from pyNastran.op2.op2 import OP2
+from cpylog import SimpleLogger
+
+PKG_PATH = pyNastran.__path__[0]
+MODEL_PATH = os.path.join(PKG_PATH, '..', 'models')
+RESULT_TYPES = {0: 'real', 1: 'complex', 2: 'random'}
+
+
+def _timed_read(op2_filename: str, use_vector: bool,
+                timings: dict[tuple[str, str, str, int], list[float]]) -> None:
+    """reads an OP2 and sums the time spent in the OES/OEF table 4 parsers"""
+    log = SimpleLogger(level='critical')
+    model = OP2(log=log)
+    model.use_vector = use_vector
+    read_subtable_results = model._read_subtable_results
+
+    def _time_parser(table4_parser: Callable) -> Callable:
+        def timed_parser(data: bytes, ndata: int) -> int:
+            t0 = time.perf_counter()
+            n = table4_parser(data, ndata)
+            dt = time.perf_counter() - t0
+            table_name = model.table_name_str
+            if table_name.startswith(('OES', 'OSTR', 'OEF')):
+                element_name = getattr(model, 'element_name', '')
+                result_type = RESULT_TYPES.get(getattr(model, 'result_type', -1), '???')
+                key = (table_name, element_name, result_type, model.sort_method)
+                timings[key][int(not use_vector)] += dt
+            return n
+        return timed_parser
+
+    def _read_subtable_results(table4_parser, record_len: int, is_indexed: bool=False):
+        if model.read_mode == 2:
+            table4_parser = _time_parser(table4_parser)
+        return read_subtable_results(table4_parser, record_len, is_indexed=is_indexed)
+
+    model._read_subtable_results = _read_subtable_results
+    model.read_op2(op2_filename, skip_undefined_matrices=True)
+
+
+def run_benchmark(op2_filenames: list[str], nrepeat: int=1) -> dict[tuple[str, str, str, int],
+                                                                    list[float]]:
+    """
+    Times the OES/OEF readers with use_vector=True/False
+
+    Parameters
+    ----------
+    op2_filenames : list[str]
+        the OP2s to read
+    nrepeat : int; default=1
+        the number of times to read each OP2
+
+    Returns
+    -------
+    timings : dict[key] = [vectorized_time, unvectorized_time]
+        key : (table_name, element_name, result_type, sort_method)
+    """
+    timings = defaultdict(lambda: [0., 0.])
+    for op2_filename in op2_filenames:
+        for unused_i in range(nrepeat):
+            for use_vector in (True, False):
+                try:
+                    _timed_read(op2_filename, use_vector, timings)
+                except Exception as error:  # pragma: no cover
+                    print(f'failed reading {op2_filename!r}: {error}')
+                    break
+    return dict(timings)
+
+
+def get_benchmark_summary(timings: dict[tuple[str, str, str, int], list[float]]) -> str:
+    """creates a table of the timings grouped by element_name/result_type/sort_method"""
+    grouped = defaultdict(lambda: [0., 0.])
+    for (unused_table_name, element_name, result_type, sort_method), (tvec, tloop) in timings.items():
+        key = (element_name, result_type, sort_method)
+        grouped[key][0] += tvec
+        grouped[key][1] += tloop
+
+    msg = [f'{"element":<16s} {"result":<8s} {"sort":<4s} '
+           f'{"vector [ms]":>12s} {"loop [ms]":>12s} {"speedup":>8s}\n']
+    tvec_total = tloop_total = 0.
+    for (element_name, result_type, sort_method), (tvec, tloop) in sorted(
+            grouped.items(), key=lambda item: -item[1][1]):
+        speedup = tloop / tvec if tvec > 0. else 0.
+        msg.append(f'{element_name:<16s} {result_type:<8s} {sort_method:<4d} '
+                   f'{tvec*1000:12.3f} {tloop*1000:12.3f} {speedup:8.2f}\n')
+        tvec_total += tvec
+        tloop_total += tloop
+    speedup = tloop_total / tvec_total if tvec_total > 0. else 0.
+    msg.append(f'{"total":<31s} {tvec_total*1000:12.3f} {tloop_total*1000:12.3f} {speedup:8.2f}\n')
+    return ''.join(msg)
+
+
+def main(argv=None) -> None:
+    """the interface for bench_vectorized_results"""
+    if argv is None:
+        argv = sys.argv[1:]
+    parser = argparse.ArgumentParser(
+        description='benchmarks the vectorized OES/OEF readers')
+    parser.add_argument('op2_filenames', nargs='*',
+                        help='the OP2s to read (default=the pyNastran models)')
+    parser.add_argument('--nrepeat', type=int, default=1,
+                        help='the number of times to read each OP2 (default=1)')
+    args = parser.parse_args(argv)
+
+    op2_filenames = args.op2_filenames
+    if not op2_filenames:
+        op2_filenames = sorted(glob.glob(os.path.join(MODEL_PATH, '**', '*.op2'),
+                                         recursive=True))
+    timings = run_benchmark(op2_filenames, nrepeat=args.nrepeat)
+    print(get_benchmark_summary(timings))
+
+
+if __name__ == '__main__':  # pragma: no cover
+    main()
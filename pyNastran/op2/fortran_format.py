@@ -118,7 +118,8 @@ class FortranFormat:
     def _finish(self):
         raise NotImplementedError('overwrite this')
 
-    def _read_subtable_results(self, table4_parser, record_len: int) -> Optional[int]:
+    def _read_subtable_results(self, table4_parser, record_len: int,
+                               is_indexed: bool=False) -> Optional[int]:
         """
         # if reading the data
         # 1 - 1st pass to size the array (vectorized)
@@ -130,6 +131,9 @@ class FortranFormat:
             the parser function for table 4
         record_len : int
             the length of the record block
+        is_indexed : bool; default=False
+            the record_len came from the OP2Index, so the record doesn't
+            need to be skipped during the array sizing step
 
         Returns
         -------
@@ -141,10 +145,16 @@ class FortranFormat:
         op2_reader = self.op2_reader  # type: OP2Reader
         #datai = b''
         n = 0
+        valid_ids = op2_reader.get_valid_ids()
         if self.read_mode == 2:
             self.ntotal = 0
 
             data, ndata = op2_reader._read_record_ndata()
+            if valid_ids is not None:
+                data, ndata = op2_reader.filter_record_ids(data, valid_ids)
+                if ndata == 0:
+                    self._cleanup_data_members()
+                    return n
             n = table4_parser(data, ndata)
             assert isinstance(n, integer_types), self.table_name
 
@@ -161,6 +171,17 @@ class FortranFormat:
                 # PVT/PVTS - we want to know what the PARAM cards are,
                 #            so we can determine the NXVER
                 data, ndata = op2_reader._read_record_ndata()
+            elif valid_ids is not None:
+                # the rows have to be read to size the arrays
+                data, ndata = op2_reader._read_record_ndata()
+                data, ndata = op2_reader.filter_record_ids(data, valid_ids)
+                if ndata == 0:
+                    self._cleanup_data_members()
+                    return n
+                data, record_len = None, ndata
+            elif is_indexed:
+                # the record length is the sum of the block lengths
+                data, ndata = None, record_len
             else:
                 try:
                     data, ndata = op2_reader._skip_record_ndata()
@@ -15,13 +15,16 @@ Defines the main OP2 class.  Defines:
    - object_methods(mode='public', keys_to_skip=None)
    - print_subcase_key()
    - read_op2(op2_filename=None, combine=True, build_dataframe=False,
-              skip_undefined_matrices=False, encoding=None)
+              skip_undefined_matrices=False, encoding=None, use_index=False,
+              lazy=False, n_workers=1)
+   - load_lazy_results()
    - set_mode(mode)
    - transform_displacements_to_global(i_transform, coords, xyz_cid0=None, debug=False)
    - transform_gpforce_to_global(nids_all, nids_transform, i_transform, coords, xyz_cid0=None)
 
 """
 from __future__ import annotations
+import os
 import sys
 from collections import defaultdict
 from pickle import load, dump, dumps
@@ -42,8 +45,9 @@ from pyNastran.op2.writer.op2_writer import OP2Writer
 #from pyNastran.op2.op2_interface.op2_f06_common import Op2F06Attributes
 from pyNastran.op2.op2_interface.types import NastranKey
 from pyNastran.op2.op2_interface.op2_scalar import OP2_Scalar
-from pyNastran.op2.op2_interface.transforms import (
-    transform_displacement_to_global, transform_gpforce_to_globali)
+from pyNastran.op2.op2_interface.op2_index import OP2Index, get_index_filename
+from pyNastran.op2.op2_interface.op2_lazy import LazyResult, LazyResultLoader
+from pyNastran.op2.op2_interface.transforms import DisplacementTransformPlan
 from pyNastran.utils import check_path
 if TYPE_CHECKING:  # pragma: no cover
     from h5py import File as H5File
@@ -103,6 +107,8 @@ class OP2(OP2_Scalar, OP2Writer):
         self.ask = False
         self.post = None
         self.table_count = defaultdict(int)
+        #: reads the results of read_op2(..., lazy=True) when they're accessed
+        self.lazy_loader = None
         self._set_mode(mode)
 
     def __del__(self) -> None:
@@ -469,6 +475,7 @@ class OP2(OP2_Scalar, OP2Writer):
         """Saves a pickleable object"""
         #del self.log
         #del self._card_parser, self._card_parser_prepare
+        self.load_lazy_results()
         if hasattr(self, 'generalized_tables'):
             del self.generalized_tables
         if hasattr(self, 'op2_reader'):
@@ -547,7 +554,10 @@ class OP2(OP2_Scalar, OP2Writer):
                  combine: bool=True,
                  build_dataframe: Optional[bool]=False,
                  skip_undefined_matrices: bool=False,
-                 encoding: Optional[str]=None) -> None:
+                 encoding: Optional[str]=None,
+                 use_index: bool=False,
+                 lazy: bool=False,
+                 n_workers: int=1) -> None:
         """
         Starts the OP2 file reading
 
@@ -569,10 +579,37 @@ class OP2(OP2_Scalar, OP2Writer):
              True : prevents matrix reading crashes
         encoding : str
             the unicode encoding (default=None; system default)
+        use_index : bool; default=False
+            use the table/subtable byte offsets to read the OP2
+            False : the file is walked twice (array sizing & array filling)
+            True : the offsets are loaded from the sidecar index file
+                   (e.g., model.op2_index.npz) or are stored during the
+                   array sizing step and saved to the sidecar file.  The
+                   array filling step jumps directly to each record.
+        lazy : bool; default=False
+            read the vectorized result objects (e.g., displacements,
+            cquad4_stress) the first time their data is accessed;
+            implies use_index=True
+            False : all the results are loaded
+            True : the results are sized, but only the table 4 records
+                   of a result are read when the result.data (or another
+                   array) is first accessed.  The OP2 stays open until
+                   ``load_lazy_results()`` or ``close_op2()`` is called.
+        n_workers : int; default=1
+            the number of processes used to read the result tables;
+            implies use_index=True
+            1 : the results are read by the current process
+            >1 : the tables (e.g., OUGV1, OES1X1) are split across a
+                 process pool; the workers read the OP2 using the index and
+                 send back the result objects
 
         """
         if op2_filename:
             check_path(op2_filename, name='op2_filename')
+        is_parallel = n_workers > 1
+        if is_parallel and lazy:
+            raise RuntimeError(f'lazy=True is not supported with n_workers={n_workers}')
+        lazy = lazy or is_parallel
         mode = self.mode
         if build_dataframe is None:
             build_dataframe = False
@@ -595,27 +632,44 @@ class OP2(OP2_Scalar, OP2Writer):
         if hasattr(self, 'load_as_h5'):
             load_as_h5 = self.load_as_h5
 
+        op2_reader = self.op2_reader
+        if use_index or lazy:
+            op2_filename = self._validate_op2_filename(op2_filename)
+            self._setup_op2_index(op2_filename)
+        self.lazy_loader = None
+        if lazy:
+            op2_reader.lazy_rows = {}
+
         try:
             # get GUI object names, build objects, but don't read data
             table_names = OP2_Scalar.read_op2(self, op2_filename=op2_filename,
                                               load_as_h5=load_as_h5, mode=mode)
             self.table_names = table_names
+            if op2_reader.record_index:
+                self._save_op2_index(op2_reader.op2_index)
+            if lazy:
+                self.lazy_loader = LazyResultLoader(self)
+                op2_reader._index_skip = self.lazy_loader.setup(op2_reader.lazy_rows)
+                op2_reader.lazy_rows = None
 
             # TODO: stuff to figure out objects
             # TODO: stuff to show gui of table names
             # TODO: clear out objects the user doesn't want
             self.read_mode = 2
-            self._close_op2 = True
+            self._close_op2 = not lazy
             self.log.debug('-------- reading op2 with read_mode=2 (array filling) --------')
-            op2_reader = self.op2_reader
             _create_hdf5_info(self.op2_reader.h5_file, self)
             OP2_Scalar.read_op2(self, op2_filename=self.op2_filename, mode=mode)
+            op2_reader._index_skip = None
         except FileNotFoundError:
             raise
         except Exception:
             OP2_Scalar.close_op2(self, force=True)
             raise
         self._finalize()
+        if is_parallel:
+            self.lazy_loader.load_parallel(n_workers)
+            self.load_lazy_results()
         op2_reader._create_objects_from_matrices()
         if build_dataframe:
             self.build_dataframe()
@@ -625,6 +679,38 @@ class OP2(OP2_Scalar, OP2Writer):
         if len(self.op2_results.thermal_load):
             self.app = 'HEAT'
 
+    def _setup_op2_index(self, op2_filename: str) -> None:
+        """
+        Loads the sidecar OP2Index if it's up to date; otherwise,
+        the index will be stored during the array sizing step.
+        """
+        op2_reader = self.op2_reader
+        index_filename = get_index_filename(op2_filename)
+        op2_index = None
+        if os.path.exists(index_filename):
+            op2_index = OP2Index.load(index_filename, op2_filename)
+            if op2_index is None:
+                self.log.info(f'index_filename={index_filename!r} is out of date')
+
+        if op2_index is None:
+            op2_reader.op2_index = OP2Index(op2_filename)
+            op2_reader.record_index = True
+        else:
+            self.log.debug(f'-------- using index_filename={index_filename!r} --------')
+            op2_reader.op2_index = op2_index
+            op2_reader.record_index = False
+
+    def _save_op2_index(self, op2_index: OP2Index) -> None:
+        """writes the index that was built during the array sizing step"""
+        op2_index.finalize()
+        self.op2_reader.record_index = False
+        index_filename = get_index_filename(op2_index.op2_filename)
+        try:
+            op2_index.save(index_filename)
+        except OSError:
+            # we can still use the index; it just won't be cached
+            self.log.warning(f'cannot write index_filename={index_filename!r}')
+
     def _finalize(self) -> None:
         """internal method"""
         if hasattr(self, 'subcase'):
@@ -647,12 +733,37 @@ class OP2(OP2_Scalar, OP2Writer):
 
             #print(result_type)
             for obj in values:
+                if isinstance(obj, LazyResult):
+                    # finalized when it's loaded
+                    continue
                 if hasattr(obj, 'finalize'):
                     obj.finalize()
                 elif hasattr(obj, 'tCode') and not obj.is_sort1:
                     raise RuntimeError('object has not implemented finalize\n%s' % (
                         ''.join(obj.get_stats())))
-        self.del_structs()
+        if self.lazy_loader is None:
+            # the structs are still needed to read the lazy results
+            self.del_structs()
+
+    def load_lazy_results(self) -> None:
+        """
+        Reads the results that haven't been accessed yet and closes the OP2.
+        Only necessary when using ``read_op2(..., lazy=True)`` or
+        ``load_hdf5_filename(..., lazy=True)``.
+        """
+        if self.lazy_loader is None:
+            return
+        self.lazy_loader.load_all()
+        self.lazy_loader.close()
+
+    def close_op2(self, force: bool=True) -> None:
+        """closes the OP2 and debug file"""
+        is_closed = force or getattr(self, '_close_op2', True)
+        OP2_Scalar.close_op2(self, force=force)
+        if is_closed and self.lazy_loader is not None:
+            # any results that weren't loaded can't be loaded anymore
+            self.lazy_loader = None
+            self.del_structs()
 
     def build_dataframe(self) -> None:
         """
@@ -737,16 +848,25 @@ class OP2(OP2_Scalar, OP2Writer):
                     self.log.error(f'build_dataframe is broken for {class_name}')
                     raise
 
-    def load_hdf5_filename(self, hdf5_filename: str, combine: bool=True) -> None:
+    def load_hdf5_filename(self, hdf5_filename: str, combine: bool=True,
+                           lazy: bool=False) -> None:
         """
         Loads an h5 file into an OP2 object
 
+        Only the results, subcases, nodes/elements and times selected with
+        set_results, set_subcases, set_node_ids, set_element_ids and
+        set_time_range are read.
+
         Parameters
         ----------
         hdf5_filename : str
             the path to the an hdf5 file
         combine : bool; default=True
             runs the combine routine
+        lazy : bool; default=False
+            only read the result data (e.g., displacements[1].data) the
+            first time it's accessed; the HDF5 file is left open until
+            ``load_lazy_results()`` is called
 
         """
         check_path(hdf5_filename, 'hdf5_filename')
@@ -756,11 +876,17 @@ class OP2(OP2_Scalar, OP2Writer):
 
         self.log.info(f'hdf5_op2_filename = {hdf5_filename!r}')
         debug = False
-        with h5py.File(hdf5_filename, 'r') as h5_file:
-            load_op2_from_hdf5_file(self, h5_file, self.log, debug=debug)
+        if lazy:
+            h5_file = h5py.File(hdf5_filename, 'r')
+            load_op2_from_hdf5_file(self, h5_file, self.log, debug=debug, lazy=True)
+            self.lazy_loader.is_owner = True
+        else:
+            with h5py.File(hdf5_filename, 'r') as h5_file:
+                load_op2_from_hdf5_file(self, h5_file, self.log, debug=debug)
         self.combine_results(combine=combine)
 
-    def load_hdf5_file(self, h5_file: H5File, combine: bool=True) -> None:
+    def load_hdf5_file(self, h5_file: H5File, combine: bool=True,
+                       lazy: bool=False) -> None:
         """
         Loads an h5 file object into an OP2 object
 
@@ -770,27 +896,46 @@ class OP2(OP2_Scalar, OP2Writer):
             an h5py file object
         combine : bool; default=True
             runs the combine routine
+        lazy : bool; default=False
+            only read the result data the first time it's accessed;
+            h5_file must be open until then
 
         """
         from pyNastran.op2.op2_interface.hdf5_interface import load_op2_from_hdf5_file
         #self.op2_filename = hdf5_filename
         #self.log.info('hdf5_op2_filename = %r' % hdf5_filename)
         debug = False
-        load_op2_from_hdf5_file(self, h5_file, self.log, debug=debug)
+        load_op2_from_hdf5_file(self, h5_file, self.log, debug=debug, lazy=lazy)
         self.combine_results(combine=combine)
 
-    def export_hdf5_filename(self, hdf5_filename: str) -> None:
+    def export_hdf5_filename(self, hdf5_filename: str,
+                             compression=None, compression_opts=None) -> None:
         """
         Converts the OP2 objects into hdf5 object
 
+        Parameters
+        ----------
+        hdf5_filename : str
+            the path to the an hdf5 file
+        compression : str / int; default=None -> no compression
+            an h5py compression filter for the result arrays
+            (e.g., 'lzf' (fast), 'gzip')
+        compression_opts : Any; default=None
+            the compression options (e.g., the gzip level)
+
+        The result data is chunked by time and by blocks of rows, so a
+        few times/elements may be loaded without reading the rest.
+
         TODO: doesn't support:
           - BucklingEigenvalues
 
         """
         from pyNastran.op2.op2_interface.hdf5_interface import export_op2_to_hdf5_filename
-        export_op2_to_hdf5_filename(hdf5_filename, self)
+        export_op2_to_hdf5_filename(hdf5_filename, self, compression=compression,
+                                    compression_opts=compression_opts)
 
-    def export_hdf5_file(self, hdf5_file: H5File, exporter=None) -> None:
+    def export_hdf5_file(self, hdf5_file: H5File, exporter=None,
+                         compression=None, compression_opts=None) -> None:
         """
         Converts the OP2 objects into hdf5 object
 
@@ -800,6 +945,11 @@ class OP2(OP2_Scalar, OP2Writer):
             an h5py object
         exporter : HDF5Exporter; default=None
             unused
+        compression : str / int; default=None -> no compression
+            an h5py compression filter for the result arrays
+            (e.g., 'lzf' (fast), 'gzip')
+        compression_opts : Any; default=None
+            the compression options (e.g., the gzip level)
 
         TODO: doesn't support:
           - BucklingEigenvalues
@@ -807,7 +957,8 @@ class OP2(OP2_Scalar, OP2Writer):
         """
         ## type (file, Any) -> None
         from pyNastran.op2.op2_interface.hdf5_interface import export_op2_to_hdf5_file
-        export_op2_to_hdf5_file(hdf5_file, self)
+        export_op2_to_hdf5_file(hdf5_file, self, compression=compression,
+                                compression_opts=compression_opts)
 
     def combine_results(self, combine: bool=True) -> None:
         """
@@ -1186,7 +1337,8 @@ class OP2(OP2_Scalar, OP2Writer):
     def transform_displacements_to_global(self, icd_transform: Any,
                                           coords: dict[int, Any],
                                           xyz_cid0: Any=None,
-                                          debug: bool=False) -> None:
+                                          debug: bool=False,
+                                          transform_plan: Optional[DisplacementTransformPlan]=None) -> None:
         """
         Transforms the ``data`` of displacement-like results into the
         global coordinate system for those nodes with different output
@@ -1212,6 +1364,11 @@ class OP2(OP2_Scalar, OP2Writer):
             Use this if CD is not rectangular
         debug : bool; default=False
             developer debug
+        transform_plan : DisplacementTransformPlan; default=None
+            the rotation matrices of the nodes
+            (see ``get_displacement_transform_plan``); icd_transform and
+            xyz_cid0 are not used if this is defined
+            None : built from icd_transform/coords/xyz_cid0
 
         .. warning:: only works if all nodes are included...
                      ``test_pynastrangui isat_tran.dat isat_tran.op2 -f nastran``
@@ -1271,15 +1428,19 @@ class OP2(OP2_Scalar, OP2Writer):
             if not disp_like_dict:
                 continue
             #print('-----------')
-            for subcase, result in disp_like_dict.items():
+            for unused_subcase, result in disp_like_dict.items():
                 if result.table_name in ['BOUGV1', 'BOPHIG', 'TOUGV1']:
                     continue
+                if transform_plan is None:
+                    # the rotation matrices are the same for every result
+                    transform_plan = DisplacementTransformPlan(
+                        icd_transform, coords, xyz_cid0=xyz_cid0)
                 self.log.debug(f'transforming {result.table_name}')
-                transform_displacement_to_global(subcase, result, icd_transform, coords, xyz_cid0,
-                                                 self.log, debug=debug)
+                transform_plan.transform_displacement(result, self.log)
 
     def transform_gpforce_to_global(self, nids_all, nids_transform, icd_transform, coords,
-                                    xyz_cid0=None):
+                                    xyz_cid0=None,
+                                    transform_plan: Optional[DisplacementTransformPlan]=None):
         """
         Transforms the ``data`` of GPFORCE results into the
         global coordinate system for those nodes with different output
@@ -1305,6 +1466,10 @@ class OP2(OP2_Scalar, OP2Writer):
             Use this if CD is not rectangular
         xyz_cid0 : ???
             required for cylindrical/spherical coordinate systems
+        transform_plan : DisplacementTransformPlan; default=None
+            the rotation matrices of the nodes
+            (see ``get_displacement_transform_plan``)
+            None : built from nids_all/icd_transform/coords/xyz_cid0
 
         """
         disp_like_dicts = [
@@ -1316,10 +1481,12 @@ class OP2(OP2_Scalar, OP2Writer):
             if not disp_like_dict:
                 continue
             self.log.debug('-----------')
-            for subcase, result in disp_like_dict.items():
-                transform_gpforce_to_globali(subcase, result,
-                                             nids_all, nids_transform,
-                                             icd_transform, coords, xyz_cid0, self.log)
+            for unused_subcase, result in disp_like_dict.items():
+                if transform_plan is None:
+                    transform_plan = DisplacementTransformPlan(
+                        icd_transform, coords, xyz_cid0=xyz_cid0, nids_all=nids_all)
+                self.log.debug('result.name = %s' % result.class_name)
+                transform_plan.transform_gpforce(result, self.log)
         self.log.debug('-----------')
 
 
@@ -1346,6 +1513,9 @@ def read_op2(op2_filename: Optional[str]=None,
              load_geometry: bool=False,
              combine: bool=True,
              subcases: Optional[list[int]]=None,
+             node_ids: Optional[list[int]]=None,
+             element_ids: Optional[list[int]]=None,
+             time_range: Optional[tuple[float, float]]=None,
              exclude_results: Optional[list[str]]=None,
              include_results: Optional[list[str]]=None,
              log: Any=None,
@@ -1353,7 +1523,10 @@ def read_op2(op2_filename: Optional[str]=None,
              build_dataframe: Optional[bool]=False,
              skip_undefined_matrices: bool=True,
              mode: Optional[str]=None,
-             encoding: Optional[str]=None) -> OP2:
+             encoding: Optional[str]=None,
+             use_index: bool=False,
+             lazy: bool=False,
+             n_workers: int=1) -> OP2:
     """
     Creates the OP2 object without calling the OP2 class.
 
@@ -1370,6 +1543,12 @@ def read_op2(op2_filename: Optional[str]=None,
                 will be used for superelements regardless of the option
     subcases : list[int, ...] / int; default=None->all subcases
         list of [subcase1_ID,subcase2_ID]
+    node_ids / element_ids : list[int]; default=None->all ids
+        only read the nodes/elements in the list (SORT1 results);
+        see ``OP2.set_node_ids`` / ``OP2.set_element_ids``
+    time_range : (float, float); default=None->all times
+        only read the times/frequencies/modes in [min, max] (SORT1 results);
+        see ``OP2.set_time_range``
     exclude_results / include_results : list[str] / str; default=None
         a list of result types to exclude/include
         one of these must be None
@@ -1391,6 +1570,15 @@ def read_op2(op2_filename: Optional[str]=None,
         {nx, msc, autodesk, optistruct, nasa95}
     encoding : str
         the unicode encoding (default=None; system default)
+    use_index : bool; default=False
+        use/create the sidecar table/subtable offset index
+        (e.g., model.op2_index.npz); see ``OP2.read_op2``
+    lazy : bool; default=False
+        read the result data the first time it's accessed;
+        see ``OP2.read_op2``
+    n_workers : int; default=1
+        the number of processes used to read the result tables;
+        see ``OP2.read_op2``
 
     Returns
     -------
@@ -1410,20 +1598,26 @@ def read_op2(op2_filename: Optional[str]=None,
         from pyNastran.op2.op2_geom import read_op2_geom
         model = read_op2_geom(
             op2_filename=op2_filename, combine=combine, subcases=subcases,
+            node_ids=node_ids, element_ids=element_ids, time_range=time_range,
             exclude_results=exclude_results, include_results=include_results,
             validate=True, xref=True,
             build_dataframe=build_dataframe,
             skip_undefined_matrices=skip_undefined_matrices,
-            mode=mode, log=log, debug=debug, encoding=encoding)
+            mode=mode, log=log, debug=debug, encoding=encoding,
+            use_index=use_index, lazy=lazy, n_workers=n_workers)
     else:
         model = OP2(log=log, debug=debug, mode=mode)
         model.set_subcases(subcases)
+        model.set_node_ids(node_ids)
+        model.set_element_ids(element_ids)
+        model.set_time_range(time_range)
         model.include_exclude_results(exclude_results=exclude_results,
                                       include_results=include_results)
 
         model.read_op2(op2_filename=op2_filename, build_dataframe=build_dataframe,
                        skip_undefined_matrices=skip_undefined_matrices, combine=combine,
-                       encoding=encoding)
+                       encoding=encoding, use_index=use_index, lazy=lazy,
+                       n_workers=n_workers)
 
     ## TODO: this will go away when OP2 is refactored
     ## TODO: many methods will be missing, but it's a start...
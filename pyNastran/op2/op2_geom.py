@@ -41,13 +41,19 @@ if TYPE_CHECKING:  # pragma: no cover
 def read_op2_geom(op2_filename: Optional[Union[str, PurePath]]=None,
                   combine: bool=True,
                   subcases: Optional[list[int]]=None,
+                  node_ids: Optional[list[int]]=None,
+                  element_ids: Optional[list[int]]=None,
+                  time_range: Optional[tuple[float, float]]=None,
                   exclude_results: Optional[list[str]]=None,
                   include_results: Optional[list[str]]=None,
                   validate: bool=True, xref: bool=True,
                   build_dataframe: bool=False, skip_undefined_matrices: bool=True,
                   mode: str='msc', log: SimpleLogger=None, debug: bool=True,
                   debug_file: Optional[str]=None,
-                  encoding: Optional[str]=None):
+                  encoding: Optional[str]=None,
+                  use_index: bool=False,
+                  lazy: bool=False,
+                  n_workers: int=1):
     """
     Creates the OP2 object without calling the OP2 class.
 
@@ -61,6 +67,12 @@ def read_op2_geom(op2_filename: Optional[Union[str, PurePath]]=None,
                 will be used for superelements regardless of the option
     subcases : list[int, ...] / int; default=None->all subcases
         list of [subcase1_ID,subcase2_ID]
+    node_ids / element_ids : list[int]; default=None->all ids
+        only read the nodes/elements in the list (SORT1 results);
+        see ``OP2.set_node_ids`` / ``OP2.set_element_ids``
+    time_range : (float, float); default=None->all times
+        only read the times/frequencies/modes in [min, max] (SORT1 results);
+        see ``OP2.set_time_range``
     exclude_results / include_results : list[str] / str; default=None
         a list of result types to exclude/include
         one of these must be None
@@ -81,6 +93,15 @@ def read_op2_geom(op2_filename: Optional[Union[str, PurePath]]=None,
         sets the filename that will be written to
     encoding : str
         the unicode encoding (default=None; system default)
+    use_index : bool; default=False
+        use/create the sidecar table/subtable offset index
+        (e.g., model.op2_index.npz); see ``OP2.read_op2``
+    lazy : bool; default=False
+        read the result data the first time it's accessed;
+        see ``OP2.read_op2``
+    n_workers : int; default=1
+        the number of processes used to read the result tables;
+        see ``OP2.read_op2``
 
     Returns
     -------
@@ -95,12 +116,16 @@ def read_op2_geom(op2_filename: Optional[Union[str, PurePath]]=None,
     """
     model = OP2Geom(log=log, debug=debug, debug_file=debug_file, mode=mode)
     model.set_subcases(subcases)
+    model.set_node_ids(node_ids)
+    model.set_element_ids(element_ids)
+    model.set_time_range(time_range)
     model.include_exclude_results(exclude_results=exclude_results,
                                   include_results=include_results)
 
     model.read_op2(op2_filename=op2_filename, build_dataframe=build_dataframe,
                    skip_undefined_matrices=skip_undefined_matrices, combine=combine,
-                   encoding=encoding)
+                   encoding=encoding, use_index=use_index, lazy=lazy,
+                   n_workers=n_workers)
     if validate:
         model.validate()
     if xref:
@@ -313,12 +338,16 @@ class OP2Geom(BDF, OP2GeomCommon):
     def read_op2(self, op2_filename: Optional[Union[str, PurePath]]=None, combine: bool=True,
                  build_dataframe: Optional[bool]=False,
                  skip_undefined_matrices: bool=False,
-                 encoding: Optional[str]=None):
+                 encoding: Optional[str]=None,
+                 use_index: bool=False,
+                 lazy: bool=False,
+                 n_workers: int=1):
         """see ``OP2.read_op2``"""
         OP2.read_op2(self, op2_filename=op2_filename, combine=combine,
                      build_dataframe=build_dataframe,
                      skip_undefined_matrices=skip_undefined_matrices,
-                     encoding=encoding)
+                     encoding=encoding, use_index=use_index, lazy=lazy,
+                     n_workers=n_workers)
         if len(self.nodes) == 0:
             self.gpdt_to_nodes()
 
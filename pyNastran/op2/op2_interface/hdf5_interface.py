@@ -5,9 +5,13 @@ defines:
  export_op2_to_hdf5(hdf5_filename, op2_model)
 
  model = load_op2_from_hdf5(hdf5_filename, combine=True, log=None)
- model = load_op2_from_hdf5_file(model, h5_file, log, debug=False)
- export_op2_to_hdf5_file(hdf5_filename, op2_model)
- export_op2_to_hdf5_file(hdf5_file, op2_model)
+ model = load_op2_from_hdf5_file(model, h5_file, log, debug=False, lazy=False)
+ export_op2_to_hdf5_file(hdf5_filename, op2_model, compression=None)
+ export_op2_to_hdf5_file(hdf5_file, op2_model, compression=None)
+
+The result data is chunked by (time, block of rows), so the loader
+only reads the times/rows that were selected with model.set_results,
+set_subcases, set_node_ids, set_element_ids and set_time_range.
 
 """
 from typing import Union, Optional, Any
@@ -143,6 +147,7 @@ from pyNastran.op2.tables.oef_forces.oef_thermal_objects import (
 #from pyNastran.op2.tables.oqg_constraintForces.oqg_thermal_gradient_and_flux import RealTemperatureGradientAndFluxArray
 from pyNastran.utils import check_path
 from pyNastran.op2.result_objects.matrix import Matrix
+from pyNastran.op2.op2_interface.op2_lazy import LazyResult, get_lazy_class
 
 
 def _cast(h5_result_attr):
@@ -1160,8 +1165,18 @@ def _load_eigenvalue(h5_result, encoding: str,
     return obj
 
 def _load_table(result_name, h5_result, objs: tuple[Any], encoding: str,
-                log: SimpleLogger, debug: bool=False):# real_obj, complex_obj
-    """loads a RealEigenvectorArray/ComplexEigenvectorArray"""
+                log: SimpleLogger, debug: bool=False,
+                node_ids: Optional[np.ndarray]=None,
+                element_ids: Optional[np.ndarray]=None,
+                time_range: Optional[tuple[float, float]]=None,
+                lazy_loader: Optional['Hdf5LazyLoader']=None):# real_obj, complex_obj
+    """
+    loads a RealEigenvectorArray/ComplexEigenvectorArray
+
+    Only the selected times/rows of the data are read (see
+    ``_apply_hdf5_selection``).  If there is a lazy_loader, the data is
+    read the first time it's accessed.
+    """
     is_real = _cast(h5_result.get('is_real'))
     #is_complex = _cast(h5_result.get('is_complex'))
     nonlinear_factor = _cast(h5_result.get('nonlinear_factor'))
@@ -1224,9 +1239,222 @@ def _load_table(result_name, h5_result, objs: tuple[Any], encoding: str,
         raise RuntimeError(msg)
     _apply_hdf5_attributes_to_object(obj, h5_result, result_name, data_code, str_data_names,
                                      encoding, debug=debug)
+
+    # the ids aren't attributes of an empty object, so they're not loaded
+    # by _apply_hdf5_attributes_to_object
+    obj_dict = obj.__dict__
+    for key in [key for key, unused_id_type in ROW_ID_KEYS] + ['element_cid']:
+        h5_ids = h5_result.get(key)
+        if key not in obj_dict and h5_ids is not None and h5_ids.dtype.kind in 'iu':
+            obj_dict[key] = _cast(h5_ids)
+
+    h5_data = h5_result.get('data')
+    if h5_data is not None and 'data' in obj.object_attributes(filter_properties=True):
+        itimes, irows = _apply_hdf5_selection(
+            obj, h5_data.shape, data_code['name'], data_names,
+            node_ids, element_ids, time_range)
+        if lazy_loader is None:
+            obj.data = read_hdf5_data(h5_data, itimes, irows)
+        else:
+            lazy_loader.add(obj, h5_data, itimes, irows)
     return obj
 
 
+#: the arrays that aren't sized by the number of rows of the data
+NON_ROW_KEYS = {
+    'data', 'data_names', 'headers', 'words', 'sort_bits', 'thermal_bits',
+    'stress_bits', 'element_cid',
+}
+
+#: the id array of the rows of the data and the type of id
+ROW_ID_KEYS = [
+    ('node_gridtype', 'node'),
+    ('element_node', 'element'),
+    ('element_layer', 'element'),
+    ('element', 'element'),
+]
+
+
+def _apply_hdf5_selection(obj: Any, data_shape: tuple[int, ...],
+                          time_name: str, data_names: list[str],
+                          node_ids: Optional[np.ndarray],
+                          element_ids: Optional[np.ndarray],
+                          time_range: Optional[tuple[float, float]],
+                          ) -> tuple[Optional[np.ndarray], Optional[np.ndarray]]:
+    """
+    Gets the times and rows of the (ntimes, nrows, ncols) data to read
+    and slices the time/id arrays of the object to match
+
+    Static results are always read and results without a
+    node_gridtype/element_node/element_layer/element array
+    (e.g., grid_point_forces) aren't filtered by id.
+
+    Returns
+    -------
+    itimes / irows : (n, ) int ndarray; None -> all
+        the times/rows to read
+
+    """
+    obj_dict = obj.__dict__
+    ntimes, nrows = data_shape[:2]
+
+    itimes = None
+    times = obj_dict.get(time_name + 's')
+    nonlinear_factor = obj_dict.get('nonlinear_factor')
+    is_static = nonlinear_factor is None or (
+        isinstance(nonlinear_factor, float) and np.isnan(nonlinear_factor))
+    if time_range is not None and not is_static and times is not None and len(times) == ntimes:
+        time_min, time_max = time_range
+        times = np.asarray(times)
+        itimes = np.flatnonzero((times >= time_min) & (times <= time_max))
+        for name in [data_name + 's' for data_name in data_names] + ['_times']:
+            values = obj_dict.get(name)
+            if isinstance(values, np.ndarray) and len(values) == ntimes:
+                obj_dict[name] = values[itimes]
+            elif isinstance(values, list) and len(values) == ntimes:
+                obj_dict[name] = [values[itime] for itime in itimes.tolist()]
+        _set_sizes(obj_dict, ['ntimes'], ntimes, len(itimes))
+
+    irows = None
+    for key, id_type in ROW_ID_KEYS:
+        ids = obj_dict.get(key)
+        if isinstance(ids, np.ndarray) and ids.ndim and len(ids) == nrows:
+            break
+    else:
+        return itimes, irows
+
+    valid_ids = node_ids if id_type == 'node' else element_ids
+    if valid_ids is None:
+        return itimes, irows
+    ids = ids[:, 0] if ids.ndim == 2 else ids
+    irows = np.flatnonzero(np.isin(ids, valid_ids))
+    for key, value in list(obj_dict.items()):
+        if (key not in NON_ROW_KEYS and isinstance(value, np.ndarray) and
+                value.ndim and len(value) == nrows):
+            obj_dict[key] = value[irows]
+
+    element_cid = obj_dict.get('element_cid')
+    if id_type == 'element' and isinstance(element_cid, np.ndarray) and element_cid.ndim == 2:
+        obj_dict['element_cid'] = element_cid[np.isin(element_cid[:, 0], valid_ids), :]
+
+    # the number of rows/ids (e.g., the number of elements of a CQUAD4
+    # with 5 rows per element)
+    _set_sizes(obj_dict, ['ntotal', 'nelements', 'nnodes'], nrows, len(irows))
+    _set_sizes(obj_dict, ['nelements', 'nnodes'],
+               len(np.unique(ids)), len(np.unique(ids[irows])))
+    return itimes, irows
+
+
+def _set_sizes(obj_dict: dict[str, Any], names: list[str],
+               old_size: int, new_size: int) -> None:
+    """updates the sizes (e.g., ntotal) that match the full data"""
+    for name in names:
+        value = obj_dict.get(name)
+        if isinstance(value, int) and value == old_size:
+            obj_dict[name] = new_size
+
+
+def read_hdf5_data(h5_data: h5py.Dataset,
+                   itimes: Optional[np.ndarray]=None,
+                   irows: Optional[np.ndarray]=None) -> np.ndarray:
+    """
+    Reads a (time, row) hyperslab of the (ntimes, nrows, ncols) data
+
+    Parameters
+    ----------
+    h5_data : h5py.Dataset
+        the data
+    itimes / irows : (n, ) int ndarray; default=None -> all
+        the sorted times/rows to read
+
+    """
+    ntimes, nrows = h5_data.shape[:2]
+    if (itimes is not None and len(itimes) == 0) or (irows is not None and len(irows) == 0):
+        shape = (ntimes if itimes is None else len(itimes),
+                 nrows if irows is None else len(irows), *h5_data.shape[2:])
+        return np.zeros(shape, dtype=h5_data.dtype)
+
+    time_index = _get_hdf5_index(itimes)
+    row_index = _get_hdf5_index(irows)
+    if isinstance(time_index, np.ndarray) and isinstance(row_index, np.ndarray):
+        # h5py supports a list on only one axis
+        data = h5_data[time_index[0]:time_index[-1] + 1, row_index]
+        return data[time_index - time_index[0]]
+    return h5_data[time_index, row_index]
+
+
+def _get_hdf5_index(indices: Optional[np.ndarray]) -> Union[slice, np.ndarray]:
+    """gets a slice for all/a contiguous set of indices"""
+    if indices is None:
+        return slice(None)
+    if indices[-1] - indices[0] + 1 == len(indices):
+        return slice(int(indices[0]), int(indices[-1]) + 1)
+    return indices
+
+
+class Hdf5LazyLoader:
+    """
+    reads the data of the results of ``load_hdf5_filename(..., lazy=True)``
+    the first time it's accessed (see LazyResult)
+
+    The HDF5 file is left open until ``model.load_lazy_results()`` is called.
+    """
+    def __init__(self, model: OP2, h5_file: h5py.File, is_owner: bool=True):
+        self.model = model
+        self.h5_file = h5_file
+        self.is_owner = is_owner
+        #: id(obj) : (cls, dataset name, itimes, irows)
+        self.objects = {}
+
+    @property
+    def nobjects(self) -> int:
+        """the number of results that haven't been loaded"""
+        return len(self.objects)
+
+    def add(self, obj: Any, h5_data: h5py.Dataset,
+            itimes: Optional[np.ndarray], irows: Optional[np.ndarray]) -> None:
+        """swaps the class of the object, so the data is loaded on demand"""
+        cls = obj.__class__
+        obj.__dict__.pop('data', None)
+        self.objects[id(obj)] = (cls, h5_data.name, itimes, irows)
+        obj._lazy_loader = self
+        obj.__class__ = get_lazy_class(cls)
+
+    def load(self, obj: Any) -> None:
+        """reads the data of a lazy result object"""
+        cls, dataset_name, itimes, irows = self.objects[id(obj)]
+        if not self.h5_file:
+            # the object is left lazy, so the error is the same the next time
+            raise RuntimeError(f'cannot load {cls.__name__} because the HDF5 file was closed')
+        data = read_hdf5_data(self.h5_file[dataset_name], itimes, irows)
+        del self.objects[id(obj)]
+        obj.__class__ = cls
+        del obj._lazy_loader
+        obj.data = data
+
+    def get_sizes(self, obj: Any) -> tuple[int, str, int, int]:
+        """gets the isubcase, element_name, ntimes, ntotal of a lazy result"""
+        obj_dict = obj.__dict__
+        return (obj_dict.get('isubcase'), obj_dict.get('element_name', ''),
+                obj_dict.get('ntimes', 0), obj_dict.get('ntotal', 0))
+
+    def load_all(self) -> None:
+        """reads all the lazy results"""
+        for result_type in self.model.get_table_types():
+            result = self.model.get_result(result_type)
+            if not isinstance(result, dict):
+                continue
+            for obj in list(result.values()):
+                if isinstance(obj, LazyResult):
+                    self.load(obj)
+
+    def close(self) -> None:
+        """closes the HDF5 file; results that weren't loaded can't be loaded anymore"""
+        if self.is_owner:
+            self.h5_file.close()
+        self.model.lazy_loader = None
+
+
 def _apply_hdf5_attributes_to_object(obj, h5_result, result_name, data_code, str_data_names,
                                      encoding: str, debug: bool=False):
     """helper method for ``_load_table``"""
@@ -1243,6 +1471,9 @@ def _apply_hdf5_attributes_to_object(obj, h5_result, result_name, data_code, str
     for key in h5_result.keys():
         if key not in filtered_attrs:
             continue
+        elif key == 'data':
+            # read by _load_table, so a subset of the data may be read
+            continue
         elif result_name == 'grid_point_forces' and key in ['element_name']:
             pass
         elif key in str_data_names:
@@ -1342,23 +1573,43 @@ def _get_obj_class(objs: tuple[Any],
             #obj_class = complex_obj
     return obj_class
 
-def export_op2_to_hdf5_filename(hdf5_filename: str, op2_model: OP2) -> None:
-    """exports an OP2 object to an HDF5 file"""
+def export_op2_to_hdf5_filename(hdf5_filename: str, op2_model: OP2,
+                                compression=None, compression_opts=None) -> None:
+    """
+    exports an OP2 object to an HDF5 file
+
+    Parameters
+    ----------
+    hdf5_filename : str
+        the HDF5 file
+    op2_model : OP2
+        the model
+    compression : str / int; default=None -> no compression
+        an h5py compression filter for the result arrays
+        (e.g., 'lzf' (fast), 'gzip')
+    compression_opts : Any; default=None
+        the compression options (e.g., the gzip level)
+
+    """
     #no_sort2_classes = ['RealEigenvalues', 'ComplexEigenvalues', 'BucklingEigenvalues']
     try:
         with h5py.File(hdf5_filename, 'w') as hdf5_file:
             op2_model.log.info(f'starting export_op2_to_hdf5_file of {hdf5_filename!r}')
-            export_op2_to_hdf5_file(hdf5_file, op2_model)
+            export_op2_to_hdf5_file(hdf5_file, op2_model, compression=compression,
+                                    compression_opts=compression_opts)
     except OSError:
         op2_model.log.error(f'failed to export {hdf5_filename!r}')
         raise
 
-def export_op2_to_hdf5_file(hdf5_file, op2_model: OP2) -> None:
+def export_op2_to_hdf5_file(hdf5_file, op2_model: OP2,
+                            compression=None, compression_opts=None) -> None:
     """exports an OP2 object to an HDF5 file object"""
     assert not isinstance(hdf5_file, str), hdf5_file
     create_info_group(hdf5_file, op2_model)
-    export_matrices(hdf5_file, op2_model)
-    _export_subcases(hdf5_file, op2_model)
+    export_matrices(hdf5_file, op2_model, compression=compression,
+                    compression_opts=compression_opts)
+    _export_subcases(hdf5_file, op2_model, compression=compression,
+                     compression_opts=compression_opts)
 
 def create_info_group(hdf5_file, op2_model: OP2) -> None:
     """creates the info HDF5 group"""
@@ -1369,21 +1620,23 @@ def create_info_group(hdf5_file, op2_model: OP2) -> None:
     #info_group.create_dataset('is_nx', data=self.is_nx)
     #info_group.create_dataset('nastran_version', data=self.is_nx)
 
-def export_matrices(hdf5_file, op2_model: OP2) -> None:
+def export_matrices(hdf5_file, op2_model: OP2,
+                    compression=None, compression_opts=None) -> None:
     """exports the matrices to HDF5"""
     if len(op2_model.matrices):
         matrix_group = hdf5_file.create_group('matrices')
         for key, matrix in sorted(op2_model.matrices.items()):
             matrixi_group = matrix_group.create_group(key.encode('latin-1'))
             if hasattr(matrix, 'export_to_hdf5'):
-                matrix.export_to_hdf5(matrixi_group, op2_model.log)
+                matrix.export_to_hdf5(matrixi_group, op2_model.log, compression=compression,
+                                      compression_opts=compression_opts)
             else:
                 msg = 'HDF5: key=%r type=%s cannot be exported' % (key, str(type(matrix)))
                 op2_model.log.warning(msg)
                 raise NotImplementedError(msg)
                 #continue
 
-def _export_subcases(hdf5_file, op2_model):
+def _export_subcases(hdf5_file, op2_model, compression=None, compression_opts=None):
     """exports the subcases to HDF5"""
     subcase_groups = {}
     result_types = op2_model.get_table_types()
@@ -1421,35 +1674,92 @@ def _export_subcases(hdf5_file, op2_model):
             #result_name = result_type + ':' + class_name
             result_name = result_type
             result_group = subcase_group.create_group(result_name)
-            obj.export_to_hdf5(result_group, op2_model.log)
+            obj.export_to_hdf5(result_group, op2_model.log, compression=compression,
+                               compression_opts=compression_opts)
 
-def load_op2_from_hdf5(hdf5_filename, combine=True, log=None):
-    return load_op2_from_hdf5_filename(hdf5_filename, combine=combine, log=log)
+def load_op2_from_hdf5(hdf5_filename, combine=True, log=None, **kwargs):
+    return load_op2_from_hdf5_filename(hdf5_filename, combine=combine, log=log, **kwargs)
 
 def load_op2_from_hdf5_filename(hdf5_filename: str, combine: bool=True,
-                                log: Optional[SimpleLogger]=None):
-    """loads an hdf5 file into an OP2 object"""
+                                log: Optional[SimpleLogger]=None,
+                                include_results: Optional[list[str]]=None,
+                                exclude_results: Optional[list[str]]=None,
+                                subcases: Optional[list[int]]=None,
+                                node_ids: Optional[list[int]]=None,
+                                element_ids: Optional[list[int]]=None,
+                                time_range: Optional[tuple[float, float]]=None,
+                                lazy: bool=False) -> OP2:
+    """
+    loads an hdf5 file into an OP2 object
+
+    Parameters
+    ----------
+    hdf5_filename : str
+        the HDF5 file
+    combine : bool; default=True
+        runs the combine routine
+    log : SimpleLogger; default=None
+        the logging object
+    include_results / exclude_results : list[str] / str; default=None
+        a list of result types to include/exclude (e.g., 'stress')
+    subcases : list[int]; default=None -> all subcases
+        the subcases to load
+    node_ids / element_ids : list[int] / (n, ) int array; default=None -> all ids
+        the rows of the nodal/element results to load
+        (e.g., np.arange(1000, 2001))
+    time_range : (float, float); default=None -> all times
+        the (min, max) time/frequency/mode to load (inclusive)
+    lazy : bool; default=False
+        only read the result data when it's accessed; the HDF5 file is
+        left open until ``model.load_lazy_results()`` is called
+
+    """
     check_path(hdf5_filename, 'hdf5_filename')
     model = OP2(log=log)
-    model.op2_filename = hdf5_filename
-
-    log.info(f'hdf5_op2_filename = {hdf5_filename!r}')
-    debug = False
-    with h5py.File(hdf5_filename, 'r') as h5_file:
-        load_op2_from_hdf5_file(model, h5_file, log, debug=debug)
-    model.combine_results(combine=combine)
+    model.include_exclude_results(exclude_results=exclude_results,
+                                  include_results=include_results)
+    model.set_subcases(subcases)
+    model.set_node_ids(node_ids)
+    model.set_element_ids(element_ids)
+    model.set_time_range(time_range)
+    model.load_hdf5_filename(hdf5_filename, combine=combine, lazy=lazy)
     return model
 
 def load_op2_from_hdf5_file(model: OP2, h5_file,
-                            log: SimpleLogger, debug=False):
-    """loads an h5 file object into an OP2 object"""
+                            log: SimpleLogger, debug=False, lazy: bool=False):
+    """
+    loads an h5 file object into an OP2 object
+
+    Only the results, subcases, nodes/elements and times selected with
+    model.set_results, set_subcases, set_node_ids, set_element_ids and
+    set_time_range are read.  If lazy, the result data is read the first
+    time it's accessed (see Hdf5LazyLoader).
+    """
     encoding = 'latin1'
+    results = getattr(model, '_results', None)
+    valid_subcases = None if getattr(model, 'is_all_subcases', True) else model.valid_subcases
+    selection = {
+        'node_ids': getattr(model, 'valid_node_ids', None),
+        'element_ids': getattr(model, 'valid_element_ids', None),
+        'time_range': getattr(model, 'valid_time_range', None),
+    }
+    lazy_loader = None
+    if lazy:
+        lazy_loader = model.lazy_loader = Hdf5LazyLoader(model, h5_file, is_owner=False)
+
     for key in h5_file.keys():
         if key.startswith('Subcase'):
             h5_subcase = h5_file.get(key)
             #log.debug('subcase:')
             for result_name in h5_subcase.keys():
                 assert isinstance(result_name, str), f'result_name={result_name}; type={type(result_name)}'
+                if (results is not None and result_name in results.allowed and
+                        results.is_not_saved(result_name)):
+                    continue
+                if valid_subcases is not None:
+                    isubcase = _cast(h5_subcase.get(result_name).get('isubcase'))
+                    if isubcase is not None and isubcase not in valid_subcases:
+                        continue
 
                 if result_name in ['eigenvalues', 'eigenvalues_fluid']:
                     #log.warning('    skipping %r...' % result_name)
@@ -1476,7 +1786,8 @@ def load_op2_from_hdf5_file(model: OP2, h5_file,
                         continue
                     assert isinstance(objs, tuple), f'check that {result_name!r} is tuple in the above dictionary'
                     obj = _load_table(result_name, h5_result, objs,
-                                      encoding, log=log, debug=debug)
+                                      encoding, log=log, debug=debug,
+                                      lazy_loader=lazy_loader, **selection)
                     if obj is None:
                         continue
 
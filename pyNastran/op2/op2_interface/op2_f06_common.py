@@ -11,6 +11,7 @@ from pyNastran.bdf.cards.base_card import deprecated
 from pyNastran.bdf.case_control_deck import CaseControlDeck
 
 from pyNastran.op2.result_objects.op2_results import Results
+from pyNastran.op2.op2_interface.op2_lazy import LazyResult
 
 if TYPE_CHECKING:  # pragma: no cover
     from pyNastran.op2.op2 import OP2
@@ -1882,6 +1883,8 @@ def _get_op2_stats_short(model: OP2, table_types: list[str],
             class_name = subcase.__class__.__name__
             if class_name in no_data_classes:
                 msg.append('%s[%r]\n' % (table_type_print, isubcase))
+            elif isinstance(subcase, LazyResult):
+                msg.append('%s[%s] # lazy\n' % (table_type_print, isubcase))
             elif hasattr(subcase, 'data'):
                 #data = subcase.data
                 #shape = [int(i) for i in subcase.data.shape]
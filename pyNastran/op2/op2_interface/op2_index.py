@@ -0,0 +1,274 @@
+"""
+Defines:
+ - OP2Index(op2_filename)
+ - get_index_filename(op2_filename)
+
+The OP2Index is a byte-offset map of an OP2.  It stores:
+ - the offset of every table (e.g., OUGV1, OES1X1)
+ - the offset/length of every table 3 (header) / table 4 (data) record
+   along with the table 3 codes (approach_code, table_code, element_type,
+   isubcase, num_wide)
+
+The index is built during the array sizing pass (read_mode=1) and is then
+used to jump directly to the records during the array filling pass
+(read_mode=2).  It may be saved as a sidecar file (e.g., model.op2_index.npz),
+so the next time the OP2 is loaded, the array sizing pass doesn't need to
+walk the Fortran block markers of the data records.
+
+"""
+from __future__ import annotations
+import os
+from typing import Optional
+
+import numpy as np
+
+#: bump this when the layout of the sidecar file changes
+INDEX_VERSION = 1
+
+TABLE_DTYPE = np.dtype([
+    ('table_name', 'S8'),
+    ('offset', 'int64'),
+])
+
+# record_type:
+#    3 : table 3 (header record)
+#    4 : table 4 (data record)
+#
+# The codes are from the last table 3, so they're also filled for table 4.
+# element_type is the 3rd word of the table 3, which is only an
+# element type for element-based tables (e.g., OES, OEF)
+SUBTABLE_DTYPE = np.dtype([
+    ('itable', 'int32'),
+    ('igroup', 'int32'),
+    ('isubtable', 'int32'),
+    ('record_type', 'int8'),
+    ('offset', 'int64'),
+    ('record_len', 'int64'),
+    ('approach_code', 'int32'),
+    ('table_code', 'int32'),
+    ('element_type', 'int32'),
+    ('isubcase', 'int32'),
+    ('num_wide', 'int32'),
+])
+
+
+def get_index_filename(op2_filename: str) -> str:
+    """gets the sidecar index filename (e.g., model.op2 -> model.op2_index.npz)"""
+    base = os.path.splitext(op2_filename)[0]
+    return base + '.op2_index.npz'
+
+
+class OP2Index:
+    """stores the byte offsets of the tables/subtables in an OP2"""
+    def __init__(self, op2_filename: str):
+        """
+        Creates an empty OP2Index
+
+        Parameters
+        ----------
+        op2_filename : str
+            the OP2 that is being indexed
+
+        """
+        self.op2_filename = op2_filename
+        stat = os.stat(op2_filename)
+        self.nbytes = stat.st_size
+        self.mtime_ns = stat.st_mtime_ns
+
+        #: 4 (single precision) or 8 (double precision)
+        self.size = 4
+        self.tables = np.zeros(0, dtype=TABLE_DTYPE)
+        self.subtables = np.zeros(0, dtype=SUBTABLE_DTYPE)
+
+        # temporary storage used while the index is built
+        self._tables = []
+        self._subtables = []
+        self._igroup = -1
+        self._codes = (0, 0, 0, 0, 0)
+
+    @property
+    def ntables(self) -> int:
+        return len(self.tables)
+
+    @property
+    def nsubtables(self) -> int:
+        return len(self.subtables)
+
+    def add_table(self, table_name: bytes, offset: int) -> None:
+        """adds a table that starts at offset (the start of the table name)"""
+        self._tables.append((table_name, offset))
+        self._igroup = -1
+
+    def add_subtable_group(self) -> None:
+        """starts a new set of table 3/4 records (one per ``_read_subtables`` call)"""
+        self._igroup += 1
+
+    def add_subtable(self, isubtable: int, offset: int, record_len: int,
+                     endian: bytes, data: Optional[bytes]=None) -> int:
+        """
+        Adds a table 3/4 record
+
+        Parameters
+        ----------
+        isubtable : int
+            the subtable counter (-3, -4, -5, ...)
+        offset : int
+            the offset of the start of the record
+        record_len : int
+            the number of bytes in the record (not including the markers)
+        endian : bytes
+            the endian (b'<', b'>')
+        data : bytes; default=None
+            the table 3 record; None for a table 4 record
+
+        Returns
+        -------
+        irow : int
+            the row of the record in ``subtables``
+
+        """
+        itable = len(self._tables) - 1
+        if data is None:
+            record_type = 4
+        else:
+            record_type = 3
+            size = self.size
+            dtype = f'{endian.decode("latin1")}i{size:d}'
+            ints = np.frombuffer(data, dtype=dtype, count=min(10, len(data) // size))
+            if len(ints) == 10:
+                (approach_code, table_code, element_type, isubcase) = ints[:4]
+                num_wide = ints[9]
+                self._codes = (approach_code, table_code, element_type, isubcase, num_wide)
+        self._subtables.append((itable, self._igroup, isubtable, record_type,
+                                offset, record_len) + self._codes)
+        return len(self._subtables) - 1
+
+    def finalize(self) -> None:
+        """converts the temporary lists into arrays"""
+        self.tables = np.array(self._tables, dtype=TABLE_DTYPE)
+        self.subtables = np.array(self._subtables, dtype=SUBTABLE_DTYPE)
+        self._tables = []
+        self._subtables = []
+
+    def get_subtable_groups(self, itable: int) -> list[np.ndarray]:
+        """
+        Gets the table 3/4 records for a table
+
+        Returns
+        -------
+        groups : list[irows]
+            irows : (n, ) int array
+                the rows in ``subtables`` for a single ``_read_subtables`` call
+        """
+        irows = np.flatnonzero(self.subtables['itable'] == itable)
+        if len(irows) == 0:
+            return []
+        igroups = self.subtables['igroup'][irows]
+        groups = [irows[igroups == igroup] for igroup in range(igroups.max() + 1)]
+        return groups
+
+    def get_header_rows(self, irows: np.ndarray) -> np.ndarray:
+        """
+        Gets the table 3 (header) record that precedes each table 4 record
+
+        Parameters
+        ----------
+        irows : (n, ) int array
+            the rows of the table 4 records in ``subtables``
+
+        Returns
+        -------
+        irows3 : (n, ) int array
+            the rows of the table 3 records; -1 if there isn't one
+        """
+        is_table3 = self.subtables['record_type'] == 3
+        irows3 = np.where(is_table3, np.arange(self.nsubtables), -1)
+        np.maximum.accumulate(irows3, out=irows3)
+        return irows3[irows]
+
+    def get_result_records(self) -> np.ndarray:
+        """
+        Gets a summary of the data records grouped by
+        (table_name, isubcase, table_code, element_type)
+
+        Returns
+        -------
+        records : (n, ) structured array
+            table_name, isubcase, table_code, element_type, num_wide,
+            ntimes (the number of table 4 records), nvalues (the number of
+            nodes/elements in the largest record)
+        """
+        dtype = np.dtype([
+            ('table_name', 'S8'), ('isubcase', 'int32'), ('table_code', 'int32'),
+            ('element_type', 'int32'), ('num_wide', 'int32'),
+            ('ntimes', 'int32'), ('nvalues', 'int64'),
+        ])
+        subtables = self.subtables[(self.subtables['record_type'] == 4) &
+                                   (self.subtables['num_wide'] > 0)]
+        records = {}
+        for subtable in subtables:
+            table_name = self.tables['table_name'][subtable['itable']]
+            key = (table_name, subtable['isubcase'], subtable['table_code'],
+                   subtable['element_type'], subtable['num_wide'])
+            nvalues = subtable['record_len'] // (subtable['num_wide'] * self.size)
+            ntimes0, nvalues0 = records.get(key, (0, 0))
+            records[key] = (ntimes0 + 1, max(nvalues0, nvalues))
+        out = [key + value for key, value in records.items()]
+        return np.array(out, dtype=dtype)
+
+    def is_valid(self, op2_filename: str) -> bool:
+        """is the index consistent with the OP2 (same size and modification time)"""
+        stat = os.stat(op2_filename)
+        return stat.st_size == self.nbytes and stat.st_mtime_ns == self.mtime_ns
+
+    def save(self, index_filename: str) -> None:
+        """saves the index as an npz file"""
+        np.savez(
+            index_filename,
+            version=INDEX_VERSION,
+            nbytes=self.nbytes,
+            mtime_ns=self.mtime_ns,
+            size=self.size,
+            tables=self.tables,
+            subtables=self.subtables,
+        )
+
+    @classmethod
+    def load(cls, index_filename: str, op2_filename: str) -> Optional[OP2Index]:
+        """
+        Loads an index from an npz file
+
+        Returns
+        -------
+        op2_index : OP2Index / None
+            None : the index is out of date or was written by a different version
+        """
+        op2_index = cls(op2_filename)
+        with np.load(index_filename) as data:
+            if int(data['version']) != INDEX_VERSION:
+                return None
+            op2_index.nbytes = int(data['nbytes'])
+            op2_index.mtime_ns = int(data['mtime_ns'])
+            op2_index.size = int(data['size'])
+            op2_index.tables = data['tables']
+            op2_index.subtables = data['subtables']
+        if not op2_index.is_valid(op2_filename):
+            return None
+        return op2_index
+
+    def get_stats(self) -> str:
+        """gets a summary of the indexed tables"""
+        msg = [f'OP2Index: op2_filename={self.op2_filename!r} ntables={self.ntables} '
+               f'nsubtables={self.nsubtables}\n']
+        for record in self.get_result_records():
+            table_name = record['table_name'].decode('latin1')
+            msg.append(f'  {table_name:<8s} isubcase={record["isubcase"]} '
+                       f'table_code={record["table_code"]} '
+                       f'element_type={record["element_type"]} '
+                       f'num_wide={record["num_wide"]} ntimes={record["ntimes"]} '
+                       f'nvalues={record["nvalues"]}\n')
+        return ''.join(msg)
+
+    def __repr__(self) -> str:
+        return (f'OP2Index(op2_filename={self.op2_filename!r}, ntables={self.ntables}, '
+                f'nsubtables={self.nsubtables})')
@@ -0,0 +1,349 @@
+"""
+Defines:
+ - LazyResult
+ - LazyResultLoader(model)
+
+Lazy loading reads the OP2 in the same two passes as a normal read, but the
+table 4 (data) records of the vectorized result objects (e.g.,
+RealDisplacementArray, RealPlateStressArray) are skipped during the array
+filling step.  The objects are sized (ntimes, ntotal, ...), but the
+``data`` array isn't allocated.
+
+The attributes of a lazy object are stored by the LazyResultLoader, so
+the first time any attribute (e.g., ``data``, ``element``, ``_times``) is
+accessed, the table 3/4 records of that object are read using the offsets
+in the OP2Index.  The OP2 is left open until ``model.load_lazy_results()``
+or ``model.close_op2()`` is called.
+
+``read_op2(..., n_workers=4)`` uses the same machinery to decode the
+results in parallel.  ``load_hdf5_filename(..., lazy=True)`` uses LazyResult
+with an Hdf5LazyLoader (see hdf5_interface.py).  The lazy results are grouped by table (e.g., OUGV1,
+OES1X1) and each group of tables is read by a worker process, which reads
+the OP2 using the saved OP2Index and sends back the loaded result objects.
+
+"""
+from __future__ import annotations
+from concurrent.futures import ProcessPoolExecutor
+from typing import Any, TYPE_CHECKING
+
+import numpy as np
+from cpylog import SimpleLogger
+if TYPE_CHECKING:  # pragma: no cover
+    from pyNastran.op2.op2 import OP2
+
+
+class LazyResult:
+    """
+    Mixin for a result object that hasn't been read yet
+
+    The class of the result object is swapped for a subclass of
+    (LazyResult, cls), so ``isinstance(obj, cls)`` still works.
+    """
+    def __getattr__(self, name: str) -> Any:
+        # __getattr__ is only called when the attribute doesn't exist
+        if name.startswith('__') or name == '_lazy_loader':
+            raise AttributeError(name)
+        self._lazy_loader.load(self)
+        return getattr(self, name)
+
+    def __reduce_ex__(self, protocol: int):
+        """pickle/deepcopy the loaded object"""
+        self._lazy_loader.load(self)
+        return self.__reduce_ex__(protocol)
+
+    def get_stats(self, short: bool=False) -> list[str]:
+        """gets the sizing info without loading the result"""
+        class_name = self.__class__.__name__
+        isubcase, element_name, ntimes, ntotal = self._lazy_loader.get_sizes(self)
+        element_name_str = f' element_name={element_name}' if element_name else ''
+        return [f'  type={class_name} isubcase={isubcase}{element_name_str} (lazy)\n'
+                f'  ntimes={ntimes} ntotal={ntotal}\n']
+
+    def _get_stats_short(self) -> list[str]:
+        class_name = self.__class__.__name__
+        isubcase, unused_element_name, ntimes, ntotal = self._lazy_loader.get_sizes(self)
+        return [f'{class_name}[{isubcase}]; lazy; ntimes={ntimes}; ntotal={ntotal}\n']
+
+
+class LazyResultLoader:
+    """reads the results that were skipped during the array filling step"""
+    def __init__(self, model: OP2):
+        self.model = model
+        #: id(obj) : (cls, result_type, key, irows, obj_dict)
+        self.objects = {}
+
+    @property
+    def nobjects(self) -> int:
+        """the number of results that haven't been loaded"""
+        return len(self.objects)
+
+    def setup(self, lazy_rows: dict[int, list[Any]]) -> np.ndarray:
+        """
+        Swaps the result objects for their lazy versions
+
+        Parameters
+        ----------
+        lazy_rows : dict[int, [obj, irows]]
+            the table 4 records that sized each result object
+            irows : list[int]; None if the object can't be lazy loaded
+
+        Returns
+        -------
+        is_skipped : (nsubtables, ) bool array
+            the table 4 records that shouldn't be read during the array
+            filling step
+        """
+        model = self.model
+        op2_index = model.op2_reader.op2_index
+        is_skipped = np.zeros(op2_index.nsubtables, dtype='bool')
+        for result_type, result in _get_result_dicts(model):
+            for key, obj in result.items():
+                obj_rows = lazy_rows.get(id(obj))
+                if obj_rows is None or obj_rows[1] is None or not obj_rows[1]:
+                    continue
+                obj_dict = obj.__dict__
+                if not (hasattr(obj, 'build') and obj_dict.get('is_built', True) is False and
+                        'data' in obj_dict and obj_dict['data'] is None):
+                    continue
+                irows = np.array(obj_rows[1], dtype='int64')
+                is_skipped[irows] = True
+                self._make_lazy(obj, result_type, key, irows)
+        return is_skipped
+
+    def _make_lazy(self, obj: Any, result_type: str, key: Any, irows: np.ndarray) -> None:
+        """swaps the class of the object, so the build attributes are loaded on demand"""
+        cls = obj.__class__
+        lazy_cls = get_lazy_class(cls)
+        # build/finalize change more than the arrays (e.g., nelements,
+        # table_name for SORT2), so all the attributes are stashed, which
+        # makes __getattr__ get called for everything
+        obj_dict = obj.__dict__.copy()
+        obj.__dict__.clear()
+        self.objects[id(obj)] = (cls, result_type, key, irows, obj_dict)
+        obj._lazy_loader = self
+        obj.__class__ = lazy_cls
+
+    def load(self, obj: Any) -> None:
+        """reads the table 3/4 records of a lazy result object"""
+        model = self.model
+        cls, result_type, key, irows, obj_dict = self.objects[id(obj)]
+        if not hasattr(model, 'op2_reader') or getattr(model, 'f', None) is None:
+            # the object is left lazy, so it may be loaded after the OP2 is reopened
+            raise RuntimeError(
+                f'cannot load {cls.__name__} ({result_type}[{key}]) because the OP2 '
+                'was closed; call model.load_lazy_results() before model.close_op2()')
+
+        del self.objects[id(obj)]
+        obj.__class__ = cls
+        del obj._lazy_loader
+        obj.__dict__.update(obj_dict)
+
+        op2_reader = model.op2_reader
+        op2_index = op2_reader.op2_index
+        irows3 = op2_index.get_header_rows(irows)
+        irows_all = np.unique(np.hstack([irows3[irows3 >= 0], irows]))
+
+        # the object is looked up by its original key (e.g., (1, 1, 1, 0, 0, '', ''))
+        # while it's being filled
+        result = model.get_result(result_type)
+        is_renamed = key not in result
+        if is_renamed:
+            result[key] = obj
+
+        # the code also depends on the state of the reader
+        # (e.g., an ogs from a previous table)
+        state0 = {name: getattr(model, name) for name in ('_count', 'ogs')
+                  if hasattr(model, name)}
+        table_count0 = model.table_count.copy()
+        unused_isubcase, unused_analysis_code, unused_sort_method, model._count, model.ogs = key[:5]
+        itables = op2_index.subtables['itable'][irows_all]
+        try:
+            for itable in np.unique(itables).tolist():
+                groups = op2_index.get_subtable_groups(itable)
+                op2_reader._index_groups = [
+                    group[np.isin(group, irows_all)] for group in groups]
+                table_name = op2_index.tables['table_name'][itable]
+                op2_reader._goto(int(op2_index.tables['offset'][itable]))
+                model._read_table(table_name, [])
+        finally:
+            op2_reader._index_groups = None
+            if 'ogs' not in state0:
+                del model.ogs
+            for name, value in state0.items():
+                setattr(model, name, value)
+            model.table_count = table_count0
+            if is_renamed:
+                del result[key]
+        if hasattr(obj, 'finalize'):
+            obj.finalize()
+
+    def get_sizes(self, obj: Any) -> tuple[int, str, int, int]:
+        """gets the isubcase, element_name, ntimes, ntotal of a lazy result"""
+        obj_dict = self.objects[id(obj)][-1]
+        return (obj_dict.get('isubcase'), obj_dict.get('element_name', ''),
+                obj_dict.get('ntimes', 0), obj_dict.get('ntotal', 0))
+
+    def load_all(self) -> None:
+        """reads all the lazy results"""
+        for unused_result_type, result in _get_result_dicts(self.model):
+            for obj in list(result.values()):
+                if isinstance(obj, LazyResult):
+                    self.load(obj)
+
+    def close(self) -> None:
+        """closes the OP2; results that weren't loaded can't be loaded anymore"""
+        self.model.close_op2(force=True)
+
+    def load_parallel(self, n_workers: int) -> None:
+        """
+        Reads the lazy results in a process pool
+
+        The tables are split across the workers, so the number of bytes
+        each worker reads is about the same.  Results that can't be
+        loaded by a worker are left as lazy results.
+
+        Parameters
+        ----------
+        n_workers : int
+            the number of worker processes
+
+        """
+        model = self.model
+        log = model.log
+        lazy_objects = {}
+        table_keys = {}
+        table_nbytes = {}
+        subtables = model.op2_reader.op2_index.subtables
+        for obj_id, (unused_cls, result_type, key, irows, unused_obj_dict) in self.objects.items():
+            lazy_objects[(result_type, key)] = obj_id
+            itable = int(subtables['itable'][irows[0]])
+            table_keys.setdefault(itable, []).append((result_type, key))
+            table_nbytes[itable] = table_nbytes.get(itable, 0) + int(subtables['record_len'][irows].sum())
+        if len(table_keys) < 2:
+            return
+
+        # biggest tables first; each goes to the worker with the least bytes
+        nworkers = min(n_workers, len(table_keys))
+        worker_keys = [[] for unused_i in range(nworkers)]
+        worker_nbytes = [0] * nworkers
+        for itable in sorted(table_nbytes, key=table_nbytes.get, reverse=True):
+            iworker = int(np.argmin(worker_nbytes))
+            worker_keys[iworker].extend(table_keys[itable])
+            worker_nbytes[iworker] += table_nbytes[itable]
+
+        log.debug(f'-------- reading {len(lazy_objects)} results on {nworkers} workers --------')
+        settings = _get_worker_settings(model)
+        objs = {id(obj): obj for unused_result_type, result in _get_result_dicts(model)
+                for obj in result.values() if isinstance(obj, LazyResult)}
+        with ProcessPoolExecutor(max_workers=nworkers) as executor:
+            futures = [executor.submit(_load_results, model.op2_filename, settings, keys)
+                       for keys in worker_keys]
+            for future in futures:
+                try:
+                    loaded_objects = future.result()
+                except Exception as error:
+                    # the results will be read by the main process
+                    log.warning(f'parallel OP2 read failed; {error}')
+                    continue
+                for result_type, key, loaded_obj in loaded_objects:
+                    obj_id = lazy_objects[(result_type, key)]
+                    obj = objs[obj_id]
+                    del self.objects[obj_id]
+                    obj.__class__ = loaded_obj.__class__
+                    obj.__dict__.clear()
+                    obj.__dict__.update(loaded_obj.__dict__)
+
+
+def get_lazy_class(cls: type) -> type:
+    """gets the (LazyResult, cls) subclass of a result class"""
+    try:
+        lazy_cls = _LAZY_CLASSES[cls]
+    except KeyError:
+        lazy_cls = type(cls.__name__, (LazyResult, cls), {'__module__': cls.__module__})
+        _LAZY_CLASSES[cls] = lazy_cls
+    return lazy_cls
+
+
+#: cls : (LazyResult, cls)
+_LAZY_CLASSES = {}
+
+
+def _get_result_dicts(model: OP2) -> list[tuple[str, dict[Any, Any]]]:
+    """gets the result dictionaries (e.g., model.displacements)"""
+    results = []
+    for result_type in model.get_table_types():
+        result = model.get_result(result_type)
+        if isinstance(result, dict):
+            results.append((result_type, result))
+    return results
+
+
+def _get_worker_settings(model: OP2) -> dict[str, Any]:
+    """gets the reader options, so a worker reads the OP2 the same way"""
+    level = getattr(model.log, 'level', 'warning')
+    if not isinstance(level, str):
+        level = 'warning'
+    settings = {
+        'mode': model._nastran_format,
+        'log_level': level,
+        'use_vector': model.use_vector,
+        'is_all_subcases': model.is_all_subcases,
+        'valid_subcases': model.valid_subcases,
+        'valid_node_ids': model.valid_node_ids,
+        'valid_element_ids': model.valid_element_ids,
+        'valid_time_range': model.valid_time_range,
+        'saved_results': set(model._results.saved),
+        'skip_undefined_matrices': model.skip_undefined_matrices,
+        'encoding': model.encoding,
+    }
+    return settings
+
+
+def _load_results(op2_filename: str, settings: dict[str, Any],
+                  result_keys: list[tuple[str, Any]]) -> list[tuple[str, Any, Any]]:
+    """
+    Reads a set of results in a worker process
+
+    Parameters
+    ----------
+    op2_filename : str
+        the OP2 (the OP2Index sidecar file should exist)
+    settings : dict[str, Any]
+        see ``_get_worker_settings``
+    result_keys : list[(result_type, key)]
+        the results to read
+
+    Returns
+    -------
+    loaded_objects : list[(result_type, key, obj)]
+        the loaded result objects
+    """
+    from pyNastran.op2.op2 import OP2
+    log = SimpleLogger(level=settings['log_level'])
+    model = OP2(log=log, mode=settings['mode'])
+    model.use_vector = settings['use_vector']
+    model.is_all_subcases = settings['is_all_subcases']
+    model.valid_subcases = settings['valid_subcases']
+    model.valid_node_ids = settings['valid_node_ids']
+    model.valid_element_ids = settings['valid_element_ids']
+    model.valid_time_range = settings['valid_time_range']
+    model._results.saved = settings['saved_results']
+    model.read_op2(op2_filename, combine=False,
+                   skip_undefined_matrices=settings['skip_undefined_matrices'],
+                   encoding=settings['encoding'], lazy=True)
+
+    lazy_loader = model.lazy_loader
+    objs = {}
+    for unused_result_type, result in _get_result_dicts(model):
+        for obj in result.values():
+            if isinstance(obj, LazyResult):
+                unused_cls, result_type, key = lazy_loader.objects[id(obj)][:3]
+                objs[(result_type, key)] = obj
+
+    loaded_objects = []
+    for result_type, key in result_keys:
+        obj = objs[(result_type, key)]
+        lazy_loader.load(obj)
+        loaded_objects.append((result_type, key, obj))
+    model.close_op2(force=True)
+    return loaded_objects
@@ -81,6 +81,7 @@ from pyNastran.op2.op2_interface.read_optimization import (
     read_dbcopt, read_descyc, read_destab, read_dscmcol,
     read_hisadd, read_r1tabrg)
 from pyNastran.op2.op2_interface.read_trmbu_trmbd import read_trmbu, read_trmbd
+from pyNastran.op2.op2_interface.op2_codes import _adjust_table_code
 
 if TYPE_CHECKING:  # pragma: no cover
     from pyNastran.op2.op2 import OP2
@@ -94,6 +95,11 @@ class SubTableReadError(Exception):
 
 GEOM_TABLES = MSC_GEOM_TABLES + NX_GEOM_TABLES
 
+# the table codes of the results that may be filtered by node/element id
+# (e.g., OUG/OQG/OPG and OES/OEF); the first word of each row is id*10+device_code
+NODE_TABLE_CODES = {1, 2, 3, 7, 10, 11, 12, 14, 15, 16, 17, 39}
+ELEMENT_TABLE_CODES = {4, 5}
+
 
 # https://pyyeti.readthedocs.io/en/latest/modules/nastran/generated/pyyeti.nastran.bulk.wtextseout.html
 EXTSEOUT = [
@@ -113,6 +119,23 @@ class OP2Reader:
         self.h5_file = None
         self.size = 4
 
+        #: the table/subtable byte offsets (see ``OP2Index``)
+        self.op2_index = None
+        #: should the table/subtable offsets be stored in ``op2_index``
+        self.record_index = False
+        #: the table 3/4 records of the table that is being read from the
+        #: index; None if the index isn't being used
+        self._index_groups = None
+        #: the row in ``op2_index.subtables`` of the current record
+        self._index_row = -1
+        #: the table 4 records that aren't read during the array filling step
+        #: (n, ) bool array; None if all the records are read
+        self._index_skip = None
+        #: the table 4 records that were used to size each result object
+        #: id(obj) : [obj, irows]; None if lazy loading isn't being used
+        #: irows is set to None if the object can't be lazy loaded
+        self.lazy_rows = None
+
         # Hack to dump the IBULK/CASECC decks in reverse order
         # It's in reverse because that's how Nastran writes it.
         #
@@ -3502,6 +3525,85 @@ class OP2Reader:
             return False
         return True
 
+    def is_valid_time(self) -> bool:
+        """
+        Lets the code check whether or not to read a SORT1 time step
+
+        Returns
+        -------
+        is_valid : bool
+            is the time/frequency/mode (the nonlinear_factor) in the
+            time_range set by ``OP2.set_time_range``?
+
+        """
+        op2: OP2 = self.op2
+        if op2.valid_time_range is None:
+            return True
+        nonlinear_factor = getattr(op2, 'nonlinear_factor', None)
+        if nonlinear_factor is None or np.isnan(nonlinear_factor) or not op2.is_sort1:
+            return True
+        time_min, time_max = op2.valid_time_range
+        return bool(time_min <= nonlinear_factor <= time_max)
+
+    def get_valid_ids(self) -> Optional[np.ndarray]:
+        """
+        Gets the node/element ids to read for the current table 4 record
+
+        Returns
+        -------
+        ids : (n, ) int array / None
+            the ids set by ``OP2.set_node_ids`` or ``OP2.set_element_ids``
+            None : read all the rows (no filter or an unsupported table)
+
+        """
+        op2: OP2 = self.op2
+        if op2.valid_node_ids is None and op2.valid_element_ids is None:
+            return None
+        table_code = _adjust_table_code(getattr(op2, 'table_code', 0))
+        if table_code in NODE_TABLE_CODES:
+            ids = op2.valid_node_ids
+        elif table_code in ELEMENT_TABLE_CODES:
+            ids = op2.valid_element_ids
+        else:
+            return None
+        if getattr(op2, '_data_factor', 1) != 1 or not op2.is_sort1:
+            return None
+        return ids
+
+    def filter_record_ids(self, data: bytes, ids: np.ndarray) -> tuple[bytes, int]:
+        """
+        Removes the rows of a SORT1 table 4 record that aren't in ids
+
+        Parameters
+        ----------
+        data : bytes
+            the table 4 record
+        ids : (n, ) int array
+            the node/element ids to keep
+
+        Returns
+        -------
+        data : bytes
+            the rows that were kept
+        ndata : int
+            the length of data
+
+        """
+        op2: OP2 = self.op2
+        ndata = len(data)
+        num_wide = op2.num_wide
+        nbytes_per_row = num_wide * self.size
+        if nbytes_per_row == 0 or ndata % nbytes_per_row:
+            return data, ndata
+
+        nrows = ndata // nbytes_per_row
+        row_ids = np.frombuffer(data, dtype=op2.idtype8).reshape(nrows, num_wide)[:, 0] // 10
+        is_valid = np.isin(row_ids, ids)
+        if is_valid.all():
+            return data, ndata
+        data = np.frombuffer(data, dtype='uint8').reshape(nrows, nbytes_per_row)[is_valid].tobytes()
+        return data, len(data)
+
     def read_results_table(self) -> None:
         """Reads a results table"""
         if self.size == 4:
@@ -3737,6 +3839,16 @@ class OP2Reader:
             table4_parser = None
             passer = True
 
+        if self._index_groups:
+            # we know where the table 3/4 records are, so jump to them
+            group = self._index_groups.pop(0)
+            self._read_subtables_from_index(group, table3_parser, table4_parser, passer)
+            op2._finish()
+            return
+
+        if self.record_index:
+            self.op2_index.add_subtable_group()
+
         # we need to check the marker, so we read it and rewind, so we don't
         # screw up our positioning in the file
         markers = self.get_nmarkers(1, rewind=True)
@@ -3829,10 +3941,44 @@ class OP2Reader:
         assert marker == 0, marker
         op2._finish()
 
+    def _read_subtables_from_index(self, irows: np.ndarray,
+                                   table3_parser: Optional[Callable],
+                                   table4_parser: Optional[Callable],
+                                   passer: bool) -> None:
+        """
+        Reads a series of subtable 3/4 using the offsets in the OP2Index,
+        so the block markers don't need to be walked.
+
+        Parameters
+        ----------
+        irows : (n, ) int array
+            the rows of the table 3/4 records in ``op2_index.subtables``
+        table3_parser / table4_parser / passer
+            see ``_read_subtable_3_4``
+
+        """
+        if passer:
+            return
+        op2: OP2 = self.op2
+        if self._index_skip is not None:
+            irows = irows[~self._index_skip[irows]]
+        subtables = self.op2_index.subtables[irows]
+        for irow, isubtable, offset, record_len in zip(irows.tolist(),
+                                                       subtables['isubtable'].tolist(),
+                                                       subtables['offset'].tolist(),
+                                                       subtables['record_len'].tolist()):
+            self._index_row = irow
+            op2.isubtable = isubtable
+            op2.is_start_of_subtable = True
+            self._goto(offset)
+            self._read_subtable_3_4(table3_parser, table4_parser, passer,
+                                    record_len=record_len)
+
     def _read_subtable_3_4(self,
                            table3_parser: Optional[Callable],
                            table4_parser: Optional[Callable],
-                           passer: Optional[Callable]) -> Optional[bool]:
+                           passer: Optional[Callable],
+                           record_len: Optional[int]=None) -> Optional[bool]:
         """
         Reads a series of subtable 3/4
 
@@ -3846,6 +3992,10 @@ class OP2Reader:
             function : the table 4 reading function
         passer : bool
             flag to see if we're skipping tables
+        record_len : int; default=None
+            None : calculate the length of the record from the block markers
+            int : the length of the record from the OP2Index; skipped
+                  records aren't read
 
         Returns
         -------
@@ -3860,7 +4010,10 @@ class OP2Reader:
         if self.binary_debug:
             self.binary_debug.write('-' * 60 + '\n')
         # this is the length of the current record inside table3/table4
-        record_len = self._get_record_length()
+        is_indexed = record_len is not None
+        offset = op2.n
+        if not is_indexed:
+            record_len = self._get_record_length()
         if self.is_debug_file:
             self.binary_debug.write(f'record_length = {record_len:d}\n')
 
@@ -3882,6 +4035,9 @@ class OP2Reader:
             }
             op2.obj = None
             data, ndata = self._read_record_ndata()
+            if self.record_index:
+                self._index_row = self.op2_index.add_subtable(
+                    op2.isubtable, offset, record_len, self._endian, data)
             if not passer:
                 try:
                     table3_parser(data, ndata)
@@ -3907,6 +4063,9 @@ class OP2Reader:
                                 #print('***_init_vector_counter', self.op2.table_name)
                             #print('record_len', record_len)
                             self.op2._init_vector_counter(record_len)
+                            if self.lazy_rows is not None:
+                                # the table 3 record was read as a table 4 record
+                                self._add_lazy_row(is_valid=False)
                         else:
                             self.op2._reset_vector_counter()
 
@@ -3916,20 +4075,28 @@ class OP2Reader:
                 #if hasattr(op2, 'isubcase'):
                     #print("code = ", op2._get_code())
         else:
+            if self.record_index:
+                self._index_row = self.op2_index.add_subtable(
+                    op2.isubtable, offset, record_len, self._endian)
             if table_name in GEOM_TABLES:
                 if passer:
-                    data = self._skip_record()
+                    if not is_indexed:
+                        data = self._skip_record()
                 else:
                     data, ndata = self._read_record_ndata()
                     unused_n = table4_parser(data, ndata)
 
-            elif passer or not self.is_valid_subcase():
-                data = self._skip_record()
+            elif passer or not self.is_valid_subcase() or not self.is_valid_time():
+                if not is_indexed:
+                    data = self._skip_record()
             else:
                 if hasattr(op2, 'num_wide'):
                     # num_wide is the result size and is usually found in
                     # table3, but some B-list tables don't have it
-                    unused_n = op2._read_subtable_results(table4_parser, record_len)
+                    unused_n = op2._read_subtable_results(table4_parser, record_len,
+                                                          is_indexed=is_indexed)
+                    if self.lazy_rows is not None and op2.read_mode == 1:
+                        self._add_lazy_row()
                 else:
                     data, ndata = self._read_record_ndata()
                     unused_n = table4_parser(data, ndata)
@@ -3938,6 +4105,22 @@ class OP2Reader:
                 #del n
         return None
 
+    def _add_lazy_row(self, is_valid: bool=True) -> None:
+        """
+        Stores the current table 4 record, so the result object it sized
+        may be filled later (see ``LazyResultLoader``)
+        """
+        obj = getattr(self.op2, 'obj', None)
+        if obj is None:
+            return
+        obj_rows = self.lazy_rows.setdefault(id(obj), [obj, []])
+        if obj_rows[1] is None:
+            return
+        if is_valid:
+            obj_rows[1].append(self._index_row)
+        else:
+            obj_rows[1] = None
+
     def _run_checks(self, table4_parser):
         """helper method"""
         if table4_parser != self.op2._table_passer:
@@ -63,6 +63,7 @@ from pyNastran import is_release, __version__
 from pyNastran.f06.errors import FatalError
 from pyNastran.op2.errors import EmptyRecordError
 from pyNastran.op2.op2_interface.op2_reader import OP2Reader, reshape_bytes_block
+from pyNastran.op2.op2_interface.op2_index import OP2Index
 from pyNastran.bdf.cards.params import PARAM
 
 #============================
@@ -437,6 +438,13 @@ def _check_unique_sets(*sets: list[set[str]]):
 _check_unique_sets(INT_PARAMS_1, FLOAT_PARAMS_1, FLOAT_PARAMS_2, STR_PARAMS_1)
 
 
+def _get_valid_ids(ids) -> Optional[np.ndarray]:
+    """helper for set_node_ids/set_element_ids"""
+    if ids is None:
+        return None
+    return np.unique(np.atleast_1d(np.asarray(ids, dtype='int64')))
+
+
 class OP2_Scalar(OP2Common, FortranFormat):
     """Defines an interface for the Nastran OP2 file."""
     @property
@@ -564,6 +572,12 @@ class OP2_Scalar(OP2Common, FortranFormat):
 
         self.result_names = set()
 
+        #: the node/element ids of the results to read (None -> all)
+        self.valid_node_ids = None
+        self.valid_element_ids = None
+        #: the (min, max) time/frequency/mode to read (None -> all)
+        self.valid_time_range = None
+
         self.grid_point_weight: dict[str, GridPointWeight] = {}
         self.words = []
         self.debug = debug
@@ -606,6 +620,57 @@ class OP2_Scalar(OP2Common, FortranFormat):
             self.valid_subcases = set(subcases)
         self.log.debug(f'set_subcases - subcases = {self.valid_subcases}')
 
+    def set_node_ids(self, node_ids=None) -> None:
+        """
+        Allows you to read only the rows of the SORT1 nodal results
+        (e.g., displacements, spc_forces, load_vectors) for a set of nodes.
+        The result arrays are sized to the selected nodes.
+
+        Parameters
+        ----------
+        node_ids : list[int] / (n, ) int array; default=None -> all nodes
+            the node ids to read
+
+        """
+        self.valid_node_ids = _get_valid_ids(node_ids)
+
+    def set_element_ids(self, element_ids=None) -> None:
+        """
+        Allows you to read only the rows of the SORT1 element results
+        (e.g., cquad4_stress, cbar_force) for a set of elements.
+        The result arrays are sized to the selected elements.
+
+        Parameters
+        ----------
+        element_ids : list[int] / (n, ) int array; default=None -> all elements
+            the element ids to read
+
+        """
+        self.valid_element_ids = _get_valid_ids(element_ids)
+
+    def set_time_range(self, time_range=None) -> None:
+        """
+        Allows you to read only the SORT1 time steps/frequencies/modes/load
+        steps (the nonlinear_factor) within a range.  Static results are
+        always read.
+
+        Parameters
+        ----------
+        time_range : (float, float); default=None -> all times
+            the (min, max) time to read (inclusive)
+
+        Examples
+        --------
+        **read modes 1-20**
+        >>> model.set_time_range((1, 20))
+
+        """
+        if time_range is not None:
+            time_min, time_max = time_range
+            assert time_min <= time_max, f'time_range={time_range}'
+            time_range = (time_min, time_max)
+        self.valid_time_range = time_range
+
     def set_transient_times(self, times):  # TODO this name sucks...
         """
         Takes a dictionary of list of times in a transient case and
@@ -2001,8 +2066,12 @@ class OP2_Scalar(OP2Common, FortranFormat):
 
         self._make_tables()
         table_names = []
+        op2_reader = self.op2_reader
         try:
-            self._read_tables(table_name, table_names)
+            if op2_reader.op2_index is not None and not op2_reader.record_index:
+                self._read_tables_from_index(op2_reader.op2_index, table_names)
+            else:
+                self._read_tables(table_name, table_names)
         except EmptyRecordError:
             self.show(500, types='ifs', endian=None, force=False)
             raise
@@ -2145,96 +2214,140 @@ class OP2_Scalar(OP2Common, FortranFormat):
 
         """
         self.table_mapper = self._get_table_mapper()
-        desc_map = self.op2_reader.desc_map
 
         op2_reader = self.op2_reader
+        op2_index = op2_reader.op2_index
+        if op2_reader.record_index:
+            op2_index.size = self.size
+
         self.table_count = defaultdict(int)
         while table_name is not None:
-            self.table_count[table_name] += 1
-            table_names.append(table_name)
-
-            if self.is_debug_file:
-                self.binary_debug.write('-' * 80 + '\n')
-                self.binary_debug.write(f'table_name = {table_name!r}\n')
-
-            if is_release:
-                #self.log.info("table_name = %r ()" % (
-                    #table_name + ' (' + self.desc_map.get(table_name, '') + ')').rstrip('( )'))
-                #self.log.info("table_name = %r ()" % (
-                    #table_name + ' (' + self.desc_map.get(table_name, '') + ')').rstrip('( )'))
-                #self.log.debug(f'  table_name={table_name!r}')
-                try:
-                    desc = desc_map[table_name]
-                except KeyError:
-                    if table_name in MATRIX_TABLES:
-                        desc = 'matrix'
-                    else:
-                        desc = '???'
-                        #self.log.debug('unknown table')
-                        #raise
-                #print(table_name, desc)
-                #desc = desc_map.get(table_name, '???')
-                assert isinstance(desc, str), table_name
-                table_name2 = f'{table_name!r}'
-                self.log.debug(f'  table_name={table_name2:<11} ({desc})')
-                #assert desc != '???', table_name2
-
-            self.table_name = table_name
-            #if 0:
-                #op2_reader._skip_table(table_name)
-            #else:
-            #print(table_name, table_name in op2_reader.mapped_tables)
-            if table_name in self.generalized_tables:
-                t0 = self.f.tell()
-                self.generalized_tables[table_name](self)
-                assert self.f.tell() != t0, 'the position was unchanged...'
-            elif table_name in op2_reader.mapped_tables:
-                t0 = self.f.tell()
-                func, unused_desc = op2_reader.mapped_tables[table_name]
-                func()
-                assert self.f.tell() != t0, 'the position was unchanged...'
-            elif table_name in GEOM_TABLES:
-                op2_reader.read_geom_table()  # DIT (agard)
-            elif table_name in MATRIX_TABLES:
-                read_matrix(op2_reader, table_name)
-            elif table_name in RESULT_TABLES:
-                op2_reader.read_results_table()
-            elif self.skip_undefined_matrices:
-                read_matrix(op2_reader, table_name)
-            elif table_name.strip() in self.additional_matrices:
-                read_matrix(op2_reader, table_name)
-            else:
-                #self.show(1000, types='ifsq')
-                msg = (
-                    f'Invalid Table = {table_name!r}\n\n'
-                    'If you have matrices that you want to read, see:\n'
-                    '  model.set_additional_matrices_to_read(matrices)\n'
-                    '  matrices = {\n'
-                    "      b'BHH' : True,\n"
-                    "      b'KHH' : False,\n"
-                    '  }  # you want to read some matrices, but not others\n'
-                    "  matrices = [b'BHH', b'KHH']  # assumes True\n\n"
-
-                    'If you the table is a geom/result table, see:\n'
-                    '  model.set_additional_result_tables_to_read(methods_dict)\n'
-                    "  methods_dict = {\n"
-                    "      b'OUGV1' : [method3, method4],\n"
-                    "      Gb'GEOM4SX' : [method3, method4],\n"
-                    "      b'OES1X1' : False,\n"
-                    '  }\n\n'
-
-                    'If you want to take control of the OP2 reader (mainly useful '
-                    'for obscure tables), see:\n'
-                    "  methods_dict = {\n"
-                    "      b'OUGV1' : [method],\n"
-                    '  }\n'
-                    '  model.set_additional_generalized_tables_to_read(methods_dict)\n'
-                )
-                raise NotImplementedError(msg)
-
+            if op2_reader.record_index:
+                op2_index.add_table(table_name, self.n)
+            self._read_table(table_name, table_names)
             table_name = op2_reader._read_table_name(last_table_name=table_name,
                                                      rewind=True, stop_on_failure=False)
 
+    def _read_tables_from_index(self, op2_index: OP2Index, table_names: list[bytes]) -> None:
+        """
+        Reads all the geometry/result tables by jumping to the offsets
+        stored in the OP2Index.  The OP2 header is not read by this function.
+
+        Parameters
+        ----------
+        op2_index : OP2Index
+            the table/subtable offsets
+        table_names : list[bytes str]
+            the table names that were read
+
+        """
+        self.table_mapper = self._get_table_mapper()
+
+        op2_reader = self.op2_reader
+        self.table_count = defaultdict(int)
+        for itable, (table_name, offset) in enumerate(zip(op2_index.tables['table_name'].tolist(),
+                                                          op2_index.tables['offset'].tolist())):
+            op2_reader._goto(offset)
+            op2_reader._index_groups = op2_index.get_subtable_groups(itable)
+            self._read_table(table_name, table_names)
+        op2_reader._index_groups = None
+
+    def _read_table(self, table_name: bytes, table_names: list[bytes]) -> None:
+        """
+        Reads a single geometry/result table
+
+        Parameters
+        ----------
+        table_name : bytes str
+            the table's name
+        table_names : list[bytes str]
+            the table names that were read
+
+        """
+        desc_map = self.op2_reader.desc_map
+        op2_reader = self.op2_reader
+        self.table_count[table_name] += 1
+        table_names.append(table_name)
+
+        if self.is_debug_file:
+            self.binary_debug.write('-' * 80 + '\n')
+            self.binary_debug.write(f'table_name = {table_name!r}\n')
+
+        if is_release:
+            #self.log.info("table_name = %r ()" % (
+                #table_name + ' (' + self.desc_map.get(table_name, '') + ')').rstrip('( )'))
+            #self.log.info("table_name = %r ()" % (
+                #table_name + ' (' + self.desc_map.get(table_name, '') + ')').rstrip('( )'))
+            #self.log.debug(f'  table_name={table_name!r}')
+            try:
+                desc = desc_map[table_name]
+            except KeyError:
+                if table_name in MATRIX_TABLES:
+                    desc = 'matrix'
+                else:
+                    desc = '???'
+                    #self.log.debug('unknown table')
+                    #raise
+            #print(table_name, desc)
+            #desc = desc_map.get(table_name, '???')
+            assert isinstance(desc, str), table_name
+            table_name2 = f'{table_name!r}'
+            self.log.debug(f'  table_name={table_name2:<11} ({desc})')
+            #assert desc != '???', table_name2
+
+        self.table_name = table_name
+        #if 0:
+            #op2_reader._skip_table(table_name)
+        #else:
+        #print(table_name, table_name in op2_reader.mapped_tables)
+        if table_name in self.generalized_tables:
+            t0 = self.f.tell()
+            self.generalized_tables[table_name](self)
+            assert self.f.tell() != t0, 'the position was unchanged...'
+        elif table_name in op2_reader.mapped_tables:
+            t0 = self.f.tell()
+            func, unused_desc = op2_reader.mapped_tables[table_name]
+            func()
+            assert self.f.tell() != t0, 'the position was unchanged...'
+        elif table_name in GEOM_TABLES:
+            op2_reader.read_geom_table()  # DIT (agard)
+        elif table_name in MATRIX_TABLES:
+            read_matrix(op2_reader, table_name)
+        elif table_name in RESULT_TABLES:
+            op2_reader.read_results_table()
+        elif self.skip_undefined_matrices:
+            read_matrix(op2_reader, table_name)
+        elif table_name.strip() in self.additional_matrices:
+            read_matrix(op2_reader, table_name)
+        else:
+            #self.show(1000, types='ifsq')
+            msg = (
+                f'Invalid Table = {table_name!r}\n\n'
+                'If you have matrices that you want to read, see:\n'
+                '  model.set_additional_matrices_to_read(matrices)\n'
+                '  matrices = {\n'
+                "      b'BHH' : True,\n"
+                "      b'KHH' : False,\n"
+                '  }  # you want to read some matrices, but not others\n'
+                "  matrices = [b'BHH', b'KHH']  # assumes True\n\n"
+
+                'If you the table is a geom/result table, see:\n'
+                '  model.set_additional_result_tables_to_read(methods_dict)\n'
+                "  methods_dict = {\n"
+                "      b'OUGV1' : [method3, method4],\n"
+                "      Gb'GEOM4SX' : [method3, method4],\n"
+                "      b'OES1X1' : False,\n"
+                '  }\n\n'
+
+                'If you want to take control of the OP2 reader (mainly useful '
+                'for obscure tables), see:\n'
+                "  methods_dict = {\n"
+                "      b'OUGV1' : [method],\n"
+                '  }\n'
+                '  model.set_additional_generalized_tables_to_read(methods_dict)\n'
+            )
+            raise NotImplementedError(msg)
+
     def set_additional_generalized_tables_to_read(self, tables: dict[bytes, Any]) -> None:
         """
         Adds methods to call a generalized table.
@@ -5,9 +5,14 @@ Defines:
  - transform_gpforce_to_globali(subcase, result,
                                  nids_all, nids_transform,
                                  i_transform, coords, xyz_cid0, log)
+ - DisplacementTransformPlan(icd_transform, coords, xyz_cid0=None, nids_all=None)
+ - get_displacement_transform_plan(model, xyz_cid0=None, recompute=False)
 
 """
+from __future__ import annotations
 import sys
+import hashlib
+from typing import Optional, Any, TYPE_CHECKING
 import numpy as np
 
 from pyNastran.femutils.coord_transforms import cylindrical_rotation_matrix
@@ -16,6 +21,298 @@ from pyNastran.femutils.matrix3d import (
     #dot_n33_n33,
     #dot_33_n33,
     dot_n33_n3)
+if TYPE_CHECKING:  # pragma: no cover
+    from pyNastran.bdf.bdf import BDF
+
+RECTANGULAR_COORDS = {'CORD2R', 'CORD1R'}
+CYLINDRICAL_COORDS = {'CORD2C', 'CORD1C'}
+SPHERICAL_COORDS = {'CORD2S', 'CORD1S'}
+
+
+class DisplacementTransformPlan:
+    """
+    Stores the rotation matrices to transform displacement-like results
+    (and grid point forces) from the output (CD) frame into the global
+    frame.
+
+    The plan is built once for a mesh and is applied to every time step of
+    every result with a single einsum:
+        data[:, inode, :3] = data[:, inode, :3] @ rotations
+        data[:, inode, 3:] = data[:, inode, 3:] @ rotations
+
+    Spherical CD frames don't have a rotation matrix, so they use
+    ``_transform_spherical_displacement``/``_transform_spherical_gpforce``.
+
+    """
+    def __init__(self, icd_transform: dict[int, np.ndarray],
+                 coords: dict[int, Any],
+                 xyz_cid0: Optional[np.ndarray]=None,
+                 nids_all: Optional[np.ndarray]=None):
+        """
+        Creates the DisplacementTransformPlan
+
+        Parameters
+        ----------
+        icd_transform : dict{int cid : int ndarray}
+            Dictionary from coordinate id to index of the nodes in
+            ``nids_all`` that their output (`CD`) in that
+            coordinate system.
+        coords : dict{int cid :Coord()}
+            Dictionary of coordinate id to the coordinate object
+        xyz_cid0 : (nnodes+nspoints, 3) float ndarray; default=None
+            the nodes in the global frame
+            required if CD is cylindrical
+        nids_all : (nnodes+nspoints, ) int ndarray; default=None
+            the node ids that correspond to icd_transform
+            if this is defined, the results are transformed by node id,
+            so the result doesn't need to have all the nodes
+
+        """
+        if nids_all is not None:
+            nids_all = np.asarray(nids_all)
+        self.nids_all = nids_all
+
+        inodes = []
+        rotations = []
+        inodes_gpforce = []
+        rotations_gpforce = []
+
+        #: the cylindrical coordinate systems that couldn't be transformed
+        #: because xyz_cid0 wasn't defined
+        self.cids_missing_xyz = []
+        #: [(cid, inode), ...]
+        self.spherical = []
+        self.coords = coords
+        for cid, inode in sorted(icd_transform.items()):
+            if cid in [-1, 0]:
+                continue
+            inode = np.asarray(inode)
+            coord = coords[cid]
+            coord_type = coord.type
+            cid_transform = coord.beta()
+            ninode = len(inode)
+
+            # a global coordinate system has 1.0 along the main diagonal
+            is_global_cid = np.array_equal([1., 1., 1.], np.diagonal(cid_transform))
+            if coord_type in RECTANGULAR_COORDS:
+                if is_global_cid:
+                    continue
+                rotation = np.broadcast_to(cid_transform, (ninode, 3, 3))
+                inodes.append(inode)
+                rotations.append(rotation)
+                inodes_gpforce.append(inode)
+                rotations_gpforce.append(rotation)
+
+            elif coord_type in CYLINDRICAL_COORDS:
+                if not is_global_cid:
+                    inodes_gpforce.append(inode)
+                    rotations_gpforce.append(np.broadcast_to(cid_transform, (ninode, 3, 3)))
+                if xyz_cid0 is None:
+                    self.cids_missing_xyz.append(cid)
+                    continue
+
+                # xforms @ translation -> translation @ xforms.T
+                rtz_cid = coord.xyz_to_coord_array(xyz_cid0[inode, :])
+                thetar = np.radians(rtz_cid[:, 1])
+                xforms = cylindrical_rotation_matrix(thetar, dtype='float64')
+                if not is_global_cid:
+                    xforms = xforms @ cid_transform
+                inodes.append(inode)
+                rotations.append(xforms.transpose(0, 2, 1))
+
+            elif coord_type in SPHERICAL_COORDS:
+                self.spherical.append((cid, inode))
+            else:
+                raise RuntimeError(coord)
+
+        self.inode, self.rotations = _stack_rotations(inodes, rotations)
+        self.inode_gpforce, self.rotations_gpforce = _stack_rotations(
+            inodes_gpforce, rotations_gpforce)
+        self.xyz_cid0 = xyz_cid0
+
+    def transform_displacement(self, result, log) -> None:
+        """
+        Performs an inplace operation to transform the DISPLACMENT, VELOCITY,
+        ACCELERATION, SPC/MPC force result into the global (cid=0) frame
+
+        """
+        if self.cids_missing_xyz:
+            msg = 'xyz_cid0 is required for cylindrical coordinate transforms'
+            raise RuntimeError(msg)
+
+        data = result.data
+        nids = None
+        if self.nids_all is not None and hasattr(result, 'node_gridtype'):
+            nids = result.node_gridtype[:, 0]
+
+        idata, irotation = self._get_index(self.inode, nids, data.shape[1], log)
+        _rotate_data(data, idata, self.rotations[irotation])
+
+        for cid, inode in self.spherical:
+            if self.xyz_cid0 is None:
+                msg = 'xyz_cid is required for spherical coordinate transforms'
+                raise RuntimeError(msg)
+            idata, unused_irotation = self._get_index(inode, nids, data.shape[1], log)
+            coord = self.coords[cid]
+            cid_transform = coord.beta()
+            is_global_cid = np.array_equal([1., 1., 1.], np.diagonal(cid_transform))
+            _transform_spherical_displacement(idata, data, coord, self.xyz_cid0,
+                                              cid_transform, is_global_cid)
+
+    def transform_gpforce(self, result, log) -> None:
+        """
+        Performs an inplace operation to transform the GPFORCE result
+        into the global (cid=0) frame
+
+        """
+        if len(self.inode_gpforce) == 0 and len(self.spherical) == 0:
+            return
+        if not result.is_unique: # TODO: doesn't support preload
+            raise NotImplementedError(result)
+        if self.nids_all is None:
+            raise RuntimeError('nids_all is required to transform grid point forces')
+
+        data = result.data
+        # the grid points are repeated for each element
+        nids_all_gp = result.node_element[0, :, 0]
+        nids_gpforce = self.nids_all[self.inode_gpforce]
+        isort = np.argsort(nids_gpforce)
+        nids_gpforce = nids_gpforce[isort]
+
+        idata = np.array([], dtype='int32')
+        irotation = idata
+        if len(nids_gpforce):
+            inid = np.searchsorted(nids_gpforce, nids_all_gp).clip(max=len(nids_gpforce) - 1)
+            idata = np.flatnonzero(nids_gpforce[inid] == nids_all_gp)
+            irotation = isort[inid[idata]]
+        _rotate_data(data, idata, self.rotations_gpforce[irotation])
+
+        for cid, inode_xyz in self.spherical:
+            log.debug('spherical')
+            if self.xyz_cid0 is None:
+                msg = ('xyz_cid is required for spherical '
+                       'coordinate transforms')
+                raise RuntimeError(msg)
+            coord = self.coords[cid]
+            _transform_spherical_gpforce(inode_xyz, None, data, coord.beta(), coord,
+                                         self.xyz_cid0, log)
+
+    def _get_index(self, inode: np.ndarray, nids: Optional[np.ndarray],
+                   nnodes: int, log) -> tuple[np.ndarray, np.ndarray]:
+        """
+        Gets the rows of the result data and the rows of the plan.
+
+        The node ids are used if they're available; otherwise, the result
+        must have all the nodes.
+
+        """
+        irotation = np.arange(len(inode))
+        if nids is None:
+            is_valid = inode < nnodes
+            if not is_valid.all():
+                log.warning('shape of inode is incorrect')
+                irotation = irotation[is_valid]
+            return inode[irotation], irotation
+
+        nids_transform = self.nids_all[inode]
+        isort = np.argsort(nids)
+        nids_sorted = nids[isort]
+        if len(nids_sorted) == 0:
+            return irotation[:0], irotation[:0]
+        inid = np.searchsorted(nids_sorted, nids_transform).clip(max=len(nids_sorted) - 1)
+        is_valid = nids_sorted[inid] == nids_transform
+        return isort[inid[is_valid]], irotation[is_valid]
+
+
+def _stack_rotations(inodes: list[np.ndarray],
+                     rotations: list[np.ndarray]) -> tuple[np.ndarray, np.ndarray]:
+    """stacks the nodes/rotations of each coordinate system"""
+    if len(inodes) == 0:
+        return np.array([], dtype='int32'), np.zeros((0, 3, 3), dtype='float64')
+    return np.hstack(inodes), np.vstack(rotations)
+
+
+def _rotate_data(data: np.ndarray, idata: np.ndarray, rotations: np.ndarray) -> None:
+    """
+    Rotates the translation/rotation of each time step in place
+    (data[:, idata, :3] @ rotations; data[:, idata, 3:] @ rotations).
+    """
+    ndata = len(idata)
+    if ndata == 0:
+        return
+    ntimes = data.shape[0]
+    datai = data[:, idata, :].reshape(ntimes, ndata, 2, 3)
+    data[:, idata, :] = np.einsum('tnki,nij->tnkj', datai, rotations).reshape(ntimes, ndata, 6)
+
+
+def get_displacement_transform_plan(model: BDF, xyz_cid0: Optional[np.ndarray]=None,
+                                    recompute: bool=False) -> DisplacementTransformPlan:
+    """
+    Gets the DisplacementTransformPlan of a model using
+    ``BDF.get_displacement_index``.
+
+    The plan is cached on the model, so it may be reused for all the
+    subcases and for each OP2 that uses the same mesh.  The cache is keyed
+    on a hash of the node ids/CDs, the coordinate systems and xyz_cid0, so
+    moving a node (with a new xyz_cid0) or a coordinate system rebuilds it.
+
+    Parameters
+    ----------
+    model : BDF
+        the model with the nodes/coords
+    xyz_cid0 : (nnodes+nspoints, 3) float ndarray; default=None
+        the nodes in the global frame
+        required if CD is cylindrical/spherical
+    recompute : bool; default=False
+        rebuild the plan even if the mesh hasn't changed
+
+    Returns
+    -------
+    transform_plan : DisplacementTransformPlan
+        the plan
+
+    Examples
+    --------
+    >>> transform_plan = get_displacement_transform_plan(bdf_model, xyz_cid0=xyz_cid0)
+    >>> for op2_model in op2_models:
+    ...     op2_model.transform_displacements_to_global(
+    ...         None, bdf_model.coords, transform_plan=transform_plan)
+
+    """
+    key = _get_transform_plan_key(model, xyz_cid0)
+    cache = getattr(model, '_displacement_transform_plan', None)
+    if cache is not None and not recompute and cache[0] == key:
+        return cache[1]
+
+    out = model.get_displacement_index()
+    if isinstance(out, dict):
+        # there are no coordinate systems
+        nids_all = np.array(sorted(model.point_ids))
+        icd_transform = out
+    else:
+        nids_all, unused_nids_transform, icd_transform = out
+    transform_plan = DisplacementTransformPlan(
+        icd_transform, model.coords, xyz_cid0=xyz_cid0, nids_all=nids_all)
+    model._displacement_transform_plan = (key, transform_plan)
+    return transform_plan
+
+
+def _get_transform_plan_key(model: BDF, xyz_cid0: Optional[np.ndarray]) -> str:
+    """hashes the parts of the mesh that the DisplacementTransformPlan uses"""
+    sha = hashlib.sha1()
+    nid_cd = np.array([(nid, node.Cd()) for nid, node in sorted(model.nodes.items())],
+                      dtype='int64')
+    sha.update(nid_cd.tobytes())
+    sha.update(np.array(sorted(model.spoints), dtype='int64').tobytes())
+    sha.update(np.array(sorted(model.epoints), dtype='int64').tobytes())
+    for cid, coord in sorted(model.coords.items()):
+        sha.update(f'{cid} {coord.type}'.encode('ascii'))
+        sha.update(np.asarray(coord.origin, dtype='float64').tobytes())
+        sha.update(np.asarray(coord.beta(), dtype='float64').tobytes())
+    if xyz_cid0 is not None:
+        sha.update(b'xyz_cid0')
+        sha.update(np.ascontiguousarray(xyz_cid0, dtype='float64').tobytes())
+    return sha.hexdigest()
 
 
 def transform_displacement_to_global(subcase, result, icd_transform, coords, xyz_cid0,
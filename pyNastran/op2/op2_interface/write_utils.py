@@ -16,6 +16,9 @@ SCIPY_VERSION = int_version('scipy', scipy.__version__)[:2]
 IS_NEW_SCIPY = (SCIPY_VERSION >= [1, 8])
 IS_OLD_SCIPY = not IS_NEW_SCIPY
 
+#: the target size of an HDF5 chunk of the (ntimes, nrows, ncols) result data
+HDF5_CHUNK_NBYTES = 256 * 1024
+
 
 def set_table3_field(str_fields, ifield: int, value):
     """
@@ -124,8 +127,44 @@ def view_dtype(array_obj: np.ndarray, dtype) -> np.ndarray:
         return array_obj.view(dtype)
     return array_obj.astype(dtype)
 
-def export_to_hdf5(self, group, log):
-    """exports the object to HDF5 format"""
+def get_hdf5_dataset_options(name: str, value, compression=None,
+                             compression_opts=None) -> dict:
+    """gets the chunking/compression options of an HDF5 dataset"""
+    if not isinstance(value, np.ndarray) or value.ndim == 0 or value.size == 0:
+        return {}
+
+    options = {}
+    if name == 'data' and value.ndim == 3:
+        # (1, nrows_chunk, ncols) chunks; the data is always stored as SORT1
+        unused_ntimes, nrows, ncols = value.shape
+        nrows_chunk = HDF5_CHUNK_NBYTES // (ncols * value.dtype.itemsize)
+        options['chunks'] = (1, min(max(nrows_chunk, 1), nrows), ncols)
+    if compression is not None:
+        options['compression'] = compression
+        options['compression_opts'] = compression_opts
+        options['shuffle'] = True
+    return options
+
+
+def export_to_hdf5(self, group, log, compression=None, compression_opts=None):
+    """
+    exports the object to HDF5 format
+
+    The (ntimes, nrows, ncols) data is chunked by time and by blocks of
+    rows, so a few times/elements may be read without reading the rest.
+
+    Parameters
+    ----------
+    group : h5py.Group
+        the result group
+    log : SimpleLogger
+        the logging object
+    compression : str / int; default=None -> no compression
+        an h5py compression filter (e.g., 'lzf' (fast), 'gzip') for the arrays
+    compression_opts : Any; default=None
+        the compression options (e.g., the gzip level)
+
+    """
     #headers = self.get_headers()
 
     # for some reason we can't just not write the properties...
@@ -152,9 +191,10 @@ def export_to_hdf5(self, group, log):
             #
             # https://stackoverflow.com/questions/43390038/storing-scipy-sparse-matrix-as-hdf5
             #g = group.create_group('Mcoo')
-            group.create_dataset('data', data=value.data)
-            group.create_dataset('row', data=value.row)
-            group.create_dataset('col', data=value.col)
+            for namei, valuei in [('data', value.data), ('row', value.row), ('col', value.col)]:
+                group.create_dataset(namei, data=valuei,
+                                     **get_hdf5_dataset_options(namei, valuei, compression,
+                                                                compression_opts))
             group.attrs['shape'] = value.shape
             continue
         #else:  #pragma, no cover
@@ -194,7 +234,8 @@ def export_to_hdf5(self, group, log):
             value = np.asarray(value, dtype='|S'+n)
 
         try:
-            group.create_dataset(name, data=value)
+            group.create_dataset(name, data=value,
+                                 **get_hdf5_dataset_options(name, value, compression, compression_opts))
         except TypeError:
             print('name = %r; type=%s' % (name, type(value)))
             print(value)
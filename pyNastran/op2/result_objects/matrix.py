@@ -117,9 +117,10 @@ class Matrix:
         else:
             raise RuntimeError(f'form = {self.form!r}')
 
-    def export_to_hdf5(self, group, log) -> None:
+    def export_to_hdf5(self, group, log, compression=None, compression_opts=None) -> None:
         """exports the object to HDF5 format"""
-        export_to_hdf5(self, group, log)
+        export_to_hdf5(self, group, log, compression=compression,
+                       compression_opts=compression_opts)
 
     def build_dataframe(self):
         """exports the object to pandas format"""
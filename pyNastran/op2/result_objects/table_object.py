@@ -37,7 +37,8 @@ from pyNastran.op2.result_objects.op2_objects import (
     NULL_GRIDTYPE, SORT1_TABLES, SORT2_TABLES)
 
 from pyNastran.f06.f06_formatting import (
-    write_floats_13e, write_floats_13e_long,
+    write_floats_13e, write_floats_13e_long, write_floats_13e_array,
+    write_f06_rows, write_f06_rows_by_format,
     write_imag_floats_13e, write_float_12e)
 from pyNastran.op2.errors import SixtyFourBitError
 from pyNastran.op2.op2_interface.write_utils import set_table3_field, view_dtype, view_idtype_as_fdtype
@@ -1530,23 +1531,20 @@ class RealTableArray(TableArray):
         f06_file.write(''.join(header + words))
 
         node = self.node_gridtype[:, 0]
-        gridtype = self.node_gridtype[:, 1]
-        t1 = self.data[0, :, 0]
-        t2 = self.data[0, :, 1]
-        t3 = self.data[0, :, 2]
-        r1 = self.data[0, :, 3]
-        r2 = self.data[0, :, 4]
-        r3 = self.data[0, :, 5]
-        for node_id, gridtypei, t1i, t2i, t3i, r1i, r2i, r3i in zip(node, gridtype, t1, t2, t3, r1, r2, r3):
-            sgridtype = self.recast_gridtype_as_string(gridtypei)
-            vals = [t1i, t2i, t3i, r1i, r2i, r3i]
-            vals2 = write_floats_13e(vals)
-            (dx, dy, dz, rx, ry, rz) = vals2
-            f06_file.write('%14i %6s     %-13s  %-13s  %-13s  %-13s  %-13s  %s\n' % (
-                node_id, sgridtype, dx, dy, dz, rx, ry, rz))
+        sgridtype = self._get_sgridtypes()
+        (dx, dy, dz, rx, ry, rz) = write_floats_13e_array(self.data[0, :, :6]).T
+        write_f06_rows(f06_file, '%14i %6s     %-13s  %-13s  %-13s  %-13s  %-13s  %s\n',
+                       [node, sgridtype, dx, dy, dz, rx, ry, rz])
         f06_file.write(page_stamp % page_num)
         return page_num
 
+    def _get_sgridtypes(self) -> np.ndarray:
+        """gets the grid type strings (e.g., G, S) of each node"""
+        ugridtypes, igridtype = np.unique(self.node_gridtype[:, 1], return_inverse=True)
+        sgridtypes = np.array([self.recast_gridtype_as_string(gridtype)
+                               for gridtype in ugridtypes.tolist()], dtype=object)
+        return sgridtypes[igridtype.ravel()]
+
     def _write_sort1_as_sort2(self, f06_file: TextIO, page_num, page_stamp, header, words):
         nodes = self.node_gridtype[:, 0]
         gridtypes = self.node_gridtype[:, 1]
@@ -1580,35 +1578,31 @@ class RealTableArray(TableArray):
 
     def _write_sort1_as_sort1(self, f06_file: TextIO, page_num, page_stamp, header, words):
         nodes = self.node_gridtype[:, 0]
-        gridtypes = self.node_gridtype[:, 1]
+        sgridtypes = self._get_sgridtypes()
         unused_times = self._times
 
+        # the scalar points only have 1 component
+        is_grid = np.isin(sgridtypes, ['G', 'H', 'L'])
+        is_scalar = np.isin(sgridtypes, ['S', 'M', 'E'])
+        if not np.all(is_grid | is_scalar):  # pragma: no cover
+            inode = np.flatnonzero(~(is_grid | is_scalar))[0]
+            raise NotImplementedError(f'node_id={nodes[inode]} sgridtype={sgridtypes[inode]}')
+        fmts = [
+            '%14i %6s     %-13s  %-13s  %-13s  %-13s  %-13s  %s\n',
+            '%14i %6s     %s\n' + '%.0s' * 5,
+        ]
+        ifmt = is_scalar.astype('int32')
+
         for itime in range(self.ntimes):
             dt = self._times[itime]
-            t1 = self.data[itime, :, 0]
-            t2 = self.data[itime, :, 1]
-            t3 = self.data[itime, :, 2]
-            r1 = self.data[itime, :, 3]
-            r2 = self.data[itime, :, 4]
-            r3 = self.data[itime, :, 5]
-
             if isinstance(dt, float_types):
                 header[1] = ' %s = %10.4E\n' % (self.data_code['name'], dt)
             else:
                 header[1] = ' %s = %10i\n' % (self.data_code['name'], dt)
             f06_file.write(''.join(header + words))
-            for node_id, gridtypei, t1i, t2i, t3i, r1i, r2i, r3i in zip(nodes, gridtypes, t1, t2, t3, r1, r2, r3):
-                sgridtype = self.recast_gridtype_as_string(gridtypei)
-                vals = [t1i, t2i, t3i, r1i, r2i, r3i]
-                vals2 = write_floats_13e(vals)
-                (dx, dy, dz, rx, ry, rz) = vals2
-                if sgridtype in ['G', 'H', 'L']:
-                    f06_file.write('%14i %6s     %-13s  %-13s  %-13s  %-13s  %-13s  %s\n' % (
-                        node_id, sgridtype, dx, dy, dz, rx, ry, rz))
-                elif sgridtype in ['S', 'M', 'E']:
-                    f06_file.write('%14i %6s     %s\n' % (node_id, sgridtype, dx))
-                else:  # pragma: no cover
-                    raise NotImplementedError(f'node_id={node_id} sgridtype={sgridtype} vals={vals2}')
+            (dx, dy, dz, rx, ry, rz) = write_floats_13e_array(self.data[itime, :, :6]).T
+            write_f06_rows_by_format(f06_file, fmts, ifmt,
+                                     [nodes, sgridtypes, dx, dy, dz, rx, ry, rz])
             f06_file.write(page_stamp % page_num)
             page_num += 1
         return page_num
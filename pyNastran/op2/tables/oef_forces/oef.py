@@ -24,7 +24,7 @@ from numpy import frombuffer, vstack, sin, cos, radians, array, hstack, zeros
 
 from pyNastran.op2.op2_interface.function_codes import func1, func7
 from pyNastran.op2.op2_interface.op2_reader import mapfmt
-from pyNastran.op2.tables.utils import get_eid_dt_from_eid_device
+from pyNastran.op2.tables.utils import get_eid_dt_from_eid_device, set_sort2_element_times
 from pyNastran.op2.op2_helper import polar_to_real_imag
 from pyNastran.op2.op2_interface.utils import apply_mag_phase, reshape_bytes_block_strip
 from pyNastran.op2.op2_interface.msc_tables import MSC_OEF_REAL_MAPPER, MSC_OEF_IMAG_MAPPER
@@ -1304,6 +1304,12 @@ class OEF:
                 obj.data[obj.itime, itotal:itotal2, :] = floats[:, 1:].copy()
                 obj.itotal = itotal2
                 obj.ielement = ielement2
+            elif op2.use_vector and is_vectorized and op2.sort_method == 2:
+                n = nelements * ntotal
+                floats = frombuffer(data, dtype=op2.fdtype8).reshape(nelements, 3)
+                itime, itime2, ielement = set_sort2_element_times(op2, obj, data, nelements)
+                #[axial, torsion]
+                obj.data[itime:itime2, ielement, :] = floats[:, 1:]
             else:
                 n = oef_crod_real_3(op2, data, obj,
                                     nelements, ntotal)
@@ -1616,6 +1622,12 @@ class OEF:
                 obj.data[obj.itime, itotal:itotal2, 0] = floats[:, 1].copy()
                 obj.itotal = itotal2
                 obj.ielement = ielement2
+            elif op2.use_vector and is_vectorized and op2.sort_method == 2:
+                n = nelements * ntotal
+                floats = frombuffer(data, dtype=op2.fdtype8).reshape(nelements, 2)
+                itime, itime2, ielement = set_sort2_element_times(op2, obj, data, nelements)
+                #(eid_device, force)
+                obj.data[itime:itime2, ielement, 0] = floats[:, 1]
             else:
                 n = oef_celas_cdamp_real_2(op2, data, obj,
                                            nelements, ntotal, dt)
@@ -1707,6 +1719,12 @@ class OEF:
                 obj.data[obj.itime, itotal:itotal2, :] = floats[:, 1:].copy()
                 obj.itotal = itotal2
                 obj.ielement = ielement2
+            elif op2.use_vector and is_vectorized and op2.sort_method == 2:
+                n = nelements * ntotal
+                floats = frombuffer(data, dtype=op2.fdtype8).reshape(nelements, 3)
+                itime, itime2, ielement = set_sort2_element_times(op2, obj, data, nelements)
+                #(eid_device, axial, torque)
+                obj.data[itime:itime2, ielement, :] = floats[:, 1:]
             else:
                 n = oef_cvisc_real_3(op2, data, obj,
                                      nelements, ntotal, dt)
@@ -1829,11 +1847,15 @@ class OEF:
                 obj.data[obj.itime, itotal:itotal2, :] = floats[:, 1:].copy()
                 obj.itotal = itotal2
                 obj.ielement = ielement2
-            # elif op2.use_vector and is_vectorized and op2.sort_method == 1:
+            elif op2.use_vector and is_vectorized and op2.sort_method == 2:
+                n = nelements * ntotal
+                floats = frombuffer(data, dtype=op2.fdtype8).reshape(nelements, 9)
+                itime, itime2, ielement = set_sort2_element_times(op2, obj, data, nelements)
+                #[bm1a, bm2a, bm1b, bm2b, ts1, ts2, af, trq]
+                obj.data[itime:itime2, ielement, :] = floats[:, 1:]
             else:
                 n = oef_cbar_real_9(op2, data, obj, nelements, ntotal)
         elif result_type == 1 and op2.num_wide == 17: # imag
-            # TODO: vectorize
             ntotal = 68 * self.factor  # 17*4
             nelements = ndata // ntotal
             assert ndata % ntotal == 0
@@ -1844,7 +1866,35 @@ class OEF:
                 return nelements * ntotal, None, None
 
             obj = op2.obj
-            n = oef_cbar_imag_17(op2, data, obj, nelements, ntotal, is_magnitude_phase)
+            if op2.use_vector and is_vectorized and op2.sort_method == 1:
+                n = nelements * ntotal
+                itotal = obj.itotal
+                itotal2 = itotal + nelements
+
+                floats = frombuffer(data, dtype=op2.fdtype8).reshape(nelements, 17)
+                obj._times[obj.itime] = dt
+                if obj.itime == 0:
+                    ints = frombuffer(data, dtype=op2.idtype8).reshape(nelements, 17)
+                    eids = ints[:, 0] // 10
+                    assert eids.min() > 0, eids.min()
+                    obj.element[itotal:itotal2] = eids
+
+                #[bm1a, bm2a, bm1b, bm2b, ts1, ts2, af, trq]
+                real_imag = apply_mag_phase(floats, is_magnitude_phase,
+                                            [1, 2, 3, 4, 5, 6, 7, 8],
+                                            [9, 10, 11, 12, 13, 14, 15, 16])
+                obj.data[obj.itime, itotal:itotal2, :] = real_imag
+                obj.itotal = itotal2
+            elif op2.use_vector and is_vectorized and op2.sort_method == 2:
+                n = nelements * ntotal
+                floats = frombuffer(data, dtype=op2.fdtype8).reshape(nelements, 17)
+                itime, itime2, ielement = set_sort2_element_times(op2, obj, data, nelements)
+                real_imag = apply_mag_phase(floats, is_magnitude_phase,
+                                            [1, 2, 3, 4, 5, 6, 7, 8],
+                                            [9, 10, 11, 12, 13, 14, 15, 16])
+                obj.data[itime:itime2, ielement, :] = real_imag
+            else:
+                n = oef_cbar_imag_17(op2, data, obj, nelements, ntotal, is_magnitude_phase)
         else:
             raise RuntimeError(op2.code_information())
             #print(op2.table_name)
@@ -1967,6 +2017,12 @@ class OEF:
                 obj.data[obj.itime, ielement:ielement2, :] = floats[:, 1:].copy()
                 obj.itotal = ielement2
                 obj.ielement = ielement2
+            elif op2.use_vector and is_vectorized and op2.sort_method == 2:
+                n = nelements * ntotal
+                floats = frombuffer(data, dtype=op2.fdtype8).reshape(nelements, 9)
+                itime, itime2, ielement = set_sort2_element_times(op2, obj, data, nelements)
+                #[mx, my, mxy, bmx, bmy, bmxy, tx, ty]
+                obj.data[itime:itime2, ielement, :] = floats[:, 1:]
             else:
                 n = oef_cquad4_33_real_9(op2, data, obj,
                                          nelements, ntotal)
@@ -2337,6 +2393,13 @@ class OEF:
                 obj.data[obj.itime, itotal:itotal2, :] = floats[:, 1:].copy()
                 obj.itotal = itotal2
                 obj.ielement = ielement2
+            elif op2.use_vector and is_vectorized and op2.sort_method == 2:
+                n = nelements * ntotal
+                floats = frombuffer(data, dtype=op2.fdtype8).reshape(nelements, 17)
+                itime, itime2, ielement = set_sort2_element_times(op2, obj, data, nelements)
+                # [f41, f21, f12, f32, f23, f43, f34, f14, kf1,
+                #  s12, kf2, s23, kf3, s34, kf4, s41]
+                obj.data[itime:itime2, ielement, :] = floats[:, 1:]
             else:
                 n = oef_cshear_real_17(op2, data, obj,
                                        nelements, ntotal, dt)
@@ -2864,6 +2927,12 @@ class OEF:
 
                 #[fx, fy, fz, mx, my, mz]
                 obj.data[obj.itime, istart:iend, :] = results[:, 1:].copy()
+            elif op2.use_vector and is_vectorized and op2.sort_method == 2:
+                n = nelements * ntotal
+                floats = frombuffer(data, dtype=op2.fdtype8).reshape(nelements, 7)
+                itime, itime2, ielement = set_sort2_element_times(op2, obj, data, nelements)
+                #[fx, fy, fz, mx, my, mz]
+                obj.data[itime:itime2, ielement, :] = floats[:, 1:]
             else:
                 n = oef_cbush_real_7(op2, data, obj,
                                      nelements, ntotal, dt)
@@ -2882,7 +2951,6 @@ class OEF:
             # 12 MYI RS Moment y - imag./phase part
             # 13 MZI RS Moment z - imag./phase part
 
-            # TODO: vectorize
             ntotal = 52 * self.factor  # 13*4
             nelements = ndata // ntotal
             #result_name = prefix + 'cbush_force' + postfix
@@ -2892,9 +2960,35 @@ class OEF:
                 return nelements * ntotal, None, None
 
             obj = op2.obj
-            n = oef_cbush_imag_13(op2, data, obj,
-                                  nelements, ntotal,
-                                  is_magnitude_phase)
+            if op2.use_vector and is_vectorized and op2.sort_method == 1:
+                n = nelements * ntotal
+                itotal = obj.itotal
+                itotal2 = itotal + nelements
+
+                floats = frombuffer(data, dtype=op2.fdtype8).reshape(nelements, 13)
+                obj._times[obj.itime] = dt
+                if obj.itime == 0:
+                    ints = frombuffer(data, dtype=op2.idtype8).reshape(nelements, 13)
+                    eids = ints[:, 0] // 10
+                    assert eids.min() > 0, eids.min()
+                    obj.element[itotal:itotal2] = eids
+
+                #[fx, fy, fz, mx, my, mz]
+                real_imag = apply_mag_phase(floats, is_magnitude_phase,
+                                            [1, 2, 3, 4, 5, 6], [7, 8, 9, 10, 11, 12])
+                obj.data[obj.itime, itotal:itotal2, :] = real_imag
+                obj.itotal = itotal2
+            elif op2.use_vector and is_vectorized and op2.sort_method == 2:
+                n = nelements * ntotal
+                floats = frombuffer(data, dtype=op2.fdtype8).reshape(nelements, 13)
+                itime, itime2, ielement = set_sort2_element_times(op2, obj, data, nelements)
+                real_imag = apply_mag_phase(floats, is_magnitude_phase,
+                                            [1, 2, 3, 4, 5, 6], [7, 8, 9, 10, 11, 12])
+                obj.data[itime:itime2, ielement, :] = real_imag
+            else:
+                n = oef_cbush_imag_13(op2, data, obj,
+                                      nelements, ntotal,
+                                      is_magnitude_phase)
         #elif op2.format_code == 2 and op2.num_wide == 7:
             #op2.log.warning(op2.code_information())
         else:
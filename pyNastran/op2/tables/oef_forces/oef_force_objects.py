@@ -769,9 +769,10 @@ class RealSpringDamperForceArray(RealForceObject):
         assert isinstance(eid, integer_types) and eid > 0, 'dt=%s eid=%s' % (dt, eid)
         #print('dt=%s eid=%s' % (dt, eid))
         itime = self.itotal
+        ielement = self.itime
         self._times[itime] = dt
-        self.element[self.ielement] = eid
-        self.data[itime, self.ielement, :] = [force]
+        self.element[ielement] = eid
+        self.data[itime, ielement, :] = [force]
         self.itotal += 1
 
     def get_stats(self, short: bool=False) -> list[str]:
@@ -1196,9 +1197,10 @@ class RealRodForceArray(RealForceObject):
         assert self.is_sort2, self
         assert isinstance(eid, integer_types) and eid > 0, 'dt=%s eid=%s' % (dt, eid)
         itime = self.itotal
+        ielement = self.itime
         self._times[itime] = dt
-        self.element[self.ielement] = eid
-        self.data[self.itime, self.ielement, :] = [axial, torque]
+        self.element[ielement] = eid
+        self.data[itime, ielement, :] = [axial, torque]
         self.itotal += 1
         #if self.ielement == self.nelements:
             #self.ielement = 0
@@ -2229,9 +2231,11 @@ class RealCShearForceArray(RealForceObject):
         """unvectorized method for adding SORT1 transient data"""
         assert self.is_sort2, self
         assert isinstance(eid, integer_types) and eid > 0, 'dt=%s eid=%s' % (dt, eid)
-        self._times[self.itotal] = dt
-        self.element[self.ielement] = eid
-        self.data[self.itotal, self.ielement, :] = [
+        itime = self.itotal
+        ielement = self.itime
+        self._times[itime] = dt
+        self.element[ielement] = eid
+        self.data[itime, ielement, :] = [
             force41, force14, force21, force12, force32, force23, force43, force34,
             kick_force1, kick_force2, kick_force3, kick_force4,
             shear12, shear23, shear34, shear41]
@@ -2635,9 +2639,11 @@ class RealViscForceArray(RealForceObject):  # 24-CVISC
         """unvectorized method for adding SORT1 transient data"""
         assert self.is_sort2, self
         assert isinstance(eid, integer_types) and eid > 0, 'dt=%s eid=%s' % (dt, eid)
-        self._times[self.itotal] = dt
-        self.element[self.ielement] = eid
-        self.data[self.itotal, self.ielement, :] = [axial, torque]
+        itime = self.itotal
+        ielement = self.itime
+        self._times[itime] = dt
+        self.element[ielement] = eid
+        self.data[itime, ielement, :] = [axial, torque]
         self.itotal += 1
 
     def get_stats(self, short: bool=False) -> list[str]:
@@ -2970,9 +2976,10 @@ class RealPlateForceArray(RealForceObject):  # 33-CQUAD4, 74-CTRIA3
         assert self.is_sort2, self
 
         itime = self.itotal
+        ielement = self.itime
         self._times[itime] = dt
-        self.element[self.itotal] = eid
-        self.data[itime, self.itotal, :] = [mx, my, mxy, bmx, bmy, bmxy, tx, ty]
+        self.element[ielement] = eid
+        self.data[itime, ielement, :] = [mx, my, mxy, bmx, bmy, bmxy, tx, ty]
         self.itotal += 1
         #raise NotImplementedError('SORT2')
         #if dt not in self.mx:
@@ -5533,12 +5540,12 @@ class RealForceMomentArray(RealForceObject):
         """unvectorized method for adding SORT2 transient data"""
         assert self.is_sort2, self
         assert isinstance(eid, integer_types) and eid > 0, 'dt=%s eid=%s' % (dt, eid)
-        itotal = self.itime
+        ielement = self.itime
         itime = self.itotal
         #print(f'itime={self.itime} itotal={self.itotal} dt={dt}')
         self._times[itime] = dt
-        self.element[self.ielement] = eid
-        self.data[itime, self.ielement, :] = [fx, fy, fz, mx, my, mz]
+        self.element[ielement] = eid
+        self.data[itime, ielement, :] = [fx, fy, fz, mx, my, mz]
         self.itotal += 1
 
     def get_stats(self, short: bool=False) -> list[str]:
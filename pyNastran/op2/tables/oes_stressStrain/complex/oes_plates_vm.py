@@ -157,8 +157,8 @@ class ComplexPlateVMArray(OES_Object):
                     for ieid, (eid, nid) in enumerate(self.element_node):
                         t1 = self.data[itime, ieid, :]
                         t2 = table.data[itime, ieid, :]
-                        (oxx1, oyy1, txy1) = t1
-                        (oxx2, oyy2, txy2) = t2
+                        (oxx1, oyy1, txy1, unused_ovm1) = t1
+                        (oxx2, oyy2, txy2, unused_ovm2) = t2
                         #d = t1 - t2
                         if not np.allclose(
                                 [oxx1.real, oxx1.imag, oyy1.real, oyy1.imag, txy1.real, txy1.imag, ], # atol=0.0001
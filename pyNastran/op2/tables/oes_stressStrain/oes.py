@@ -32,7 +32,7 @@ from pyNastran.op2.op2_interface.utils import (
 from pyNastran.op2.op2_helper import polar_to_real_imag
 from pyNastran.op2.op2_interface.function_codes import func1, func7
 
-from pyNastran.op2.tables.utils import get_eid_dt_from_eid_device
+from pyNastran.op2.tables.utils import get_eid_dt_from_eid_device, set_sort2_element_times
 from pyNastran.op2.tables.oug.oug import get_shock_prefix_postfix
 from pyNastran.op2.tables.oes_stressStrain.real.oes_bars import RealBarStressArray, RealBarStrainArray
 from pyNastran.op2.tables.oes_stressStrain.real.oes_bars100 import RealBar10NodesStressArray, RealBar10NodesStrainArray
@@ -2150,6 +2150,12 @@ class OES(OP2Common2):
                 obj.data[obj.itime, itotal:itotal2, 0] = floats[:, 1].copy()
                 obj.itotal = itotal2
                 obj.ielement = ielement2
+            elif op2.use_vector and is_vectorized and op2.sort_method == 2:
+                n = nelements * ntotal
+                floats = frombuffer(data, dtype=op2.fdtype8).reshape(nelements, 2)
+                itime, itime2, ielement = set_sort2_element_times(op2, obj, data, nelements)
+                #(eid_device, stress)
+                obj.data[itime:itime2, ielement, 0] = floats[:, 1]
             else:
                 if is_vectorized and op2.use_vector:  # pragma: no cover
                     log.debug('vectorize CELASx real SORT%s' % op2.sort_method)
@@ -2190,6 +2196,12 @@ class OES(OP2Common2):
 
                 obj.itotal = itotal2
                 obj.ielement = ielement2
+            elif op2.use_vector and is_vectorized and op2.sort_method == 2:
+                n = nelements * ntotal
+                floats = frombuffer(data, dtype=op2.fdtype8).reshape(nelements, 3)
+                itime, itime2, ielement = set_sort2_element_times(op2, obj, data, nelements)
+                real_imag = apply_mag_phase(floats, is_magnitude_phase, [1], [2])
+                obj.data[itime:itime2, ielement, :] = real_imag
             else:
                 if is_vectorized and op2.use_vector:  # pragma: no cover
                     log.debug('vectorize CELASx imag SORT%s' % op2.sort_method)
@@ -2267,6 +2279,12 @@ class OES(OP2Common2):
                 obj.data[obj.itime, itotal:itotal2, :] = floats[:, 1:].copy()
                 obj.itotal = itotal2
                 obj.ielement = ielement2
+            elif op2.use_vector and is_vectorized and op2.sort_method == 2:
+                n = nelements * ntotal
+                floats = frombuffer(data, dtype=op2.fdtype8).reshape(nelements, 5)
+                itime, itime2, ielement = set_sort2_element_times(op2, obj, data, nelements)
+                #[axial, torsion, SMa, SMt]
+                obj.data[itime:itime2, ielement, :] = floats[:, 1:]
             else:
                 if is_vectorized and op2.use_vector:  # pragma: no cover
                     op2.log.debug('vectorize CROD real SORT%s' % op2.sort_method)
@@ -2301,6 +2319,12 @@ class OES(OP2Common2):
 
                 obj.itotal = itotal2
                 obj.ielement = ielement2
+            elif op2.use_vector and is_vectorized and op2.sort_method == 2:
+                n = nelements * ntotal
+                floats = frombuffer(data, dtype=op2.fdtype8).reshape(nelements, 5)
+                itime, itime2, ielement = set_sort2_element_times(op2, obj, data, nelements)
+                real_imag = apply_mag_phase(floats, is_magnitude_phase, [1, 3], [2, 4])
+                obj.data[itime:itime2, ielement, :] = real_imag
             else:
                 if is_vectorized and op2.use_vector:  # pragma: no cover
                     op2.log.debug('vectorize CROD imag SORT%s' % op2.sort_method)
@@ -2341,6 +2365,12 @@ class OES(OP2Common2):
                 obj.data[obj.itime, itotal:itotal2, :] = floats[:, 1:].copy()
                 obj.itotal = itotal2
                 obj.ielement = ielement2
+            elif op2.use_vector and is_vectorized and op2.sort_method == 2:
+                n = nelements * ntotal
+                floats = frombuffer(data, dtype=op2.fdtype8).reshape(nelements, 3)
+                itime, itime2, ielement = set_sort2_element_times(op2, obj, data, nelements)
+                #[axial, torsion]
+                obj.data[itime:itime2, ielement, :] = floats[:, 1:]
             else:
                 n = oes_crod_random_3(op2, data, ndata, obj, nelements, ntotal)
 
@@ -2663,6 +2693,12 @@ class OES(OP2Common2):
                 obj.data[itime, itotal:itotal2, :] = floats[:, 1:].copy()
                 obj.itotal = itotal2
                 obj.ielement = ielement2
+            elif op2.use_vector and is_vectorized and op2.sort_method == 2:
+                n = nelements * ntotal
+                floats = frombuffer(data, dtype=op2.fdtype8).reshape(nelements, 3)
+                itime, itime2, ielement = set_sort2_element_times(op2, obj, data, nelements)
+                #[max_strain, avg_strain, margin]
+                obj.data[itime:itime2, ielement, :] = floats[:, 1:]
             else:
                 if is_vectorized and op2.use_vector:  # pragma: no cover
                     op2.log.debug('vectorize CSHEAR random SORT%s' % op2.sort_method)
@@ -2820,26 +2856,25 @@ class OES(OP2Common2):
                 op2.binary_debug.write('  nelements=%i; nnodes=1 # centroid\n' % nelements)
 
             obj = op2.obj
-            if op2.use_vector and is_vectorized and 0:  # pragma: no cover
-                # self.itime = 0
-                # self.ielement = 0
-                # self.itotal = 0
-                #self.ntimes = 0
-                #self.nelements = 0
+            if op2.use_vector and is_vectorized and op2.sort_method == 1:
                 n = nelements * ntotal
-
-                ielement = obj.ielement
-                ielement2 = ielement + nelements
+                itotal = obj.itotal
+                itotal2 = itotal + nelements
                 obj._times[obj.itime] = dt
                 self.obj_set_element(obj, itotal, itotal2, data, nelements)
 
-                floats = frombuffer(data, dtype=op2.fdtype).reshape(nelements, 10)
+                floats = frombuffer(data, dtype=op2.fdtype8).reshape(nelements, 10)
 
                 #[s1a, s2a, s3a, s4a, axial,
                 # s1b, s2b, s3b, s4b]
-                obj.data[obj.itime, ielement:ielement2, :] = floats[:, 1:].copy()
-                obj.itotal = ielement2
-                obj.ielement = ielement2
+                obj.data[obj.itime, itotal:itotal2, :] = floats[:, 1:].copy()
+                obj.itotal = itotal2
+                obj.ielement = itotal2
+            elif op2.use_vector and is_vectorized and op2.sort_method == 2:
+                n = nelements * ntotal
+                floats = frombuffer(data, dtype=op2.fdtype8).reshape(nelements, 10)
+                itime, itime2, ielement = set_sort2_element_times(op2, obj, data, nelements)
+                obj.data[itime:itime2, ielement, :] = floats[:, 1:]
             else:
                 if is_vectorized and op2.use_vector and obj.itime == 0:  # pragma: no cover
                     op2.log.debug('vectorize CBAR random SORT%s' % op2.sort_method)
@@ -2986,6 +3021,41 @@ class OES(OP2Common2):
                 obj.data[obj.itime, itotal:itotal2, 9] = floats1[:, 8]
                 obj.itotal = itotal2
                 obj.ielement = itotali
+            elif op2.use_vector and is_vectorized and op2.sort_method == 2:
+                # one element per record with one row per time
+                n = nelements * ntotal
+                ntimes = nelements
+                itime = obj.itotal // nnodes_expected
+                itime2 = itime + ntimes
+                ielement = obj.itime
+                itotal = ielement * nnodes_expected
+                itotal2 = itotal + nnodes_expected
+
+                ints = frombuffer(data, dtype=op2.idtype8).reshape(ntimes, numwide_real)
+                if op2._analysis_code_fmt == b'i':
+                    obj._times[itime:itime2] = ints[:, 0]
+                else:
+                    obj._times[itime:itime2] = frombuffer(data, dtype=op2.fdtype8).reshape(
+                        ntimes, numwide_real)[:, 0]
+
+                eid = op2.nonlinear_factor
+                cid = ints[0, 1]
+                assert cid >= -2, cid
+                grid_device = ints[0, 4:].reshape(nnodes_expected, 21)[:, 0]
+                obj.element_node[itotal:itotal2, 0] = eid
+                obj.element_node[itotal:itotal2, 1] = grid_device
+                obj.element_cid[ielement, :] = [eid, cid]
+
+                floats = frombuffer(data, dtype=op2.fdtype8).reshape(ntimes, numwide_real)[:, 4:]
+                floats1 = floats.reshape(ntimes, nnodes_expected, 21)
+
+                # o1/o2/o3 is not max/mid/min.  They are not consistently ordered, so we force it.
+                max_mid_min = floats1[:, :, [3, 11, 17]].copy()
+                max_mid_min.sort(axis=2)
+                obj.data[itime:itime2, itotal:itotal2, 6:9] = max_mid_min[:, :, [2, 1, 0]]
+                obj.data[itime:itime2, itotal:itotal2, :6] = floats1[:, :, [1, 9, 15, 2, 10, 16]]
+                obj.data[itime:itime2, itotal:itotal2, 9] = floats1[:, :, 8]
+                obj.itotal = itime2 * nnodes_expected
             else:
                 if is_vectorized and op2.use_vector:  # pragma: no cover
                     log.debug(f'vectorize CSolid real SORT{sort_method} from {op2.table_name}')
@@ -5049,32 +5119,24 @@ class OES(OP2Common2):
                 return nelements * ntotal, None, None
 
             obj = op2.obj
-            if op2.use_vector and is_vectorized and 0:  # pragma: no cover
-                n = nelements * 4 * op2.num_wide
-                ielement = obj.ielement
-                ielement2 = ielement + nelements
+            if op2.use_vector and is_vectorized and op2.sort_method == 1:
+                n = nelements * ntotal
                 itotal = obj.itotal
-                itotal2 = itotal + nelements * nnodes_expected
+                itotal2 = itotal + nlayers
                 obj._times[obj.itime] = dt
                 if obj.itime == 0:
-                    ints = frombuffer(data, dtype=op2.idtype)
-                    ints1 = ints.reshape(nelements, 9)
-                    eids = ints1[:, 0] // 10
-                    print(eids)
-                    eids = np.vstack([eids, eids]).T.ravel()
-                    print(eids.shape)
-                    print(eids)
-                    print(obj.element)
+                    ints = frombuffer(data, dtype=op2.idtype8).reshape(nelements, 11)
+                    eids = ints[:, 0] // 10
                     assert eids.min() > 0, eids.min()
-                    obj.element[itotal:itotal2, 0] = eids
+                    obj.element_node[itotal:itotal2, 0] = np.repeat(eids, 2)
 
-                floats = frombuffer(data, dtype=op2.fdtype).reshape(nelements, 11)[:, 1:]
-                print(floats.shape)
-                #fd, sx, sy, txy,
-                floats1 = floats.reshape(nelements * nnodes_expected, 10)
-                obj.data[obj.itime, itotal:itotal2, :] = floats1.copy()
+                #[fd, sx, sy, txy, ovm]
+                floats = frombuffer(data, dtype=op2.fdtype8).reshape(nelements, 11)
+                floats1 = floats[:, 1:].reshape(nlayers, 5)
+                obj.fiber_distance[itotal:itotal2] = floats1[:, 0]
+                obj.data[obj.itime, itotal:itotal2, :] = floats1[:, 1:]
                 obj.itotal = itotal2
-                obj.ielement = ielement2
+                obj.ielement = itotal2
             else:
                 n = oes_cquad4_33_random_vm_11(op2, data, obj, nelements, ntotal)
 
@@ -5114,8 +5176,9 @@ class OES(OP2Common2):
                            #-0.5, -0.8152692317962646, 0.0, -1.321874737739563, 0.0, -3.1585168838500977, 0.0, 5.591334342956543,
                            #0.5,   1.7285730838775635, 0.0, -7.103837490081787, 0.0,  2.8560397624969482, 0.0, 9.497518539428711)
             obj = op2.obj
-            if is_vectorized and op2.use_vector and op2.sort_method == 1 and 0:  # pragma: no cover
-                raise NotImplementedError(op2.table_name_str)
+            if is_vectorized and op2.use_vector and op2.sort_method == 1:
+                n = self.obj_set_complex_vm(obj, data, nelements, 1, dt,
+                                            is_magnitude_phase)
             else:
                 if is_vectorized and op2.use_vector:  # pragma: no cover
                     op2.log.debug('vectorize CQUAD4-33 complex '
@@ -5357,8 +5420,12 @@ class OES(OP2Common2):
             #    ID.        DISTANCE              NORMAL-X                       NORMAL-Y                      SHEAR-XY               VON MISES
             #0       1  -4.359080E+00  -1.391918E+00 /  2.474756E-03  -1.423926E+00 /  2.530494E-03   2.655153E-02 / -5.158625E-05   1.408948E+00
             #            4.359080E+00   1.391918E+00 / -2.474756E-03   1.423926E+00 / -2.530494E-03  -2.655153E-02 /  5.158625E-05   1.408948E+00
-            n = oes_ctria3_complex_vm_17(op2, data, obj, nelements, ntotal, dt,
-                                         is_magnitude_phase)
+            if is_vectorized and op2.use_vector and op2.sort_method == 1:
+                n = self.obj_set_complex_vm(obj, data, nelements, 1, dt,
+                                            is_magnitude_phase)
+            else:
+                n = oes_ctria3_complex_vm_17(op2, data, obj, nelements, ntotal, dt,
+                                             is_magnitude_phase)
             assert n is not None, n
 
         elif op2.format_code in [1, 2, 3] and op2.num_wide == 11: # random; CTRIA3
@@ -5398,32 +5465,24 @@ class OES(OP2Common2):
                 return nelements * ntotal, None, None
 
             obj = op2.obj
-            if op2.use_vector and is_vectorized and 0:  # pragma: no cover
-                n = nelements * 4 * op2.num_wide
-                ielement = obj.ielement
-                ielement2 = ielement + nelements
+            if op2.use_vector and is_vectorized and op2.sort_method == 1:
+                n = nelements * ntotal
                 itotal = obj.itotal
-                itotal2 = itotal + nelements * nnodes_expected
+                itotal2 = itotal + nlayers
                 obj._times[obj.itime] = dt
                 if obj.itime == 0:
-                    ints = frombuffer(data, dtype=op2.idtype)
-                    ints1 = ints.reshape(nelements, 9)
-                    eids = ints1[:, 0] // 10
-                    print(eids)
-                    eids = np.vstack([eids, eids]).T.ravel()
-                    print(eids.shape)
-                    print(eids)
-                    print(obj.element)
+                    ints = frombuffer(data, dtype=op2.idtype8).reshape(nelements, 11)
+                    eids = ints[:, 0] // 10
                     assert eids.min() > 0, eids.min()
-                    obj.element[itotal:itotal2, 0] = eids
+                    obj.element_node[itotal:itotal2, 0] = np.repeat(eids, 2)
 
-                floats = frombuffer(data, dtype=op2.fdtype).reshape(nelements, 11)[:, 1:]
-                print(floats.shape)
-                #fd, sx, sy, txy,
-                floats1 = floats.reshape(nelements * nnodes_expected, 10)
-                obj.data[obj.itime, itotal:itotal2, :] = floats1.copy()
+                #[fd, sx, sy, txy, ovm]
+                floats = frombuffer(data, dtype=op2.fdtype8).reshape(nelements, 11)
+                floats1 = floats[:, 1:].reshape(nlayers, 5)
+                obj.fiber_distance[itotal:itotal2] = floats1[:, 0]
+                obj.data[obj.itime, itotal:itotal2, :] = floats1[:, 1:]
                 obj.itotal = itotal2
-                obj.ielement = ielement2
+                obj.ielement = itotal2
             else:
                 if is_vectorized and op2.use_vector and obj.itime == 0:  # pragma: no cover
                     op2.log.debug(f'vectorize {element_name_type} random numwide=11 SORT{sort_method}')
@@ -5458,32 +5517,42 @@ class OES(OP2Common2):
                 return nelements * ntotal, None, None
 
             obj = op2.obj
-            if op2.use_vector and is_vectorized and 0:  # pragma: no cover
-                n = nelements * 4 * op2.num_wide
-                ielement = obj.ielement
-                ielement2 = ielement + nelements
+            if op2.use_vector and is_vectorized and op2.sort_method == 1:
+                n = nelements * ntotal
                 itotal = obj.itotal
-                itotal2 = itotal + nelements * nnodes_expected
+                itotal2 = itotal + nelements * 2
                 obj._times[obj.itime] = dt
                 if obj.itime == 0:
-                    ints = frombuffer(data, dtype=op2.idtype)
-                    ints1 = ints.reshape(nelements, 9)
-                    eids = ints1[:, 0] // 10
-                    #print(eids)
-                    eids = np.vstack([eids, eids]).T.ravel()
-                    #print(eids.shape)
-                    #print(eids)
-                    #print(obj.element)
+                    ints = frombuffer(data, dtype=op2.idtype8).reshape(nelements, 9)
+                    eids = ints[:, 0] // 10
                     assert eids.min() > 0, eids.min()
-                    obj.element[itotal:itotal2, 0] = eids
+                    obj.element_node[itotal:itotal2, 0] = np.repeat(eids, 2)
 
-                floats = frombuffer(data, dtype=op2.fdtype).reshape(nelements, 9)[:, 1:]
-                #print(floats.shape)
-                #fd, sx, sy, txy,
-                floats1 = floats.reshape(nelements * nnodes_expected, 8)
-                obj.data[obj.itime, itotal:itotal2, :] = floats1.copy()
+                #[fd, sx, sy, txy]
+                floats = frombuffer(data, dtype=op2.fdtype8).reshape(nelements, 9)
+                floats1 = floats[:, 1:].reshape(nelements * 2, 4)
+                obj.fiber_distance[itotal:itotal2] = floats1[:, 0]
+                obj.data[obj.itime, itotal:itotal2, :] = floats1[:, 1:]
                 obj.itotal = itotal2
-                obj.ielement = ielement2
+                obj.ielement = itotal2
+            elif op2.use_vector and is_vectorized and op2.sort_method == 2:
+                # one element per record; one row per time
+                n = nelements * ntotal
+                ie_upper = 2 * obj.itime
+                ie_lower = ie_upper + 1
+                if op2._analysis_code_fmt == b'i':
+                    times = frombuffer(data, dtype=op2.idtype8).reshape(nelements, 9)[:, 0]
+                else:
+                    times = frombuffer(data, dtype=op2.fdtype8).reshape(nelements, 9)[:, 0]
+                obj._times[:nelements] = times
+
+                #[fd, sx, sy, txy]
+                floats = frombuffer(data, dtype=op2.fdtype8).reshape(nelements, 9)
+                obj.element_node[ie_upper:ie_lower+1, 0] = element_id
+                obj.fiber_distance[ie_upper] = floats[0, 1]
+                obj.fiber_distance[ie_lower] = floats[0, 5]
+                obj.data[:nelements, ie_upper, :] = floats[:, 2:5]
+                obj.data[:nelements, ie_lower, :] = floats[:, 6:9]
             else:
                 if is_vectorized and op2.use_vector:  # pragma: no cover
                     op2.log.debug(f'vectorize {element_name_type} random2 SORT{sort_method}')
@@ -5722,44 +5791,54 @@ class OES(OP2Common2):
 
             obj = op2.obj
             #print('dt=%s, itime=%s' % (obj.itime, dt))
-            if op2.use_vector and is_vectorized and 0:
-                # self.itime = 0
-                # self.ielement = 0
-                # self.itotal = 0
-                #self.ntimes = 0
-                #self.nelements = 0
+            if op2.use_vector and is_vectorized and op2.sort_method == 1:
                 n = nelements * ntotal
-
                 istart = obj.itotal
                 iend = istart + nlayers
                 obj._times[obj.itime] = dt
 
+                #[eid_device, 'CEN/', [grid, fd1, sx1, sy1, txy1, fd2, sx2, sy2, txy2] * nnodes_all]
                 if obj.itime == 0:
-                    ints = frombuffer(data, dtype=op2.idtype).reshape(nelements, numwide_real)
-                    ints1 = ints[:, 2:].reshape(nlayers//2, 17)[:, 0].reshape(nelements, nnodes_all).copy()
-                    ints1[:, 0] = 0.
-                    nids = ints1.ravel()
-
+                    ints = frombuffer(data, dtype=op2.idtype8).reshape(nelements, op2.num_wide)
                     eids = ints[:, 0] // 10
-                    eids2 = array([eids] * (nnodes_all * 2), dtype='int32').T.ravel()
-                    nids2 = vstack([nids, nids]).T.ravel()
-                    obj.element_node[istart:iend, 0] = eids2
-                    obj.element_node[istart:iend, 1] = nids2
-                    #assert obj.element_node[:iend, 0].min() > 0, eids2
-                    if obj.nonlinear_factor is not None:
-                        float_mask = np.arange(nelements * numwide_real, dtype=np.int32).reshape(nelements, numwide_real)
-                        float_mask1 = float_mask[:, 2:].reshape(nlayers // 2, 17)[:, 1:].reshape(nlayers, 8)
-                        obj.float_mask = float_mask1
-
-                if obj.nonlinear_factor is not None:
-                    results = frombuffer(data, dtype=op2.fdtype)[obj.float_mask].copy()
+                    assert eids.min() > 0, eids.min()
+                    nids = ints[:, 2:].reshape(nelements, nnodes_all, 9)[:, :, 0].copy()
+                    nids[:, 0] = 0  # centroid
+                    obj.element_node[istart:iend, 0] = np.repeat(eids, nnodes_all * 2)
+                    obj.element_node[istart:iend, 1] = np.repeat(nids.ravel(), 2)
+
+                floats = frombuffer(data, dtype=op2.fdtype8).reshape(nelements, op2.num_wide)
+                #[fd, sx, sy, txy]
+                results = floats[:, 2:].reshape(nelements * nnodes_all, 9)[:, 1:].reshape(nlayers, 4)
+                obj.fiber_distance[istart:iend] = results[:, 0]
+                obj.data[obj.itime, istart:iend, :] = results[:, 1:]
+                obj.itotal = iend
+                obj.ielement = iend
+            elif op2.use_vector and is_vectorized and op2.sort_method == 2:
+                # one element per record; one row per time
+                n = nelements * ntotal
+                ntimes = nelements
+                nlayers_per_element = nnodes_all * 2
+                istart = obj.itime * nlayers_per_element
+                iend = istart + nlayers_per_element
+                if op2._analysis_code_fmt == b'i':
+                    times = frombuffer(data, dtype=op2.idtype8).reshape(ntimes, op2.num_wide)[:, 0]
                 else:
-                    floats = frombuffer(data, dtype=op2.fdtype).reshape(nelements, numwide_real)
-                    floats1 = floats[:, 2:].reshape(nlayers // 2, 17)
-                    results = floats1[:, 1:].reshape(nlayers, 8).copy()
-
-                #[fiber_dist, oxx, oyy, txy, angle, majorP, minorP, ovm]
-                obj.data[obj.itime, istart:iend, :] = results
+                    times = frombuffer(data, dtype=op2.fdtype8).reshape(ntimes, op2.num_wide)[:, 0]
+                obj._times[:ntimes] = times
+
+                ints = frombuffer(data, dtype=op2.idtype8).reshape(ntimes, op2.num_wide)
+                nids = ints[0, 2:].reshape(nnodes_all, 9)[:, 0].copy()
+                nids[0] = 0  # centroid
+                obj.element_node[istart:iend, 0] = op2.nonlinear_factor
+                obj.element_node[istart:iend, 1] = np.repeat(nids, 2)
+
+                floats = frombuffer(data, dtype=op2.fdtype8).reshape(ntimes, op2.num_wide)
+                #[fd, sx, sy, txy]
+                floats1 = floats[:, 2:].reshape(ntimes, nnodes_all, 9)[:, :, 1:]
+                results = floats1.reshape(ntimes, nlayers_per_element, 4)
+                obj.fiber_distance[istart:iend] = results[0, :, 0]
+                obj.data[:ntimes, istart:iend, :] = results[:, :, 1:]
             else:
                 if is_vectorized and op2.use_vector:  # pragma: no cover
                     log.debug(f'vectorize CQUAD4-144/{element_name_type}... random SORT{sort_method}')
@@ -5821,8 +5900,12 @@ class OES(OP2Common2):
                 #self.show_data(data)
                 #print(ndata, ntotal)
                 obj = op2.obj
-                n = oes_cquad4_complex_vm_87(op2, data, obj, nelements, nnodes_all,
-                                             is_magnitude_phase)
+                if is_vectorized and op2.use_vector and op2.sort_method == 1:
+                    n = self.obj_set_complex_vm(obj, data, nelements, nnodes_all, dt,
+                                                is_magnitude_phase)
+                else:
+                    n = oes_cquad4_complex_vm_87(op2, data, obj, nelements, nnodes_all,
+                                                 is_magnitude_phase)
 
             #if result_type == 1 and op2.num_wide in [70, 87]:
                 # 70 - CTRIA6-75
@@ -6194,6 +6277,8 @@ class OES(OP2Common2):
                 #[o1, o2, t12, t1z, t2z, angle, major, minor, ovm]
                 obj.data[obj.itime, istart:iend, :] = floats[:, 2:].copy()
             else:
+                # TODO: vectorize SORT2; needs a SORT2 composite model to check
+                #       against (the SORT2 RealCompositePlateArray sizing is suspect)
                 if is_vectorized and op2.use_vector:  # pragma: no cover
                     op2.log.debug(f'vectorize COMP_SHELL real SORT{sort_method}')
 
@@ -6714,6 +6799,12 @@ class OES(OP2Common2):
                 floats = frombuffer(data, dtype=op2.fdtype8).reshape(nelements, 7)
                 #[tx, ty, tz, rx, ry, rz]
                 obj.data[obj.itime, istart:iend, :] = floats[:, 1:].copy()
+            elif op2.use_vector and is_vectorized and op2.sort_method == 2:
+                n = nelements * ntotal
+                floats = frombuffer(data, dtype=op2.fdtype8).reshape(nelements, 7)
+                itime, itime2, ielement = set_sort2_element_times(op2, obj, data, nelements)
+                #[tx, ty, tz, rx, ry, rz]
+                obj.data[itime:itime2, ielement, :] = floats[:, 1:]
             else:
                 n = oes_cbush_real_7(op2, data, obj,
                                      nelements, ntotal, dt)
@@ -8127,6 +8218,50 @@ class OES(OP2Common2):
             assert eids.min() > 0, eids.min()
             obj.element[ielement:ielement2] = eids
 
+    def obj_set_complex_vm(self, obj, data, nelements, nnodes, dt,
+                           is_magnitude_phase):
+        """
+        vectorized SORT1 complex von Mises plate stress/strain
+
+        nnodes=1 (CQUAD4-33, CTRIA3; numwide=17):
+            [eid_device, layer1, layer2]
+        nnodes>1 (CQUAD4-144, CQUADR, CTRIA6, ...; numwide=2+17*nnodes):
+            [eid_device, 'CEN/', [nid, layer1, layer2] * nnodes]
+
+        layer = [fd, sxr, sxi, syr, syi, txyr, txyi, von_mises]
+        """
+        op2 = self.op2
+        num_wide = op2.num_wide
+        n = nelements * num_wide * op2.size
+        nlayers = nelements * nnodes * 2
+        itotal = obj.itotal
+        itotal2 = itotal + nlayers
+        obj._times[obj.itime] = dt
+
+        floats = frombuffer(data, dtype=op2.fdtype8).reshape(nelements, num_wide)
+        if nnodes == 1:
+            floats1 = floats[:, 1:].reshape(nlayers, 8)
+        else:
+            floats1 = floats[:, 2:].reshape(nelements * nnodes, 17)[:, 1:].reshape(nlayers, 8)
+
+        if obj.itime == 0:
+            ints = frombuffer(data, dtype=op2.idtype8).reshape(nelements, num_wide)
+            eids = ints[:, 0] // 10
+            assert eids.min() > 0, eids.min()
+            obj.element_node[itotal:itotal2, 0] = np.repeat(eids, nnodes * 2)
+            if nnodes > 1:
+                nids = ints[:, 2:].reshape(nelements, nnodes, 17)[:, :, 0].copy()
+                nids[:, 0] = 0  # centroid
+                obj.element_node[itotal:itotal2, 1] = np.repeat(nids.ravel(), 2)
+
+        real_imag = apply_mag_phase(floats1, is_magnitude_phase, [1, 3, 5], [2, 4, 6])
+        obj.fiber_distance[itotal:itotal2] = floats1[:, 0]
+        obj.data[obj.itime, itotal:itotal2, :3] = real_imag
+        obj.data[obj.itime, itotal:itotal2, 3] = floats1[:, 7]
+        obj.itotal = itotal2
+        obj.ielement = itotal2
+        return n
+
 def oes_cgapnl_real_11(op2: OP2, data: bytes,
                        obj: NonlinearGapStressArray,
                        nelements: int, ntotal: int) -> int:
@@ -10,7 +10,7 @@ from pyNastran.op2.tables.oes_stressStrain.real.oes_objects import (
     set_transient_case, set_post_buckling_case,
 )
 from pyNastran.f06.f06_formatting import (
-    write_floats_13e, write_floats_13e_long, _eigenvalue_header)
+    write_floats_13e_long, write_floats_13e_array, write_f06_rows, _eigenvalue_header)
 from pyNastran.op2.op2_interface.write_utils import (
     to_column_bytes, view_dtype, view_idtype_as_fdtype)
 
@@ -412,39 +412,15 @@ class RealBarArray(OES_Object):
             header = _eigenvalue_header(self, header, itime, ntimes, dt)
             f06_file.write(''.join(header + msg))
 
-            s1a = self.data[itime, :, 0]
-            s2a = self.data[itime, :, 1]
-            s3a = self.data[itime, :, 2]
-            s4a = self.data[itime, :, 3]
-
-            axial = self.data[itime, :, 4]
-            smaxa = self.data[itime, :, 5]
-            smina = self.data[itime, :, 6]
-            MSt = self.data[itime, :, 7]
-
-            s1b = self.data[itime, :, 8]
-            s2b = self.data[itime, :, 9]
-            s3b = self.data[itime, :, 10]
-            s4b = self.data[itime, :, 11]
-
-            smaxb = self.data[itime, :, 12]
-            sminb = self.data[itime, :, 13]
-            MSc = self.data[itime, :, 14]
-
-            for (eid, s1ai, s2ai, s3ai, s4ai, axiali, smaxai, sminai, MSti,
-                      s1bi, s2bi, s3bi, s4bi,         smaxbi, sminbi, MSci) in zip(
-                eids, s1a, s2a, s3a, s4a, axial, smaxa, smina, MSt,
-                      s1b, s2b, s3b, s4b,        smaxb, sminb, MSc):
-
-                vals = [s1ai, s2ai, s3ai, s4ai, axiali, smaxai, sminai, MSti,
-                        s1bi, s2bi, s3bi, s4bi,         smaxbi, sminbi, MSci]
-                vals2 = write_floats_13e(vals)
-                [s1ai, s2ai, s3ai, s4ai, axiali, smaxai, sminai, MSti,
-                 s1bi, s2bi, s3bi, s4bi,         smaxbi, sminbi, MSci] = vals2
-                f06_file.write('0%8i   %-13s  %-13s  %-13s  %-13s  %-13s  %-13s  %-13s %s\n'
-                               ' %8s   %-13s  %-13s  %-13s  %-13s  %-13s  %-13s  %-13s %s\n'
-                               % (eid, s1ai, s2ai, s3ai, s4ai, axiali, smaxai, sminai, MSti,
-                                  '', s1bi, s2bi, s3bi, s4bi, '',     smaxbi, sminbi, MSci))
+            [s1a, s2a, s3a, s4a, axial, smaxa, smina, MSt,
+             s1b, s2b, s3b, s4b, smaxb, sminb, MSc] = write_floats_13e_array(
+                 self.data[itime, :, :15]).T
+            write_f06_rows(
+                f06_file,
+                '0%8i   %-13s  %-13s  %-13s  %-13s  %-13s  %-13s  %-13s %s\n'
+                '            %-13s  %-13s  %-13s  %-13s                 %-13s  %-13s %s\n',
+                [eids, s1a, s2a, s3a, s4a, axial, smaxa, smina, MSt,
+                 s1b, s2b, s3b, s4b, smaxb, sminb, MSc])
 
             f06_file.write(page_stamp % page_num)
             page_num += 1
@@ -10,7 +10,9 @@ from pyNastran.op2.tables.oes_stressStrain.real.oes_objects import (
     oes_real_data_code, set_element_node_xxb_case,
     set_static_case, set_modal_case, set_transient_case, set_post_buckling_case,
 )
-from pyNastran.f06.f06_formatting import write_floats_13e, _eigenvalue_header
+from pyNastran.f06.f06_formatting import (
+    write_floats_13e, write_floats_13e_array, write_f06_rows_by_format,
+    _eigenvalue_header)
 from pyNastran.op2.result_objects.op2_objects import set_as_sort1
 
 
@@ -422,39 +424,35 @@ class RealBeamArray(OES_Object):
         assert len(eids) == len(nids)
         assert len(eids) == len(xxbs)
         #print('CBEAM ntimes=%s ntotal=%s' % (ntimes, ntotal))
+
+        # a station is skipped if it's at the same xxb as the previous
+        # station; an element id line is written if the element is
+        # different than the last station that was written
+        nrows = len(eids)
+        is_station = np.ones(nrows, dtype='bool')
+        is_station[1:] = (xxbs[1:] != xxbs[:-1])
+        iprevious = np.maximum.accumulate(np.where(is_station, np.arange(nrows), 0))
+        is_eid = np.ones(nrows, dtype='bool')
+        is_eid[1:] = (eids[1:] != eids[iprevious[:-1]])
+        ifmt = is_eid.astype('int32') + 2 * is_station
+
+        fmt_station = '%19s   %4.3f   %12s %12s %12s %12s %12s %12s %12s %s\n'
+        fmts = [
+            '%.0s' * 11,
+            '0  %8i\n' + '%.0s' * 10,
+            '%.0s' + fmt_station,
+            '0  %8i\n' + fmt_station,
+        ]
         for itime in range(ntimes):
             dt = self._times[itime]
             header = _eigenvalue_header(self, header, itime, ntimes, dt)
             f06_file.write(''.join(header + msg))
 
-            sxcs = self.data[itime, :, 0]
-            sxds = self.data[itime, :, 1]
-            sxes = self.data[itime, :, 2]
-            sxfs = self.data[itime, :, 3]
-            smaxs = self.data[itime, :, 4]
-            smins = self.data[itime, :, 5]
-            smts = self.data[itime, :, 6]
-            smcs = self.data[itime, :, 7]
-            assert len(eids) == len(sxcs)
-
-            eid_old = None
-            xxb_old = None
-            for (eid, nid, xxb, sxc, sxd, sxe, sxf, smax, smin, smt, smc) in zip(
-                    eids, nids, xxbs, sxcs, sxds, sxes, sxfs, smaxs, smins, smts, smcs):
-                if eid != eid_old:
-                    f06_file.write('0  %8i\n' % eid)
-                if xxb == xxb_old:
-                    continue
-                # #if eid != eid_old and xxb != xxb_old:
-                    #continue
-                vals = [sxc, sxd, sxe, sxf, smax, smin, smt, smc]
-                vals2 = write_floats_13e(vals)
-                [sxc, sxd, sxe, sxf, smax, smin, smt, smc] = vals2
-                f06_file.write('%19s   %4.3f   %12s %12s %12s %12s %12s %12s %12s %s\n' % (
-                    nid, xxb, sxc, sxd, sxe, sxf,
-                    smax, smin, smt, smc.strip()))
-                eid_old = eid
-                xxb_old = xxb
+            [sxc, sxd, sxe, sxf, smax, smin, smt, smc] = write_floats_13e_array(
+                self.data[itime, :, :8]).T
+            smc = np.char.strip(smc)
+            columns = [eids, nids, xxbs, sxc, sxd, sxe, sxf, smax, smin, smt, smc]
+            write_f06_rows_by_format(f06_file, fmts, ifmt, columns)
 
             f06_file.write(page_stamp % page_num)
             page_num += 1
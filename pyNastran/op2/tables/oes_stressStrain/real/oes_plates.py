@@ -13,7 +13,9 @@ from pyNastran.op2.tables.oes_stressStrain.real.oes_objects import (
     oes_real_data_code, get_scode,
     set_static_case, set_modal_case, set_transient_case)
 from pyNastran.op2.result_objects.op2_objects import get_times_dtype
-from pyNastran.f06.f06_formatting import write_floats_13e, write_floats_13e_long, _eigenvalue_header
+from pyNastran.f06.f06_formatting import (
+    write_floats_13e_long, write_floats_13e_array, write_f06_rows_by_format,
+    _eigenvalue_header)
 from pyNastran.op2.errors import SixtyFourBitError
 
 NUM_WIDE_CENTROID = 17
@@ -714,46 +716,36 @@ class RealPlateArray(OES_Object):
             #print("self.data.shape=%s itime=%s ieids=%s" % (str(self.data.shape), itime, str(ieids)))
 
             #[fiber_dist, oxx, oyy, txy, angle, majorP, minorP, ovm]
-            fiber_dist = self.data[itime, :, 0]
-            oxx = self.data[itime, :, 1]
-            oyy = self.data[itime, :, 2]
-            txy = self.data[itime, :, 3]
-            angle = self.data[itime, :, 4]
-            major_principal = self.data[itime, :, 5]
-            minor_principal = self.data[itime, :, 6]
-            ovm = self.data[itime, :, 7]
+            [fdi, oxxi, oyyi, txyi, major, minor, ovmi] = write_floats_13e_array(
+                self.data[itime][:, [0, 1, 2, 3, 5, 6, 7]].T)
+            anglei = self.data[itime, :, 4]
+            columns = [eids, nids, fdi, oxxi, oyyi, txyi, anglei, major, minor, ovmi]
+            ilayer = np.arange(len(eids)) % 2
 
             is_linear = self.element_type in {33, 74, 227, 228, 83}
             is_bilinear = self.element_type in {64, 70, 75, 82, 144}
-            for (i, eid, nid, fdi, oxxi, oyyi, txyi, anglei, major, minor, ovmi) in zip(
-                 count(), eids, nids, fiber_dist, oxx, oyy, txy, angle, major_principal, minor_principal, ovm):
-                [fdi, oxxi, oyyi, txyi, major, minor, ovmi] = write_floats_13e(
-                    [fdi, oxxi, oyyi, txyi, major, minor, ovmi])
-                ilayer = i % 2
-                # tria3
-                if is_linear:  # CQUAD4, CTRIA3, CTRIAR linear, CQUADR linear
-                    if ilayer == 0:
-                        f06_file.write('0  %6i   %-13s     %-13s  %-13s  %-13s   %8.4f   %-13s   %-13s  %s\n' % (
-                            eid, fdi, oxxi, oyyi, txyi, anglei, major, minor, ovmi))
-                    else:
-                        f06_file.write('   %6s   %-13s     %-13s  %-13s  %-13s   %8.4f   %-13s   %-13s  %s\n' % (
-                            '', fdi, oxxi, oyyi, txyi, anglei, major, minor, ovmi))
-
-                elif is_bilinear:  # CQUAD8, CTRIAR, CTRIA6, CQUADR, CQUAD4
-                    # bilinear
-                    if nid == 0 and ilayer == 0:  # CEN
-                        f06_file.write('0  %8i %8s  %-13s  %-13s %-13s %-13s   %8.4f  %-13s %-13s %s\n' % (
-                            eid, cen_word, fdi, oxxi, oyyi, txyi, anglei, major, minor, ovmi))
-                    elif ilayer == 0:
-                        f06_file.write('   %8s %8i  %-13s  %-13s %-13s %-13s   %8.4f  %-13s %-13s %s\n' % (
-                            '', nid, fdi, oxxi, oyyi, txyi, anglei, major, minor, ovmi))
-                    elif ilayer == 1:
-                        f06_file.write('   %8s %8s  %-13s  %-13s %-13s %-13s   %8.4f  %-13s %-13s %s\n\n' % (
-                            '', '', fdi, oxxi, oyyi, txyi, anglei, major, minor, ovmi))
-                else:  # pragma: no cover
-                    msg = 'element_name=%s self.element_type=%s' % (
-                        self.element_name, self.element_type)
-                    raise NotImplementedError(msg)
+            # tria3
+            if is_linear:  # CQUAD4, CTRIA3, CTRIAR linear, CQUADR linear
+                fmts = [
+                    '0  %6i%.0s   %-13s     %-13s  %-13s  %-13s   %8.4f   %-13s   %-13s  %s\n',
+                    '   %6.0s%.0s   %-13s     %-13s  %-13s  %-13s   %8.4f   %-13s   %-13s  %s\n',
+                ]
+                ifmt = ilayer
+
+            elif is_bilinear:  # CQUAD8, CTRIAR, CTRIA6, CQUADR, CQUAD4
+                # bilinear
+                fmts = [
+                    # CEN
+                    '0  %8i ' + '%8s' % cen_word + '%.0s  %-13s  %-13s %-13s %-13s   %8.4f  %-13s %-13s %s\n',
+                    '   %8.0s %8i  %-13s  %-13s %-13s %-13s   %8.4f  %-13s %-13s %s\n',
+                    '   %8.0s %8.0s  %-13s  %-13s %-13s %-13s   %8.4f  %-13s %-13s %s\n\n',
+                ]
+                ifmt = np.where(ilayer == 1, 2, np.where(nids == 0, 0, 1))
+            else:  # pragma: no cover
+                msg = 'element_name=%s self.element_type=%s' % (
+                    self.element_name, self.element_type)
+                raise NotImplementedError(msg)
+            write_f06_rows_by_format(f06_file, fmts, ifmt, columns)
 
             f06_file.write(page_stamp % page_num)
             page_num += 1
@@ -9,7 +9,7 @@ from pyNastran.op2.tables.oes_stressStrain.real.oes_objects import (
     set_transient_case, set_post_buckling_case)
 from pyNastran.op2.op2_interface.write_utils import view_dtype, view_idtype_as_fdtype
 from pyNastran.f06.f06_formatting import (
-    write_floats_13e, write_floats_13e_long,
+    write_floats_13e_long, write_floats_13e_array, write_f06_rows,
     _eigenvalue_header) #, get_key0
 
 ELEMENT_NAME_TO_ELEMENT_TYPE = {
@@ -379,22 +379,18 @@ class RealRodArray(OES_Object):
             f06_file.write(''.join(header + msg_temp))
 
             #print("self.data.shape=%s itime=%s ieids=%s" % (str(self.data.shape), itime, str(ieids)))
-            axial = self.data[itime, :, 0]
-            SMa = self.data[itime, :, 1]
-            torsion = self.data[itime, :, 2]
-            SMt = self.data[itime, :, 3]
-
-            out = []
-            for eid, axiali, SMai, torsioni, SMti in zip(eids, axial, SMa, torsion, SMt):
-                [axiali, torsioni, SMai, SMti] = write_floats_13e([axiali, torsioni, SMai, SMti])
-                out.append([eid, axiali, SMai, torsioni, SMti])
-
-            for i in range(0, nwrite, 2):
-                f06_file.write(
-                    '      %8i %-13s  %-13s %-13s  %-13s %-8i   %-13s  %-13s %-13s  %-s\n' % (
-                        tuple(out[i] + out[i + 1])))
+            [axial, SMa, torsion, SMt] = write_floats_13e_array(self.data[itime, :, :4]).T
+
+            # 2 elements per line
+            write_f06_rows(
+                f06_file,
+                '      %8i %-13s  %-13s %-13s  %-13s %-8i   %-13s  %-13s %-13s  %-s\n',
+                [eids[0:nwrite:2], axial[0:nwrite:2], SMa[0:nwrite:2], torsion[0:nwrite:2], SMt[0:nwrite:2],
+                 eids[1:nwrite:2], axial[1:nwrite:2], SMa[1:nwrite:2], torsion[1:nwrite:2], SMt[1:nwrite:2]])
             if is_odd:
-                f06_file.write('      %8i %-13s  %-13s %-13s  %13s\n' % (tuple(out[-1])))
+                write_f06_rows(
+                    f06_file, '      %8i %-13s  %-13s %-13s  %13s\n',
+                    [eids[-1:], axial[-1:], SMa[-1:], torsion[-1:], SMt[-1:]])
             f06_file.write(page_stamp % page_num)
             page_num += 1
         return page_num - 1
@@ -10,7 +10,8 @@ from numpy.linalg import eigh  # type: ignore
 
 from pyNastran.utils.numpy_utils import float_types
 from pyNastran.f06.f06_formatting import (
-    write_floats_13e, write_floats_13e_long, _eigenvalue_header)
+    write_floats_13e_long, write_floats_13e_array, write_f06_rows_by_format,
+    _eigenvalue_header)
 from pyNastran.op2.result_objects.op2_objects import get_times_dtype
 from pyNastran.op2.tables.oes_stressStrain.real.oes_objects import (
     StressObject, StrainObject, OES_Object,
@@ -142,9 +143,10 @@ class RealSolidArray(OES_Object):
             nelements = self.nelements
         else:
             #print(f'ntimes={self.ntimes} nelements={self.nelements} ntotal={self.ntotal}')
+            # one element per record; ntotal is the size of a record (ntimes*nnodes)
             ntimes = self.nelements
-            ntotal = self.ntotal
             nelements = self.ntimes
+            ntotal = nelements * (self.ntotal // ntimes)
             #print(f'ntimes={ntimes} nelements={nelements} ntotal={ntotal}')
         #self.ntimes = ntimes
         #self.ntotal = ntotal
@@ -168,7 +170,7 @@ class RealSolidArray(OES_Object):
 
         #[oxx, oyy, ozz, txy, tyz, txz, o1, o2, o3, ovmShear]
         data = zeros((ntimes, ntotal, 10), fdtype)
-        self.nnodes = element_node.shape[0] // self.nelements
+        self.nnodes = ntotal // nelements
         #self.data = zeros((self.ntimes, self.nelements, nnodes+1, 10), 'float32')
 
         if self.load_as_h5:
@@ -363,9 +365,10 @@ class RealSolidArray(OES_Object):
         #ielement = self.itotal
         #itotal = self.itime
         #print(self.ntimes, self.nelements, self.ntotal, self.nnodes)
+        # the record is a single element (self.itime) with nnodes rows per time
         itime = self.itotal // self.nnodes
         ielement = self.itime
-        itotal = self.itotal
+        itotal = ielement * self.nnodes
         assert cid >= -2, cid
         assert eid >= 0, eid
 
@@ -414,7 +417,7 @@ class RealSolidArray(OES_Object):
         #itime = self.itime - 1
         nnodes = self.nnodes
         itime = self.itotal // nnodes
-        itotal = self.itotal
+        itotal = self.itime * nnodes + self.itotal % nnodes
         #ielement = self.ielement - 1
         #ielement = self.itime
         #inode = self.itotal % nnodes
@@ -669,56 +672,57 @@ class RealSolidArray(OES_Object):
         else:
             v = np.zeros((ntimes, nnodes, 3, 3), dtype=fdtype)
 
+        # the center is the first row of each element
+        cnnodes = nnodes + 1
+        is_node = (np.arange(len(eids2)) % cnnodes != 0).astype('int32')
+        cids = np.zeros(len(eids2), dtype=cids3.dtype)
+        icenter = np.flatnonzero(is_node == 0)
+        if len(icenter):
+            ueids3, ifirst = np.unique(eids3, return_index=True)
+            ieid = np.searchsorted(ueids3, eids2[icenter])
+            ieid[ieid == len(ueids3)] = 0
+            if not np.array_equal(ueids3[ieid], eids2[icenter]):
+                raise IndexError(f'eids={np.setdiff1d(eids2[icenter], eids3)} '
+                                 f'are not in element_cid')
+            cids[icenter] = cids3[ifirst[ieid]]
+
+        blank = '               ' + ' ' * 8
+        fmt_block = (
+            '  X  %-13s  XY  %-13s   A  %-13s  LX%5.2f%5.2f%5.2f  %-13s   %s\n' +
+            blank + '  Y  %-13s  YZ  %-13s   B  %-13s  LY%5.2f%5.2f%5.2f\n' +
+            blank + '  Z  %-13s  ZX  %-13s   C  %-13s  LZ%5.2f%5.2f%5.2f\n')
+        fmts = [
+            '0  %%8s    %%8iGRID CS  %i GP\n' % nnodes +
+            '0              %8s%%.0s' % 'CENTER' + fmt_block,
+            '%.0s%.0s0              %8s' + fmt_block,
+        ]
         for itime in range(ntimes):
             dt = self._times[itime]
             header = _eigenvalue_header(self, header, itime, ntimes, dt)
             f06_file.write(''.join(header + msg_temp))
 
             #print("self.data.shape=%s itime=%s ieids=%s" % (str(self.data.shape), itime, str(ieids)))
-            oxx = self.data[itime, :, 0]
-            oyy = self.data[itime, :, 1]
-            ozz = self.data[itime, :, 2]
-            txy = self.data[itime, :, 3]
-            tyz = self.data[itime, :, 4]
-            txz = self.data[itime, :, 5]
             o1 = self.data[itime, :, 6]
             o2 = self.data[itime, :, 7]
             o3 = self.data[itime, :, 8]
-            ovm = self.data[itime, :, 9]
             vi = v[itime, :, :, :]
-            pi = p[itime, :]
 
-            cnnodes = nnodes + 1
-            for i, deid, node_id, doxx, doyy, dozz, dtxy, dtyz, dtxz, do1, do2, do3, dp, dv, dovm in zip(
-                    count(), eids2, nodes, oxx, oyy, ozz, txy, tyz, txz, o1, o2, o3, pi, vi, ovm):
-
-                # o1-max
-                # o2-mid
-                # o3-min
-                assert do1 >= do2 >= do3, 'o1 >= o2 >= o3; eid=%s o1=%e o2=%e o3=%e' % (deid, do1, do2, do3)
-                [oxxi, oyyi, ozzi, txyi, tyzi, txzi, o1i, o2i, o3i, pii, ovmi] = write_floats_13e(
-                    [doxx, doyy, dozz, dtxy, dtyz, dtxz, do1, do2, do3, dp, dovm])
-
-                if i % cnnodes == 0:
-                    j = where(eids3 == deid)[0][0]
-                    cid = cids3[j]
-                    f06_file.write('0  %8s    %8iGRID CS  %i GP\n' % (deid, cid, nnodes))
-                    f06_file.write(
-                        '0              %8s  X  %-13s  XY  %-13s   A  %-13s  LX%5.2f%5.2f%5.2f  %-13s   %s\n'
-                        '               %8s  Y  %-13s  YZ  %-13s   B  %-13s  LY%5.2f%5.2f%5.2f\n'
-                        '               %8s  Z  %-13s  ZX  %-13s   C  %-13s  LZ%5.2f%5.2f%5.2f\n'
-                        % ('CENTER', oxxi, txyi, o1i, dv[0, 1], dv[0, 2], dv[0, 0], pii, ovmi,
-                           '', oyyi, tyzi, o2i, dv[1, 1], dv[1, 2], dv[1, 0],
-                           '', ozzi, txzi, o3i, dv[2, 1], dv[2, 2], dv[2, 0]))
-                else:
-                    f06_file.write(
-                        '0              %8s  X  %-13s  XY  %-13s   A  %-13s  LX%5.2f%5.2f%5.2f  %-13s   %s\n'
-                        '               %8s  Y  %-13s  YZ  %-13s   B  %-13s  LY%5.2f%5.2f%5.2f\n'
-                        '               %8s  Z  %-13s  ZX  %-13s   C  %-13s  LZ%5.2f%5.2f%5.2f\n'
-                        % (node_id, oxxi, txyi, o1i, dv[0, 1], dv[0, 2], dv[0, 0], pii, ovmi,
-                           '', oyyi, tyzi, o2i, dv[1, 1], dv[1, 2], dv[1, 0],
-                           '', ozzi, txzi, o3i, dv[2, 1], dv[2, 2], dv[2, 0]))
-                i += 1
+            # o1-max
+            # o2-mid
+            # o3-min
+            is_sorted = (o1 >= o2) & (o2 >= o3)
+            if not is_sorted.all():
+                i = np.flatnonzero(~is_sorted)[0]
+                raise AssertionError('o1 >= o2 >= o3; eid=%s o1=%e o2=%e o3=%e' % (
+                    eids2[i], o1[i], o2[i], o3[i]))
+
+            data = np.column_stack([self.data[itime, :, :10], p[itime, :]])
+            [oxxi, oyyi, ozzi, txyi, tyzi, txzi, o1i, o2i, o3i, ovmi, pii] = write_floats_13e_array(data).T
+            columns = [
+                eids2, cids, nodes, oxxi, txyi, o1i, vi[:, 0, 1], vi[:, 0, 2], vi[:, 0, 0], pii, ovmi,
+                oyyi, tyzi, o2i, vi[:, 1, 1], vi[:, 1, 2], vi[:, 1, 0],
+                ozzi, txzi, o3i, vi[:, 2, 1], vi[:, 2, 2], vi[:, 2, 0]]
+            write_f06_rows_by_format(f06_file, fmts, is_node, columns)
             f06_file.write(page_stamp % page_num)
             page_num += 1
         return page_num - 1
@@ -10,7 +10,9 @@ from pyNastran.op2.tables.oes_stressStrain.real.oes_objects import (
     StressObject, StrainObject, OES_Object,
     oes_real_data_code, set_static_case, set_modal_case,
     set_transient_case, set_post_buckling_case, set_element_case)
-from pyNastran.f06.f06_formatting import write_float_13e, write_float_13e_long, _eigenvalue_header
+from pyNastran.f06.f06_formatting import (
+    write_float_13e, write_float_13e_long, write_floats_13e_array, write_f06_rows,
+    _eigenvalue_header)
 from pyNastran.op2.op2_interface.write_utils import set_table3_field, view_dtype, view_idtype_as_fdtype
 
 ELEMENT_NAME_TO_ELEMENT_TYPE = {
@@ -458,30 +460,24 @@ class RealSpringArray(OES_Object):
         nwrite = len(eids)
         nrows = nwrite // 4
         nleftover = nwrite - nrows * 4
+        n4 = nrows * 4
 
         for itime in range(ntimes):
             dt = self._times[itime]
             header = _eigenvalue_header(self, header, itime, ntimes, dt)
             f06_file.write(''.join(header + msg_temp))
-            stress = self.data[itime, :, 0]
-
-            out = []
-            for eid, stressi in zip(eids, stress):
-                out.append([eid, write_float_13e(stressi)])
-
-            for i in range(0, nrows * 4, 4):
-                f06_file.write('    %10i  %13s    %10i  %13s    %10i  %13s    %10i  %13s\n' % (
-                    tuple(out[i] + out[i + 1] + out[i + 2] + out[i + 3])))
-
-            i = nrows * 4
-            if nleftover == 3:
-                f06_file.write('    %10i  %13s    %10i  %13s    %10i  %13s\n' % (
-                    tuple(out[i] + out[i + 1] + out[i + 2])))
-            elif nleftover == 2:
-                f06_file.write('    %10i  %13s    %10i  %13s\n' % (
-                    tuple(out[i] + out[i + 1])))
-            elif nleftover == 1:
-                f06_file.write('    %10i  %13s\n' % tuple(out[i]))
+            stress = write_floats_13e_array(self.data[itime, :, 0])
+
+            # 4 elements per line
+            write_f06_rows(
+                f06_file,
+                '    %10i  %13s    %10i  %13s    %10i  %13s    %10i  %13s\n',
+                [eids[0:n4:4], stress[0:n4:4], eids[1:n4:4], stress[1:n4:4],
+                 eids[2:n4:4], stress[2:n4:4], eids[3:n4:4], stress[3:n4:4]])
+            if nleftover:
+                write_f06_rows(
+                    f06_file, '    %10i  %13s' * nleftover + '\n',
+                    [column[i:i + 1] for i in range(n4, nwrite) for column in (eids, stress)])
             f06_file.write(page_stamp % page_num)
             page_num += 1
         return page_num - 1
@@ -1,3 +1,10 @@
+from __future__ import annotations
+from typing import Any, TYPE_CHECKING
+from numpy import frombuffer
+if TYPE_CHECKING:  # pragma: no cover
+    from pyNastran.op2.op2 import OP2
+
+
 def get_eid_dt_from_eid_device(eid_device, dt, sort_method):
     """common unvectorized method for transforming SORT2 data into SORT1"""
     if sort_method == 1:
@@ -6,3 +13,47 @@ def get_eid_dt_from_eid_device(eid_device, dt, sort_method):
     else:
         eid, dt = dt, eid_device
     return eid, dt
+
+
+def set_sort2_element_times(op2: OP2, obj: Any, data: bytes,
+                            ntimes: int) -> tuple[int, int, int]:
+    """
+    Common vectorized method for a SORT2 element record with one row per
+    time (e.g., CROD, CBAR, CBUSH).  The element id is the nonlinear_factor
+    and the first word of each row is the time/frequency/mode.
+
+    The SORT2 element objects are stored like SORT1 (ntimes, nelements, ...),
+    so ``obj.itime`` is the element counter (one per record) and
+    ``obj.itotal`` is the time counter.
+
+    Parameters
+    ----------
+    op2 : OP2
+        the reader
+    obj : OES/OEF result object
+        the vectorized result
+    data : bytes
+        the table 4 record
+    ntimes : int
+        the number of rows in data
+
+    Returns
+    -------
+    itime, itime2 : int
+        the time slice of obj.data to fill
+    ielement : int
+        the element index of obj.data to fill
+
+    """
+    num_wide = op2.num_wide
+    itime = obj.itotal
+    itime2 = itime + ntimes
+    ielement = obj.itime
+    if op2._analysis_code_fmt == b'i':
+        times = frombuffer(data, dtype=op2.idtype8).reshape(ntimes, num_wide)[:, 0]
+    else:
+        times = frombuffer(data, dtype=op2.fdtype8).reshape(ntimes, num_wide)[:, 0]
+    obj._times[itime:itime2] = times
+    obj.element[ielement] = op2.nonlinear_factor
+    obj.itotal = itime2
+    return itime, itime2, ielement
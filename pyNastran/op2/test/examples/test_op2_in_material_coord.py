@@ -11,7 +11,7 @@ from pyNastran.op2.test.test_op2 import IS_PANDAS
 from pyNastran.op2.data_in_material_coord import (
     data_in_material_coord,
     get_eids_from_op2_vector, force_vectors, stress_vectors,
-    strain_vectors, get_eid_to_theta_rad, get_eid_to_theta_rad2)
+    strain_vectors, get_eid_to_theta_rad, get_eid_to_theta_rad2, get_shell_theta_rad)
 
 PKG_PATH = pyNastran.__path__[0]
 TEST_PATH = os.path.join(PKG_PATH, 'op2', 'test', 'examples', 'coord_transform')
@@ -65,6 +65,41 @@ class TestMaterialCoordReal(unittest.TestCase):
 
         x = 1
 
+    def test_shell_theta_rad(self):
+        """the array-based angles match the element-based angles and are cached"""
+        log = get_logger(level='error')
+        basepath = os.path.join(TEST_PATH, 'test_dummy_wing_metallic')
+        bdf_filename = os.path.join(basepath, 'dummy_wing_metallic.bdf')
+        model = BDF(debug=False, log=log)
+        model.read_bdf(bdf_filename)
+
+        eids, theta_rad = get_shell_theta_rad(model)
+        eid_to_theta_rad = get_eid_to_theta_rad(model, debug=False)
+        assert len(eids) == len(eid_to_theta_rad)
+        theta_rad_expected = np.array([eid_to_theta_rad[eid] for eid in eids])
+        assert np.allclose(theta_rad, theta_rad_expected)
+        assert get_shell_theta_rad(model)[1] is theta_rad
+
+        # a new element invalidates the cache
+        elem = model.elements[eids[0]]
+        model.add_ctria3(eids[-1] + 1, elem.pid, elem.nodes[:3], theta_mcid=30.)
+        eids2, theta_rad2 = get_shell_theta_rad(model)
+        assert len(eids2) == len(eids) + 1
+        assert np.allclose(np.degrees(theta_rad2[-1]), 30.)
+
+        # moving a node requires recompute
+        iquad = [i for i, eid in enumerate(eids2) if model.elements[eid].type == 'CQUAD4'][0]
+        quad = model.elements[eids2[iquad]]
+        node = model.nodes[quad.nodes[3]]
+        node.xyz = node.xyz + 0.5 * (model.nodes[quad.nodes[2]].xyz - node.xyz)
+        assert get_shell_theta_rad(model)[1] is theta_rad2
+        eids3, theta_rad3 = get_shell_theta_rad(model, recompute=True)
+        assert theta_rad3 is not theta_rad2
+        assert np.array_equal(eids3, eids2)
+        assert not np.isclose(theta_rad3[iquad], theta_rad2[iquad])
+        eid_to_theta_rad3 = get_eid_to_theta_rad(model, debug=False)
+        assert np.allclose(theta_rad3, [eid_to_theta_rad3[eid] for eid in eids3])
+
     def test_ctria6_mcid_real(self):
         log = get_logger(level='error')
         bdf = BDF(debug=False, log=log)
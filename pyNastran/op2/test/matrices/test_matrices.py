@@ -41,6 +41,25 @@ class TestOP2Matrix(unittest.TestCase):
         uexpt = model.matrices['UEXP']
         assert uexpt.data.shape == (276, 24), uexpt.data.shape
 
+    def test_gpspc_hdf5_compression(self):
+        """tests the matrices use the HDF5 compression"""
+        try:
+            import h5py
+        except ImportError:  # pragma: no cover
+            return
+        from pyNastran.op2.op2 import read_op2
+        op2_filename = os.path.join(PKG_PATH, 'op2', 'test', 'matrices', 'gpsc1.op2')
+        h5_filename = os.path.join(PKG_PATH, 'op2', 'test', 'matrices', 'gpsc1_lzf.h5')
+        log = SimpleLogger(level='warning')
+        model = read_op2(op2_filename, log=log)
+        model.export_hdf5_filename(h5_filename, compression='lzf')
+        with h5py.File(h5_filename, 'r') as h5_file:
+            for name, matrix in model.matrices.items():
+                matrix_group = h5_file['matrices'][name]
+                assert matrix_group['data'].compression == 'lzf', name
+                assert np.array_equal(matrix_group['row'][()], matrix.data.row), name
+        os.remove(h5_filename)
+
     def test_kelm_kdict(self):
         """Tests reading KELM and KDICT"""
         op2_filename = os.path.join(MODEL_PATH, 'sol_101_elements', 'static_solid_shell_bar_kelm.op2')
@@ -28,6 +28,10 @@ import pyNastran
 from pyNastran.bdf.bdf import BDF, read_bdf, CORD2R
 from pyNastran.op2.op2 import OP2, read_op2, FatalError, FortranMarkerError
 from pyNastran.op2.op2_interface.op2_common import get_scode_word
+from pyNastran.op2.op2_interface.op2_index import OP2Index, get_index_filename
+from pyNastran.op2.op2_interface.op2_lazy import LazyResult
+from pyNastran.op2.op2_interface.transforms import (
+    transform_displacement_to_global, get_displacement_transform_plan)
 from pyNastran.op2.op2_geom import OP2Geom, read_op2_geom
 from pyNastran.op2.test.test_op2 import run_op2, main as test_op2
 
@@ -40,6 +44,7 @@ from pyNastran.bdf.bdf_interface.compare_card_content import compare_elements
 #from pyNastran.op2.tables.ogf_gridPointForces.ogf_objects import RealGridPointForcesArray
 from pyNastran.op2.vector_utils import filter1d, abs_max_min_global, abs_max_min_vector
 from pyNastran.op2.tables.oug.oug_displacements import RealDisplacementArray
+from pyNastran.op2.tables.oqg_constraintForces.oqg_spc_forces import RealSPCForcesArray
 from pyNastran.femutils.test.utils import is_array_close
 from pyNastran.op2.result_objects.grid_point_weight import make_grid_point_weight
 from pyNastran.op2.tables.geom.geom4 import _read_spcadd_mpcadd
@@ -182,6 +187,87 @@ class TestOP2Unit(Tester):
 
         ## TODO: fix the thetad in the cid=3 coordinates (nid=33,34)
 
+    def test_cd_displacement_transform_plan(self):
+        """the cached transform plan matches the coordinate-by-coordinate transform"""
+        log = get_logger(level='warning')
+        data_code = {
+            'device_code' : 1,
+            'analysis_code' : 1,
+            'table_code' : 1,
+            'nonlinear_factor' : None,
+            'sort_bits' : [0, 0, 0],
+            'sort_method' : 1,
+            'is_msc' : True,
+            'format_code' : 1,
+            'data_names' : [],
+            'tCode' : 1,
+            'table_name' : 'OUGV1',
+            '_encoding' : 'utf-8',
+        }
+        bdf_model = BDF(log=log)
+        bdf_model.add_cord2r(1, [1., 2., 3.], [0., 1., 1.], [1., 1., 0.])
+        bdf_model.add_cord2c(2, [0., 0., 0.], [0., 0., 1.], [1., 0., 0.])
+        bdf_model.add_cord2c(3, [0., 1., 0.], [1., 0., 0.], [0., 1., 1.])
+        bdf_model.add_grid(1, [0., 0., 0.], cd=0)
+        bdf_model.add_grid(2, [1., 0., 0.], cd=1)
+        bdf_model.add_grid(3, [1., 45., 0.], cp=2, cd=2)
+        bdf_model.add_grid(4, [0., 1., 2.], cd=3)
+        bdf_model.add_grid(5, [2., 3., 1.], cd=1)
+        bdf_model.add_grid(6, [-1., 3., 1.], cd=3)
+        bdf_model.cross_reference()
+
+        out = bdf_model.get_xyz_in_coord_array(cid=0, fdtype='float64', idtype='int32')
+        unused_nid_cp_cd, xyz_cid0, unused_xyz_cp, icd_transform, unused_icp_transform = out
+        transform_plan = get_displacement_transform_plan(bdf_model, xyz_cid0=xyz_cid0)
+        assert get_displacement_transform_plan(bdf_model, xyz_cid0=xyz_cid0) is transform_plan
+
+        dxyz = np.random.default_rng(42).random((3, 6, 6))
+        nid_gridtype = np.array([[nid, 1] for nid in range(1, 7)])
+        op2_model = OP2(log=log)
+        disp = RealDisplacementArray(data_code, True, 1, None)
+        disp.data = dxyz.copy()
+        disp.node_gridtype = nid_gridtype
+        op2_model.displacements[1] = disp
+        op2_model.transform_displacements_to_global(
+            None, bdf_model.coords, transform_plan=transform_plan)
+
+        expected = RealDisplacementArray(data_code, True, 1, None)
+        expected.data = dxyz.copy()
+        transform_displacement_to_global(1, expected, icd_transform, bdf_model.coords,
+                                         xyz_cid0, log)
+        assert np.allclose(disp.data, expected.data)
+        assert np.array_equal(disp.data[:, 0, :], dxyz[:, 0, :])
+
+        # the result doesn't need to have all the nodes
+        spc = RealSPCForcesArray(data_code, True, 1, None)
+        spc.data = dxyz[:, [1, 3, 5], :].copy()
+        spc.node_gridtype = nid_gridtype[[1, 3, 5], :]
+        op2_model.spc_forces[1] = spc
+        op2_model.displacements = {}
+        op2_model.transform_displacements_to_global(
+            None, bdf_model.coords, transform_plan=transform_plan)
+        assert np.allclose(spc.data, expected.data[:, [1, 3, 5], :])
+
+        # moving a node or a coordinate system rebuilds the plan
+        xyz_cid0_moved = xyz_cid0.copy()
+        xyz_cid0_moved[3, :] += 1.
+        transform_plan2 = get_displacement_transform_plan(bdf_model, xyz_cid0=xyz_cid0_moved)
+        assert transform_plan2 is not transform_plan
+        assert not np.allclose(transform_plan2.rotations, transform_plan.rotations)
+        assert get_displacement_transform_plan(bdf_model, xyz_cid0=xyz_cid0_moved) is transform_plan2
+
+        bdf_model.nodes[2].cd = 3
+        bdf_model.nodes[2].cd_ref = bdf_model.coords[3]
+        transform_plan3 = get_displacement_transform_plan(bdf_model, xyz_cid0=xyz_cid0_moved)
+        assert transform_plan3 is not transform_plan2
+
+        coord = bdf_model.coords[1]
+        bdf_model.coords[1] = bdf_model.add_cord2r(1, [1., 2., 3.], [0., 1., 2.], [1., 1., 0.])
+        bdf_model.coords[1].cross_reference(bdf_model)
+        assert not np.allclose(coord.beta(), bdf_model.coords[1].beta())
+        transform_plan4 = get_displacement_transform_plan(bdf_model, xyz_cid0=xyz_cid0_moved)
+        assert transform_plan4 is not transform_plan3
+
     def test_spcadd(self):
         """tests loading SPCADD/MPCADDs"""
         model = BDF()
@@ -2583,6 +2669,250 @@ class TestOP2Main(Tester):
         op2.write_f06(f06_filename)
         os.remove(f06_filename)
 
+    def test_op2_index(self):
+        """tests reading an OP2 with the table/subtable offset index"""
+        log = get_logger(level='warning')
+        op2_filename = MODEL_PATH / 'sol_101_elements' / 'transient_solid_shell_bar.op2'
+        index_filename = get_index_filename(str(op2_filename))
+        if os.path.exists(index_filename):
+            os.remove(index_filename)
+
+        model = read_op2(op2_filename, log=log)
+
+        # build the index and save it
+        model_index = read_op2(op2_filename, log=log, use_index=True)
+        assert os.path.exists(index_filename), index_filename
+        model.assert_op2_equal(model_index)
+
+        # reuse the index
+        op2_index = OP2Index.load(index_filename, str(op2_filename))
+        assert op2_index is not None
+        assert op2_index.ntables > 0, op2_index
+        assert op2_index.nsubtables > 0, op2_index
+        records = op2_index.get_result_records()
+        ioug = (records['table_name'] == b'OUGV1') & (records['table_code'] == 1)
+        assert ioug.sum() == 1, records
+        disp = model.displacements[1]
+        assert records['ntimes'][ioug][0] == disp.ntimes, records
+        assert records['nvalues'][ioug][0] == disp.data.shape[1], records
+        str(op2_index.get_stats())
+
+        model_index2 = read_op2(op2_filename, log=log, use_index=True)
+        model.assert_op2_equal(model_index2)
+        assert model.table_names == model_index2.table_names
+        os.remove(index_filename)
+
+    def test_op2_lazy(self):
+        """tests reading the OP2 results when they're accessed"""
+        log = get_logger(level='warning')
+        op2_filename = MODEL_PATH / 'sol_101_elements' / 'transient_solid_shell_bar.op2'
+        index_filename = get_index_filename(str(op2_filename))
+        if os.path.exists(index_filename):
+            os.remove(index_filename)
+
+        model = read_op2(op2_filename, log=log)
+        model_lazy = read_op2(op2_filename, log=log, lazy=True)
+        assert os.path.exists(index_filename), index_filename
+        nlazy = model_lazy.lazy_loader.nobjects
+        assert nlazy > 0, nlazy
+
+        # the results are listed, but not loaded
+        disp = model_lazy.displacements[1]
+        assert isinstance(disp, LazyResult)
+        assert isinstance(disp, RealDisplacementArray)
+        assert 'lazy' in str(disp), str(disp)
+        stats = model_lazy.get_op2_stats(short=True)
+        assert 'displacements[1] # lazy' in stats, stats
+        assert model_lazy.lazy_loader.nobjects == nlazy
+
+        # only the displacements are loaded
+        assert np.array_equal(disp.data, model.displacements[1].data)
+        assert not isinstance(disp, LazyResult)
+        assert model_lazy.lazy_loader.nobjects == nlazy - 1
+        assert model.displacements[1] == disp
+
+        model_lazy.load_lazy_results()
+        assert model_lazy.lazy_loader is None
+        model.assert_op2_equal(model_lazy)
+
+        # the OP2 can't be read after it's closed
+        model_lazy2 = read_op2(op2_filename, log=log, lazy=True)
+        model_lazy2.close_op2()
+        with self.assertRaises(RuntimeError):
+            model_lazy2.displacements[1].data
+        # the result is still lazy, so it fails the same way the second time
+        assert isinstance(model_lazy2.displacements[1], LazyResult)
+        with self.assertRaises(RuntimeError):
+            model_lazy2.displacements[1].data
+        os.remove(index_filename)
+
+    def test_op2_node_element_time_filter(self):
+        """tests reading a subset of the nodes/elements/times"""
+        log = get_logger(level='warning')
+        op2_filename = MODEL_PATH / 'sol_101_elements' / 'transient_solid_shell_bar.op2'
+        ids = [1, 3, 5, 7]
+        time_range = (0.1, 0.5)
+        model = read_op2(op2_filename, log=log)
+        model_filtered = read_op2(op2_filename, log=log,
+                                  node_ids=ids, element_ids=ids, time_range=time_range)
+
+        disp = model.displacements[1]
+        disp_filtered = model_filtered.displacements[1]
+        itime = (disp._times >= time_range[0]) & (disp._times <= time_range[1])
+        inode = np.isin(disp.node_gridtype[:, 0], ids)
+        assert itime.sum() < len(itime)
+        assert np.array_equal(disp_filtered._times, disp._times[itime])
+        assert np.array_equal(disp_filtered.node_gridtype, disp.node_gridtype[inode, :])
+        assert np.array_equal(disp_filtered.data, disp.data[itime, :][:, inode, :])
+
+        nresults = 0
+        for result_type in ('stress.ctetra_stress', 'stress.cquad4_stress', 'force.cbar_force'):
+            result = model.get_result(result_type)
+            result_filtered = model_filtered.get_result(result_type)
+            for key, obj in result.items():
+                eids = obj.element_node[:, 0] if hasattr(obj, 'element_node') else obj.element
+                ielement = np.isin(eids, ids)
+                if not ielement.any():
+                    assert key not in result_filtered, key
+                    continue
+                obj_filtered = result_filtered[key]
+                eids_filtered = (obj_filtered.element_node[:, 0] if hasattr(obj, 'element_node')
+                                 else obj_filtered.element)
+                itime = (obj._times >= time_range[0]) & (obj._times <= time_range[1])
+                assert np.array_equal(eids_filtered, eids[ielement])
+                assert np.array_equal(obj_filtered.data, obj.data[itime, :][:, ielement, :])
+                nresults += 1
+        assert nresults > 0
+
+        model_none = read_op2(op2_filename, log=log, element_ids=[-1], node_ids=[-1])
+        assert len(model_none.displacements) == 0
+        assert len(model_none.op2_results.stress.ctetra_stress) == 0
+
+        with self.assertRaises(AssertionError):
+            model.set_time_range((1.0, 0.0))
+
+    def test_op2_parallel(self):
+        """tests reading the OP2 result tables with a process pool"""
+        log = get_logger(level='warning')
+        op2_filename = MODEL_PATH / 'sol_101_elements' / 'transient_solid_shell_bar.op2'
+        index_filename = get_index_filename(str(op2_filename))
+
+        model = read_op2(op2_filename, log=log)
+        model_parallel = read_op2(op2_filename, log=log, n_workers=2)
+        assert os.path.exists(index_filename), index_filename
+        assert model_parallel.lazy_loader is None
+        model.assert_op2_equal(model_parallel)
+
+        model_parallel2 = read_op2(op2_filename, log=log, n_workers=2,
+                                   element_ids=[1, 3, 5], time_range=(0.1, 0.5))
+        model_filtered = read_op2(op2_filename, log=log,
+                                  element_ids=[1, 3, 5], time_range=(0.1, 0.5))
+        model_filtered.assert_op2_equal(model_parallel2)
+
+        with self.assertRaises(RuntimeError):
+            read_op2(op2_filename, log=log, n_workers=2, lazy=True)
+        os.remove(index_filename)
+
+    @unittest.skipIf(not IS_H5PY, "No h5py")
+    def test_op2_hdf5_chunked_partial_load(self):
+        """tests the chunked/compressed HDF5 and loading a subset of it"""
+        import h5py
+        from pyNastran.op2.op2_interface.hdf5_interface import load_op2_from_hdf5_filename
+        log = get_logger(level='warning')
+        op2_filename = MODEL_PATH / 'sol_101_elements' / 'transient_solid_shell_bar.op2'
+        hdf5_filename = str(op2_filename)[:-4] + '.test_op2_hdf5_chunked.h5'
+        model = read_op2(op2_filename, log=log)
+        model.export_hdf5_filename(hdf5_filename, compression='lzf')
+        with h5py.File(hdf5_filename, 'r') as h5_file:
+            h5_data = h5_file['Subcase=1']['stress.cquad4_stress']['data']
+            assert h5_data.compression == 'lzf'
+            assert h5_data.chunks == (1, h5_data.shape[1], h5_data.shape[2]), h5_data.chunks
+
+        ids = [1, 3, 6, 7]
+        time_range = (0.1, 0.5)
+        model_full = load_op2_from_hdf5_filename(hdf5_filename, log=log)
+        model_filtered = load_op2_from_hdf5_filename(
+            hdf5_filename, log=log, include_results=['displacements', 'stress'],
+            node_ids=ids, element_ids=ids, time_range=time_range)
+        assert len(model_filtered.op2_results.force.cquad4_force) == 0
+        assert len(model_filtered.spc_forces) == 0
+
+        for result_type in ('displacements', 'stress.cquad4_stress', 'stress.cpenta_stress'):
+            obj = model.get_result(result_type)[1]
+            obj_full = model_full.get_result(result_type)[1]
+            obj_filtered = model_filtered.get_result(result_type)[1]
+            assert np.array_equal(obj_full.data, obj.data)
+
+            ids_array = obj.node_gridtype if hasattr(obj, 'node_gridtype') else obj.element_node
+            irow = np.isin(ids_array[:, 0], ids)
+            itime = (obj._times >= time_range[0]) & (obj._times <= time_range[1])
+            assert 0 < irow.sum() < len(irow), result_type
+            assert itime.sum() < len(itime)
+            assert np.allclose(obj_filtered._times, obj._times[itime])
+            assert obj_filtered.ntimes == itime.sum()
+            assert obj_filtered.ntotal == irow.sum()
+            assert np.array_equal(obj_filtered.data, obj.data[itime, :][:, irow, :])
+
+        # the data is read when it's accessed
+        model_lazy = load_op2_from_hdf5_filename(hdf5_filename, log=log, node_ids=ids, lazy=True)
+        nlazy = model_lazy.lazy_loader.nobjects
+        disp = model_lazy.displacements[1]
+        assert isinstance(disp, LazyResult)
+        assert 'lazy' in str(disp), str(disp)
+        inode = np.isin(model.displacements[1].node_gridtype[:, 0], ids)
+        assert np.array_equal(disp.data, model.displacements[1].data[:, inode, :])
+        assert not isinstance(disp, LazyResult)
+        assert model_lazy.lazy_loader.nobjects == nlazy - 1
+        model_lazy.load_lazy_results()
+        assert model_lazy.lazy_loader is None
+        cquad4_stress = model_lazy.op2_results.stress.cquad4_stress[1]
+        assert np.array_equal(cquad4_stress.data, model.op2_results.stress.cquad4_stress[1].data)
+
+        # the HDF5 can't be read after it's closed, but the result stays lazy
+        model_lazy2 = load_op2_from_hdf5_filename(hdf5_filename, log=log, lazy=True)
+        model_lazy2.lazy_loader.close()
+        for unused_i in range(2):
+            with self.assertRaises(RuntimeError):
+                model_lazy2.displacements[1].data
+            assert isinstance(model_lazy2.displacements[1], LazyResult)
+        os.remove(hdf5_filename)
+
+    def test_op2_vectorized_sort2_complex_random(self):
+        """tests the vectorized SORT2/complex/random readers against the unvectorized ones"""
+        log = get_logger(level='warning')
+        op2_filenames = [
+            MODEL_PATH / 'other' / 'ofprand1.op2',  # SORT2 random
+            MODEL_PATH / 'other' / 'sdbush01.op2',  # SORT2 CBUSH
+            MODEL_PATH / 'random' / 'rms_tri_oesrmx1.op2',  # random von Mises
+            MODEL_PATH / 'elements' / 'freq_elements2.op2',  # complex von Mises
+            MODEL_PATH / 'elements' / 'modes_complex_elements.op2',
+            MODEL_PATH / 'other' / 'tr1091x.op2',  # SORT2 CHEXA/CPENTA
+            MODEL_PATH / 'other' / 'cqrcc128a.op2',  # SORT2 CTETRA/CHEXA/CPENTA
+        ]
+        for op2_filename in op2_filenames:
+            model = read_op2(op2_filename, log=log)
+            model_loop = OP2(log=log)
+            model_loop.use_vector = False
+            model_loop.read_op2(op2_filename)
+            model.assert_op2_equal(model_loop, stop_on_failure=True)
+
+    def test_op2_vectorized_sort2_solid(self):
+        """the SORT2 solid stress matches the SORT1 solid stress"""
+        log = get_logger(level='warning')
+        op2_filename = MODEL_PATH / 'other' / 'tr1091x.op2'
+        for use_vector in [True, False]:
+            model = OP2(log=log)
+            model.use_vector = use_vector
+            model.read_op2(op2_filename)
+            stress = model.op2_results.stress
+            for result in [stress.chexa_stress, stress.cpenta_stress]:
+                sort1, sort2 = [result[key] for key in sorted(result, key=lambda key: key[2])]
+                assert sort2.is_sort1, sort2
+                assert np.array_equal(sort1._times, sort2._times)
+                assert np.array_equal(sort1.element_node, sort2.element_node)
+                assert np.array_equal(sort1.element_cid, sort2.element_cid)
+                assert np.array_equal(sort1.data, sort2.data)
+
     def test_op2_solid_bending_01(self):
         log = get_logger(level='warning')
         folder = os.path.join(MODEL_PATH, 'solid_bending')
@@ -0,0 +1,406 @@
+"""
+Defines:
+ - write_op2_subset(op2_filename, op2_filename_out,
+                    table_names=None, subcases=None, eids=None)
+
+Streams a subset of an OP2 (some tables/subcases/elements) to a new OP2
+without loading the model.  The OP2 is walked at the Fortran record level:
+ - records that are kept whole are copied as bytes in chunks
+ - the table 3 (header) records are read to get the subcase/codes
+ - table 4 (data) records that are filtered by element id are read,
+   filtered and rewritten
+
+so the memory use is bounded by the largest filtered data record instead
+of the size of the results.
+
+"""
+from __future__ import annotations
+from struct import Struct
+from typing import Optional, BinaryIO
+
+import numpy as np
+from cpylog import get_logger2
+
+from pyNastran.op2.errors import FortranMarkerError
+from pyNastran.op2.op2_interface.msc_tables import MSC_RESULT_TABLES
+from pyNastran.op2.op2_interface.nx_tables import NX_RESULT_TABLES
+from pyNastran.utils import PathLike
+
+RESULT_TABLES = {table_name.decode('latin1') for table_name in
+                 MSC_RESULT_TABLES + NX_RESULT_TABLES}
+
+#: table codes of the element results that are filtered by eids
+#:  - 4 : OEF (force)
+#:  - 5 : OES/OSTR (stress/strain)
+ELEMENT_TABLE_CODES = {4, 5}
+
+#: sort codes of the SORT2 tables; the element id is word 5 of the
+#: table 3 record and the rows start with the time/frequency
+#:  - 2/3 : SORT2 real/complex
+#:  - 5 : random (e.g., OEFPSD2, OESATO2, OESCRM2)
+#:  - 6/7 : random SORT2
+SORT2_CODES = {2, 3, 5, 6, 7}
+
+
+def write_op2_subset(op2_filename: PathLike, op2_filename_out: PathLike,
+                     table_names: Optional[list[str]]=None,
+                     subcases: Optional[list[int]]=None,
+                     eids: Optional[list[int]]=None,
+                     chunk_size: int=2**20,
+                     log=None, debug: bool=False) -> list[str]:
+    """
+    Writes a subset of an OP2 without loading it
+
+    Parameters
+    ----------
+    op2_filename : PathLike
+        the OP2 to read
+    op2_filename_out : PathLike
+        the OP2 to write
+    table_names : list[str]; default=None -> all
+        the tables to keep (e.g., ['GEOM1', 'OUGV1', 'OES1X1'])
+    subcases : list[int]; default=None -> all
+        the subcases of the result tables to keep
+    eids : list[int]; default=None -> all
+        the elements to keep in the force/stress/strain tables; the rows
+        of the SORT1 tables are filtered and the records of the SORT2
+        tables (one element per record) are kept/dropped
+    chunk_size : int; default=1 MB
+        the number of bytes to copy at a time
+    log : logger; default=None
+        a logger
+    debug : bool; default=False
+        debug the subset writer
+
+    Returns
+    -------
+    table_names_out : list[str]
+        the tables that were written
+
+    Only single precision (size=4) OP2s are supported.
+
+    """
+    log = get_logger2(log, debug)
+    table_names_set = None if table_names is None else set(table_names)
+    subcases_set = None if subcases is None else set(subcases)
+    eids_array = None if eids is None else np.unique(np.asarray(eids, dtype='int32'))
+
+    table_names_out = []
+    with open(op2_filename, 'rb') as op2_file, open(op2_filename_out, 'wb') as op2_file_out:
+        endian = _get_endian(op2_file)
+        struct_i = Struct(endian + b'i')
+
+        # the header (PARAM,POST,-1) is copied as-is
+        nheader = _get_header_length(op2_file, struct_i)
+        _copy_bytes(op2_file, op2_file_out, 0, nheader, chunk_size)
+
+        op2_file.seek(nheader)
+        while True:
+            table = _scan_table(op2_file, struct_i)
+            if table is None:
+                break
+            table_name, table_start, table_end, items = table
+            if table_names_set is not None and table_name not in table_names_set:
+                log.debug(f'skipping table={table_name}')
+                continue
+
+            is_filtered = (subcases_set is not None or eids_array is not None)
+            if table_name in RESULT_TABLES and is_filtered:
+                is_written = _write_result_table_subset(
+                    op2_file, op2_file_out, table_name, table_start, table_end, items,
+                    struct_i, subcases_set, eids_array, endian, chunk_size, log)
+            else:
+                _copy_bytes(op2_file, op2_file_out, table_start, table_end, chunk_size)
+                is_written = True
+
+            if is_written:
+                table_names_out.append(table_name)
+            op2_file.seek(table_end)
+
+        # the closing [4, 0, 4] marker
+        op2_file_out.write(struct_i.pack(4) + struct_i.pack(0) + struct_i.pack(4))
+    return table_names_out
+
+
+def _write_result_table_subset(op2_file: BinaryIO, op2_file_out: BinaryIO,
+                               table_name: str, table_start: int, table_end: int,
+                               items: list[tuple[int, int, int, int, int]],
+                               struct_i: Struct,
+                               subcases: Optional[set[int]],
+                               eids: Optional[np.ndarray],
+                               endian: bytes, chunk_size: int, log) -> bool:
+    """
+    Writes the subcases/elements of a result table that are kept.
+
+    The subtables are renumbered (-3, -4, ...), so the table is still
+    contiguous when subcases are removed.
+
+    """
+    # the table ends with an empty [itable, 1, 0] subtable
+    subtables = [item for item in items if item[0] <= -3 and item[4] > 0]
+
+    # the subtables alternate between the table 3 (header) and table 4 (data)
+    # records: [-3, 1, 0] is a header, [-4, 1, 0] is data, ...
+    # Tables without a subcase header (e.g., CSTM, GPLS) are copied.
+    is_header_table = len(subtables) > 0 and all(
+        nbytes == 584 for itable, unused_marker_start, unused_record_start,
+        unused_record_end, nbytes in subtables if itable % 2 == 1)
+    if not is_header_table:
+        log.debug(f'copying table={table_name}; no subcase header')
+        _copy_bytes(op2_file, op2_file_out, table_start, table_end, chunk_size)
+        return True
+    # the table name and the -1/-2 records
+    header_end = subtables[0][1]
+
+    table_code = 0
+    num_wide = 0
+    is_sort2 = False
+    eid_sort2 = 0
+    header = None
+    records_out = []
+    for itable, unused_marker_start, record_start, record_end, unused_nbytes in subtables:
+        if itable % 2 == 1:
+            # table 3
+            data = _read_record(op2_file, struct_i, record_start, record_end)
+            (unused_approach_code, tcode, unused_element_type, isubcase,
+             eid_device, unused_5, unused_6, unused_7, unused_8, num_wide) = Struct(
+                 endian + b'10i').unpack(data[:40])
+            table_code = tcode % 1000
+            is_sort2 = tcode // 1000 in SORT2_CODES
+            eid_sort2 = eid_device // 10
+            is_kept = subcases is None or isubcase in subcases
+            header = (record_start, record_end, None) if is_kept else None
+            continue
+
+        # table 4; the header is only written with its data
+        if header is None:
+            continue
+        if eids is None or table_code not in ELEMENT_TABLE_CODES:
+            records_out.extend([header, (record_start, record_end, None)])
+            header = None
+            continue
+        if is_sort2:
+            # a SORT2 record has a single element
+            if eid_sort2 in eids:
+                records_out.extend([header, (record_start, record_end, None)])
+            header = None
+            continue
+
+        data = _read_record(op2_file, struct_i, record_start, record_end)
+        data_out = _filter_eids(data, num_wide, eids, endian)
+        if data_out is None:
+            log.warning(f'cannot filter table_name={table_name} '
+                        f'table_code={table_code} num_wide={num_wide}')
+            records_out.extend([header, (record_start, record_end, None)])
+        elif len(data_out):
+            records_out.extend([header, (record_start, record_end, data_out)])
+        header = None
+
+    if len(records_out) == 0:
+        log.debug(f'skipping table={table_name}; no subcases/elements')
+        return False
+
+    _copy_bytes(op2_file, op2_file_out, table_start, header_end, chunk_size)
+    itable = -3
+    for record_start, record_end, data_out in records_out:
+        _write_markers(op2_file_out, struct_i, [itable, 1, 0])
+        if data_out is None:
+            _copy_bytes(op2_file, op2_file_out, record_start, record_end, chunk_size)
+        else:
+            nbytes = len(data_out)
+            _write_markers(op2_file_out, struct_i, [nbytes // 4])
+            op2_file_out.write(struct_i.pack(nbytes))
+            op2_file_out.write(data_out)
+            op2_file_out.write(struct_i.pack(nbytes))
+        itable -= 1
+    _write_markers(op2_file_out, struct_i, [itable, 1, 0, 0])
+    return True
+
+
+def _filter_eids(data: bytes, num_wide: int, eids: np.ndarray,
+                 endian: bytes) -> Optional[bytes]:
+    """
+    Filters the rows of a SORT1 element table 4 record (eid_device is the
+    first word of every row).  Returns None if the record isn't a multiple
+    of num_wide.
+    """
+    ndata = len(data)
+    if num_wide <= 0 or ndata % (num_wide * 4) != 0:
+        return None
+    ints = np.frombuffer(data, dtype=endian + b'i4').reshape(ndata // (num_wide * 4), num_wide)
+    eids_data = ints[:, 0] // 10
+    irows = np.isin(eids_data, eids)
+    return ints[irows, :].tobytes()
+
+
+def _get_endian(op2_file: BinaryIO) -> bytes:
+    """the first block is a [4, 3, 4] or [4, 2, 4] marker"""
+    data = op2_file.read(4)
+    op2_file.seek(0)
+    if len(data) < 4:
+        raise FortranMarkerError('the OP2 is empty')
+    for endian in (b'<', b'>'):
+        nbytes, = Struct(endian + b'i').unpack(data)
+        if nbytes == 4:
+            return endian
+        if nbytes == 8:
+            raise NotImplementedError('64-bit OP2s are not supported')
+    raise FortranMarkerError(f'invalid OP2 marker; data={data!r}')
+
+
+def _get_header_length(op2_file: BinaryIO, struct_i: Struct) -> int:
+    """
+    Gets the length of the header:
+     - PARAM,POST,-1: [3], date, [7], tape code, [2], version, [-1, 0]
+     - PARAM,POST,-2: there is no header
+    """
+    op2_file.seek(0)
+    if _read_marker(op2_file, struct_i) != 3:
+        return 0
+    ints_previous = None
+    while True:
+        nbytes = _read_block_length(op2_file, struct_i)
+        data = op2_file.read(nbytes)
+        op2_file.read(4)
+        if nbytes == 4:
+            value, = struct_i.unpack(data)
+            if value == 0 and ints_previous == -1:
+                return op2_file.tell()
+            ints_previous = value
+        else:
+            ints_previous = None
+
+
+def _scan_table(op2_file: BinaryIO, struct_i: Struct) -> Optional[
+        tuple[str, int, int, list[tuple[int, int, int, int, int]]]]:
+    """
+    Walks a table that has the standard layout (geometry/result/matrix tables):
+        [2], name, [-1], record, [-2, 1, 0], record, [-3, 1, 0], record, ..., [0]
+
+    Returns
+    -------
+    table : tuple or None (end of the OP2)
+        table_name : str
+            the table name
+        table_start / table_end : int
+            the byte range of the table
+        items : list[(itable, marker_start, record_start, record_end, nbytes)]
+            the byte range of the subtables
+
+    """
+    table_start = op2_file.tell()
+    value = _peek_marker(op2_file, struct_i)
+    if value is None or value == 0:
+        return None
+
+    record_start = op2_file.tell()
+    record_end, unused_nbytes = _skip_record(op2_file, struct_i)
+    table_name = _read_record(op2_file, struct_i, record_start, record_end)
+    # MSC 2014+ has a long name record (e.g., 'OEF1X   20141   0   ...')
+    table_name = table_name[:8].decode('latin1').strip()
+
+    items = []
+    while True:
+        marker_start = op2_file.tell()
+        itable = _read_marker(op2_file, struct_i)
+        if itable is None:
+            raise FortranMarkerError(f'table_name={table_name} is not closed')
+        if itable == 0:
+            break
+        if itable > 0:
+            raise FortranMarkerError(
+                f'expected a negative subtable marker; table_name={table_name} itable={itable}')
+        if itable <= -2:
+            # [itable, 1, 0] or [itable, 1, 1] for matrices
+            one = _read_marker(op2_file, struct_i)
+            flag = _read_marker(op2_file, struct_i)
+            if one != 1 or flag not in {0, 1}:
+                raise FortranMarkerError(
+                    f'expected [{itable}, 1, 0]; found [{itable}, {one}, {flag}]; '
+                    f'table_name={table_name}')
+
+        record_start = op2_file.tell()
+        value = _peek_marker(op2_file, struct_i)
+        nbytes = 0
+        if value is not None and value > 0:
+            unused_record_end, nbytes = _skip_record(op2_file, struct_i)
+        record_end = op2_file.tell()
+        items.append((itable, marker_start, record_start, record_end, nbytes))
+    table_end = op2_file.tell()
+    return table_name, table_start, table_end, items
+
+
+def _skip_record(op2_file: BinaryIO, struct_i: Struct) -> tuple[int, int]:
+    """
+    Skips a record:
+        [nwords], [nbytes, data, nbytes], ([nwords], [nbytes, data, nbytes])...
+
+    Returns the end of the record and the number of bytes in the data.
+    """
+    nbytes_total = 0
+    while True:
+        _read_marker(op2_file, struct_i)
+        nbytes = _read_block_length(op2_file, struct_i)
+        op2_file.seek(nbytes + 4, 1)
+        nbytes_total += nbytes
+
+        value = _peek_marker(op2_file, struct_i)
+        if value is None or value <= 0:
+            break
+    return op2_file.tell(), nbytes_total
+
+
+def _read_record(op2_file: BinaryIO, struct_i: Struct,
+                 record_start: int, record_end: int) -> bytes:
+    """reads the data in a record (and its continuation blocks)"""
+    op2_file.seek(record_start)
+    blocks = []
+    while op2_file.tell() < record_end:
+        _read_marker(op2_file, struct_i)
+        nbytes = _read_block_length(op2_file, struct_i)
+        blocks.append(op2_file.read(nbytes))
+        op2_file.seek(4, 1)
+    return b''.join(blocks)
+
+
+def _read_block_length(op2_file: BinaryIO, struct_i: Struct) -> int:
+    data = op2_file.read(4)
+    if len(data) < 4:
+        raise FortranMarkerError('unexpected end of the OP2')
+    return struct_i.unpack(data)[0]
+
+
+def _read_marker(op2_file: BinaryIO, struct_i: Struct) -> Optional[int]:
+    """reads a [4, value, 4] marker; returns None at the end of the file"""
+    data = op2_file.read(12)
+    if len(data) < 12:
+        return None
+    nbytes, value, nbytes2 = Struct(struct_i.format + 'ii').unpack(data)
+    if nbytes != 4 or nbytes2 != 4:
+        raise FortranMarkerError(f'expected a [4, value, 4] marker; found {[nbytes, value, nbytes2]}')
+    return value
+
+
+def _peek_marker(op2_file: BinaryIO, struct_i: Struct) -> Optional[int]:
+    n = op2_file.tell()
+    value = _read_marker(op2_file, struct_i)
+    op2_file.seek(n)
+    return value
+
+
+def _write_markers(op2_file_out: BinaryIO, struct_i: Struct, markers: list[int]) -> None:
+    for marker in markers:
+        op2_file_out.write(struct_i.pack(4) + struct_i.pack(marker) + struct_i.pack(4))
+
+
+def _copy_bytes(op2_file: BinaryIO, op2_file_out: BinaryIO,
+                start: int, end: int, chunk_size: int) -> None:
+    """copies a byte range of the OP2 in chunks"""
+    op2_file.seek(start)
+    nleft = end - start
+    while nleft > 0:
+        data = op2_file.read(min(chunk_size, nleft))
+        if not data:
+            raise FortranMarkerError('unexpected end of the OP2')
+        op2_file_out.write(data)
+        nleft -= len(data)
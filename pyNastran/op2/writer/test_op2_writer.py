@@ -10,6 +10,7 @@ from pyNastran.op2.op2_geom import read_op2_geom
 from pyNastran.op2.op2 import OP2
 #from pyNastran.op2.test.test_op2 import run_op2
 #from pyNastran.op2.writer.op2_writer import OP2Writer
+from pyNastran.op2.writer.op2_subset import write_op2_subset
 
 PKG_PATH = pyNastran.__path__[0]
 MODEL_PATH = os.path.abspath(os.path.join(PKG_PATH, '..', 'models'))
@@ -367,6 +368,143 @@ class TestOP2Writer(unittest.TestCase):
                              stop_on_failure=True, debug=False)
         os.remove(op2_filename_debug_out)
 
+    def test_write_subset_1(self):
+        """tests streaming a subset of the subcases/tables of an op2"""
+        log = SimpleLogger(level='warning', encoding='utf-8')
+        folder = os.path.join(MODEL_PATH, 'other')
+        op2_filename = os.path.join(folder, 'api3.op2')
+        op2_filename_out = os.path.join(folder, 'api3_subset.op2')
+
+        # no filtering is a byte-for-byte copy
+        write_op2_subset(op2_filename, op2_filename_out, log=log)
+        with open(op2_filename, 'rb') as op2_file, open(op2_filename_out, 'rb') as op2_file_out:
+            assert op2_file.read() == op2_file_out.read()
+
+        table_names = write_op2_subset(
+            op2_filename, op2_filename_out, subcases=[2],
+            table_names=['GEOM1', 'OUGV1', 'OES1X'], log=log)
+        assert table_names == ['GEOM1', 'OUGV1', 'OES1X'], table_names
+
+        op2 = read_op2_geom(op2_filename, log=log)
+        op2b = read_op2_geom(op2_filename_out, log=log)
+        assert list(op2b.displacements) == [2], list(op2b.displacements)
+        assert len(op2b.spc_forces) == 0
+        assert op2b.nodes.keys() == op2.nodes.keys()
+        assert len(op2b.elements) == 0
+        assert op2.displacements[2] == op2b.displacements[2]
+        os.remove(op2_filename_out)
+
+    def test_write_subset_2(self):
+        """tests streaming a subset of the elements of an op2"""
+        log = SimpleLogger(level='warning', encoding='utf-8')
+        folder = os.path.join(MODEL_PATH, 'sol_101_elements')
+        op2_filename = os.path.join(folder, 'static_solid_shell_bar.op2')
+        op2_filename_out = os.path.join(folder, 'static_solid_shell_bar_subset.op2')
+
+        eids = [1, 2, 3, 7, 8, 9]
+        table_names = write_op2_subset(op2_filename, op2_filename_out, eids=eids, log=log)
+        assert 'OES1C' not in table_names, table_names  # composites are 16-21
+
+        op2 = read_op2_geom(op2_filename, log=log)
+        op2b = read_op2_geom(op2_filename_out, log=log)
+        assert op2b.displacements[1] == op2.displacements[1]
+        stress = op2.op2_results.stress
+        stressb = op2b.op2_results.stress
+        assert stressb.chexa_stress[1] == stress.chexa_stress[1]
+        assert stressb.cpenta_stress[1] == stress.cpenta_stress[1]
+        assert len(stressb.ctetra_stress) == 0
+        assert len(stressb.cquad4_composite_stress) == 0
+
+        # CQUAD4 6/7 -> 7; CTRIA3 8-11 -> 8/9
+        cquad4b = stressb.cquad4_stress[1]
+        ctria3b = stressb.ctria3_stress[1]
+        assert set(cquad4b.element_node[:, 0]) == {7}, cquad4b.element_node
+        assert set(ctria3b.element_node[:, 0]) == {8, 9}, ctria3b.element_node
+        cquad4 = stress.cquad4_stress[1]
+        irows = cquad4.element_node[:, 0] == 7
+        assert (cquad4.data[:, irows, :] == cquad4b.data).all()
+        os.remove(op2_filename_out)
+
+    def test_write_subset_3(self):
+        """tests a subcase subset with 584 byte data records (OESNLXR)"""
+        log = SimpleLogger(level='warning', encoding='utf-8')
+        folder = os.path.join(MODEL_PATH, 'elements')
+        op2_filename = os.path.join(folder, 'loadstep_elements.op2')
+        op2_filename_out = os.path.join(folder, 'loadstep_elements_subset.op2')
+
+        write_op2_subset(op2_filename, op2_filename_out, subcases=[1], log=log)
+        op2 = OP2(log=log)
+        op2.read_op2(op2_filename)
+        op2b = OP2(log=log)
+        op2b.read_op2(op2_filename_out)
+        assert list(op2b.nonlinear_chexa_stress_strain) == [1], list(op2b.nonlinear_chexa_stress_strain)
+        assert op2b.nonlinear_chexa_stress_strain[1] == op2.nonlinear_chexa_stress_strain[1]
+        assert list(op2b.displacements) == [1], list(op2b.displacements)
+        os.remove(op2_filename_out)
+
+    def test_write_subset_4(self):
+        """tests tables without a subcase header (CSTM) are kept"""
+        log = SimpleLogger(level='warning', encoding='utf-8')
+        folder = os.path.join(MODEL_PATH, 'aero')
+        op2_filename = os.path.join(folder, 'cpmopt.op2')
+        op2_filename_out = os.path.join(folder, 'cpmopt_subset.op2')
+
+        table_names = write_op2_subset(op2_filename, op2_filename_out, subcases=[1], log=log)
+        assert 'CSTM' in table_names, table_names
+        assert 'GPL' in table_names, table_names
+        os.remove(op2_filename_out)
+
+    def test_write_subset_5(self):
+        """tests the long MSC 2014+ table names"""
+        log = SimpleLogger(level='warning', encoding='utf-8')
+        folder = os.path.join(MODEL_PATH, 'msc')
+        op2_filename = os.path.join(folder, 'cantilever_2014.1.op2')
+        op2_filename_out = os.path.join(folder, 'cantilever_2014.1_subset.op2')
+
+        table_names = write_op2_subset(
+            op2_filename, op2_filename_out, table_names=['OUG1', 'OEF1X'], eids=[1], log=log)
+        assert table_names == ['OUG1', 'OEF1X'], table_names
+
+        op2 = OP2(log=log)
+        op2.read_op2(op2_filename)
+        op2b = OP2(log=log)
+        op2b.read_op2(op2_filename_out)
+        assert op2b.displacements[1] == op2.displacements[1]
+        assert len(op2b.spc_forces) == 0
+        cbeam_force = op2b.op2_results.force.cbeam_force[1]
+        assert list(cbeam_force.element) == [1, 1], cbeam_force.element
+        os.remove(op2_filename_out)
+
+    def test_write_subset_6(self):
+        """tests the random (SORT2) tables are filtered by the element id of the header"""
+        log = SimpleLogger(level='warning', encoding='utf-8')
+        folder = os.path.join(MODEL_PATH, 'other')
+        op2_filename = os.path.join(folder, 'sdbush01.op2')
+        op2_filename_out = os.path.join(folder, 'sdbush01_subset.op2')
+
+        op2 = OP2(log=log)
+        op2.read_op2(op2_filename)
+        write_op2_subset(op2_filename, op2_filename_out, eids=[123], log=log)
+        op2b = OP2(log=log)
+        op2b.read_op2(op2_filename_out)
+        for res_name in ['psd', 'ato', 'crm']:
+            results = getattr(op2.op2_results, res_name)
+            resultsb = getattr(op2b.op2_results, res_name)
+            for name in ['cbush_force', 'cbush_stress']:
+                resultb = getattr(resultsb, name)
+                result = getattr(results, name)
+                assert len(resultb) == 1, (res_name, name)
+                for key, res in result.items():
+                    assert resultb[key] == res, (res_name, name)
+
+        write_op2_subset(op2_filename, op2_filename_out, eids=[1], log=log)
+        op2c = OP2(log=log)
+        op2c.read_op2(op2_filename_out)
+        assert len(op2c.op2_results.psd.cbush_force) == 0
+        assert len(op2c.op2_results.psd.cbush_stress) == 0
+        assert op2c.displacements[1] == op2.displacements[1]
+        os.remove(op2_filename_out)
+
     #def test_thermal_3(self):
         #"""tests basic op2 thermal writing"""
         #folder = os.path.join(MODEL_PATH, 'other')
@@ -7,11 +7,10 @@ from typing import TextIO, BinaryIO, Optional, Union, cast
 
 import numpy as np
 from numpy import float32, float64, complex64, complex128
-from scipy.sparse import coo_matrix  # type: ignore
+from scipy.sparse import coo_matrix, issparse  # type: ignore
 from cpylog import get_logger2, SimpleLogger
 
 from pyNastran.utils import is_binary_file as file_is_binary, PathLike, PurePath
-from pyNastran.utils.mathematics import print_matrix #, print_annotated_matrix
 from pyNastran.op2.result_objects.matrix import Matrix
 
 
@@ -33,7 +32,8 @@ class OP4:
 
     def read_op4(self, op4_filename: Optional[PathLike]=None,
                  matrix_names: Optional[list[str]]=None,
-                 precision: str='default') -> dict[str, Matrix]:
+                 precision: str='default',
+                 columns: Optional[tuple[int, int]]=None) -> dict[str, Matrix]:
         """See ``read_op4``"""
         if precision not in {'default', 'single', 'double'}:
             msg = "precision=%r and must be 'single', 'double', or 'default'" % precision
@@ -57,10 +57,12 @@ class OP4:
 
         if file_is_binary(op4_filename):
             matrices = self.read_op4_binary(
-                op4_filename, matrix_names, precision)
+                op4_filename, matrix_names, precision, columns=columns)
         else:
             matrices = self.read_op4_ascii(
                 op4_filename, matrix_names, precision)
+            if columns is not None:
+                _slice_columns(matrices, columns)
         return matrices
 
 #--------------------------------------------------------------------------
@@ -542,30 +544,6 @@ class OP4:
             self.log.info('  IS=%s L=%s irow=%s' % (IS, L, irow))
         return irow, iline
 
-    def _get_irow_small_binary(self, op4: BinaryIO, data_bytes: bytes) -> tuple[int, int]:
-        """
-        Returns
-        -------
-        irow : int
-           the row id
-        L : int
-            the row length
-
-        """
-        if len(data_bytes) == 0:
-            data_bytes = op4.read(4)
-            self.n += 4
-
-        IS, = unpack(self._endian + 'i', data_bytes)
-        L = IS // 65536 - 1
-        irow = IS - 65536 * (L + 1)
-        if self.debug:
-            self.log.info('small_mat-next row')
-            self.log.info("  IS=%s L=%s irow=%s" % (IS, L, irow))
-            assert IS > 0, IS
-            assert L > 0, L
-        return irow, L
-
     def _get_irow_big_ascii(self, op4: TextIO, iline: int,
                             line: str,
                             sline: list[str], irow: int) -> tuple[int, int]:
@@ -582,339 +560,124 @@ class OP4:
             self.log.debug("idummy=%s irow=%s" % (idummy, irow))
         return irow, iline
 
-    def _get_irow_big_binary(self, op4: BinaryIO, data_bytes: bytes) -> tuple[int, int]:
-        """
-        Returns
-        -------
-        irow : int
-           the row id
-        L : int
-            ???
-
-        """
-        if len(data_bytes) == 0:
-            data_bytes = op4.read(8)
-            self.n += 8
-        idummy, irow = unpack(self._endian + '2i', data_bytes)
-        if self.debug:
-            self.log.debug("idummy=%s irow=%s" % (idummy, irow))
-            assert irow < 100, irow
-        return irow, idummy - 1
-
 #--------------------------------------------------------------------------
     def read_op4_binary(self, op4_filename: PathLike,
                         matrix_names: Optional[list[str]]=None,
                         precision: str='default',
-                       use_matrix_class=False):
-        """matrix_names must be a list or None, but basically the same"""
-        self.n = 0
-        matrices: dict[str, Matrix] = {}
-        name = 'dummyName'
+                        columns: Optional[tuple[int, int]]=None) -> dict[str, Matrix]:
+        """
+        Reads a binary OP4 with a memory map
 
+        The column records of each matrix are indexed in one pass;
+        the records of the matrices (and columns) that aren't requested
+        are skipped over without being read.
+        """
+        matrices: dict[str, Matrix] = {}
         with open(op4_filename, mode='rb') as op4:
             self._endian = self._determine_endian(op4)
-            while name is not None:
-                # checks for the end of the file
-                assert self.n == op4.tell(), 'n=%s tell=%s' % (self.n, op4.tell())
-                n = self.n
-                data1 = op4.read(1)
-                op4.seek(n)
-                if len(data1) == 0:
-                    break
-                #self.show(f, 60)
 
-                (name, amat) = self._read_matrix_binary(op4, precision, matrix_names)
-                #print(print_matrix(amat.matrix))
-                if is_saved_matrix(name, matrix_names):
-                    _save_matrix(matrices, name, amat)
-
-                #print("not op4.closed = ",not op4.closed,form,name)
-                # if not op4.closed or form is not None:
-                #     data_bytes = op4.read(4)
-                #     self.n += 4
-                #     if len(data_bytes) == 0:
-                #         break
-                #     (record_length,) = unpack(self._endian + 'i', data_bytes)
-                ##     print("record_length = %s" % record_length)
-                #     if record_length == 24:
-                #         self.n -= 4
-                #         op4.seek(self.n)
-                #     else:
-                #         data_bytes = op4.read(4)
-                #         if len(data_bytes) == 0:
-                #             break
-                #         (record_length2,) = unpack(self._endian + 'i', data_bytes)
-                #         assert record_length2 == 24
-                #         op4.seek(self.n)
-                #
+        data = np.memmap(op4_filename, dtype='uint8', mode='r')
+        nwords = len(data) // 4
+        words = data[:nwords * 4].view(self._endian + 'i4')
+        iword = 0
+        while iword < nwords:
+            name, amat, iword = self._read_matrix_binary(
+                data, words, iword, precision, matrix_names, columns)
+            if amat is not None:
+                _save_matrix(matrices, name, amat)
         return matrices
 
-    def read_start_marker(self, op4: BinaryIO) -> tuple[int, int, int, int]:
-        if self.debug:
-            self.log.info('--------------------------------------')
-        #self.show(op4, 60)
-        data_bytes: bytes = op4.read(4)
-        self.n += 4
-        record_length, = unpack(self._endian + 'i', data_bytes)
-        #print('record_length =', record_length)
-
-        record_length = 16
-        data_bytes = op4.read(record_length)
-        self.n += record_length
-        assert self.n == op4.tell(), 'n=%s tell=%s' % (self.n, op4.tell())
-
-        if record_length == 16:
-            a, icol, irow, nwords = unpack(self._endian + '4i', data_bytes)
-            if self.debug:
-                self.log.info("a=%s icol=%s irow=%s nwords=%s" % (a, icol, irow, nwords))
-        else:
-            raise NotImplementedError('record_length=%s' % record_length)
-        return a, icol, irow, nwords
+    def _read_matrix_binary(self, data: np.memmap, words: np.ndarray, iword: int,
+                            precision: str,
+                            matrix_names: Optional[list[str]],
+                            columns: Optional[tuple[int, int]]) -> tuple[str, Optional[Matrix], int]:
+        """
+        Reads a binary matrix
 
-    def _read_matrix_binary(self, op4: BinaryIO, precision: str,
-                            matrix_names: list[str]) -> tuple[str, Matrix]:
-        """Reads a binary matrix"""
-        #self.show(f, 60)
-        log = self.log
-        if self.debug:
-            log.info("*************************")
-        data_bytes = op4.read(4)
-        self.n += 4
-        (record_length,) = unpack(self._endian + 'i', data_bytes)
-        assert self.n == op4.tell(), 'n=%s tell=%s' % (self.n, op4.tell())
-        if self.debug:
-            log.info("record_length = %s" % record_length)
+        Each Fortran record is [record_length, data, record_length].
+        The header record is followed by one record per column
+        (icol, irow, nwords, data) and a dummy column (ncols + 1).
 
+        Returns
+        -------
+        name : str
+            the name of the matrix
+        amat : Matrix / None
+            the matrix (None if it's not requested)
+        iword : int
+            the word of the next matrix
+
+        """
+        log = self.log
+        endian = self._endian
+        record_length = int(words[iword])
         if record_length == 24:
-            fmt = self._endian + '4i8s'
+            fmt = endian + '4i8s'
         elif record_length == 48:
-            fmt = self._endian + '4Q16s'
+            fmt = endian + '4Q16s'
         else:
-            #msg = record_length #+ self.print_block(data_bytes)
-            msg = 'record_length=%s filename=%r' % (record_length, op4.name)
+            msg = 'record_length=%s filename=%r' % (record_length, data.filename)
             raise NotImplementedError(msg)
 
-        data_bytes = op4.read(record_length)
-        self.n += record_length
-        (ncols, nrows, form, matrix_type, name) = unpack(fmt, data_bytes)
+        (ncols, nrows, form, matrix_type, name_bytes) = unpack(
+            fmt, data[4 * iword + 4:4 * iword + 4 + record_length])
+        name = name_bytes.strip().decode('ascii')
         if self.debug:
             log.info("nrows=%s ncols=%s form=%s matrix_type=%s name=%r" % (
                 nrows, ncols, form, matrix_type, name))
-
-        name = name.strip()
-        name = name.decode('ascii')
-        if self.debug:
-            if matrix_type == 1:
-                log.info("matrix_type = Real, Single Precision")
-            elif matrix_type == 2:
-                log.info("matrix_type = Real, Double Precision")
-            elif matrix_type == 3:
-                log.info("matrix_type = Complex, Single Precision")
-            elif matrix_type == 4:
-                log.info("matrix_type = Complex, Double Precision")
-
         is_big_mat, nrows = get_big_mat_nrows(nrows)
+        iword += 2 + record_length // 4
 
-        if self.debug:
-            log.info('is_big_matrix = %s' % is_big_mat)
-
-        # jump forward to get irow (needed for check on is_sparse),
-        # then jump back
-        nsave = self.n
-        irow = self.read_start_marker(op4)[2]
-        op4.seek(nsave)
-        self.n = nsave
-
-        #(nwords_per_value, nbytes_per_value, data_format, dtype) = self._get_matrix_info(matrix_type)
-        data_format, dtype = _get_matrix_info(matrix_type, self.log, debug=self.debug)[2:]
+        # index the column records
+        column_struct = Struct(endian + '2i')
+        record_iwords = []
+        while True:
+            record_length, icol = column_struct.unpack_from(data, 4 * iword)
+            if icol > ncols:
+                # dummy column (the value is 1.0)
+                iword += 2 + record_length // 4
+                break
+            record_iwords.append(iword)
+            iword += 2 + record_length // 4
 
-        is_sparse = False
-        if irow == 0:
-            is_sparse = True
+        if not is_saved_matrix(name, matrix_names):
+            return name, None, iword
 
-        assert self.n == op4.tell(), 'n=%s tell=%s' % (self.n, op4.tell())
-        if matrix_type in {1, 2}:  # real
-            if is_sparse:
-                data_mat = self._read_real_sparse_binary(op4, nrows, ncols, matrix_type, is_big_mat)
-            else:
-                data_mat = self._read_real_dense_binary(op4, nrows, ncols, matrix_type, is_big_mat)
-        elif matrix_type in {3, 4}:  # complex
-            if is_sparse:
-                data_mat = self._read_complex_sparse_binary(op4, nrows, ncols, matrix_type, is_big_mat)
-            else:
-                data_mat = self._read_complex_dense_binary(op4, nrows, ncols, matrix_type, is_big_mat)
-        else:
-            log.error('is_sparse=%s data_format=%s dtype=%s' % (is_sparse, data_format, dtype))
-            raise TypeError(f'matrix_type={matrix_type}')
-
-        #try:
-            #print_matrix(A.toarray())
-        #except Exception:
-            #pass
-
-        if data_format in {'d', 'dd'}:
-            op4.read(8)
-            self.n += 8
-        elif data_format in {'f', 'ff'}:
-            op4.read(4)
-            self.n += 4
+        icol0, icol1 = _get_column_range(columns, ncols)
+        (nwords_per_value, unused_nbytes_per_value,
+         unused_data_format, unused_dtype) = _get_matrix_info(matrix_type, log, debug=self.debug)
+        dtype = get_dtype(matrix_type, precision)
+        shape = (nrows, icol1 - icol0)
+
+        # record_length, icol, irow, nwords
+        record_iwords = np.array(record_iwords, dtype='int64')
+        icols_array = words[record_iwords + 1].astype('int64')
+        irows_array = words[record_iwords + 2].astype('int64')
+
+        # a NULL matrix only has the dummy column and is written as a dense matrix
+        is_sparse = len(irows_array) > 0 and irows_array[0] == 0
+        irecord = (icols_array > icol0) & (icols_array <= icol1)
+        record_iwords = record_iwords[irecord]
+        icols_array = icols_array[irecord]
+        irows_array = irows_array[irecord]
+        iwords_array = record_iwords + 4
+        nwords_array = words[record_iwords].astype('int64') // 4 - 3
+        if is_sparse:
+            # a column is made up of strings of values;
+            # each string has a header with the row id and length
+            icols_array, irows_array, iwords_array, nwords_array = _get_binary_strings(
+                words, icols_array, iwords_array, nwords_array, is_big_mat)
+
+        rows, cols, values = _read_binary_values(
+            words, icols_array - 1 - icol0, irows_array - 1, iwords_array, nwords_array,
+            nwords_per_value, matrix_type, endian, dtype)
+        if is_sparse:
+            data_mat = coo_matrix((values, (rows, cols)), shape=shape, dtype=dtype)
         else:
-            raise NotImplementedError(data_format)
-        #f.read(record_length); self.n+=record_length
-        #self.show(f, 10)
-        #f.read(4); self.n+=4
-
-        assert self.n == op4.tell(), 'n=%s op4.tell=%s' % (self.n, op4.tell())
+            data_mat = np.zeros(shape, dtype=dtype)
+            data_mat[rows, cols] = values
         amat = Matrix(name, form, data=data_mat)
-        return name, amat
-
-    def _read_real_dense_binary(self, op4: BinaryIO, nrows: int, ncols: int,
-                                matrix_type: int, is_big_mat: bool) -> np.ndarray:
-        if self.debug:
-            self.log.info('_read_real_dense_binary')
-        out = _get_matrix_info(matrix_type, self.log, debug=False)
-        (nwords_per_value, _nbytes_per_value, data_format, dtype) = out
-        data_mat = np.zeros((nrows, ncols), dtype=dtype)
-
-        icol = -1  # dummy value so the loop starts
-        while icol < ncols + 1:  # if isDense
-            assert self.n == op4.tell(), 'n=%s tell=%s' % (self.n, op4.tell())
-            (icol, irow, nwords) = self.get_markers_dense(op4)
-            L = nwords
-            if icol == ncols + 1:
-                break
-            if L == -1:
-                break
-
-            record_length = 4 * nwords
-            data_bytes = op4.read(record_length)
-            self.n += record_length
-            nvalues = L // nwords_per_value
-            str_values = self._endian + '%i%s' % (nvalues, data_format)
-            data_mat[irow-1:irow-1+nvalues, icol-1] = unpack(str_values, data_bytes)
-            if self.debug:
-                self.log.info('A[%s:%s, %s] = %s' % (
-                    irow - 1,
-                    irow - 1 + nvalues,
-                    icol-1,
-                    data_mat[irow-1:irow-1+nvalues, icol-1]))
-        #assert self.n == op4.tell(), 'n=%s tell=%s' % (self.n, op4.tell())
-        op4.read(4)
-        self.n += 4
-        return data_mat
-
-    def _read_real_sparse_binary(self, op4: BinaryIO,
-                                 nrows: int, ncols: int, matrix_type: int,
-                                 is_big_mat: bool) -> coo_matrix:
-        if self.debug:
-            self.log.info('_read_real_sparse_binary')
-        #self._show(op4, 200, types='ifsdq', endian=None)
-        out = _get_matrix_info(matrix_type, self.log, debug=False)
-        (nwords_per_value, nbytes_per_value, data_format, dtype) = out
-        log = self.log
-        rows = []
-        cols = []
-        entries: list[float] = []
-
-        data_bytes = b''
-        icol = -1  # dummy value so the loop starts
-        while icol < ncols + 1:  # if isDense
-            #if record_length==0:
-            assert self.n == op4.tell(), 'n=%s tell=%s' % (self.n, op4.tell())
-            (icol, irow, nwords) = self.get_markers_sparse(op4, is_big_mat)
-            L = nwords
-
-            if icol == ncols + 1:
-                if self.debug:
-                    log.info('breaking on icol=%s ncol+1=%s' % (icol, ncols + 1))
-                break
-
-            if is_big_mat:
-                irow, L = self._get_irow_big_binary(op4, data_bytes[:8])
-                data_bytes = data_bytes[8:]
-            else:
-                irow, L = self._get_irow_small_binary(op4, data_bytes[:4])
-                data_bytes = data_bytes[4:]
-
-            if L == -1:
-                if self.debug:
-                    log.info('breaking on L=-1')
-                break
-
-            if self.debug:
-                log.info("  next icol")
-                log.info("    n=%s icol=%s irow=%s nwords=%s" % (
-                    self.n, icol, irow, nwords))
-                self._show(op4, 100, types='qd')
-                log.info('**************************************************')
-
-            #if nwords == 0 and is_big_mat:
-                #self.n -= 4
-                #op4.seek(self.n)
-                #break
-
-            record_length = 4 * nwords
-            data_bytes = op4.read(record_length)
-            self.n += record_length
-            if self.debug:
-                log.info("  data_format=%s record_length=%s n_next=%s" % (
-                    data_format, record_length, self.n))
-            #if icol == ncols + 1:
-                #break
-
-            i = 0
-            while len(data_bytes) > 0:
-                if i > 0:
-                    if is_big_mat:
-                        (irow, L) = self._get_irow_big_binary(op4, data_bytes[0:8])
-                        data_bytes = data_bytes[8:]
-                    else:
-                        (irow, L) = self._get_irow_small_binary(op4, data_bytes[0:4])
-                        data_bytes = data_bytes[4:]
-                    assert irow > 0
-                nvalues = L // nwords_per_value
-                str_values = self._endian + '%i%s' % (nvalues, data_format)
-
-                if self.debug:
-                    log.info('irow=%s L=%s nwords_per_value=%s nvalues=%s '
-                             'nbytes_per_value=%s' % (irow, L, nwords_per_value,
-                                                      nvalues, nbytes_per_value))
-                    log.info('str_values = %r' % str_values)
-
-                value_list = unpack(str_values, data_bytes[0:nvalues * nbytes_per_value])
-                assert self.n == op4.tell(), 'n=%s tell=%s' % (self.n, op4.tell())
-
-                #irow -= 1
-                #icol -= 1
-                if self.debug:
-                    log.info('rows = %s' % list(i+irow-1 for i in range(nvalues)))
-                    log.info('cols = %s ' % ([icol-1] * nvalues))
-                    log.info('value_list = %s' % str(value_list))
-
-                rows.extend([i+irow-1 for i in range(nvalues)])
-                irow += nvalues
-                cols.extend([icol-1] * nvalues)
-                entries.extend(value_list)
-
-                record_length -= nvalues * nbytes_per_value
-                data_bytes = data_bytes[nvalues * nbytes_per_value:]
-                if self.debug:
-                    log.info("  record_length=%s nbytes_per_value=%s len(data)=%s" % (
-                        record_length, nbytes_per_value, len(data_bytes)))
-                    ##print(A)
-                    #print("********")  # ,data_bytes
-                    #print(self.print_block(data_bytes))
-                i += 1
-            #print "-------------------------------"
-
-        #if rows == []:  # NULL matrix
-            #raise NotImplementedError()
-
-        A = coo_matrix((entries, (rows, cols)), shape=(nrows, ncols),
-                       dtype=dtype)
-        op4.read(4)
-        self.n += 4
-        return A
+        return name, amat, iword
 
     def _show(self, op4: BinaryIO, n, types: str='ifs', endian: Optional[str]=None):
         """Shows binary data"""
@@ -968,255 +731,6 @@ class OP4:
         f.seek(self.n)
         return _write_data(fout, data_bytes, endian=endian, types=types)
 
-    def _read_complex_dense_binary(self, op4: BinaryIO, nrows: int, ncols: int,
-                                   matrix_type: int, is_big_mat: bool) -> coo_matrix:
-        """reads a dense complex binary matrix"""
-        if self.debug:
-            self.log.info('_read_complex_dense_binary')
-        out = _get_matrix_info(matrix_type, self.log, debug=False)
-        (nwords_per_value, nbytes_per_value, data_format, dtype) = out
-
-        A = np.zeros((nrows, ncols), dtype=dtype)
-        record_length = 0
-        icol = -1  # dummy value so the loop starts
-        while icol < ncols + 1:  # if isDense
-            #if record_length==0:
-            assert self.n == op4.tell(), 'n=%s tell=%s' % (self.n, op4.tell())
-            (icol, irow, nwords) = self.get_markers_dense(op4)
-            if self.debug:
-                self.log.info("N=%s icol=%s irow=%s nwords=%s" % (
-                    self.n, icol, irow, nwords))
-                self.log.info("-----------")
-
-            L = nwords
-            if icol == ncols + 1:
-                if self.debug:
-                    self.log.info('breaking...icol=%s ncols+1=%s' % (
-                        icol, ncols + 1))
-                break
-
-            if L == -1:
-                if self.debug:
-                    self.log.info('breaking...nwords (L) = %s' % nwords)
-                break
-
-            if self.debug:
-                self.log.info("  n=%s icol=%s irow=%s nwords=%s" % (
-                    self.n, icol, irow, nwords))
-
-            #if nwords == 0 and is_big_mat:
-                #self.n -=4
-                #f.seek(self.n)
-                #break
-
-            record_length = 4 * nwords
-            data_bytes = op4.read(record_length)
-            self.n += record_length
-            if self.debug:
-                self.log.info("data_format=%s record_length=%s n_next=%s" % (
-                    data_format, record_length, self.n))
-            if icol == ncols + 1:
-                continue
-
-            nvalues = nwords // nwords_per_value
-            #nread = nwords // 4
-            while record_length >= nbytes_per_value:
-                if self.debug:
-                    self.log.info("inner while...")
-                    self.log.info("nwords  = %s" % nwords)
-                    self.log.info("nvalues = %s" % nvalues)
-                    self.log.info("nwords_per_value = %s" % nwords_per_value)
-
-                #if nvalues == 0:
-                    #assert icol == ncols + 1
-                    #break
-
-                # we have more 2x values for complex numbers
-                str_values = self._endian + '%i%s' % (nvalues * 2, data_format)
-                if self.debug:
-                    self.log.info("str_values = %s" % str_values)
-                    self.log.info("nvalues*nbytes_per_value=%s len(data)=%s" % (
-                        nvalues * nbytes_per_value, len(data_bytes)))
-                value_list = unpack(str_values, data_bytes[0:nvalues * nbytes_per_value])
-                assert self.n == op4.tell(), 'n=%s tell=%s' % (self.n, op4.tell())
-                #self.show(op4, 4)
-                #print self.print_block(data)
-                if self.debug:
-                    self.log.info("value_list = %s" % str(value_list))
-
-                #irow -= 1
-                #icol -= 1
-                irow -= 1
-                icol -= 1
-                for i, value in enumerate(value_list):
-                    if i % 2 == 0:
-                        real_value = value
-                    else:
-                        ai = complex(real_value, value)
-                        if self.debug:
-                            self.log.info("A[%s,%s] = %s" % (irow, icol, ai))
-                        A[irow, icol] = ai
-                        irow += 1
-
-                record_length -= nvalues * nbytes_per_value
-                data_bytes = data_bytes[nvalues * nbytes_per_value:]
-                if self.debug:
-                    self.log.info("record_length=%s nbytes_per_value=%s" % (
-                        record_length, nbytes_per_value))
-                    self.log.info(print_matrix(A))
-                    self.log.info("******** %r" % data_bytes)
-
-        op4.read(4)
-        self.n += 4
-        return A
-
-    #def _read_complex_binary(self, op4: BinaryIO, nrows: int, ncols: int,
-                             #matrix_type: int, is_sparse: bool, is_big_mat: bool) -> coo_matrix:
-        #"""Reads a complex binary matrix"""
-        #if is_sparse:
-            #A = self._read_complex_sparse_binary(op4, nrows, ncols, matrix_type, is_big_mat)
-        #else:
-            #A = self._read_complex_dense_binary(op4, nrows, ncols, matrix_type, is_big_mat)
-        #return A
-
-    def _read_complex_sparse_binary(self, op4: BinaryIO, nrows: int, ncols: int,
-                                    matrix_type: int, is_big_mat: bool) -> coo_matrix:
-        """Reads a sparse complex binary matrix"""
-        if self.debug:
-            self.log.info('_read_complex_sparse_binary')
-        out = _get_matrix_info(matrix_type, self.log, debug=False)
-        (nwords_per_value, nbytes_per_value, data_format, dtype) = out
-        rows = []
-        cols = []
-        entries = []
-        record_length = 0
-        data_bytes = b''
-        icol = -1  # dummy value so the loop starts
-        while icol < ncols + 1:  # if isDense
-            #if record_length == 0:
-            assert self.n == op4.tell(), 'n=%s tell=%s' % (self.n, op4.tell())
-            (icol, irow, nwords) = self.get_markers_sparse(op4, is_big_mat)
-            if self.debug:
-                self.log.info("n=%s icol=%s irow=%s nwords=%s" % (
-                    self.n, icol, irow, nwords))
-                self.log.info("-----------")
-
-            L = nwords
-            if icol == ncols + 1:
-                break
-
-            if is_big_mat:
-                (irow, L) = self._get_irow_big_binary(op4, data_bytes[:8])
-                data_bytes = data_bytes[8:]
-            else:
-                (irow, L) = self._get_irow_small_binary(op4, data_bytes[:4])
-                data_bytes = data_bytes[4:]
-
-            if L == -1:
-                if self.debug:
-                    self.log.info('breaking on L=-1')
-                break
-
-            if self.debug:
-                self.log.info("n=%s icol=%s irow=%s nwords=%s" % (
-                    self.n, icol, irow, nwords))
-                self._show(op4, 100, types='qf')
-                self.log.info('\n\n')
-
-            #if nwords == 0 and is_big_mat:
-                #self.n -= 4
-                #op4.seek(self.n)
-                #break
-
-            record_length = 4 * nwords
-            data_bytes = op4.read(record_length)
-            self.n += record_length
-            if self.debug:
-                self.log.info("data_format=%s record_length=%s n_next=%s" % (
-                    data_format, record_length, self.n))
-            if icol == ncols + 1:
-                continue
-
-            nvalues = nwords // nwords_per_value
-            while record_length >= nbytes_per_value:
-                if self.debug:
-                    self.log.info("inner while...")
-                    self.log.info("nwords  = %s" % nwords)
-                    self.log.info("nvalues = %s" % nvalues)
-                    self.log.info("nwords_per_value = %s" % nwords_per_value)
-
-                #if nvalues == 0:
-                    #assert icol == ncols + 1
-                    #break
-
-                # we have 2x values for complex
-                str_values = self._endian + '%i%s' % (nvalues * 2, data_format)
-                if self.debug:
-                    self.log.info("  str_values = %s" % str_values)
-                    self.log.info("  nvalues*nbytes_per_value=%s len(data_bytes)=%s" % (
-                        nvalues * nbytes_per_value, len(data_bytes)))
-                value_list = unpack(str_values, data_bytes[0:nvalues * nbytes_per_value])
-                assert self.n == op4.tell(), 'n=%s tell=%s' % (self.n, op4.tell())
-                #self.show(op4, 4)
-                #print(self.print_block(data))
-                if self.debug:
-                    self.log.info("  value_list = %s" % str(value_list))
-
-                #irow -= 1
-                #icol -= 1
-                irow -= 1
-                icol -= 1
-
-                cols += [icol] * nvalues
-                rows += [i + irow for i in range(nvalues)]
-                for i, value in enumerate(value_list):
-                    if i % 2 == 0:
-                        real_value = value
-                    else:
-                        if self.debug:
-                            self.log.info("  A[%s,%s] = %s" % (
-                                irow, icol, complex(real_value, value)))
-                        #A[irow, icol] = complex(real_value, value)
-                        entries.append(complex(real_value, value))
-                        irow += 1
-
-                record_length -= nvalues * nbytes_per_value
-                data_bytes = data_bytes[nvalues * nbytes_per_value:]
-                #print("record_length=%s nbytes_per_value=%s" % (record_length, nbytes_per_value))
-                #print(print_matrix(A))
-                #print("********", data)
-
-        data_mat = coo_matrix((entries, (rows, cols)), shape=(nrows, ncols), dtype=dtype)
-        op4.read(4)
-        self.n += 4
-        return data_mat
-
-    def get_markers_sparse(self, op4: BinaryIO, is_big_mat: bool) -> tuple[int, int, int]:
-        if is_big_mat:
-            (unused_a, icol, irow, nwords) = self.read_start_marker(op4)
-            #irow = self._get_irow_big(op4)
-            nwords -= 2
-            #if nwords > 1:
-               #nwords -= 2
-            #else:
-               #print("nwords0 = %s" % nwords)
-               #nwords = 0
-        else:
-            unused_a, icol, irow, nwords = self.read_start_marker(op4)
-            #if irow != 0:
-                #assert nwords == 1, 'nwords=%s' % nwords
-
-            #irow = self._get_irow_small(f)
-            nwords -= 1
-        return icol, irow, nwords
-
-    def get_markers_dense(self, op4: BinaryIO) -> tuple[int, int, int]:
-        a, icol, irow, nwords = self.read_start_marker(op4)
-        if self.debug:
-            self.log.info("n=%s a=%s icol=%s irow=%s nwords=%s"% (
-                self.n, a, icol, irow, nwords))
-        return icol, irow, nwords
-
     def write_op4(self, op4_filename: Optional[PathLike],
                   matrices: dict[str, Matrix],
                   name_order=None,
@@ -1325,9 +839,9 @@ class OP4:
         for name in name_order:
             form, matrix = _write_form_matrix_helper(matrices, name)
 
-            if isinstance(matrix, coo_matrix):
-                #write_DMIG(f, name, matrix, form, precision='default')
-                raise NotImplementedError('sparse binary op4 writing not implemented')
+            if issparse(matrix):
+                _write_sparse_matrix_binary(
+                    op4, name, matrix, form=form, precision=precision, endian=self._endian)
             elif isinstance(matrix, np.ndarray):
                 _write_dense_matrix_binary(
                     op4, name, matrix, form=form, precision=precision, endian=self._endian)
@@ -1452,6 +966,152 @@ def _save_matrix(matrices, name: str, amat: Matrix) -> None:
         # typical case
         matrices[name] = amat
 
+def _get_column_range(columns: Optional[tuple[int, int]], ncols: int) -> tuple[int, int]:
+    """
+    gets the 0-based [start, end) columns to read
+
+    The range is clipped to the matrix, so a matrix with ncols <= start
+    has no columns.
+    """
+    if columns is None:
+        return 0, ncols
+    icol0, icol1 = columns
+    if not 0 <= icol0 < icol1:
+        raise ValueError(f'columns={columns} must be [start, end) with '
+                         f'0 <= start < end; ncols={ncols}')
+    return min(icol0, ncols), min(icol1, ncols)
+
+def _slice_columns(matrices: dict[str, Matrix], columns: tuple[int, int]) -> None:
+    """slices the columns of matrices that have already been read"""
+    for amat in matrices.values():
+        is_list = isinstance(amat.data, list)
+        datas = amat.data if is_list else [amat.data]
+        datas2 = []
+        for data in datas:
+            icol0, icol1 = _get_column_range(columns, data.shape[1])
+            if isinstance(data, coo_matrix):
+                data = data.tocsc()[:, icol0:icol1].tocoo()
+            else:
+                data = data[:, icol0:icol1]
+            datas2.append(data)
+        amat.data = datas2 if is_list else datas2[0]
+
+def _get_binary_strings(words: np.ndarray,
+                        icols: np.ndarray, iwords: np.ndarray, nwords: np.ndarray,
+                        is_big_mat: bool) -> tuple[np.ndarray, np.ndarray,
+                                                   np.ndarray, np.ndarray]:
+    """
+    Finds the strings in the sparse column records
+
+    The strings are walked for all the columns at the same time, so
+    there is one pass per string in the longest column.
+
+    Small matrices have a 1 word string header:
+        IS = irow + 65536 * (L + 1)
+    Big matrices have a 2 word string header:
+        L + 1, irow
+    where L is the number of words of values in the string.
+
+    Returns
+    -------
+    icol, irow : (nstrings, ) int ndarray
+        the 1-based column/starting row of each string
+    iword, nword : (nstrings, ) int ndarray
+        the first word/number of words of values in each string
+
+    """
+    iword = iwords.copy()
+    iword_end = iwords + nwords
+    active = np.flatnonzero(iword < iword_end)
+
+    icols_list = []
+    irows_list = []
+    iwords_list = []
+    nwords_list = []
+    while len(active):
+        iheader = iword[active]
+        if is_big_mat:
+            nwordsi = words[iheader].astype('int64') - 1
+            irowi = words[iheader + 1].astype('int64')
+            nheader = 2
+        else:
+            istring = words[iheader].astype('int64')
+            nwordsi = istring // 65536 - 1
+            irowi = istring - 65536 * (nwordsi + 1)
+            nheader = 1
+
+        # L=-1 is the end of the column
+        is_valid = nwordsi > 0
+        icols_list.append(icols[active][is_valid])
+        irows_list.append(irowi[is_valid])
+        iwords_list.append(iheader[is_valid] + nheader)
+        nwords_list.append(nwordsi[is_valid])
+
+        iword_next = iheader + nheader + nwordsi
+        iword_next[~is_valid] = iword_end[active][~is_valid]
+        iword[active] = iword_next
+        active = active[iword_next < iword_end[active]]
+
+    if len(icols_list) == 0:
+        empty = np.zeros(0, dtype='int64')
+        return empty, empty, empty, empty
+    return (np.hstack(icols_list), np.hstack(irows_list),
+            np.hstack(iwords_list), np.hstack(nwords_list))
+
+def _read_binary_values(words: np.ndarray,
+                        icols: np.ndarray, irows: np.ndarray,
+                        iwords: np.ndarray, nwords: np.ndarray,
+                        nwords_per_value: int, matrix_type: int,
+                        endian: str, dtype: str,
+                        chunk_size: int=10_000_000) -> tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """
+    Reads the values of the strings into COO arrays
+
+    Parameters
+    ----------
+    icols, irows : (nstrings, ) int ndarray
+        the 0-based column/starting row of each string
+    iwords, nwords : (nstrings, ) int ndarray
+        the first word/number of words of values in each string
+    chunk_size : int; default=10_000_000
+        the max number of words that are gathered at once
+
+    """
+    nvalues = nwords // nwords_per_value
+    nvalues_total = nvalues.sum()
+    rows = np.zeros(nvalues_total, dtype='int32')
+    cols = np.zeros(nvalues_total, dtype='int32')
+    values = np.zeros(nvalues_total, dtype=dtype)
+
+    value_dtype = endian + {1: 'f4', 2: 'f8', 3: 'c8', 4: 'c16'}[matrix_type]
+    nstrings = len(nvalues)
+    nwords_cumsum = np.cumsum(nvalues * nwords_per_value)
+    ivalue = 0
+    istring0 = 0
+    while istring0 < nstrings:
+        nwords0 = nwords_cumsum[istring0 - 1] if istring0 else 0
+        istring1 = np.searchsorted(nwords_cumsum, nwords0 + chunk_size, side='right')
+        istring1 = max(istring1, istring0 + 1)
+
+        nvaluesi = nvalues[istring0:istring1]
+        ivalue1 = ivalue + nvaluesi.sum()
+        iword = _ranges(iwords[istring0:istring1], nvaluesi * nwords_per_value)
+        values[ivalue:ivalue1] = words[iword].view(value_dtype)
+        rows[ivalue:ivalue1] = _ranges(irows[istring0:istring1], nvaluesi)
+        cols[ivalue:ivalue1] = np.repeat(icols[istring0:istring1], nvaluesi)
+        ivalue = ivalue1
+        istring0 = istring1
+    return rows, cols, values
+
+def _ranges(starts: np.ndarray, lengths: np.ndarray) -> np.ndarray:
+    """
+    Concatenates [start, start + 1, ..., start + length - 1] for each
+    start/length pair
+    """
+    lengths = np.asarray(lengths, dtype='int64')
+    offsets = np.asarray(starts, dtype='int64') - (np.cumsum(lengths) - lengths)
+    return np.repeat(offsets, lengths) + np.arange(lengths.sum(), dtype='int64')
+
 def _get_start_end_row(A: np.ndarray, nrows: int) -> tuple[Optional[int], Optional[int]]:
     """Find the starting and ending points of the matrix"""
     istart = None
@@ -1714,6 +1374,136 @@ def _write_sparse_matrix_ascii(op4: TextIO, name: str, A: coo_matrix,
     op4.write('%8i%8i%8i\n' % (ncols + 1, 1, 1))
     op4.write(' 1.0000000000000000E+00\n')
 
+def _write_sparse_matrix_binary(op4: BinaryIO, name: str, A, form: int=2,
+                                precision: str='default', endian: str='<',
+                                chunk_size: int=10_000_000) -> None:
+    """
+    Writes a scipy.sparse matrix to a binary OP4
+
+    The column records are built with arrays for a chunk of columns
+    at a time.  Each column is made up of strings of consecutive rows.
+
+    Parameters
+    ----------
+    A : scipy.sparse matrix
+        the matrix; duplicate terms are summed
+    chunk_size : int; default=10_000_000
+        the approximate number of nonzeros that are written at once
+
+    """
+    if isinstance(name, bytes):
+        name = name.decode('ascii')
+    if not endian:
+        endian = '<'
+    A = A.tocsc()
+    A.sum_duplicates()  # also sorts the rows
+    (nrows, ncols) = A.shape
+    if A.nnz:
+        matrix_type = _get_type_nwv(A.data[:1], precision)[0]
+    else:
+        matrix_type = _get_type_nwv(np.zeros(1, dtype=A.dtype), precision)[0]
+    nwords_per_value = _get_matrix_info(matrix_type, None, debug=False)[0]
+    value_dtype = endian + {1: 'f4', 2: 'f8', 3: 'c8', 4: 'c16'}[matrix_type]
+
+    # strings are limited by the IS header (L+1)*65536 + irow for small matrices
+    is_big_mat = nrows > 65535
+    if is_big_mat:
+        nheader = 2
+        max_values = (2 ** 31 - 2) // nwords_per_value
+    else:
+        nheader = 1
+        max_values = 32766 // nwords_per_value
+
+    name2 = '%-8s' % name
+    assert len(name2) == 8, 'name=%r is too long; 8 characters max' % name
+    nrows_header = -nrows if is_big_mat else nrows
+    op4.write(pack(endian + '5i8si', 24, ncols, nrows_header, form, matrix_type,
+                   name2.encode('ascii'), 24))
+
+    indptr = A.indptr
+    icol0 = 0
+    while icol0 < ncols:
+        icol1 = np.searchsorted(indptr, indptr[icol0] + chunk_size, side='right') - 1
+        icol1 = min(max(icol1, icol0 + 1), ncols)
+        i0 = indptr[icol0]
+        i1 = indptr[icol1]
+        rows = A.indices[i0:i1].astype('int64')
+        nvalues_per_col = np.diff(indptr[icol0:icol1 + 1])
+        cols = np.repeat(np.arange(icol0, icol1, dtype='int64'), nvalues_per_col)
+        values = A.data[i0:i1].astype(value_dtype)
+        op4.write(_get_sparse_column_records(
+            rows, cols, values, nwords_per_value, nheader, max_values,
+            is_big_mat, endian).tobytes())
+        icol0 = icol1
+
+    # dummy column
+    if matrix_type in [1, 3]: # single precision
+        msg = pack(endian + '4ifi', 16, ncols + 1, 1, 1, 1.0, 16)
+    else: # double precision
+        msg = pack(endian + '4idi', 20, ncols + 1, 1, 1, 1.0, 20)
+    op4.write(msg)
+
+def _get_sparse_column_records(rows: np.ndarray, cols: np.ndarray, values: np.ndarray,
+                               nwords_per_value: int, nheader: int, max_values: int,
+                               is_big_mat: bool, endian: str) -> np.ndarray:
+    """
+    Builds the Fortran records for the nonzero columns
+
+    Each record is:
+        [record_length, icol, 0, nwords, string_1, ..., string_n, record_length]
+    """
+    nvalues = len(rows)
+    if nvalues == 0:
+        return np.zeros(0, dtype=endian + 'i4')
+
+    # a string starts at a new column or a gap in the rows
+    is_start = np.ones(nvalues, dtype='bool')
+    is_start[1:] = (cols[1:] != cols[:-1]) | (rows[1:] != rows[:-1] + 1)
+    istart = np.flatnonzero(is_start)
+    irun = np.cumsum(is_start) - 1
+    is_start |= (np.arange(nvalues) - istart[irun]) % max_values == 0
+
+    istring = np.flatnonzero(is_start)
+    nstrings = len(istring)
+    string_nvalues = np.diff(np.append(istring, nvalues))
+    string_nwords = nheader + nwords_per_value * string_nvalues
+    string_col = cols[istring]
+
+    is_new_col = np.ones(nstrings, dtype='bool')
+    is_new_col[1:] = string_col[1:] != string_col[:-1]
+    icol_string = np.flatnonzero(is_new_col)
+    col_ids = string_col[icol_string]
+    col_nwords = np.add.reduceat(string_nwords, icol_string)
+    icol_rank = np.cumsum(is_new_col) - 1
+
+    # 5 words = record_length, icol, irow, nwords, record_length
+    col_start = np.cumsum(col_nwords + 5) - (col_nwords + 5)
+    string_start = (np.cumsum(string_nwords) - string_nwords) + 5 * icol_rank + 4
+    nwords_total = col_start[-1] + col_nwords[-1] + 5
+
+    words = np.zeros(nwords_total, dtype=endian + 'i4')
+    is_value = np.ones(nwords_total, dtype='bool')
+    record_length = 4 * (col_nwords + 3)
+    for offset, column_words in [(0, record_length),
+                                 (1, col_ids + 1),
+                                 (2, 0),
+                                 (3, col_nwords),
+                                 (4 + col_nwords, record_length)]:
+        words[col_start + offset] = column_words
+        is_value[col_start + offset] = False
+
+    string_rows = rows[istring] + 1
+    nwords_values = string_nwords - nheader
+    if is_big_mat:
+        words[string_start] = nwords_values + 1
+        words[string_start + 1] = string_rows
+        is_value[string_start + 1] = False
+    else:
+        words[string_start] = string_rows + 65536 * (nwords_values + 1)
+    is_value[string_start] = False
+    words[is_value] = values.view(endian + 'i4')
+    return words
+
 def get_big_mat_nrows(nrows: int) -> tuple[bool, int]:
     """
     Parameters
@@ -1997,7 +1787,8 @@ def is_saved_matrix(name: str, matrix_names: Optional[list[str]]) -> bool:
 def read_op4(op4_filename: Optional[PathLike]=None,
              matrix_names: Optional[list[str]]=None,
              precision: str='default',
-             debug: bool=False, log=None) -> dict[str, Matrix]:
+             debug: bool=False, log=None,
+             columns: Optional[tuple[int, int]]=None) -> dict[str, Matrix]:
     """
     Reads a NASTRAN OUTPUT4 file, and stores the
     matrices as the output arguments.  The number of
@@ -2025,6 +1816,10 @@ def read_op4(op4_filename: Optional[PathLike]=None,
        >>> matrices = op4.read_op4(op4_filename, matrix_names='A')
        >>> MatrixA = matrices['A']
 
+       # or because you only want the first 100 columns of A
+       >>> matrices = op4.read_op4(op4_filename, matrix_names='A', columns=(0, 100))
+       >>> MatrixA = matrices['A']
+
        # get all the matrices, but select the file using a file dialog
        >>> matrices = op4.read_op4()
        >>>
@@ -2038,6 +1833,12 @@ def read_op4(op4_filename: Optional[PathLike]=None,
     precision : str; {'default', 'single', 'double'}
         specifies if the matrices are in single or double precsion
         which means the format will be whatever the file is in
+    columns : (int, int); default=None -> all
+        the 0-based [start, end) columns to read; the matrix has
+        end - start columns.  For binary OP4s, the other columns
+        aren't read.  The range is clipped to each matrix, so a
+        matrix with fewer than end columns is shorter and a matrix
+        with ncols <= start has 0 columns.
 
     Returns
     -------
@@ -2079,7 +1880,7 @@ def read_op4(op4_filename: Optional[PathLike]=None,
     """
     op4 = OP4(log=log, debug=debug)
     matrices = op4.read_op4(
-        op4_filename, matrix_names, precision)
+        op4_filename, matrix_names, precision, columns=columns)
     return matrices
 
 def write_op4(op4_filename: Optional[PathLike],
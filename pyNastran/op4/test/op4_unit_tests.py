@@ -9,7 +9,7 @@ import scipy
 import scipy.sparse
 from scipy.sparse import coo_matrix  # type: ignore
 
-from pyNastran.op4.op4 import OP4, read_op4, Matrix
+from pyNastran.op4.op4 import OP4, read_op4, write_op4, Matrix
 import pyNastran.op4.test
 
 OP4_PATH = pyNastran.op4.test.__path__[0]
@@ -340,6 +340,71 @@ class TestOP4(unittest.TestCase):
         #for line in Kgg:
             #print(line)
 
+    def test_op4_sparse_binary_roundtrip(self):
+        """tests writing/reading a sparse binary OP4"""
+        op4_filename = os.path.join(OP4_PATH, 'sparse_binary.op4')
+        rows = np.array([0, 2, 4, 1, 3, 4, 0, 4])
+        cols = np.array([0, 0, 0, 1, 1, 1, 3, 3])
+        values = np.arange(1, len(rows) + 1, dtype='float64')
+        A = coo_matrix((values, (rows, cols)), shape=(5, 4))
+        B = coo_matrix(((1 + 2j) * values, (rows, cols)), shape=(5, 4))
+
+        # rows > 65535 uses the big matrix string headers
+        C = coo_matrix((values, (70000 + rows, cols)), shape=(70005, 4))
+        matrices = {'A': (2, A), 'B': (2, B), 'C': (2, C)}
+        write_op4(op4_filename, matrices, precision='default', is_binary=True)
+
+        matrices2 = read_op4(op4_filename)
+        for name, matrix in [('A', A), ('B', B), ('C', C)]:
+            matrix2 = matrices2[name]
+            assert matrix2.is_sparse, name
+            assert matrix2.data.shape == matrix.shape, name
+            assert np.array_equal(matrix2.data.toarray(), matrix.toarray()), name
+        assert matrices2['B'].data.dtype == np.complex128
+
+        matrices3 = read_op4(op4_filename, matrix_names=['B'], precision='single')
+        assert list(matrices3) == ['B']
+        assert matrices3['B'].data.dtype == np.complex64
+        assert np.allclose(matrices3['B'].data.toarray(), B.toarray())
+
+        # columns are a 0-based [start, end) slice
+        matrices4 = read_op4(op4_filename, matrix_names=['A', 'C'], columns=(1, 4))
+        for name, matrix in [('A', A), ('C', C)]:
+            matrix4 = matrices4[name].data
+            assert matrix4.shape == (matrix.shape[0], 3), name
+            assert np.array_equal(matrix4.toarray(), matrix.toarray()[:, 1:4]), name
+
+        # the range is clipped to each matrix
+        matrices5 = read_op4(op4_filename, matrix_names=['A', 'C'], columns=(3, 10))
+        assert matrices5['A'].data.shape == (5, 1)
+        assert np.array_equal(matrices5['A'].data.toarray(), A.toarray()[:, 3:])
+        matrices6 = read_op4(op4_filename, columns=(4, 10))
+        for name, matrix in [('A', A), ('B', B), ('C', C)]:
+            assert matrices6[name].data.shape == (matrix.shape[0], 0), name
+
+        with self.assertRaises(ValueError):
+            read_op4(op4_filename, columns=(3, 1))
+        os.remove(op4_filename)
+
+    def test_op4_columns(self):
+        """tests reading a column range from dense/sparse OP4s"""
+        for fname in ['mat_b_dn.op4', 'mat_b_s1.op4', 'mat_t_dn.op4']:
+            op4_filename = os.path.join(OP4_PATH, fname)
+            matrices = read_op4(op4_filename, matrix_names=['RND1RD'])
+            matrices2 = read_op4(op4_filename, matrix_names=['RND1RD'], columns=(1, 3))
+            matrix = matrices['RND1RD'].data
+            matrix2 = matrices2['RND1RD'].data
+            if matrices['RND1RD'].is_sparse:
+                matrix = matrix.toarray()
+                matrix2 = matrix2.toarray()
+            assert np.array_equal(matrix[:, 1:3], matrix2), fname
+
+            # a matrix with ncols <= start has no columns
+            nrows, ncols = matrix.shape
+            matrices3 = read_op4(op4_filename, matrix_names=['RND1RD'],
+                                 columns=(ncols, ncols + 2))
+            assert matrices3['RND1RD'].data.shape == (nrows, 0), fname
+
 def get_matrices():
     """creates dummy matrices"""
     strings = np.array([